@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+name: ctera_profile
+type: aggregate
+short_description: Aggregates the latency of the CTERA API calls of a play
+description:
+    - Collects the I(ctera_timings) that CTERA tasks return when I(ctera_profile=True), or when C(CTERA_PROFILE) is set on the managed node.
+    - At the end of the playbook, displays the p50, p95 and p99 latency per endpoint, per CTERA host and per play host,
+      the total login and logout overhead, and the slowest tasks.
+    - The CTERA host is the host the API calls were sent to. The play host is the inventory host the task ran for,
+      which differs from the CTERA host when tasks are delegated, for example to C(localhost).
+    - Optionally writes the report as JSON.
+version_added: 1.1.0
+requirements:
+    - Enable in the C(callbacks_enabled) setting of C(ansible.cfg)
+options:
+  output_file:
+    description: Path of a JSON file the report is written to
+    type: path
+    env:
+      - name: CTERA_PROFILE_OUTPUT_FILE
+    ini:
+      - section: callback_ctera_profile
+        key: output_file
+  slowest:
+    description: Number of slowest tasks and endpoints to display
+    type: int
+    default: 10
+    env:
+      - name: CTERA_PROFILE_SLOWEST
+    ini:
+      - section: callback_ctera_profile
+        key: slowest
+'''
+
+EXAMPLES = '''
+# ansible.cfg
+# [defaults]
+# callbacks_enabled = ctera.ctera.ctera_profile
+#
+# [callback_ctera_profile]
+# output_file = /tmp/ctera_profile.json
+
+- name: Profile the shares of every filer
+  ctera_filer_shares:
+    shares: "{{ shares }}"
+    ctera_profile: True
+'''
+
+import json
+import math
+
+from ansible.plugins.callback import CallbackBase
+
+
+class CallbackModule(CallbackBase):
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'ctera.ctera.ctera_profile'
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, display=None):
+        super().__init__(display=display)
+        self._endpoints = {}
+        self._hosts = {}
+        self._play_hosts = {}
+        self._tasks = []
+        self._login = 0
+        self._logout = 0
+
+    def v2_runner_on_ok(self, result):
+        self._collect(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._collect(result)
+
+    def _collect(self, result):
+        host = result._host.get_name()  # pylint: disable=protected-access
+        task = result._task.get_name()  # pylint: disable=protected-access
+        task_result = result._result  # pylint: disable=protected-access
+        # the items of a loop are returned under results, each with its own timings
+        for timings in [task_result.get('ctera_timings')] + [item.get('ctera_timings') for item in task_result.get('results', []) if isinstance(item, dict)]:
+            if timings:
+                self._add(host, task, timings)
+
+    def _add(self, host, task, timings):
+        for call in timings.get('calls', []):
+            self._endpoints.setdefault('%s %s' % (call['method'], call['path']), []).append(call['elapsed'])
+            self._hosts.setdefault(call['host'], []).append(call['elapsed'])
+            self._play_hosts.setdefault(host, []).append(call['elapsed'])
+        self._login += timings.get('login', 0)
+        self._logout += timings.get('logout', 0)
+        self._tasks.append(dict(host=host, task=task, total=timings.get('total', 0), requests=timings.get('requests', 0)))
+
+    @staticmethod
+    def _percentile(values, percent):
+        ''' :return: the nearest-rank percentile of a sorted list '''
+        return values[max(int(math.ceil(percent / 100.0 * len(values))) - 1, 0)]
+
+    @staticmethod
+    def _latency(values):
+        values = sorted(values)
+        return dict(
+            count=len(values),
+            p50=CallbackModule._percentile(values, 50),
+            p95=CallbackModule._percentile(values, 95),
+            p99=CallbackModule._percentile(values, 99),
+            max=values[-1],
+            total=round(sum(values), 4)
+        )
+
+    def report(self):
+        '''
+        :return: the latency per endpoint, per CTERA host and per play host, the session overhead and the slowest tasks
+        '''
+        return dict(
+            endpoints={endpoint: self._latency(values) for endpoint, values in self._endpoints.items()},
+            hosts={host: self._latency(values) for host, values in self._hosts.items()},
+            play_hosts={host: self._latency(values) for host, values in self._play_hosts.items()},
+            login=round(self._login, 4),
+            logout=round(self._logout, 4),
+            slowest_tasks=sorted(self._tasks, key=lambda task: task['total'], reverse=True)[:self.get_option('slowest')]
+        )
+
+    def v2_playbook_on_stats(self, stats):
+        if not self._tasks:
+            return
+        report = self.report()
+        self._display.banner('CTERA API LATENCY')
+        self._display_latency('Endpoint', sorted(report['endpoints'].items(), key=lambda item: item[1]['p95'], reverse=True)[:self.get_option('slowest')])
+        self._display_latency('Host', sorted(report['hosts'].items(), key=lambda item: item[1]['p95'], reverse=True))
+        self._display_latency('Play host', sorted(report['play_hosts'].items(), key=lambda item: item[1]['p95'], reverse=True))
+        self._display.display('Login: %.3fs, Logout: %.3fs' % (report['login'], report['logout']))
+        self._display.display('Slowest tasks:')
+        for task in report['slowest_tasks']:
+            self._display.display('  %-60s %-30s %8.3fs %6d requests' % (task['task'][:60], task['host'][:30], task['total'], task['requests']))
+        output_file = self.get_option('output_file')
+        if output_file:
+            with open(output_file, 'w') as report_file:
+                json.dump(report, report_file, indent=2, sort_keys=True)
+
+    def _display_latency(self, title, items):
+        self._display.display('%-70s %8s %8s %8s %8s %8s' % (title, 'count', 'p50', 'p95', 'p99', 'max'))
+        for name, latency in items:
+            self._display.display('  %-68s %8d %8.3f %8.3f %8.3f %8.3f' % (
+                name[:68], latency['count'], latency['p50'], latency['p95'], latency['p99'], latency['max']
+            ))
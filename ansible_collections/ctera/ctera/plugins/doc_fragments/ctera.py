@@ -8,8 +8,9 @@ class ModuleDocFragment(object):
     DOCUMENTATION = r'''
 options:
   ctera_host:
-    description: IP Address or FQDN of the CTERA Networks Host
-    required: True
+    description:
+    - IP Address or FQDN of the CTERA Networks Host
+    - Required unless the task runs over the ctera.ctera.ctera_gateway or ctera.ctera.ctera_portal httpapi connection
     type: str
   ctera_https:
     description: Connect to the Host using HTTPS
@@ -19,21 +20,44 @@ options:
     description: Connection port to the Host
     type: int
   ctera_user:
-    description: User Name for communicating with the CTERA Networks Host
-    required: True
+    description:
+    - User Name for communicating with the CTERA Networks Host
+    - Required unless the task runs over the ctera.ctera.ctera_gateway or ctera.ctera.ctera_portal httpapi connection
     type: str
   ctera_password:
-    description: Password of the user
-    required: True
+    description:
+    - Password of the user
+    - Required unless the task runs over the ctera.ctera.ctera_gateway or ctera.ctera.ctera_portal httpapi connection
     type: str
   ctera_trust_certificate:
     description: Trust unverified certificates
     type: bool
     default: False
+  ctera_session_cache:
+    description:
+    - Cache the session of I(ctera_user) on I(ctera_host) in a file readable only by the current user under the temporary directory
+    - Following tasks reuse the cached session instead of logging in, and do not log out while the cached session is valid
+    - A cached session that was rejected by the host is discarded and a new login is performed
+    - Portal tasks cache a separate session for every I(tenant), since the browsed tenant is a state of the session
+    type: bool
+    default: False
+  ctera_session_cache_ttl:
+    description:
+    - Number of seconds a cached session is reused when I(ctera_session_cache=True)
+    - Should be lower than the session timeout of the CTERA Networks Host
+    type: int
+    default: 300
+  ctera_profile:
+    description:
+    - Record the method, path, status, size and latency of every request sent to the CTERA Networks Host, and the login and logout time
+    - The recording is returned in I(ctera_timings), and can be aggregated across a play by the ctera.ctera.ctera_profile callback plugin
+    - Defaults to the C(CTERA_PROFILE) environment variable of the managed node
+    type: bool
+    default: False
 
 requirements:
   - A physical or virtual CTERA-Networks Gateway
   - Ansible 2.8
-  - Python3 cterasdk. Install using 'pip install cterasdk'
+  - Python3 cterasdk 2.18.5 or later. Install using 'pip install cterasdk'
 
 '''
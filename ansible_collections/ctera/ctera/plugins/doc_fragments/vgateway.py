@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+    # Documentation fragment for CTERA Edge Filer (ctera), used along with ctera.ctera.ctera
+    DOCUMENTATION = r'''
+options:
+  ctera_fleet:
+    description:
+    - Run the task concurrently against each of the listed hosts instead of I(ctera_host)
+    - Options that are not set for a host default to the respective option of the task
+    - Each host is logged in to and out of separately, the session cache and httpapi connections are not used
+    - The result of each host is returned in I(fleet), keyed by the host
+    type: list
+    elements: dict
+    suboptions:
+      ctera_host:
+        description: IP Address or FQDN of the host
+        type: str
+        required: True
+      ctera_https:
+        description: Connect to the host using HTTPS
+        type: bool
+      ctera_port:
+        description: Connection port to the host
+        type: int
+      ctera_user:
+        description: User Name for communicating with the host
+        type: str
+      ctera_password:
+        description: Password of the user
+        type: str
+  ctera_fleet_workers:
+    description: Maximal number of hosts of I(ctera_fleet) that are managed concurrently
+    type: int
+    default: 10
+  ctera_fleet_timeout:
+    description:
+    - Number of seconds after which a host of I(ctera_fleet) that did not complete is reported as failed
+    type: int
+    default: 300
+  ctera_portal:
+    description:
+    - Access the filer through the remote device access of a CTERA Portal instead of connecting to it directly
+    - I(ctera_host), and the I(ctera_host) of each host of I(ctera_fleet), are then the name of the device in the Portal
+    - A single Portal session is used for all the devices, and I(ctera_user) and I(ctera_password) are not used
+    type: dict
+    suboptions:
+      ctera_host:
+        description: IP Address or FQDN of the Portal
+        type: str
+        required: True
+      ctera_https:
+        description: Connect to the Portal using HTTPS
+        type: bool
+        default: True
+      ctera_port:
+        description: Connection port to the Portal
+        type: int
+      ctera_user:
+        description: User Name of a Global Administrator of the Portal
+        type: str
+        required: True
+      ctera_password:
+        description: Password of the user
+        type: str
+        required: True
+      tenant:
+        description:
+        - Name of the tenant of the devices
+        - Use the tenant of the session if not provided
+        type: str
+
+'''
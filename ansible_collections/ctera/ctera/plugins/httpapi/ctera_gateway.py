@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+name: ctera_gateway
+short_description: HttpApi plugin for the CTERA-Networks Edge Filer
+description:
+    - Logs in to the CTERA-Networks Edge Filer once per play and keeps the session in the persistent connection process.
+    - All ctera_filer_* tasks running over this connection reuse the session instead of logging in and out on every task.
+    - Requires the C(ansible.netcommon) collection for the C(ansible.netcommon.httpapi) connection plugin.
+version_added: 1.1.0
+requirements:
+    - Python3 cterasdk. Install using 'pip install cterasdk'
+'''
+
+EXAMPLES = '''
+# inventory
+# [filers]
+# filer01 ansible_host=192.168.1.1
+#
+# [filers:vars]
+# ansible_connection=ansible.netcommon.httpapi
+# ansible_network_os=ctera.ctera.ctera_gateway
+# ansible_httpapi_use_ssl=true
+# ansible_httpapi_validate_certs=false
+# ansible_user=admin
+# ansible_password=password
+
+- name: create local share
+  ctera.ctera.ctera_filer_share:
+    name: demo
+    directory: /main/public/demo
+'''
+
+from ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_httpapi_base import CteraHttpApiBase
+
+try:
+    from cterasdk import Gateway
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_httpapi_base
+
+
+class HttpApi(CteraHttpApiBase):
+
+    def _create_ctera_host(self, host, port, https):
+        return Gateway(host, port=port, https=https)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+name: ctera_portal
+short_description: HttpApi plugin for the CTERA-Networks Portal
+description:
+    - Logs in to the CTERA-Networks Portal once per play and keeps the session in the persistent connection process.
+    - All ctera_portal_* tasks running over this connection reuse the session instead of logging in and out on every task.
+    - Requires the C(ansible.netcommon) collection for the C(ansible.netcommon.httpapi) connection plugin.
+version_added: 1.1.0
+requirements:
+    - Python3 cterasdk. Install using 'pip install cterasdk'
+'''
+
+EXAMPLES = '''
+# inventory
+# [portals]
+# portal01 ansible_host=192.168.1.1
+#
+# [portals:vars]
+# ansible_connection=ansible.netcommon.httpapi
+# ansible_network_os=ctera.ctera.ctera_portal
+# ansible_httpapi_use_ssl=true
+# ansible_httpapi_validate_certs=false
+# ansible_user=admin
+# ansible_password=password
+
+- name: create local user
+  ctera.ctera.ctera_portal_local_user:
+    name: alice
+    email: alice@wonderland.com
+    first_name: Alice
+    last_name: Wonderland
+    password: su@p3rsecret!!
+    tenant: wonderland
+'''
+
+from ansible_collections.ctera.ctera.plugins.plugin_utils.ctera_httpapi_base import CteraHttpApiBase
+
+try:
+    from cterasdk import GlobalAdmin
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_httpapi_base
+
+
+class HttpApi(CteraHttpApiBase):
+
+    def _create_ctera_host(self, host, port, https):
+        return GlobalAdmin(host, port=port, https=https)
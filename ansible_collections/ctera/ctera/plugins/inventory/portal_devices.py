@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = '''
+---
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+name: portal_devices
+short_description: Edge Filers managed by a CTERA-Networks Portal
+description:
+    - Lists the Edge Filers of all the tenants of a CTERA-Networks Portal, using a single Global Administrator session.
+    - Groups the filers by tenant, model, firmware version and connection state.
+    - Uses the inventory cache when C(cache=True), so warm runs do not log in to the Portal.
+    - The inventory source file name must end with C(portal_devices.yml) or C(portal_devices.yaml).
+version_added: 1.1.0
+extends_documentation_fragment:
+    - constructed
+    - inventory_cache
+requirements:
+    - Python3 cterasdk. Install using 'pip install cterasdk'
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: True
+    choices: ['ctera.ctera.portal_devices']
+  ctera_host:
+    description: IP Address or FQDN of the Portal
+    required: True
+    type: str
+    env:
+      - name: CTERA_PORTAL_HOST
+  ctera_https:
+    description: Connect to the Portal using HTTPS
+    type: bool
+    default: True
+  ctera_port:
+    description: Connection port to the Portal
+    type: int
+  ctera_user:
+    description: User Name of a Global Administrator of the Portal
+    required: True
+    type: str
+    env:
+      - name: CTERA_PORTAL_USER
+  ctera_password:
+    description: Password of the user
+    required: True
+    type: str
+    env:
+      - name: CTERA_PORTAL_PASSWORD
+  ctera_trust_certificate:
+    description: Trust unverified certificates
+    type: bool
+    default: False
+  tenants:
+    description: List of tenants whose filers are included. All the tenants if not set
+    type: list
+    elements: str
+  fields:
+    description:
+    - Additional fields of the device object to retrieve from the Portal
+    - All the retrieved fields are available in the C(ctera_device) host variable, for use with I(compose), I(groups) and I(keyed_groups)
+    type: list
+    elements: str
+    default: []
+  hostname_template:
+    description:
+    - Template of the inventory host name of a filer, using the C({tenant}) and C({name}) fields
+    - Filers of different tenants may have the same name, so the default template includes the tenant
+    - The name of the filer in the Portal is available in the C(ctera_device_name) host variable
+    type: str
+    default: '{tenant}.{name}'
+'''
+
+EXAMPLES = '''
+# portal_devices.yml
+plugin: ctera.ctera.portal_devices
+ctera_host: portal.example.com
+ctera_user: admin
+ctera_password: Gr8Password!
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: /tmp/ctera_inventory
+cache_timeout: 3600
+keyed_groups:
+  - key: ctera_device.deviceType
+    prefix: type
+'''
+
+from ansible.errors import AnsibleError
+from ansible.inventory.group import to_safe_group_name
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+
+try:
+    from cterasdk import CTERAException, GlobalAdmin, config, tojsonstr
+    HAS_CTERASDK = True
+except ImportError:  # pragma: no cover
+    HAS_CTERASDK = False
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+
+    NAME = 'ctera.ctera.portal_devices'
+
+    _device_fields = ['name', 'portal', 'deviceType', 'version', 'deviceConnectionStatus']
+
+    def verify_file(self, path):
+        return super().verify_file(path) and path.endswith(('portal_devices.yml', 'portal_devices.yaml'))
+
+    def parse(self, inventory, loader, path, cache=True):
+        super().parse(inventory, loader, path, cache=cache)
+        self._read_config_data(path)
+
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option('cache') and cache
+        update_cache = self.get_option('cache') and not cache
+        devices = None
+        if use_cache:
+            try:
+                devices = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if devices is None:
+            devices = self._get_devices()
+        if update_cache:
+            self._cache[cache_key] = devices
+        self._populate(devices)
+
+    def _get_devices(self):
+        if not HAS_CTERASDK:  # pragma: no cover
+            raise AnsibleError('The portal_devices inventory plugin requires cterasdk. Install using \'pip install cterasdk\'')
+        config.http['ssl'] = 'Trust' if self.get_option('ctera_trust_certificate') else 'Consent'
+        portal = GlobalAdmin(self.get_option('ctera_host'), port=self.get_option('ctera_port'), https=self.get_option('ctera_https'))
+        try:
+            portal.login(self.get_option('ctera_user'), self.get_option('ctera_password'))
+        except CTERAException as error:
+            raise AnsibleError('Portal login failed. Exception: %s' % tojsonstr(error, False))
+        try:
+            include = InventoryModule._device_fields + [field for field in self.get_option('fields') if field not in InventoryModule._device_fields]
+            return [self._to_device_dict(device, include) for device in portal.devices.filers(include=include, allPortals=True)]
+        except CTERAException as error:
+            raise AnsibleError('Failed to list the devices. Exception: %s' % tojsonstr(error, False))
+        finally:
+            portal.logout()
+
+    @staticmethod
+    def _to_device_dict(device, include):
+        ''' :return: the retrieved fields of the device, in a form that can be stored in the cache '''
+        return InventoryModule._to_plain({field: getattr(device, field, None) for field in include})
+
+    @staticmethod
+    def _to_plain(value):
+        if isinstance(value, (list, tuple)):
+            return [InventoryModule._to_plain(item) for item in value]
+        if isinstance(value, dict):
+            return {k: InventoryModule._to_plain(v) for k, v in value.items() if not k.startswith('_')}
+        if hasattr(value, '__dict__'):
+            return InventoryModule._to_plain(value.__dict__)
+        return value
+
+    @staticmethod
+    def _tenant_name(portal_ref):
+        # object references end with the name of the object, e.g. objs/11/acme/PortalTenant/acme
+        return portal_ref.rstrip('/').rsplit('/', 1)[-1] if portal_ref else None
+
+    def _host_name(self, tenant, name):
+        try:
+            return self.get_option('hostname_template').format(tenant=tenant, name=name)
+        except (KeyError, IndexError, ValueError) as error:
+            raise AnsibleError('Invalid hostname_template: %s' % error)
+
+    def _populate(self, devices):
+        tenants = self.get_option('tenants')
+        strict = self.get_option('strict')
+        for device in devices:
+            tenant = self._tenant_name(device.get('portal'))
+            if tenants and tenant not in tenants:
+                continue
+            connection_status = device.get('deviceConnectionStatus') or {}
+            connected = connection_status.get('connected') if isinstance(connection_status, dict) else None
+            host = self.inventory.add_host(self._host_name(tenant, device['name']))
+            hostvars = dict(
+                ctera_device=device,
+                ctera_device_name=device['name'],
+                ctera_tenant=tenant,
+                ctera_device_type=device.get('deviceType'),
+                ctera_version=device.get('version'),
+                ctera_connected=connected
+            )
+            for key, value in hostvars.items():
+                self.inventory.set_variable(host, key, value)
+            self._add_to_group(host, 'tenant', tenant)
+            self._add_to_group(host, 'model', device.get('deviceType'))
+            self._add_to_group(host, 'version', device.get('version'))
+            if connected is not None:
+                self._add_to_group(host, None, 'connected' if connected else 'disconnected')
+            self._set_composite_vars(self.get_option('compose'), hostvars, host, strict=strict)
+            self._add_host_to_composed_groups(self.get_option('groups'), hostvars, host, strict=strict)
+            self._add_host_to_keyed_groups(self.get_option('keyed_groups'), hostvars, host, strict=strict)
+
+    def _add_to_group(self, host, prefix, value):
+        if value is None:
+            return
+        group = self.inventory.add_group(to_safe_group_name('%s_%s' % (prefix, value) if prefix else str(value), force=True))
+        self.inventory.add_child(group, host)
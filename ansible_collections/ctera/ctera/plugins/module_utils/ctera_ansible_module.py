@@ -20,49 +20,141 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ansible.module_utils.basic import AnsibleModule, missing_required_lib
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+import contextlib
 
-try:
-    from cterasdk import CTERAException, tojsonstr, config
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+from ansible.module_utils.basic import AnsibleModule, env_fallback, missing_required_lib
+from ansible.module_utils.connection import Connection, ConnectionError  # pylint: disable=redefined-builtin
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_profiler import ApiProfiler
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_session_cache import SessionCache
 
 
 class CteraAnsibleModule(AnsibleModule):
 
     default_argument_spec = {
-        'ctera_host': dict(type='str', required=True),
+        'ctera_host': dict(type='str', required=False),
         'ctera_https': dict(type='bool', required=False, default=True),
         'ctera_port': dict(type='int', required=False),
-        'ctera_user': dict(type='str', required=True),
-        'ctera_password': dict(type='str', required=True, no_log=True),
-        'ctera_trust_certificate': dict(type='bool', required=False, default=False)
+        'ctera_user': dict(type='str', required=False),
+        'ctera_password': dict(type='str', required=False, no_log=True),
+        'ctera_trust_certificate': dict(type='bool', required=False, default=False),
+        'ctera_session_cache': dict(type='bool', required=False, default=False),
+        'ctera_session_cache_ttl': dict(type='int', required=False, default=300),
+        'ctera_profile': dict(type='bool', required=False, default=False, fallback=(env_fallback, ['CTERA_PROFILE']))
     }
 
+    # Not required when the session is provided by the ctera_gateway / ctera_portal httpapi plugins
+    connection_arguments = ['ctera_host', 'ctera_user', 'ctera_password']
+
     def __init__(self, argument_spec, **kwargs):
         argument_spec.update(CteraAnsibleModule.default_argument_spec)
         super().__init__(argument_spec, **kwargs)
-        if not ctera_common.HAS_CTERASDK:
-            self.fail_json(msg=missing_required_lib('CTERASDK'), exception=ctera_common.CTERASDK_IMP_ERR)
-        config.http['ssl'] = 'Trust' if self.params['ctera_trust_certificate'] else 'Consent'
         self._ctera_return_value = ctera_common.AnsibleReturnValue()
         self._ctera_host = None
+        self._ctera_session = None
+        self._ctera_session_cache = None
+        self._ctera_session_cached = False
+        self._ctera_profiler = ApiProfiler() if self.params['ctera_profile'] else None
+        if self._socket_path:
+            self._ctera_session = self._get_persistent_session()
+            trust_certificate = self._ctera_session['trust_certificate']
+        else:
+            missing = [arg for arg in self._required_connection_arguments() if self.params[arg] is None]
+            if missing:
+                self.fail_json(msg='missing required arguments: %s' % ', '.join(missing))
+            trust_certificate = self.params['ctera_trust_certificate']
+            if self.params['ctera_session_cache']:
+                self._ctera_session_cache = SessionCache(
+                    self.params['ctera_host'],
+                    self.params['ctera_port'],
+                    self.params['ctera_user'],
+                    self.params['ctera_session_cache_ttl'],
+                    scope=self._ctera_session_scope()
+                )
+        if not ctera_common.import_cterasdk():
+            self.fail_json(msg=missing_required_lib('CTERASDK'), exception=ctera_common.CTERASDK_IMP_ERR)
+        elif not ctera_common.is_supported_cterasdk(ctera_common.cterasdk_version()):
+            self.fail_json(msg='cterasdk %s or later is required, found %s' % (ctera_common.CTERASDK_MIN_VERSION, ctera_common.cterasdk_version()))
+        from cterasdk import config  # pylint: disable=import-outside-toplevel
+        config.http['ssl'] = 'Trust' if trust_certificate else 'Consent'
+
+    def _required_connection_arguments(self):
+        return CteraAnsibleModule.connection_arguments
+
+    def _ctera_session_scope(self):
+        ''' :return: the server-side state of the session that tasks must not share, None if there is none '''
+        return None
+
+    def _get_persistent_session(self):
+        try:
+            return Connection(self._socket_path).get_session()
+        except ConnectionError as error:
+            self.fail_json(msg='Failed to obtain a session from the persistent connection. Exception: %s' % str(error))
+        return None  # pragma: no cover
+
+    def ctera_host_address(self):
+        if self._ctera_session is not None:
+            return self._ctera_session['host'], self._ctera_session['port'], self._ctera_session['https']
+        return self.params['ctera_host'], self.params['ctera_port'], self.params['ctera_https']
+
+    def ctera_instrument(self, ctera_host):
+        ''' :return: the handle, whose requests are recorded when I(ctera_profile=True) '''
+        if self._ctera_profiler is not None:
+            self._ctera_profiler.instrument(ctera_host)
+        return ctera_host
+
+    def ctera_timed(self, operation):
+        ''' :return: a context that measures a login or a logout when I(ctera_profile=True) '''
+        if self._ctera_profiler is not None:
+            return self._ctera_profiler.timed(operation)
+        return contextlib.nullcontext()
+
+    def ctera_reused_session(self):
+        return self._ctera_session is not None or self._ctera_session_cached
 
     def ctera_login(self):
+        with self.ctera_timed('login'):
+            self._ctera_login()
+
+    def _ctera_login(self):
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
         try:
-            self._ctera_host.login(self.params['ctera_user'], self.params['ctera_password'])
+            if self._ctera_session is not None:
+                self._ctera_host.set_session_id(self._ctera_session['session_id'])
+            elif not self._resume_cached_session():
+                self._ctera_host.login(self.params['ctera_user'], self.params['ctera_password'])
+                if self._ctera_session_cache is not None:
+                    self._ctera_session_cached = self._ctera_session_cache.store(self._ctera_host.get_session_id())
         except CTERAException as error:
             self._ctera_return_value.failed().msg('Login failed. Exception: %s' % tojsonstr(error, False))
             self.ctera_exit()
 
+    def _resume_cached_session(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        if self._ctera_session_cache is None:
+            return False
+        session_id = self._ctera_session_cache.load()
+        if session_id is None:
+            return False
+        try:
+            self._ctera_host.set_session_id(session_id)
+        except CTERAException:  # expired or revoked on the server
+            self._ctera_session_cache.invalidate()
+            return False
+        self._ctera_session_cached = True
+        return True
+
     def ctera_logout(self):
-        self._ctera_host.logout()
+        if not self.ctera_reused_session():
+            with self.ctera_timed('logout'):
+                self._ctera_host.logout()
 
     def ctera_return_value(self):
         return self._ctera_return_value
 
     def ctera_exit(self):
+        if self._ctera_profiler is not None:
+            self._ctera_return_value.put(ctera_timings=self._ctera_profiler.summary())
         if self._ctera_return_value.has_failed():
             self.fail_json(**self._ctera_return_value.as_dict())
         else:
@@ -20,15 +20,63 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import collections
+import importlib
+import importlib.util
+import re
 import traceback
 
 try:
-    from cterasdk import CTERAException
-    CTERASDK_IMP_ERR = None
-    HAS_CTERASDK = True
+    from importlib import metadata as importlib_metadata
 except ImportError:  # pragma: no cover
-    CTERASDK_IMP_ERR = traceback.format_exc()
-    HAS_CTERASDK = False
+    importlib_metadata = None
+
+HAS_CTERASDK = importlib.util.find_spec('cterasdk') is not None
+CTERASDK_IMP_ERR = None
+CTERASDK_MIN_VERSION = '2.18.5'
+
+
+def import_cterasdk():
+    '''
+    Importing the SDK loads all of its packages, which takes most of the startup time of a module.
+    The modules import it once their arguments were validated, so a task that fails validation does not pay for it.
+
+    :return: True if the SDK was imported
+    '''
+    global HAS_CTERASDK, CTERASDK_IMP_ERR  # pylint: disable=global-statement
+    if HAS_CTERASDK:
+        try:
+            importlib.import_module('cterasdk')
+        except ImportError:  # pragma: no cover
+            CTERASDK_IMP_ERR = traceback.format_exc()
+            HAS_CTERASDK = False
+    return HAS_CTERASDK
+
+
+def cterasdk_version():
+    ''' :return: the version of the installed SDK, None if it is unknown '''
+    if importlib_metadata is None:  # pragma: no cover
+        return None
+    try:
+        return importlib_metadata.version('cterasdk')
+    except importlib_metadata.PackageNotFoundError:
+        return None
+
+
+def is_supported_cterasdk(version):
+    '''
+    The modules use SDK APIs that were added in CTERASDK_MIN_VERSION, such as the SNMP and NTP configuration of the Gateway
+
+    :param str version: the version of the SDK, None if it is unknown
+    :return: True if the version is CTERASDK_MIN_VERSION or later, or is unknown
+    '''
+    if version is None:
+        return True
+    return _version_key(version) >= _version_key(CTERASDK_MIN_VERSION)
+
+
+def _version_key(version):
+    return tuple(int(number) for number in re.findall(r'\d+', version)[:3])
 
 
 class Object:
@@ -80,6 +128,7 @@ class AnsibleReturnValue:  # pylint: disable=attribute-defined-outside-init
 
 
 def object_exists(ctera_host, path):
+    from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
     try:
         ctera_object = ctera_host.get(path)
         return (True, ctera_object)
@@ -99,80 +148,9 @@ def filter_parameters(parameters, filter_list):
     return {k: v for k, v in parameters.items() if k in filter_list}
 
 
-def cmp(a, b):
-    """
-    Python 3 does not have a cmp function, this will do the cmp.
-    :param a: first object to check
-    :param b: second object to check
-    :return:
-    """
-    # convert to lower case for string comparison.
-    if a is None:
-        return -1
-    # Checking both sides
-    if not (isinstance(a, type(b)) and isinstance(b, type(a))):
-        return -1
-    if isinstance(a, str) and isinstance(b, str):
-        a = a.lower()
-        b = b.lower()
-    # if list has string element, convert string to lower case.
-    if isinstance(a, list) and isinstance(b, list):
-        a = [x.lower() if isinstance(x, list) else x for x in a]
-        b = [x.lower() if isinstance(x, list) else x for x in b]
-        a.sort()
-        b.sort()
-    return (a > b) - (a < b)
-
-
-def compare_lists(current, desired, get_list_diff):
-    ''' compares two lists and return a list of elements that are either the desired elements or elements that are
-        modified from the current state depending on the get_list_diff flag
-        :param: current: current item attribute
-        :param: desired: attributes from playbook
-        :param: get_list_diff: specifies whether to have a diff of desired list w.r.t current list for an attribute
-        :return: list of attributes to be modified
-        :rtype: list
-    '''
-    desired_diff_list = [item for item in desired if item not in current]  # get what in desired and not in current
-    current_diff_list = [item for item in current if item not in desired]  # get what in current but not in desired
-
-    if desired_diff_list or current_diff_list:
-        # there are changes
-        if get_list_diff:
-            return desired_diff_list
-        return desired
-    return []
-
-
-def get_modified_attributes(current, desired, get_list_diff=False):
-    ''' takes two dicts of attributes and return a dict of attributes that are
-        not in the current state
-        It is expected that all attributes of interest are listed in current and
-        desired.
-        :param: current: current attributes
-        :param: desired: attributes from playbook
-        :param: get_list_diff: specifies whether to have a diff of desired list w.r.t current list for an attribute
-        :return: dict of attributes to be modified
-        :rtype: dict
-    '''
-    # if the object does not exist,  we can't modify it
-    modified = dict()
-    if current is None:
-        return modified
-
-    # collect changed attributes
-    for key, value in current.items():
-        if key in desired and desired[key] is not None:
-            if isinstance(value, list):
-                modified_list = compare_lists(value, desired[key], get_list_diff)  # get modified list from current and desired
-                if modified_list:
-                    modified[key] = modified_list
-            elif isinstance(value, dict):
-                if value != desired[key]:
-                    modified[key] = desired[key]
-            elif cmp(value, desired[key]) != 0:
-                modified[key] = desired[key]
-    return modified
+def get_duplicates(values):
+    ''' :return: the sorted values that appear more than once '''
+    return sorted(value for value, count in collections.Counter(values).items() if count > 1)
 
 
 def set_result(ansible_module, messages):
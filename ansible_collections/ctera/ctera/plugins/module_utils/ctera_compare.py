@@ -0,0 +1,251 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+def cmp(a, b):
+    """
+    Python 3 does not have a cmp function, this will do the cmp.
+    :param a: first object to check
+    :param b: second object to check
+    :return:
+    """
+    # convert to lower case for string comparison.
+    if a is None:
+        return -1
+    # Checking both sides
+    if not (isinstance(a, type(b)) and isinstance(b, type(a))):
+        return -1
+    if isinstance(a, str) and isinstance(b, str):
+        a = a.lower()
+        b = b.lower()
+    # if list has string element, convert string to lower case.
+    if isinstance(a, list) and isinstance(b, list):
+        a = [x.lower() if isinstance(x, list) else x for x in a]
+        b = [x.lower() if isinstance(x, list) else x for x in b]
+        a.sort()
+        b.sort()
+    return (a > b) - (a < b)
+
+
+_DICT_KEY = object()
+
+
+def hashable_key(item, ignore_case=False):
+    ''' returns a hashable key of an element of a list, such that equal elements have equal keys
+        :param: item: the element. dictionaries and lists are converted recursively
+        :param: ignore_case: compare strings case insensitively, like cmp
+        :return: hashable key
+    '''
+    if isinstance(item, dict):
+        return (_DICT_KEY, frozenset((key, hashable_key(value, ignore_case)) for key, value in item.items()))
+    if isinstance(item, (list, tuple)):
+        return tuple(hashable_key(element, ignore_case) for element in item)
+    if isinstance(item, (set, frozenset)):
+        return frozenset(hashable_key(element, ignore_case) for element in item)
+    if isinstance(item, str):
+        return item.lower() if ignore_case else item
+    try:
+        hash(item)
+    except TypeError:
+        return repr(item)
+    return item
+
+
+class ListDiff:
+    ''' The result of diff_lists. Elements keep their order in the list they were taken from '''
+
+    def __init__(self, added, removed, unchanged):
+        self.added = added  # in desired and not in current
+        self.removed = removed  # in current and not in desired
+        self.unchanged = unchanged  # in both, taken from desired
+
+    def __bool__(self):
+        return bool(self.added or self.removed)
+
+
+def diff_lists(current, desired, ignore_case=False):
+    ''' compares two lists in linear time by converting each element to a hashable key once
+        :param: current: current item attribute
+        :param: desired: attributes from playbook
+        :param: ignore_case: compare strings case insensitively
+        :return: the added, removed and unchanged elements
+        :rtype: ListDiff
+    '''
+    current_keys = [hashable_key(item, ignore_case) for item in current]
+    desired_keys = [hashable_key(item, ignore_case) for item in desired]
+    current_key_set = set(current_keys)
+    desired_key_set = set(desired_keys)
+    added = []
+    unchanged = []
+    for item, key in zip(desired, desired_keys):
+        (unchanged if key in current_key_set else added).append(item)
+    removed = [item for item, key in zip(current, current_keys) if key not in desired_key_set]
+    return ListDiff(added, removed, unchanged)
+
+
+def compare_lists(current, desired, get_list_diff):
+    ''' compares two lists and return a list of elements that are either the desired elements or elements that are
+        modified from the current state depending on the get_list_diff flag
+        :param: current: current item attribute
+        :param: desired: attributes from playbook
+        :param: get_list_diff: specifies whether to have a diff of desired list w.r.t current list for an attribute
+        :return: list of attributes to be modified
+        :rtype: list
+    '''
+    diff = diff_lists(current, desired)
+    if diff:
+        # there are changes
+        if get_list_diff:
+            return diff.added
+        return desired
+    return []
+
+
+def get_modified_attributes(current, desired, get_list_diff=False):
+    ''' takes two dicts of attributes and return a dict of attributes that are
+        not in the current state
+        It is expected that all attributes of interest are listed in current and
+        desired.
+        :param: current: current attributes
+        :param: desired: attributes from playbook
+        :param: get_list_diff: specifies whether to have a diff of desired list w.r.t current list for an attribute
+        :return: dict of attributes to be modified
+        :rtype: dict
+    '''
+    # if the object does not exist,  we can't modify it
+    modified = dict()
+    if current is None:
+        return modified
+
+    # collect changed attributes
+    for key, value in current.items():
+        if key in desired and desired[key] is not None:
+            if isinstance(value, list):
+                modified_list = compare_lists(value, desired[key], get_list_diff)  # get modified list from current and desired
+                if modified_list:
+                    modified[key] = modified_list
+            elif isinstance(value, dict):
+                if value != desired[key]:
+                    modified[key] = desired[key]
+            elif cmp(value, desired[key]) != 0:
+                modified[key] = desired[key]
+    return modified
+
+
+class AttributeComparator:
+    ''' A get_modified_attributes that is compiled once from an argument_spec instead of dispatching on runtime types.
+        Every option is assigned a key function by its spec:
+        - str options (the default type of an option) compare case insensitively, like cmp
+        - list options compare as sets, unless their path is listed in ordered
+        - dict options and list elements with suboptions compare structurally. Suboptions that are not set
+          in the desired value are not compared
+        - any other option compares by equality
+        Options that are missing from the spec fall back to get_modified_attributes
+    '''
+
+    def __init__(self, argument_spec, ordered=None, case_sensitive=None):
+        '''
+        :param: argument_spec: the argument_spec of the module
+        :param: ordered: paths of list options whose order is significant, e.g. 'dns_servers'
+        :param: case_sensitive: paths of str options that compare case sensitively, e.g. 'acl.name'
+        '''
+        self._ordered = set(ordered or [])
+        self._case_sensitive = set(case_sensitive or [])
+        self._element_keys = {}  # element key functions of the unordered list options, for get_list_diff
+        self._keys = self._compile_options(argument_spec, '')
+
+    def _compile_options(self, options, prefix):
+        return {name: self._compile_option(spec or {}, prefix + name) for name, spec in options.items()}
+
+    def _compile_option(self, spec, path):
+        option_type = spec.get('type', 'str')
+        if option_type == 'list':
+            element_key = self._compile_element(spec.get('elements', 'str'), spec.get('options'), path)
+            if path in self._ordered:
+                return lambda value, fields=None: tuple(element_key(element, fields) for element in value)
+            self._element_keys[path] = element_key
+            return lambda value, fields=None: frozenset(element_key(element, fields) for element in value)
+        return self._compile_element(option_type, spec.get('options'), path)
+
+    def _compile_element(self, element_type, options, path):
+        if options is not None:
+            return AttributeComparator._dict_key(self._compile_options(options, path + '.'))
+        if element_type == 'str' and path not in self._case_sensitive:
+            return AttributeComparator._ignore_case_key
+        return AttributeComparator._key
+
+    @staticmethod
+    def _key(value, fields=None):  # pylint: disable=unused-argument
+        return hashable_key(value)
+
+    @staticmethod
+    def _ignore_case_key(value, fields=None):  # pylint: disable=unused-argument
+        return hashable_key(value, ignore_case=True)
+
+    @staticmethod
+    def _dict_key(keys):
+        def dict_key(value, fields=None):
+            if not isinstance(value, dict):
+                return hashable_key(value)
+            return frozenset(
+                (name, keys[name](item) if name in keys else hashable_key(item))
+                for name, item in value.items() if item is not None and (fields is None or name in fields)
+            )
+        return dict_key
+
+    @staticmethod
+    def _desired_fields(desired):
+        ''' :return: the suboptions that are set in a desired dict, or in any of the dicts of a desired list '''
+        elements = desired if isinstance(desired, list) else [desired]
+        return {name for element in elements if isinstance(element, dict) for name, value in element.items() if value is not None}
+
+    def modified_attributes(self, current, desired, get_list_diff=False):
+        ''' Same contract as get_modified_attributes
+            :param: current: current attributes
+            :param: desired: attributes from playbook
+            :param: get_list_diff: specifies whether to have a diff of desired list w.r.t current list for an attribute
+            :return: dict of attributes to be modified
+            :rtype: dict
+        '''
+        modified = dict()
+        if current is None:
+            return modified
+
+        for name, value in current.items():
+            desired_value = desired.get(name)
+            if desired_value is None:
+                continue
+            key = self._keys.get(name)
+            if key is None:
+                modified.update(get_modified_attributes({name: value}, {name: desired_value}, get_list_diff))
+                continue
+            if value is None:
+                modified[name] = desired_value
+                continue
+            fields = AttributeComparator._desired_fields(desired_value)
+            if key(value, fields) != key(desired_value, fields):
+                modified[name] = desired_value
+                if get_list_diff and name in self._element_keys and isinstance(value, list):
+                    element_key = self._element_keys[name]
+                    current_keys = {element_key(element, fields) for element in value}
+                    modified[name] = [element for element in desired_value if element_key(element, fields) not in current_keys]
+        return modified
@@ -20,21 +20,166 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module import CteraAnsibleModule
 
-try:
-    from cterasdk import Gateway
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class GatewayAnsibleModule(CteraAnsibleModule):
 
+    fleet_argument_spec = {
+        'ctera_fleet': dict(type='list', elements='dict', required=False, options=dict(
+            ctera_host=dict(type='str', required=True),
+            ctera_https=dict(type='bool', required=False),
+            ctera_port=dict(type='int', required=False),
+            ctera_user=dict(type='str', required=False),
+            ctera_password=dict(type='str', required=False, no_log=True)
+        )),
+        'ctera_fleet_workers': dict(type='int', required=False, default=10),
+        'ctera_fleet_timeout': dict(type='int', required=False, default=300),
+        'ctera_portal': dict(type='dict', required=False, options=dict(
+            ctera_host=dict(type='str', required=True),
+            ctera_https=dict(type='bool', required=False, default=True),
+            ctera_port=dict(type='int', required=False),
+            ctera_user=dict(type='str', required=True),
+            ctera_password=dict(type='str', required=True, no_log=True),
+            tenant=dict(type='str', required=False)
+        ))
+    }
+
     def __init__(self, argument_spec, **kwargs):
+        argument_spec.update(GatewayAnsibleModule.fleet_argument_spec)
         super().__init__(argument_spec, **kwargs)
-        self._ctera_host = Gateway(self.params['ctera_host'], port=self.params['ctera_port'], https=self.params['ctera_https'])
+        from cterasdk import Gateway, GlobalAdmin  # pylint: disable=import-outside-toplevel
+        self._ctera_portal = None
+        self._ctera_portal_logged_in = False
+        portal = self.params.get('ctera_portal')
+        if portal:
+            self._ctera_portal = self.ctera_instrument(GlobalAdmin(portal['ctera_host'], port=portal['ctera_port'], https=portal['ctera_https']))
+        elif not self.ctera_fleet():
+            host, port, https = self.ctera_host_address()
+            self._ctera_host = self.ctera_instrument(Gateway(host, port=port, https=https))
+
+    def _required_connection_arguments(self):
+        # every host of the fleet is logged in to separately, with its own or the default credentials
+        if self.ctera_fleet():
+            return []
+        # the filer is accessed through the session of the portal, ctera_host is the name of the device
+        if self.params.get('ctera_portal'):
+            return ['ctera_host']
+        return CteraAnsibleModule.connection_arguments
+
+    def ctera_portal_mode(self):
+        return self._ctera_portal is not None
+
+    def ctera_fleet(self):
+        ''' :return: the connection parameters of each host of the fleet, or None if not running in fleet mode '''
+        fleet = self.params.get('ctera_fleet')
+        if not fleet:
+            return None
+        return [
+            {k: v if v is not None else self.params[k] for k, v in host.items()}
+            for host in fleet
+        ]
 
     def ctera_filer(self, login=True):
-        if login:
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
+        if self.ctera_portal_mode():
+            try:
+                self._ctera_host = self.ctera_remote_filer(self.params['ctera_host'])
+            except CTERAException as error:
+                self._ctera_return_value.failed().msg('Failed to access the device through the portal. Exception: %s' % tojsonstr(error, False))
+                self.ctera_exit()
+        elif login:
             self.ctera_login()
         return self._ctera_host
+
+    def ctera_portal_login(self):
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
+        if self._ctera_portal_logged_in:
+            return
+        try:
+            with self.ctera_timed('login'):
+                self._ctera_portal.login(self.params['ctera_portal']['ctera_user'], self.params['ctera_portal']['ctera_password'])
+        except CTERAException as error:
+            self._ctera_return_value.failed().msg('Portal login failed. Exception: %s' % tojsonstr(error, False))
+            self.ctera_exit()
+        self._ctera_portal_logged_in = True
+
+    def ctera_remote_filer(self, device_name):
+        '''
+        :return: a handle of the device, whose requests are relayed by the session of the portal
+        '''
+        self.ctera_portal_login()
+        return self._ctera_portal.devices.device(device_name, tenant=self.params['ctera_portal'].get('tenant'))
+
+    def ctera_logout(self):
+        if self.ctera_portal_mode():
+            if self._ctera_portal_logged_in:
+                with self.ctera_timed('logout'):
+                    self._ctera_portal.logout()
+                self._ctera_portal_logged_in = False
+        elif not self.ctera_fleet():
+            super().ctera_logout()
+
+
+class GatewayFleetMemberExit(Exception):
+    pass
+
+
+class GatewayFleetMember:
+    ''' Stands in for the GatewayAnsibleModule of a runner that manages a single host of the fleet.
+        The session, the return value and the exit are per host, anything else is delegated to the module
+    '''
+
+    def __init__(self, ansible_module, host):
+        from cterasdk import Gateway  # pylint: disable=import-outside-toplevel
+        self._ansible_module = ansible_module
+        self._host = host
+        self._ctera_return_value = ctera_common.AnsibleReturnValue()
+        self._ctera_host = None
+        if not ansible_module.ctera_portal_mode():
+            self._ctera_host = ansible_module.ctera_instrument(Gateway(host['ctera_host'], port=host['ctera_port'], https=host['ctera_https']))
+        self._logged_in = False
+
+    def __getattr__(self, name):
+        return getattr(self._ansible_module, name)
+
+    def ctera_filer(self, login=True):
+        if self._ansible_module.ctera_portal_mode():
+            # the session of the portal is shared by all the hosts and is logged out of by the module
+            self._ctera_host = self._ansible_module.ctera_remote_filer(self._host['ctera_host'])
+        elif login:
+            self.ctera_login()
+        return self._ctera_host
+
+    def ctera_login(self):
+        missing = [arg for arg in ['ctera_user', 'ctera_password'] if self._host[arg] is None]
+        if missing:
+            self.fail_json(msg='missing required arguments: %s' % ', '.join(missing))
+        with self.ctera_timed('login'):
+            self._ctera_host.login(self._host['ctera_user'], self._host['ctera_password'])
+        self._logged_in = True
+
+    def ctera_logout(self):
+        if self._logged_in:
+            with self.ctera_timed('logout'):
+                self._ctera_host.logout()
+            self._logged_in = False
+
+    @staticmethod
+    def ctera_reused_session():
+        return False
+
+    def ctera_return_value(self):
+        return self._ctera_return_value
+
+    def ctera_exit(self):
+        pass
+
+    def fail_json(self, **kwargs):
+        self._ctera_return_value.failed().put(**kwargs)
+        raise GatewayFleetMemberExit()
+
+    def exit_json(self, **kwargs):
+        self._ctera_return_value.put(**kwargs)
+        raise GatewayFleetMemberExit()
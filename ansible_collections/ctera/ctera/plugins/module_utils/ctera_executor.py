@@ -0,0 +1,180 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import queue
+import threading
+import time
+
+
+class TaskResult:
+
+    DONE = 'done'
+    ERROR = 'error'
+    TIMEOUT = 'timeout'
+    SKIPPED = 'skipped'
+
+    def __init__(self, status, value=None, error=None):
+        self.status = status
+        self.value = value
+        self.error = error
+
+
+class BoundedExecutor:
+    ''' Runs tasks concurrently on a bounded pool of daemon threads.
+        A task that runs longer than the timeout is reported as timed out and its worker is abandoned and replaced,
+        so a single unresponsive host does not hold a slot of the pool or keep the module from exiting
+    '''
+
+    def __init__(self, workers, timeout):
+        self._workers = max(1, workers)
+        self._timeout = timeout
+        self._tasks = queue.Queue()
+        self._condition = threading.Condition()
+        self._running = {}
+        self._results = {}
+
+    def run(self, tasks):
+        '''
+        :param dict tasks: Task key to callable
+        :return: dictionary of task key to TaskResult
+        '''
+        for key, task in tasks.items():
+            self._tasks.put((key, task))
+        for _ in range(min(self._workers, len(tasks))):
+            self._start_worker()
+        with self._condition:
+            while len(self._results) < len(tasks):
+                self._condition.wait(self._expire_timed_out_tasks())
+        return {key: self._results[key] for key in tasks}
+
+    def _start_worker(self):
+        threading.Thread(target=self._work, daemon=True).start()
+
+    def _expire_timed_out_tasks(self):
+        ''' :return: the number of seconds until the next running task times out, or None if nothing is running '''
+        now = time.monotonic()
+        next_timeout = None
+        for key, started in list(self._running.items()):
+            remaining = started + self._timeout - now
+            if remaining <= 0:
+                del self._running[key]
+                self._results[key] = TaskResult(TaskResult.TIMEOUT, error='Timed out after %s seconds' % self._timeout)
+                self._start_worker()
+            elif next_timeout is None or remaining < next_timeout:
+                next_timeout = remaining
+        return next_timeout
+
+    def _work(self):
+        while True:
+            try:
+                key, task = self._tasks.get_nowait()
+            except queue.Empty:
+                return
+            with self._condition:
+                self._running[key] = time.monotonic()
+            try:
+                result = TaskResult(TaskResult.DONE, value=task())
+            except Exception as error:  # pylint: disable=broad-except
+                result = TaskResult(TaskResult.ERROR, error=str(error))
+            with self._condition:
+                if key in self._results:  # timed out and already replaced
+                    return
+                del self._running[key]
+                self._results[key] = result
+                self._condition.notify()
+
+
+class DependencyExecutor:
+    ''' Runs a graph of tasks on a BoundedExecutor, in waves. Each wave runs concurrently all the tasks whose dependencies are done.
+        A task whose dependency did not complete is reported as skipped and is not run
+    '''
+
+    def __init__(self, workers, timeout):
+        self._workers = workers
+        self._timeout = timeout
+
+    def run(self, tasks, dependencies):
+        '''
+        :param dict tasks: Task key to callable
+        :param dict dependencies: Task key to the list of task keys it depends on
+        :return: dictionary of task key to TaskResult
+        '''
+        pending = {key: set(dependencies.get(key, [])) for key in tasks}
+        unknown = {dependency for requires in pending.values() for dependency in requires} - set(tasks)
+        if unknown:
+            raise ValueError('Unknown dependencies: %s' % ', '.join(sorted(unknown)))
+        results = {}
+        while pending:
+            incomplete = {key for key, result in results.items() if result.status != TaskResult.DONE}
+            blocked = {key: requires & incomplete for key, requires in pending.items() if requires & incomplete}
+            for key, requires in blocked.items():
+                del pending[key]
+                results[key] = TaskResult(TaskResult.SKIPPED, error='Skipped since %s did not complete' % ', '.join(sorted(requires)))
+            if blocked:
+                continue  # the dependents of the skipped tasks are skipped as well
+            ready = [key for key, requires in pending.items() if requires.issubset(results)]
+            if not ready:
+                raise ValueError('Circular dependencies between: %s' % ', '.join(sorted(pending)))
+            for key in ready:
+                del pending[key]
+            results.update(BoundedExecutor(self._workers, self._timeout).run({key: tasks[key] for key in ready}))
+        return {key: results[key] for key in tasks}
+
+
+def timed(ensure, *args):
+    '''
+    :param ensure: Callable that returns a tuple of changed and message
+    :return: callable that calls ensure with args, and returns a tuple of changed, message and the number of seconds it took
+    '''
+    def timed_ensure():
+        start = time.monotonic()
+        changed, msg = ensure(*args)
+        return changed, msg, round(time.monotonic() - start, 3)
+    return timed_ensure
+
+
+def set_step_results(return_value, results, elapsed, unchanged_msg):
+    '''
+    Sets the result of each step, and the overall result, on the return value of the module
+    :param return_value: The return value of the module
+    :param dict results: Step name to the TaskResult of a timed step
+    :param float elapsed: Number of seconds it took to apply all the steps
+    :param str unchanged_msg: The message when no step changed
+    '''
+    steps = {}
+    for step, result in results.items():
+        if result.status == TaskResult.DONE:
+            changed, msg, step_elapsed = result.value
+            steps[step] = dict(status=result.status, changed=changed, msg=msg, elapsed=step_elapsed)
+        else:
+            steps[step] = dict(status=result.status, changed=False, msg=result.error, elapsed=None)
+    changed = [step for step in results if steps[step]['changed']]
+    failed = [step for step in results if steps[step]['status'] != TaskResult.DONE]
+    return_value.put(steps=steps, elapsed=elapsed)
+    if changed:
+        return_value.changed()
+    if failed:
+        return_value.failed().msg('Failed to apply: %s' % ', '.join(failed))
+    elif changed:
+        return_value.msg('Changed: %s' % ', '.join(changed))
+    else:
+        return_value.skipped().msg(unchanged_msg)
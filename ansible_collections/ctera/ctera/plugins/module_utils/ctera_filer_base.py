@@ -20,7 +20,11 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge import GatewayAnsibleModule
+import copy
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge import GatewayAnsibleModule, GatewayFleetMember, GatewayFleetMemberExit
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_executor import BoundedExecutor, TaskResult
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_runner_base import CteraRunnerBase
 
 
@@ -38,5 +42,73 @@ class CteraFilerBase(CteraRunnerBase):
         self._ctera_filer = None
 
     def run(self):
+        fleet = self.ansible_module.ctera_fleet()
+        if fleet:
+            self._run_fleet(fleet)
+            return
         self._ctera_filer = self.ansible_module.ctera_filer(login=self._login)
         super().run()
+
+    def _run_fleet(self, fleet):
+        duplicates = ctera_common.get_duplicates(host['ctera_host'] for host in fleet)
+        if duplicates:
+            self.ansible_module.fail_json(msg='Hosts are listed more than once in ctera_fleet: %s' % ', '.join(duplicates))
+            return
+        hosts = {host['ctera_host']: host for host in fleet}
+        if self.ansible_module.ctera_portal_mode():
+            self.ansible_module.ctera_portal_login()  # shared by all the hosts
+        executor = BoundedExecutor(self.ansible_module.params['ctera_fleet_workers'], self.ansible_module.params['ctera_fleet_timeout'])
+        results = executor.run({name: (lambda host=host: self._run_fleet_member(host)) for name, host in hosts.items()})
+        self.ansible_module.ctera_logout()
+        fleet_results = {}
+        for name, result in results.items():
+            if result.status == TaskResult.DONE:
+                fleet_results[name] = result.value
+            else:
+                fleet_results[name] = dict(failed=True, msg=result.error)
+        self._set_fleet_result(fleet_results)
+        self.ansible_module.ctera_exit()
+
+    @classmethod
+    def _fleet_member_runner(cls, runner, member, parameters, ctera_filer):
+        '''
+        :param CteraFilerBase runner: The runner of the task, whose other state is shared
+        :param GatewayFleetMember member: Stands in for the module of the task for the single host
+        :param dict parameters: The parameters of the single host, which the runner may change
+        :param ctera_filer: The handle of the single host
+        :return: a runner of the module against a single host of the fleet
+        '''
+        member_runner = object.__new__(cls)
+        member_runner.__dict__ = dict(vars(runner), ansible_module=member, parameters=parameters, _ctera_filer=ctera_filer)
+        return member_runner
+
+    def _run_fleet_member(self, host):
+        ''' Run this module against a single host of the fleet
+
+        :return: the return value of the host
+        '''
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
+        member = GatewayFleetMember(self.ansible_module, host)
+        try:
+            try:
+                ctera_filer = member.ctera_filer(login=self._login)
+            except CTERAException as error:
+                member.ctera_return_value().failed().msg('Login failed. Exception: %s' % tojsonstr(error, False))
+                return member.ctera_return_value().as_dict()
+            runner = self._fleet_member_runner(self, member, copy.deepcopy(self.parameters), ctera_filer)
+            CteraRunnerBase.run(runner)
+        except GatewayFleetMemberExit:
+            pass
+        finally:
+            member.ctera_logout()
+        return member.ctera_return_value().as_dict()
+
+    def _set_fleet_result(self, fleet_results):
+        failed = sorted(name for name, result in fleet_results.items() if result.get('failed'))
+        return_value = self.ansible_module.ctera_return_value().put(fleet=fleet_results)
+        if any(result.get('changed') for result in fleet_results.values()):
+            return_value.changed()
+        if failed:
+            return_value.failed().msg('Failed on %d of %d hosts: %s' % (len(failed), len(fleet_results), ', '.join(failed)))
+        else:
+            return_value.msg('Completed on %d hosts' % len(fleet_results))
@@ -0,0 +1,92 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerCloudCacheBase(CteraFilerBase):
+
+    @staticmethod
+    def cloud_cache_argument_spec():
+        return dict(
+            enabled=dict(type='bool', required=False, default=True),
+            sync_enabled=dict(type='bool', required=False, default=True),
+            force_eviction=dict(type='bool', required=False, default=False),
+            refresh_folders=dict(type='bool', required=False, default=False),
+        )
+
+    @staticmethod
+    def ensure_cache_enabled(ctera_filer, is_cache_enabled, cloud_cache, messages):
+        '''
+        Enables the cloud cache and brings cloud sync to the desired state
+
+        :param ctera_filer: the filer
+        :param bool is_cache_enabled: whether the cloud cache is enabled
+        :param dict cloud_cache: the desired cloud cache configuration
+        :param dict messages: the changed and skipped messages, which are appended to
+        '''
+        if is_cache_enabled:
+            messages['skipped'].append('Cloud cache was already enabled')
+        else:
+            ctera_filer.cache.enable()
+            messages['changed'].append('Cloud cache was enabled')
+
+        if cloud_cache['force_eviction']:
+            ctera_filer.cache.force_eviction()
+            messages['changed'].append('Started force file eviction')
+
+        is_sync_enabled = ctera_filer.sync.is_enabled()
+        if cloud_cache['sync_enabled']:
+            CteraFilerCloudCacheBase.ensure_sync_enabled(ctera_filer, is_sync_enabled, cloud_cache, messages)
+        else:
+            CteraFilerCloudCacheBase.ensure_sync_disabled(ctera_filer, is_sync_enabled, messages)
+
+    @staticmethod
+    def ensure_cache_disabled(ctera_filer, is_cache_enabled, messages):
+        if is_cache_enabled:
+            ctera_filer.cache.disable()
+            messages['changed'].append('Cloud cache was disabled')
+        else:
+            messages['skipped'].append('Cloud cache is already disabled')
+
+    @staticmethod
+    def ensure_sync_enabled(ctera_filer, is_sync_enabled, cloud_cache, messages):
+        if is_sync_enabled:
+            messages['skipped'].append('Cloud sync was already enabled')
+        else:
+            if len(ctera_filer.volumes.get()) == 0:
+                messages['skipped'].append('No volumes defined - cannot enabled sync')
+                return
+            ctera_filer.sync.unsuspend()
+            messages['changed'].append('Cloud sync was enabled')
+
+        if cloud_cache['refresh_folders']:
+            ctera_filer.sync.refresh()
+            messages['changed'].append('Started refreshing cloud folders')
+
+    @staticmethod
+    def ensure_sync_disabled(ctera_filer, is_sync_enabled, messages):
+        if is_sync_enabled:
+            ctera_filer.sync.suspend()
+            messages['changed'].append('Cloud sync was disabled')
+        else:
+            messages['skipped'].append('Cloud sync was already disabled')
@@ -0,0 +1,91 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_license_base import CteraFilerLicenseBase
+
+
+class CteraFilerCloudServicesBase(CteraFilerBase):
+    connect_params = ['server', 'user', 'password', 'ctera_license']
+
+    @staticmethod
+    def cloud_services_argument_spec():
+        return dict(
+            server=dict(type='str', required=True),
+            user=dict(type='str', required=True),
+            password=dict(type='str', required=True, no_log=True),
+            ctera_license=dict(type='str', required=False, default='EV16', choices=CteraFilerLicenseBase.licenses),
+            force_reconnect=dict(type='bool', required=False, default=False),
+            sso=dict(type='bool', required=False, default=False),
+            trust_certificate=dict(type='bool', required=False, default=False)
+        )
+
+    @staticmethod
+    def configure_sdk(cloud_services):
+        ''' Trusts the certificate of the Cloud Services when the filer connects to them, if requested '''
+        from cterasdk import config  # pylint: disable=import-outside-toplevel
+        if cloud_services['trust_certificate']:
+            config.connect['ssl'] = 'Trust'
+
+    @staticmethod
+    def ensure_connected(ctera_filer, status, cloud_services, messages):
+        '''
+        Connects the filer to the Cloud Services, moves it to a different server or reconnects it, and brings SSO to the desired state
+
+        :param ctera_filer: the filer
+        :param status: the current status of the Cloud Services connection
+        :param dict cloud_services: the desired Cloud Services connection
+        :param dict messages: the changed and skipped messages, which are appended to
+        :return: the error of connecting to a different server, after the filer was disconnected from the current one, None otherwise
+        '''
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
+        connect_params = {k: v for k, v in cloud_services.items() if k in CteraFilerCloudServicesBase.connect_params}
+        if not status.connected:
+            ctera_filer.services.connect(**connect_params)
+            messages['changed'].append('Successfully connected the Filer to the Cloud Services')
+        elif status.server_address != cloud_services['server']:
+            ctera_filer.services.disconnect()
+            try:
+                ctera_filer.services.connect(**connect_params)
+            except CTERAException as error:
+                return 'Failed to connect to new Cloud Services. Filer is now disconnected Exception: %s' % tojsonstr(error, False)
+            messages['changed'].append('Successfully modified the Filer connection to the Cloud Services')
+        elif cloud_services['force_reconnect']:
+            ctera_filer.services.reconnect()
+            messages['changed'].append('Successfully reconnected the Filer to the Cloud Services')
+        else:
+            messages['skipped'].append('The Filer is already connected to the Cloud Services')
+        CteraFilerCloudServicesBase.ensure_sso(ctera_filer, cloud_services['sso'], messages)
+        return None
+
+    @staticmethod
+    def ensure_sso(ctera_filer, sso, messages):
+        sso_state = ctera_filer.services.sso_enabled()
+        if sso_state == sso:
+            messages['skipped'].append('SSO already %s' % ('enabled' if sso_state else 'disabled'))
+            return
+        if sso:
+            ctera_filer.services.enable_sso()
+        else:
+            ctera_filer.services.disable_sso()
+        messages['changed'].append('SSO was %s' % ('enabled' if sso else 'disabled'))
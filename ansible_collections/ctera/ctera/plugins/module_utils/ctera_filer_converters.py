@@ -0,0 +1,137 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+
+
+def object_to_dict(ctera_object):
+    return {k: v for k, v in ctera_object.__dict__.items() if not k.startswith("_")}
+
+
+def user_to_dict(user):
+    user_dict = object_to_dict(user)
+    full_name = user_dict.pop('fullName', None)
+    if full_name is not None:
+        user_dict['full_name'] = full_name
+    return user_dict
+
+
+def share_to_dict(share):
+    return dict(
+        name=share.name,
+        directory=os.path.join(share.volume, share.directory[1:]),
+        acl=[share_acl_entry_to_dict(acl_entry) for acl_entry in share.acl],
+        access=share.access,
+        csc=share.clientSideCaching,
+        dir_permissions=share.dirPermissions,
+        comment=share.comment,
+        export_to_afp=share.exportToAFP,
+        export_to_ftp=share.exportToFTP,
+        export_to_nfs=share.exportToNFS,
+        export_to_pc_agent=share.exportToPCAgent,
+        export_to_rsync=share.exportToRSync,
+        indexed=share.indexed,
+        trusted_nfs_clients=[trusted_nfs_client_to_dict(trusted_nfs_client) for trusted_nfs_client in share.trustedNFSClients]
+    )
+
+
+def share_acl_entry_to_dict(acl_entry):
+    from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
+    principal_type = acl_entry.principal2._classname  # pylint: disable=protected-access
+    if principal_type in [gateway_enum.PrincipalType.LU, gateway_enum.PrincipalType.LG]:
+        name = acl_entry.principal2.ref
+        name = name[name.rfind('#') + 1:]
+    else:
+        name = acl_entry.principal2.name
+    return dict(perm=acl_entry.permissions.allowedFileAccess, principal_type=principal_type, name=name)
+
+
+def trusted_nfs_client_to_dict(trusted_nfs_client):
+    return dict(
+        address=trusted_nfs_client.address,
+        netmask=trusted_nfs_client.netmask,
+        perm=trusted_nfs_client.accessLevel
+    )
+
+
+def network_config_to_dict(config):
+    from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
+    return dict(
+        mode='dynamic' if config.DHCPMode == gateway_enum.Mode.Enabled else 'static',
+        address=config.address,
+        subnet=config.netmask,
+        gateway=config.gateway,
+        primary_dns_server=config.DNSServer1,
+        secondary_dns_server=config.DNSServer2
+    )
+
+
+def syslog_config_to_dict(config):
+    config_dict = object_to_dict(config)
+    config_dict['min_severity'] = config_dict.pop('minSeverity', None)
+    return config_dict
+
+
+def ftp_config_to_dict(config):
+    return dict(
+        mode=config.mode,
+        allow_anonymous_ftp=config.AllowAnonymousFTP,
+        anonymous_download_limit=config.AnonymousDownloadLimit,
+        anonymous_ftp_folder=config.AnonymousFTPFolder,
+        banner_message=config.BannerMessage,
+        max_connections_per_ip=config.MaxConnectionsPerIP,
+        require_ssl=config.RequireSSL
+    )
+
+
+def nfs_config_to_dict(config):
+    from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
+    return dict(
+        mode=config.mode,
+        async_write=(getattr(config, 'async') == gateway_enum.Mode.Enabled),
+        aggregate_writes=(config.aggregateWrites == gateway_enum.Mode.Enabled),
+    )
+
+
+def rsync_config_to_dict(config):
+    return dict(
+        server=config.server,
+        port=config.port,
+        max_connections=config.maxConnections,
+    )
+
+
+def snmp_config_to_dict(config):
+    return dict(
+        port=config.port,
+        community_str=config.readCommunity,
+        username=config.snmpV3.username if config.snmpV3 is not None else None,
+        password=config.snmpV3.password if config.snmpV3 is not None else None
+    )
+
+
+def ntp_config_to_dict(config):
+    from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
+    return dict(
+        enabled=config.NTPMode == gateway_enum.Mode.Enabled,
+        servers=config.NTPServer
+    )
@@ -0,0 +1,92 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerNetworkBase(CteraFilerBase):
+    set_static_params = ['address', 'subnet', 'gateway', 'primary_dns_server', 'secondary_dns_server']
+    network_required_if = [
+        ('mode', 'static', ['address', 'subnet', 'gateway', 'primary_dns_server'])
+    ]
+    network_required_by = dict(
+        secondary_dns_server=['primary_dns_server']
+    )
+
+    @staticmethod
+    def network_argument_spec():
+        return dict(
+            mode=dict(required=False, type='str', choices=['dynamic', 'static'], default='dynamic'),
+            address=dict(type='str', required=False),
+            subnet=dict(type='str', required=False),
+            gateway=dict(type='str', required=False),
+            primary_dns_server=dict(type='str', required=False),
+            secondary_dns_server=dict(type='str', required=False)
+        )
+
+    @staticmethod
+    def ensure_dynamic(ctera_filer, config, network, messages):
+        '''
+        Enables DHCP and sets the DNS servers, if they are set
+
+        :param ctera_filer: the filer
+        :param dict config: the current IP configuration
+        :param dict network: the desired IP configuration
+        :param dict messages: the changed and skipped messages, which are appended to
+        '''
+        if config['mode'] == 'dynamic':
+            messages['skipped'].append("IP addressing mode is already set to dynamic")
+        else:
+            ctera_filer.network.enable_dhcp()
+            messages['changed'].append("IP addressing mode changed to dynamic")
+
+        if network.get('primary_dns_server'):
+            CteraFilerNetworkBase.ensure_dns_servers(ctera_filer, config, network, messages)
+
+    @staticmethod
+    def ensure_dns_servers(ctera_filer, config, network, messages):
+        primary_dns_server = network['primary_dns_server']
+        secondary_dns_server = network.get('secondary_dns_server')
+        if primary_dns_server != config['primary_dns_server'] or secondary_dns_server != config['secondary_dns_server']:
+            ctera_filer.network.set_static_nameserver(primary_dns_server, secondary_dns_server=secondary_dns_server)
+            messages['changed'].append("DNS Servers were set")
+        else:
+            messages['skipped'].append("DNS Servers did not change")
+
+    @staticmethod
+    def ensure_static(ctera_filer, config, network, messages):
+        '''
+        Sets the static IP configuration, unless it did not change
+
+        :param ctera_filer: the filer
+        :param dict config: the current IP configuration
+        :param dict network: the desired IP configuration
+        :param dict messages: the changed and skipped messages, which are appended to
+        '''
+        static_params = ctera_common.filter_parameters(network, CteraFilerNetworkBase.set_static_params)
+        if config['mode'] == 'static' and not ctera_compare.get_modified_attributes(config, static_params):
+            messages['skipped'].append("IP Configuration did not change")
+            return
+        ctera_filer.network.set_static_ipaddr(**static_params)
+        messages['changed'].append("IP Configuration set")
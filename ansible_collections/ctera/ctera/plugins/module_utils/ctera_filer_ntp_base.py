@@ -0,0 +1,55 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerNtpBase(CteraFilerBase):
+
+    @staticmethod
+    def ensure_ntp_enabled(ctera_filer, ntp_config, servers, messages):
+        '''
+        Enables NTP with the servers, unless it is enabled with the same servers
+
+        :param ctera_filer: the filer
+        :param dict ntp_config: the current NTP configuration, as converted by ctera_filer_converters.ntp_config_to_dict
+        :param list servers: the desired NTP servers
+        :param dict messages: the changed and skipped messages, which are appended to
+        '''
+        if not ntp_config['enabled']:
+            ctera_filer.ntp.enable(servers)
+            messages['changed'].append('Enabled NTP')
+        elif ctera_compare.compare_lists(ntp_config['servers'] or [], servers, False):
+            ctera_filer.ntp.enable(servers)
+            messages['changed'].append('Updated NTP configuration')
+        else:
+            messages['skipped'].append('NTP configuration did not change')
+
+    @staticmethod
+    def ensure_ntp_disabled(ctera_filer, ntp_config, messages):
+        if ntp_config['enabled']:
+            ctera_filer.ntp.disable()
+            messages['changed'].append('Disabled NTP')
+        else:
+            messages['skipped'].append('NTP is already disabled')
@@ -0,0 +1,109 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+
+
+# name: (mode field, config converter) of the services that are managed like CteraFilerShareConfigBase
+SHARE_CONFIG_SERVICES = dict(
+    smb=('mode', ctera_filer_converters.object_to_dict),
+    nfs=('mode', ctera_filer_converters.nfs_config_to_dict),
+    ftp=('mode', ctera_filer_converters.ftp_config_to_dict),
+    rsync=('server', ctera_filer_converters.rsync_config_to_dict),
+)
+
+# the options that are passed when the service is enabled
+ENABLE_PARAMS = dict(
+    snmp=['port', 'community_str', 'username', 'password'],
+    syslog=['server', 'port', 'proto', 'min_severity'],
+)
+
+# the options of the services, without the option that enables or disables the service
+_ARGUMENT_SPECS = dict(
+    smb=dict(
+        packet_signing=dict(type='str', required=False, default='Disabled', choices=['Disabled', 'If client agrees', 'Required']),
+        idle_disconnect_time=dict(type='int', required=False, default=10),
+        compatibility_mode=dict(type='bool', required=False, default=False),
+        unix_extensions=dict(type='bool', required=False, default=True),
+        abe_enabled=dict(type='bool', required=False, default=False),
+    ),
+    nfs=dict(
+        async_write=dict(type='bool', required=False, default=True),
+        aggregate_writes=dict(type='bool', required=False, default=True),
+    ),
+    ftp=dict(
+        require_ssl=dict(type='bool', required=False, default=False),
+        max_connections_per_ip=dict(type='int', required=False, default=5),
+        banner_message=dict(type='str', required=False, default='Welcome to CTERA FTP.'),
+        allow_anonymous_ftp=dict(type='bool', required=False, default=False),
+        anonymous_ftp_folder=dict(type='str', required=False),
+        anonymous_download_limit=dict(type='int', required=False, default=0),
+    ),
+    rsync=dict(
+        port=dict(type='int', required=False, default=873),
+        max_connections=dict(type='int', required=False, default=25),
+    ),
+    afp=dict(),
+    telnet=dict(
+        code=dict(type='str', required=False, no_log=True),
+    ),
+    snmp=dict(
+        port=dict(type='int', required=False),
+        community_str=dict(type='str', required=False),
+        username=dict(type='str', required=False),
+        password=dict(type='str', required=False, no_log=True),
+        update_password=dict(type='bool', default=False, no_log=True),
+    ),
+    syslog=dict(
+        server=dict(type='str', required=False),
+        port=dict(type='int', required=False, default=514),
+        proto=dict(type='str', required=False, default='UDP', choices=['TCP', 'UDP']),
+        min_severity=dict(
+            type='str',
+            required=False,
+            default='info',
+            choices=['emergency', 'alert', 'critical', 'error', 'warning', 'notice', 'info', 'debug']
+        ),
+    ),
+    ntp=dict(
+        servers=dict(type='list', elements='str', required=False),
+    ),
+)
+
+# options that control how the configuration is applied, rather than being a part of it
+_FLAGS = ['update_password']
+
+
+def argument_spec(service, defaults=True):
+    '''
+    :param str service: name of the service
+    :param bool defaults: if False, the options of the configuration have no defaults, so that only the options that are set are managed
+    :return: a copy of the argument spec of the options of the service
+    '''
+    spec = copy.deepcopy(_ARGUMENT_SPECS[service])
+    if not defaults:
+        for name, option in spec.items():
+            if name not in _FLAGS:
+                option.pop('default', None)
+    return spec
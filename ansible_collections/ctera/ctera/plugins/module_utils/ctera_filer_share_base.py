@@ -0,0 +1,173 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import ipaddress
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerShareBase(CteraFilerBase):
+    add_params = [
+        'name',
+        'directory',
+        'acl',
+        'access',
+        'csc',
+        'dir_permissions',
+        'comment',
+        'export_to_afp',
+        'export_to_ftp',
+        'export_to_nfs',
+        'export_to_pc_agent',
+        'export_to_rsync',
+        'indexed',
+        'trusted_nfs_clients'
+    ]
+    _share_comparator = None
+
+    @staticmethod
+    def share_argument_spec():
+        return dict(
+            name=dict(type='str', required=True),
+            directory=dict(type='str', required=False),
+            acl=dict(
+                type='list',
+                required=False,
+                elements='dict',
+                options=dict(
+                    principal_type=dict(required=True, choices=['LocalUser', 'LocalGroup', 'DomainUser', 'DomainGroup']),
+                    name=dict(required=True),
+                    perm=dict(required=True, choices=['ReadWrite', 'ReadOnly', 'None']),
+                )
+            ),
+            access=dict(required=False, choices=['winAclMode', 'authenticated'], default='winAclMode'),
+            csc=dict(required=False, choices=['manual', 'documents', 'disabled'], default='manual'),
+            dir_permissions=dict(required=False, type='int', default=777),
+            comment=dict(type='str', required=False),
+            export_to_afp=dict(type='bool', required=False, default=False),
+            export_to_ftp=dict(type='bool', required=False, default=False),
+            export_to_nfs=dict(type='bool', required=False, default=False),
+            export_to_pc_agent=dict(type='bool', required=False, default=False),
+            export_to_rsync=dict(type='bool', required=False, default=False),
+            indexed=dict(type='bool', required=False, default=False),
+            trusted_nfs_clients=dict(
+                type='list',
+                elements='dict',
+                options=dict(
+                    address=dict(required=True),
+                    netmask=dict(required=True),
+                    perm=dict(required=True, choices=['ReadWrite', 'ReadOnly', 'None']),
+                )
+            )
+        )
+
+    @staticmethod
+    def get_modified_share_attributes(share, desired_share):
+        if CteraFilerShareBase._share_comparator is None:
+            CteraFilerShareBase._share_comparator = ctera_compare.AttributeComparator(CteraFilerShareBase.share_argument_spec())
+        return CteraFilerShareBase._share_comparator.modified_attributes(share, desired_share)
+
+    @staticmethod
+    def to_share_params(share_dict):
+        share_params = dict(share_dict)
+        if share_params.get('acl') is not None:
+            share_params['acl'] = [CteraFilerShareBase._make_ShareAccessControlEntry(acl_entry) for acl_entry in share_params['acl']]
+        if share_params.get('trusted_nfs_clients') is not None:
+            share_params['trusted_nfs_clients'] = [
+                CteraFilerShareBase._make_NFSv3AccessControlEntry(trusted_nfs_clients_entry)
+                for trusted_nfs_clients_entry in share_params['trusted_nfs_clients']
+            ]
+        return share_params
+
+    @staticmethod
+    def ensure_share_present(ctera_filer, share, desired_share):
+        '''
+        Adds the share if it does not exist, or modifies the attributes that changed
+
+        :param ctera_filer: the filer
+        :param dict share: the current share, None if it does not exist
+        :param dict desired_share: the desired share
+        :return: whether the share changed, and a message
+        '''
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        if share:
+            modified_attributes = CteraFilerShareBase.get_modified_share_attributes(share, desired_share)
+            if not modified_attributes:
+                return False, 'Share details did not change'
+            ctera_filer.shares.modify(desired_share['name'], **CteraFilerShareBase.to_share_params(modified_attributes))
+            return True, 'Share modified'
+        add_params = {k: v for k, v in desired_share.items() if k in CteraFilerShareBase.add_params}
+        if add_params.get('directory') is None:
+            raise CTERAException(message="Cannot create new share without a directory")
+        ctera_filer.shares.add(**CteraFilerShareBase.to_share_params(add_params))
+        return True, 'Share created'
+
+    @staticmethod
+    def ensure_share_absent(ctera_filer, share, name):
+        '''
+        Deletes the share if it exists
+
+        :param ctera_filer: the filer
+        :param dict share: the current share, None if it does not exist
+        :param str name: the name of the share
+        :return: whether the share changed, and a message
+        '''
+        if share:
+            ctera_filer.shares.delete(name)
+            return True, 'Share deleted'
+        return False, 'Share does not exist'
+
+    @staticmethod
+    def _collapse_trusted_nfs_clients(trusted_nfs_clients):
+        ''' Drops the entries whose subnet is covered by another entry with the same permission and merges adjacent subnets.
+            Entries whose address is a host name are kept as is
+        '''
+        collapsed = []
+        networks = {}  # (perm, ip version) -> {network: the first entry of the network}
+        for entry in trusted_nfs_clients:
+            try:
+                network = ipaddress.ip_network('%s/%s' % (entry['address'], entry['netmask']), strict=False)
+            except ValueError:
+                collapsed.append(entry)
+                continue
+            networks.setdefault((entry['perm'], network.version), {}).setdefault(network, entry)
+        for key, entries in networks.items():
+            perm = key[0]
+            for network in ipaddress.collapse_addresses(entries):
+                entry = entries.get(network)
+                collapsed.append(entry if entry else dict(address=str(network.network_address), netmask=str(network.netmask), perm=perm))
+        return collapsed
+
+    @staticmethod
+    def _make_ShareAccessControlEntry(acl_dict):
+        from cterasdk import gateway_types  # pylint: disable=import-outside-toplevel
+        return gateway_types.ShareAccessControlEntry(principal_type=acl_dict['principal_type'], name=acl_dict['name'], perm=acl_dict['perm'])
+
+    @staticmethod
+    def _make_NFSv3AccessControlEntry(trusted_nfs_clients_dict):
+        from cterasdk import gateway_types  # pylint: disable=import-outside-toplevel
+        return gateway_types.NFSv3AccessControlEntry(
+            address=trusted_nfs_clients_dict['address'],
+            netmask=trusted_nfs_clients_dict['netmask'],
+            perm=trusted_nfs_clients_dict['perm']
+        )
@@ -22,17 +22,14 @@ __metaclass__ = type
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
 from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
 
 
 class CteraFilerShareConfigBase(CteraFilerBase):
     def __init__(self, ansible_module_args, **kwars):
         ansible_module_args.update(dict(enabled=dict(type='bool', required=False, default=True)))
         super().__init__(ansible_module_args, **kwars)
+        self._current_config = None
 
     @property
     def _generic_failure_message(self):  # pragma: no cover
@@ -62,21 +59,39 @@ class CteraFilerShareConfigBase(CteraFilerBase):
             self._ensure_disabled(current_config)
 
     def _get_current_config(self):
-        return self._to_config_dict(self._manager.get_configuration())
+        ''' returns a snapshot of the configuration, which is read from the filer once '''
+        if self._current_config is None:
+            self._current_config = self._to_config_dict(self._manager.get_configuration())
+        return self._current_config
+
+    @staticmethod
+    def plan_enable(current_config, desired, mode_field):
+        '''
+        Enabling a service only sets its mode, so the configuration that it leaves is the snapshot that was read before,
+        with the mode enabled. The desired configuration is compared with it, without reading the configuration again.
+
+        :param dict current_config: the configuration that was read before the service is enabled
+        :param dict desired: the desired configuration
+        :param str mode_field: the name of the mode in the configuration
+        :return: tuple of whether the service must be enabled, and the attributes that must be modified
+        '''
+        from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
+        enabled_config = dict(current_config)
+        enabled_config[mode_field] = gateway_enum.Mode.Enabled
+        return current_config[mode_field] != gateway_enum.Mode.Enabled, ctera_compare.get_modified_attributes(enabled_config, desired)
 
     def _ensure_enabled(self, current_config):
         messages = {
             'changed': [],
             'skipped': []
         }
-        if current_config[self._mode_field] == gateway_enum.Mode.Enabled:
-            messages['skipped'].append('%s already enabled' % self._share_type)
-        else:
+        enable, modified_attributes = CteraFilerShareConfigBase.plan_enable(current_config, self.parameters, self._mode_field)
+        if enable:
             self._manager.enable()
             messages['changed'].append('%s enabled' % self._share_type)
+        else:
+            messages['skipped'].append('%s already enabled' % self._share_type)
 
-        current_config = self._get_current_config()
-        modified_attributes = ctera_common.get_modified_attributes(current_config, self.parameters)
         if modified_attributes:
             self._manager.modify(**modified_attributes)
             messages['changed'].append('%s configuration updated' % self._share_type)
@@ -86,6 +101,7 @@ class CteraFilerShareConfigBase(CteraFilerBase):
         ctera_common.set_result(self.ansible_module, messages)
 
     def _ensure_disabled(self, current_config):
+        from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
         if current_config[self._mode_field] == gateway_enum.Mode.Enabled:
             self._manager.disable()
             self.ansible_module.ctera_return_value().changed().msg('%s server disabled' % self._share_type)
@@ -0,0 +1,43 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerTimezoneBase(CteraFilerBase):
+
+    @staticmethod
+    def ensure_timezone(ctera_filer, current_timezone, timezone, messages):
+        '''
+        Sets the timezone, unless it did not change
+
+        :param ctera_filer: the filer
+        :param str current_timezone: the current timezone
+        :param str timezone: the desired timezone
+        :param dict messages: the changed and skipped messages, which are appended to
+        '''
+        if timezone == current_timezone:
+            messages['skipped'].append('No update required to the current timezone')
+        else:
+            ctera_filer.timezone.set_timezone(timezone)
+            messages['changed'].append('Changed timezone')
@@ -0,0 +1,76 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerUserBase(CteraFilerBase):
+    create_params = ['username', 'password', 'full_name', 'email', 'uid']
+
+    @staticmethod
+    def user_argument_spec():
+        return dict(
+            username=dict(type='str', required=True),
+            password=dict(type='str', required=False, no_log=True),
+            full_name=dict(type='str', required=False),
+            email=dict(type='str', required=False),
+            uid=dict(type='str', required=False)
+        )
+
+    @staticmethod
+    def ensure_user_present(ctera_filer, user, desired_user):
+        '''
+        Creates the user if it does not exist, or modifies the attributes that changed
+
+        :param ctera_filer: the filer
+        :param dict user: the current user, None if it does not exist
+        :param dict desired_user: the desired user
+        :return: whether the user changed, and a message
+        '''
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        if user:
+            modified_attributes = ctera_compare.get_modified_attributes(user, desired_user)
+            if not modified_attributes:
+                return False, 'User details did not change'
+            ctera_filer.users.modify(desired_user['username'], **modified_attributes)
+            return True, 'User modified'
+        create_params = {k: v for k, v in desired_user.items() if k in CteraFilerUserBase.create_params}
+        if create_params.get('password') is None:
+            raise CTERAException(message="Cannot create new user without a password")
+        ctera_filer.users.add(**create_params)
+        return True, 'User created'
+
+    @staticmethod
+    def ensure_user_absent(ctera_filer, user, username):
+        '''
+        Deletes the user if it exists
+
+        :param ctera_filer: the filer
+        :param dict user: the current user, None if it does not exist
+        :param str username: the name of the user
+        :return: whether the user changed, and a message
+        '''
+        if user:
+            ctera_filer.users.delete(username)
+            return True, 'User deleted'
+        return False, 'User already does not exist'
@@ -0,0 +1,75 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerVolumeBase(CteraFilerBase):
+    create_params = ['name', 'size', 'filesystem', 'device', 'passphrase']
+
+    @staticmethod
+    def volume_argument_spec():
+        return dict(
+            name=dict(type='str', required=True),
+            size=dict(type='int', required=False),
+            filesystem=dict(type='str', required=False),
+            device=dict(type='str', required=False),
+            passphrase=dict(type='str', required=False, no_log=True)
+        )
+
+    @staticmethod
+    def ensure_volume_present(ctera_filer, volume, desired_volume):
+        '''
+        Adds the volume if it does not exist, or modifies its size
+
+        :param ctera_filer: the filer
+        :param dict volume: the current volume, None if it does not exist
+        :param dict desired_volume: the desired volume
+        :return: whether the volume changed, and a message
+        '''
+        if volume:
+            modified_attributes = ctera_compare.get_modified_attributes(volume, desired_volume)
+            if not modified_attributes:
+                return False, 'Volume details did not change'
+            desired_size = modified_attributes.get('size')
+            if desired_size is None:
+                return False, 'Currently you can only modify the volume size'
+            ctera_filer.volumes.modify(desired_volume['name'], size=desired_size)
+            return True, 'Volume modified'
+        ctera_filer.volumes.add(**{k: v for k, v in desired_volume.items() if k in CteraFilerVolumeBase.create_params})
+        return True, 'Volume created'
+
+    @staticmethod
+    def ensure_volume_absent(ctera_filer, volume, name):
+        '''
+        Deletes the volume if it exists
+
+        :param ctera_filer: the filer
+        :param dict volume: the current volume, None if it does not exist
+        :param str name: the name of the volume
+        :return: whether the volume changed, and a message
+        '''
+        if volume:
+            ctera_filer.volumes.delete(name)
+            return True, 'Volume deleted'
+        return False, 'Volume already does not exist'
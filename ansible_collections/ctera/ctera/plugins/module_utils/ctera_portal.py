@@ -22,11 +22,6 @@ __metaclass__ = type
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module import CteraAnsibleModule
 
-try:
-    from cterasdk import GlobalAdmin
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class PortalAnsibleModule(CteraAnsibleModule):
     default_argument_spec = {
@@ -36,7 +31,13 @@ class PortalAnsibleModule(CteraAnsibleModule):
     def __init__(self, argument_spec, **kwargs):
         argument_spec.update(PortalAnsibleModule.default_argument_spec)
         super().__init__(argument_spec, **kwargs)
-        self._ctera_host = GlobalAdmin(self.params['ctera_host'], port=self.params['ctera_port'], https=self.params['ctera_https'])
+        from cterasdk import GlobalAdmin  # pylint: disable=import-outside-toplevel
+        host, port, https = self.ctera_host_address()
+        self._ctera_host = self.ctera_instrument(GlobalAdmin(host, port=port, https=https))
+
+    def _ctera_session_scope(self):
+        # the browsed tenant is a state of the session on the portal
+        return self.params['tenant']
 
     def ctera_portal(self, login=True):
         if login:
@@ -42,6 +42,9 @@ class CteraPortalBase(CteraRunnerBase):
         self._ctera_portal = self.ansible_module.ctera_portal(login=self._login)
         if self._login:
             tenant = self.parameters.pop('tenant', None)
+            if not tenant and self.ansible_module.ctera_reused_session():
+                # a reused session may still be browsing the tenant of a previous task
+                tenant = CteraPortalBase.GLOBAL_ADMIN_OPERATIONS_TENANT_NAME
             if tenant:
                 if tenant == CteraPortalBase.GLOBAL_ADMIN_OPERATIONS_TENANT_NAME:
                     self._ctera_portal.portals.browse_global_admin()
@@ -0,0 +1,50 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import datetime
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
+
+
+class CteraPortalLocalUserBase(CteraPortalBase):
+    create_params = ['name', 'email', 'first_name', 'last_name', 'password', 'role', 'company', 'comment', 'password_change']
+    _roles = ['Disabled', 'EndUser', 'ReadWriteAdmin', 'ReadOnlyAdmin', 'Support']
+
+    @staticmethod
+    def user_argument_spec():
+        return dict(
+            name=dict(type='str', required=True),
+            email=dict(type='str', required=False),
+            first_name=dict(type='str', required=False),
+            last_name=dict(type='str', required=False),
+            password=dict(type='str', required=False, no_log=True),
+            role=dict(type='str', required=False, choices=CteraPortalLocalUserBase._roles, default='Disabled'),
+            company=dict(type='str', required=False),
+            comment=dict(type='str', required=False),
+            password_change=dict(type='raw', required=False, default=False, no_log=True)
+        )
+
+    @staticmethod
+    def _translate_password_change(password_change):
+        if isinstance(password_change, str):
+            return datetime.datetime.strptime(password_change, '%Y-%m-%d').date()
+        return password_change
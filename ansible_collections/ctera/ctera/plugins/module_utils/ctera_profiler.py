@@ -0,0 +1,108 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import contextlib
+import threading
+import time
+
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+
+class ApiProfiler:
+    ''' Records the method, path, status, size and latency of every HTTP request of the instrumented CTERA handles,
+        and the time it took to log in and out, to be returned under ctera_timings
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = []
+        self._sessions = {}
+        self._start = time.monotonic()
+
+    def instrument(self, ctera_host):
+        '''
+        Registers a response hook on the HTTP session of the handle.
+        Devices that are accessed through a portal share the session of the portal and are recorded with it
+        :return: the handle
+        '''
+        try:
+            session = ctera_host._ctera_client.http_client.session  # pylint: disable=protected-access
+        except AttributeError:
+            return ctera_host
+        hooks = session.hooks.setdefault('response', [])
+        if self._record not in hooks:
+            hooks.append(self._record)
+        return ctera_host
+
+    @contextlib.contextmanager
+    def timed(self, operation):
+        ''' Measures a login or a logout '''
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self._sessions[operation] = self._sessions.get(operation, 0) + elapsed
+
+    def _record(self, response, *args, **kwargs):  # pylint: disable=unused-argument
+        url = urlparse(response.url)
+        content_length = response.headers.get('Content-Length')
+        if content_length is None and not kwargs.get('stream'):  # reading the content of a download would consume it
+            content_length = len(response.content or b'')
+        call = dict(
+            host=url.netloc,
+            method=response.request.method,
+            path=url.path,
+            status=response.status_code,
+            bytes=int(content_length or 0),
+            elapsed=round(response.elapsed.total_seconds(), 4)
+        )
+        with self._lock:
+            self._calls.append(call)
+        return response
+
+    def summary(self):
+        '''
+        :return: the calls, the calls aggregated by operation, and the login and logout times
+        '''
+        with self._lock:
+            calls = list(self._calls)
+            sessions = dict(self._sessions)
+        operations = {}
+        for call in calls:
+            operation = operations.setdefault('%s %s' % (call['method'], call['path']), dict(count=0, elapsed=0, max=0, bytes=0))
+            operation['count'] += 1
+            operation['elapsed'] += call['elapsed']
+            operation['max'] = max(operation['max'], call['elapsed'])
+            operation['bytes'] += call['bytes']
+        for operation in operations.values():
+            operation['elapsed'] = round(operation['elapsed'], 4)
+        return dict(
+            calls=calls,
+            operations=operations,
+            requests=len(calls),
+            elapsed=round(sum(call['elapsed'] for call in calls), 4),
+            login=round(sessions.get('login', 0), 4),
+            logout=round(sessions.get('logout', 0), 4),
+            total=round(time.monotonic() - self._start, 4)
+        )
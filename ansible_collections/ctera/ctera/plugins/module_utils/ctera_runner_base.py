@@ -24,11 +24,6 @@ from abc import ABC, abstractmethod, abstractproperty
 
 from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
 
-try:
-    from cterasdk import CTERAException, tojsonstr
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraRunnerBase(ABC):
 
@@ -43,6 +38,7 @@ class CteraRunnerBase(ABC):
         self._login = login
 
     def run(self):
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
         try:
             self._execute()
         except CTERAException as error:
@@ -0,0 +1,88 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+class SessionCache:
+    ''' Stores the session id of a (host, port, user, scope) in a file that only the current user can read,
+        so that consecutive tasks can skip the login and logout round trips until the entry expires
+    '''
+
+    def __init__(self, host, port, user, ttl, directory=None, scope=None):
+        '''
+        :param str scope: Server-side state of the session, such as the browsed tenant of a portal.
+                          Tasks that run concurrently in different scopes do not share a session
+        '''
+        key = hashlib.sha256(('%s:%s:%s:%s' % (host, port, user, scope or '')).encode('utf-8')).hexdigest()
+        self._directory = directory or os.path.join(tempfile.gettempdir(), 'ctera_ansible_%d' % os.getuid())
+        self._path = os.path.join(self._directory, 'session_%s.json' % key)
+        self._ttl = ttl
+
+    def load(self):
+        ''' :return: the cached session id, or None if there is no valid entry '''
+        if not self._is_private_directory():
+            return None
+        try:
+            with open(self._path, 'r') as cache_file:
+                entry = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            return None
+        if entry.get('expires', 0) <= time.time():
+            self.invalidate()
+            return None
+        return entry.get('session_id')
+
+    def store(self, session_id):
+        ''' :return: True if the session id was cached '''
+        if not session_id:
+            return False
+        try:
+            if not os.path.isdir(self._directory):
+                os.makedirs(self._directory, 0o700)
+            if not self._is_private_directory():
+                return False
+            fd, temp_path = tempfile.mkstemp(dir=self._directory)  # created with 0600
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(dict(session_id=session_id, expires=time.time() + self._ttl), cache_file)
+            os.replace(temp_path, self._path)
+        except (IOError, OSError):
+            return False
+        return True
+
+    def invalidate(self):
+        try:
+            os.remove(self._path)
+        except (IOError, OSError):
+            pass
+
+    def _is_private_directory(self):
+        try:
+            directory_stat = os.lstat(self._directory)
+        except (IOError, OSError):
+            return False
+        # lstat of a symbolic link reports 0777, so links are rejected as well
+        return directory_stat.st_uid == os.getuid() and (directory_stat.st_mode & 0o077) == 0
@@ -21,6 +21,7 @@ description:
     - Create, modify and delete RAID arrays.
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -81,13 +82,9 @@ members:
   sample: array
 '''
 
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
 
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraFilerArray(CteraFilerBase):
     _create_params = ['array_name', 'level', 'members']
@@ -116,6 +113,7 @@ class CteraFilerArray(CteraFilerBase):
             self._ensure_absent(array)
 
     def _get_array(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         array = None
         try:
             array = self._ctera_filer.array.get(name=self.parameters['array_name'])
@@ -126,8 +124,7 @@ class CteraFilerArray(CteraFilerBase):
 
     @staticmethod
     def _to_array_dict(array):
-        array_dict = {k: v for k, v in array.__dict__.items() if not k.startswith("_")}
-        return array_dict
+        return ctera_filer_converters.object_to_dict(array)
 
     def _ensure_present(self, array):
         if not array:
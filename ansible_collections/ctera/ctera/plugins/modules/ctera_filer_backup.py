@@ -21,6 +21,7 @@ description:
     - Configure backup settings for a CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -22,6 +22,7 @@ description:
     - Refresh folders
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -82,17 +83,12 @@ EXAMPLES = '''
 RETURN = r''' # '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_cloud_cache_base import CteraFilerCloudCacheBase
 
 
-class CteraFilerCloudSync(CteraFilerBase):
+class CteraFilerCloudSync(CteraFilerCloudCacheBase):
     def __init__(self):
-        super().__init__(dict(
-            enabled=dict(type='bool', required=False, default=True),
-            sync_enabled=dict(type='bool', required=False, default=True),
-            force_eviction=dict(type='bool', required=False, default=False),
-            refresh_folders=dict(type='bool', required=False, default=False),
-        ))
+        super().__init__(CteraFilerCloudCacheBase.cloud_cache_argument_spec())
 
     @property
     def _generic_failure_message(self):  # pragma: no cover
@@ -103,63 +99,17 @@ class CteraFilerCloudSync(CteraFilerBase):
             self._handle_not_connected()
             return
 
-        is_cache_enabled = self._ctera_filer.cache.is_enabled()
-        if self.parameters['enabled']:
-            self._ensure_cache_enabled(is_cache_enabled)
-        else:
-            self._ensure_cache_disabled(is_cache_enabled)
-
-    def _ensure_cache_enabled(self, is_cache_enabled):
         messages = {
             'skipped': [],
             'changed': []
         }
-        if is_cache_enabled:
-            messages['skipped'].append('Cloud cache was already enabled')
-        else:
-            self._ctera_filer.cache.enable()
-            messages['changed'].append('Cloud cache was enabled')
-
-        if self.parameters['force_eviction']:
-            self._ctera_filer.cache.force_eviction()
-            messages['changed'].append('Started force file eviction')
-
-        is_sync_enabled = self._ctera_filer.sync.is_enabled()
-        if self.parameters['sync_enabled']:
-            self._ensure_sync_enabled(is_sync_enabled, messages)
+        is_cache_enabled = self._ctera_filer.cache.is_enabled()
+        if self.parameters['enabled']:
+            self.ensure_cache_enabled(self._ctera_filer, is_cache_enabled, self.parameters, messages)
         else:
-            self._ensure_sync_disabled(is_sync_enabled, messages)
-
+            self.ensure_cache_disabled(self._ctera_filer, is_cache_enabled, messages)
         ctera_common.set_result(self.ansible_module, messages)
 
-    def _ensure_cache_disabled(self, is_cache_enabled):
-        if is_cache_enabled:
-            self._ctera_filer.cache.disable()
-            self.ansible_module.ctera_return_value().changed().msg('Cloud cache was disabled')
-        else:
-            self.ansible_module.ctera_return_value().skipped().msg('Cloud cache is already disabled')
-
-    def _ensure_sync_enabled(self, is_sync_enabled, messages):
-        if is_sync_enabled:
-            messages['skipped'].append('Cloud sync was already enabled')
-        else:
-            if len(self._ctera_filer.volumes.get()) == 0:
-                messages['skipped'].append('No volumes defined - cannot enabled sync')
-                return
-            self._ctera_filer.sync.unsuspend()
-            messages['changed'].append('Cloud sync was enabled')
-
-        if self.parameters['refresh_folders']:
-            self._ctera_filer.sync.refresh()
-            messages['changed'].append('Started refreshing cloud folders')
-
-    def _ensure_sync_disabled(self, is_sync_enabled, messages):
-        if is_sync_enabled:
-            self._ctera_filer.sync.suspend()
-            messages['changed'].append('Cloud sync was disabled')
-        else:
-            messages['skipped'].append('Cloud sync was already disabled')
-
     def _handle_not_connected(self):
         self.ansible_module.ctera_return_value().msg('Filer is not connected to Cloud Services')
         if self.parameters['enabled']:
@@ -21,6 +21,7 @@ description:
     - Connect, Disconnect and Reconnect a CTERA filer to the cloud serivces
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -105,27 +106,15 @@ ctera_license:
 '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_cloud_services_base import CteraFilerCloudServicesBase
 
-try:
-    from cterasdk import CTERAException, tojsonstr, config
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
 
-
-class CteraFilerCloudServices(CteraFilerBase):
-    _connect_params = ['server', 'user', 'password', 'ctera_license']
+class CteraFilerCloudServices(CteraFilerCloudServicesBase):
 
     def __init__(self):
         super().__init__(dict(
             state=dict(required=False, choices=['connected', 'disconnected'], default='connected'),
-            server=dict(type='str', required=True),
-            user=dict(type='str', required=True),
-            password=dict(type='str', required=True, no_log=True),
-            ctera_license=dict(type='str', required=False, default='EV16', choices=['EV8', 'EV16', 'EV32', 'EV64', 'EV128']),
-            force_reconnect=dict(type='bool', required=False, default=False),
-            sso=dict(type='bool', required=False, default=False),
-            trust_certificate=dict(type='bool', required=False, default=False)
+            **CteraFilerCloudServicesBase.cloud_services_argument_spec()
         ))
 
     @property
@@ -133,9 +122,7 @@ class CteraFilerCloudServices(CteraFilerBase):
         return 'Cloud Services management failed.'
 
     def _execute(self):
-        if self.parameters['trust_certificate']:
-            config.connect['ssl'] = 'Trust'
-
+        self.configure_sdk(self.parameters)
         state = self.parameters.pop('state')
         status = self._ctera_filer.services.get_status()
         if state == 'connected':
@@ -153,54 +140,14 @@ class CteraFilerCloudServices(CteraFilerBase):
             'changed': [],
             'skipped': []
         }
-        if status.connected:
-            if not self._handle_modify(status, messages):
-                return
-        else:
-            self._do_connect()
-            messages['changed'].append('Successfully connected the Filer to the Cloud Services')
-        self._ensure_sso_state(messages)
+        error = self.ensure_connected(self._ctera_filer, status, self.parameters, messages)
         self.ansible_module.ctera_return_value().put(server=self.parameters['server'])
-        ctera_common.set_result(self.ansible_module, messages)
-
-    def _ensure_sso_state(self, messages):
-        sso_state = self._ctera_filer.services.sso_enabled()
-        if sso_state == self.parameters['sso']:
-            messages['skipped'].append("SSO already %s" % ('enabled' if sso_state else 'disabled'))
+        if error:
+            self.ansible_module.ctera_return_value().failed().msg(error)
             return
-
-        if self.parameters['sso']:
-            self._ctera_filer.services.enable_sso()
-        else:
-            self._ctera_filer.services.disable_sso()
-        messages['changed'].append("SSO was %s" % ('enabled' if self.parameters['sso'] else 'disabled'))
-
-    def _do_connect(self):
-        connect_params = {k: v for k, v in self.parameters.items() if k in CteraFilerCloudServices._connect_params}
-        self._ctera_filer.services.connect(**connect_params)
-
-    def _handle_modify(self, status, messages):
-        if self._connection_parameters_changed(status):
-            self._ctera_filer.services.disconnect()
-            try:
-                self._do_connect()
-                messages['changed'].append('Successfully modified the Filer connection to the Cloud Services')
-                self.ansible_module.ctera_return_value().put(previous_server=status.server_address)
-            except CTERAException as error:
-                self.ansible_module.ctera_return_value().failed().msg(
-                    'Failed to connect to new Cloud Services. Filer is now disconnected Exception: %s' % tojsonstr(error, False)).put(
-                        server=self.parameters['server'])
-                return False
-        else:
-            if self.parameters['force_reconnect']:
-                self._ctera_filer.services.reconnect()
-                messages['changed'].append('Successfully reconnected the Filer to the Cloud Services')
-            else:
-                messages['skipped'].append('The Filer is already connected to the Cloud Services')
-        return True
-
-    def _connection_parameters_changed(self, status):
-        return self.parameters['server'] != status.server_address
+        if status.connected and status.server_address != self.parameters['server']:
+            self.ansible_module.ctera_return_value().put(previous_server=status.server_address)
+        ctera_common.set_result(self.ansible_module, messages)
 
 
 def main():  # pragma: no cover
@@ -21,6 +21,7 @@ description:
     - Reboot the CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
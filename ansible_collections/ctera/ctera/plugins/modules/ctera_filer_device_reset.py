@@ -21,6 +21,7 @@ description:
     - Reset the CTERA-Networks filer to factory settings
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -22,6 +22,7 @@ description:
     - If you only need to change the username and or password, set force_connect to True
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
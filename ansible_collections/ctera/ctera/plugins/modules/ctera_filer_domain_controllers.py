@@ -21,6 +21,7 @@ description:
     - Set static domain controllers to be used by the CTERA Edge Filer when connecting to directory services
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -0,0 +1,186 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_facts
+short_description: Gather facts of a CTERA-Networks Filer
+description:
+    - Retrieve the configuration and state of the subsystems of the filer in a single session.
+    - The subsets are retrieved concurrently, and the duration of retrieving each subset is returned.
+extends_documentation_fragment:
+    - ctera.ctera.ctera
+    - ctera.ctera.vgateway
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  gather_subset:
+    description:
+    - List of subsets to retrieve
+    - C(all) retrieves all the subsets. A subset prefixed by C(!) is not retrieved
+    - 'Supported subsets: aio, array, cache, ftp, license, network, nfs, ntp, rsync, services, shares, smb, snmp, sync, syslog, users, volumes'
+    type: list
+    elements: str
+    default: ['all']
+  gather_workers:
+    description: Maximal number of subsets that are retrieved concurrently
+    type: int
+    default: 4
+  gather_timeout:
+    description: Number of seconds after which a subset that was not retrieved is skipped with a warning
+    type: int
+    default: 60
+'''
+
+EXAMPLES = '''
+- name: gather shares and users
+  ctera_filer_facts:
+    gather_subset:
+      - shares
+      - users
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
+
+- name: gather everything but the local users
+  ctera_filer_facts:
+    gather_subset:
+      - all
+      - '!users'
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
+'''
+
+RETURN = '''
+ansible_facts:
+  description: The retrieved subsets
+  returned: Always
+  type: dict
+  contains:
+    ctera_filer:
+      description: Dictionary of subset name to the facts of the subset
+      type: dict
+      sample:
+        ntp:
+          enabled: True
+          servers: ['0.pool.ntp.org']
+        license: EV16
+timings:
+  description: Number of seconds it took to retrieve each subset
+  returned: Always
+  type: dict
+  sample:
+    ntp: 0.081
+    license: 0.062
+'''
+
+import time
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_executor import BoundedExecutor, TaskResult
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+
+
+class CteraFilerFacts(CteraFilerBase):
+
+    def __init__(self):
+        super().__init__(dict(
+            gather_subset=dict(type='list', elements='str', required=False, default=['all']),
+            gather_workers=dict(type='int', required=False, default=4),
+            gather_timeout=dict(type='int', required=False, default=60)
+        ), supports_check_mode=True)
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Failed to gather facts'
+
+    @property
+    def _subsets(self):
+        return dict(
+            aio=lambda: dict(enabled=self._ctera_filer.aio.is_enabled()),
+            array=lambda: [ctera_filer_converters.object_to_dict(array) for array in self._ctera_filer.array.get()],
+            cache=lambda: dict(enabled=self._ctera_filer.cache.is_enabled()),
+            ftp=lambda: ctera_filer_converters.ftp_config_to_dict(self._ctera_filer.ftp.get_configuration()),
+            license=self._ctera_filer.licenses.get,
+            network=lambda: ctera_filer_converters.network_config_to_dict(self._ctera_filer.network.ifconfig().ip),
+            nfs=lambda: ctera_filer_converters.nfs_config_to_dict(self._ctera_filer.nfs.get_configuration()),
+            ntp=lambda: ctera_filer_converters.ntp_config_to_dict(self._ctera_filer.ntp.get_configuration()),
+            rsync=lambda: ctera_filer_converters.rsync_config_to_dict(self._ctera_filer.rsync.get_configuration()),
+            services=lambda: ctera_filer_converters.object_to_dict(self._ctera_filer.services.get_status()),
+            shares=lambda: [ctera_filer_converters.share_to_dict(share) for share in self._ctera_filer.shares.get()],
+            smb=lambda: ctera_filer_converters.object_to_dict(self._ctera_filer.smb.get_configuration()),
+            snmp=self._get_snmp,
+            sync=lambda: dict(enabled=self._ctera_filer.sync.is_enabled()),
+            syslog=lambda: ctera_filer_converters.syslog_config_to_dict(self._ctera_filer.syslog.get_configuration()),
+            users=lambda: [ctera_filer_converters.user_to_dict(user) for user in self._ctera_filer.users.get()],
+            volumes=lambda: [ctera_filer_converters.object_to_dict(volume) for volume in self._ctera_filer.volumes.get()]
+        )
+
+    def _execute(self):
+        subsets = self._subsets
+        selected = self._select_subsets(subsets.keys())
+        executor = BoundedExecutor(self.parameters['gather_workers'], self.parameters['gather_timeout'])
+        results = executor.run({name: self._timed(subsets[name]) for name in selected})
+        facts = {}
+        timings = {}
+        return_value = self.ansible_module.ctera_return_value()
+        for name, result in results.items():
+            if result.status == TaskResult.DONE:
+                facts[name], timings[name] = result.value
+            else:
+                return_value.warning('Failed to gather %s. %s' % (name, result.error))
+        return_value.msg('Gathered %d subsets' % len(facts)).put(ansible_facts=dict(ctera_filer=facts), timings=timings)
+
+    def _select_subsets(self, supported):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        selected = set()
+        excluded = set()
+        for subset in self.parameters['gather_subset']:
+            if subset.startswith('!'):
+                excluded.add(subset[1:])
+            elif subset == 'all':
+                selected.update(supported)
+            else:
+                selected.add(subset)
+        unsupported = (selected | excluded) - set(supported) - {'all'}
+        if unsupported:
+            raise CTERAException(message='Unsupported subsets: %s' % ', '.join(sorted(unsupported)))
+        return sorted(selected - excluded)
+
+    @staticmethod
+    def _timed(gather):
+        def timed_gather():
+            start = time.monotonic()
+            facts = gather()
+            return facts, round(time.monotonic() - start, 3)
+        return timed_gather
+
+    def _get_snmp(self):
+        snmp = ctera_filer_converters.snmp_config_to_dict(self._ctera_filer.snmp.get_configuration())
+        snmp.pop('password')
+        snmp['enabled'] = self._ctera_filer.snmp.is_enabled()
+        return snmp
+
+
+def main():  # pragma: no cover
+    CteraFilerFacts().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -22,6 +22,7 @@ description:
     - Please note that the first user cannot be modified.
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -21,6 +21,7 @@ description:
     - Enable/Disable/Modify the FTP configuration of the CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -68,21 +69,13 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
 
 
 class CteraFilerFtp(CteraFilerShareConfigBase):
     def __init__(self):
-        super().__init__(
-            dict(
-                require_ssl=dict(type='bool', required=False, default=False),
-                max_connections_per_ip=dict(type='int', required=False, default=5),
-                banner_message=dict(type='str', required=False, default='Welcome to CTERA FTP.'),
-                allow_anonymous_ftp=dict(type='bool', required=False, default=False),
-                anonymous_ftp_folder=dict(type='str', required=False),
-                anonymous_download_limit=dict(type='int', required=False, default=0),
-            )
-        )
+        super().__init__(ctera_filer_service_specs.argument_spec('ftp'))
 
     @property
     def _share_type(self):
@@ -93,15 +86,7 @@ class CteraFilerFtp(CteraFilerShareConfigBase):
         return self._ctera_filer.ftp
 
     def _to_config_dict(self, config):
-        return dict(
-            mode=config.mode,
-            allow_anonymous_ftp=config.AllowAnonymousFTP,
-            anonymous_download_limit=config.AnonymousDownloadLimit,
-            anonymous_ftp_folder=config.AnonymousFTPFolder,
-            banner_message=config.BannerMessage,
-            max_connections_per_ip=config.MaxConnectionsPerIP,
-            require_ssl=config.RequireSSL
-        )
+        return ctera_filer_service_specs.SHARE_CONFIG_SERVICES['ftp'][1](config)
 
 
 def main():  # pragma: no cover
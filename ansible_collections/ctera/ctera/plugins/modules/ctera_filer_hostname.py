@@ -21,6 +21,7 @@ description:
     - Set the hostname of  the CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -58,10 +59,10 @@ current_hostname:
   sample: AfterChange
 '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_hostname_base import CteraFilerHostnameBase
 
 
-class CteraFilerHostname(CteraFilerBase):
+class CteraFilerHostname(CteraFilerHostnameBase):
 
     def __init__(self):
         super().__init__(dict(hostname=dict(type='str', required=True)))
@@ -73,11 +74,12 @@ class CteraFilerHostname(CteraFilerBase):
     def _execute(self):
         hostname = self.parameters['hostname']
         current_hostname = self._ctera_filer.config.get_hostname()
-        if hostname != current_hostname:
-            self._ctera_filer.config.set_hostname(hostname)
-            self.ansible_module.ctera_return_value().changed().msg('Changed hostname').put(previous_hostname=current_hostname, current_hostname=hostname)
+        messages = dict(changed=[], skipped=[])
+        self.ensure_hostname(self._ctera_filer, current_hostname, hostname, messages)
+        if messages['changed']:
+            self.ansible_module.ctera_return_value().changed().msg(messages['changed'][0]).put(previous_hostname=current_hostname, current_hostname=hostname)
         else:
-            self.ansible_module.ctera_return_value().msg('No update required to the current hostname').put(current_hostname=current_hostname)
+            self.ansible_module.ctera_return_value().msg(messages['skipped'][0]).put(current_hostname=current_hostname)
 
 
 def main():  # pragma: no cover
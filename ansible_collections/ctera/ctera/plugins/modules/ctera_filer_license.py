@@ -21,6 +21,7 @@ description:
     - Apply a license on a CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -59,25 +60,25 @@ license:
   sample: EV16
 '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_license_base import CteraFilerLicenseBase
 
 
-class CteraFilerLicense(CteraFilerBase):
+class CteraFilerLicense(CteraFilerLicenseBase):
 
     def __init__(self):
-        super().__init__(dict(license=dict(type='str', required=True, choices=['EV8', 'EV16', 'EV32', 'EV64', 'EV128'])))
+        super().__init__(dict(license=dict(type='str', required=True, choices=CteraFilerLicenseBase.licenses)))
 
     @property
     def _generic_failure_message(self):  # pragma: no cover
         return 'An error occurred while trying to apply license'
 
     def _execute(self):
-        current_license = self._ctera_filer.licenses.get()
-        if current_license != self.parameters['license']:
-            self._ctera_filer.licenses.apply(self.parameters['license'])
-            self.ansible_module.ctera_return_value().changed().msg('License applied').put(license=self.parameters['license'])
+        messages = dict(changed=[], skipped=[])
+        self.ensure_license(self._ctera_filer, self._ctera_filer.licenses.get(), self.parameters['license'], messages)
+        if messages['changed']:
+            self.ansible_module.ctera_return_value().changed().msg(messages['changed'][0]).put(license=self.parameters['license'])
         else:
-            self.ansible_module.ctera_return_value().skipped().msg('License has not changed').put(license=self.parameters['license'])
+            self.ansible_module.ctera_return_value().skipped().msg(messages['skipped'][0]).put(license=self.parameters['license'])
 
 
 def main():  # pragma: no cover
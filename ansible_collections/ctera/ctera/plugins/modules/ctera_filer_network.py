@@ -21,6 +21,7 @@ description:
     - Configure the network of a CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -83,33 +84,17 @@ RETURN = r''' # '''
 
 
 from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_network_base import CteraFilerNetworkBase
 
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
 
-
-class CteraFilerNetwork(CteraFilerBase):
-    _set_static_params = ['address', 'subnet', 'gateway', 'primary_dns_server', 'secondary_dns_server']
+class CteraFilerNetwork(CteraFilerNetworkBase):
 
     def __init__(self):
         super().__init__(
-            dict(
-                mode=dict(required=False, type='str', choices=['dynamic', 'static'], default='dynamic'),
-                address=dict(type='str', required=False),
-                subnet=dict(type='str', required=False),
-                gateway=dict(type='str', required=False),
-                primary_dns_server=dict(type='str', required=False),
-                secondary_dns_server=dict(type='str', required=False)
-            ),
-            required_if=[
-                ('mode', 'static', ['address', 'subnet', 'gateway', 'primary_dns_server'])
-            ],
-            required_by=dict(
-                secondary_dns_server=['primary_dns_server']
-            )
+            CteraFilerNetworkBase.network_argument_spec(),
+            required_if=CteraFilerNetworkBase.network_required_if,
+            required_by=CteraFilerNetworkBase.network_required_by
         )
 
     @property
@@ -119,55 +104,21 @@ class CteraFilerNetwork(CteraFilerBase):
     def _execute(self):
         mode = self.parameters.pop('mode')
         config = self._get_current_config()
-        if mode == 'dynamic':
-            self._ensure_dynamic(config)
-        else:
-            self._ensure_static(config)
-
-    def _ensure_dynamic(self, config):
         messages = {
             'changed': [],
             'skipped': []
         }
-        if config['mode'] == 'dynamic':
-            messages['skipped'].append("IP addressing mode is already set to dynamic")
+        if mode == 'dynamic':
+            self.ensure_dynamic(self._ctera_filer, config, self.parameters, messages)
         else:
-            self._ctera_filer.network.enable_dhcp()
-            messages['changed'].append("IP addressing mode changed to dynamic")
-
-        if self.parameters.get('primary_dns_server'):
-            self._ensure_dns_servers(config, messages)
+            self.ensure_static(self._ctera_filer, config, self.parameters, messages)
         ctera_common.set_result(self.ansible_module, messages)
 
-    def _ensure_dns_servers(self, config, messages):
-        primary_dns_server = self.parameters['primary_dns_server']
-        secondary_dns_server = self.parameters.get('secondary_dns_server')
-        if primary_dns_server != config['primary_dns_server'] or secondary_dns_server != config['secondary_dns_server']:
-            self._ctera_filer.network.set_static_nameserver(primary_dns_server, secondary_dns_server=secondary_dns_server)
-            messages['changed'].append("DNS Servers were set")
-        else:
-            messages['skipped'].append("DNS Servers did not change")
-
-    def _ensure_static(self, config):
-        modified_attributes = ctera_common.get_modified_attributes(config, self.parameters)
-        if config['mode'] == 'static' and not modified_attributes:
-            self.ansible_module.ctera_return_value().msg("IP Configuration did not change")
-            return
-        self._ctera_filer.network.set_static_ipaddr(**ctera_common.filter_parameters(self.parameters, CteraFilerNetwork._set_static_params))
-        self.ansible_module.ctera_return_value().changed().msg("IP Configuration set")
-
     def _get_current_config(self):
         return self._to_config_dict(self._ctera_filer.network.ifconfig().ip)
 
     def _to_config_dict(self, config):
-        return dict(
-            mode='dynamic' if config.DHCPMode == gateway_enum.Mode.Enabled else 'static',
-            address=config.address,
-            subnet=config.netmask,
-            gateway=config.gateway,
-            primary_dns_server=config.DNSServer1,
-            secondary_dns_server=config.DNSServer2
-        )
+        return ctera_filer_converters.network_config_to_dict(config)
 
 
 def main():  # pragma: no cover
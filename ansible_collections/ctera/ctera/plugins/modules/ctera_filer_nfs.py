@@ -21,6 +21,7 @@ description:
     - Enable/Disable/Modify the NFS configuration of the CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -54,22 +55,13 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
 
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraFilerNfs(CteraFilerShareConfigBase):
     def __init__(self):
-        super().__init__(
-            dict(
-                async_write=dict(type='bool', required=False, default=True),
-                aggregate_writes=dict(type='bool', required=False, default=True),
-            ),
-        )
+        super().__init__(ctera_filer_service_specs.argument_spec('nfs'))
 
     @property
     def _share_type(self):
@@ -80,11 +72,7 @@ class CteraFilerNfs(CteraFilerShareConfigBase):
         return self._ctera_filer.nfs
 
     def _to_config_dict(self, config):
-        return dict(
-            mode=config.mode,
-            async_write=(getattr(config, 'async') == gateway_enum.Mode.Enabled),
-            aggregate_writes=(config.aggregateWrites == gateway_enum.Mode.Enabled),
-        )
+        return ctera_filer_service_specs.SHARE_CONFIG_SERVICES['nfs'][1](config)
 
 
 def main():  # pragma: no cover
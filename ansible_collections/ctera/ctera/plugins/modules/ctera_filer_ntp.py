@@ -21,6 +21,7 @@ description:
     - Set the NTP configuration of the CTERA Edge filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -58,22 +59,18 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_ntp_base import CteraFilerNtpBase
 
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
 
-
-class CteraFilerNtp(CteraFilerBase):
+class CteraFilerNtp(CteraFilerNtpBase):
 
     def __init__(self):
         super().__init__(
             dict(
                 state=dict(required=False, choices=['enabled', 'disabled'], default='enabled'),
-                servers=dict(type='list', elements='str', required=False)
+                **ctera_filer_service_specs.argument_spec('ntp')
             ),
             required_if=[
                 ('state', 'enabled', ['servers'])
@@ -86,30 +83,17 @@ class CteraFilerNtp(CteraFilerBase):
 
     def _execute(self):
         state = self.parameters.pop('state')
-        ntp_config = self._ctera_filer.ntp.get_configuration()
+        ntp_config = ctera_filer_converters.ntp_config_to_dict(self._ctera_filer.ntp.get_configuration())
+        messages = dict(changed=[], skipped=[])
         if state == 'enabled':
-            self._ensure_enabled(ntp_config)
-        else:
-            self._ensure_disabled(ntp_config)
-
-    def _ensure_enabled(self, ntp_config):
-        ntp_servers = self.parameters['servers']
-        if ntp_config.NTPMode == gateway_enum.Mode.Enabled:
-            if ctera_common.compare_lists(ntp_config.NTPServer, ntp_servers, False):
-                self._ctera_filer.ntp.enable(ntp_servers)
-                self.ansible_module.ctera_return_value().changed().msg('Updated NTP configuration').put(servers=ntp_servers)
-            else:
-                self.ansible_module.ctera_return_value().skipped().msg('NTP configuration did not change').put(servers=ntp_servers)
+            self.ensure_ntp_enabled(self._ctera_filer, ntp_config, self.parameters['servers'], messages)
+            self.ansible_module.ctera_return_value().put(servers=self.parameters['servers'])
         else:
-            self._ctera_filer.ntp.enable(ntp_servers)
-            self.ansible_module.ctera_return_value().changed().msg('Enabled NTP').put(servers=ntp_servers)
-
-    def _ensure_disabled(self, ntp_config):
-        if ntp_config.NTPMode == gateway_enum.Mode.Disabled:
-            self.ansible_module.ctera_return_value().skipped().msg('NTP is already disabled')
+            self.ensure_ntp_disabled(self._ctera_filer, ntp_config, messages)
+        if messages['changed']:
+            self.ansible_module.ctera_return_value().changed().msg(messages['changed'][0])
         else:
-            self._ctera_filer.ntp.disable()
-            self.ansible_module.ctera_return_value().changed().msg('Disabled NTP')
+            self.ansible_module.ctera_return_value().skipped().msg(messages['skipped'][0])
 
 
 def main():  # pragma: no cover
@@ -21,6 +21,7 @@ description:
     - Enable/Disable/Modify the RSync configuration of the CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -53,17 +54,13 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
 
 
 class CteraFilerRSync(CteraFilerShareConfigBase):
     def __init__(self):
-        super().__init__(
-            dict(
-                port=dict(type='int', required=False, default=873),
-                max_connections=dict(type='int', required=False, default=25),
-            )
-        )
+        super().__init__(ctera_filer_service_specs.argument_spec('rsync'))
 
     @property
     def _share_type(self):
@@ -75,14 +72,10 @@ class CteraFilerRSync(CteraFilerShareConfigBase):
 
     @property
     def _mode_field(self):
-        return 'server'
+        return ctera_filer_service_specs.SHARE_CONFIG_SERVICES['rsync'][0]
 
     def _to_config_dict(self, config):
-        return dict(
-            server=config.server,
-            port=config.port,
-            max_connections=config.maxConnections,
-        )
+        return ctera_filer_service_specs.SHARE_CONFIG_SERVICES['rsync'][1](config)
 
 
 def main():  # pragma: no cover
@@ -0,0 +1,441 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_services
+short_description: Manage the file and network services of the CTERA-Networks filer in a single session
+description:
+    - Configure SMB, NFS, FTP, RSync, AFP, Telnet, SNMP, Syslog and NTP in a single task.
+    - The current configuration of all the listed services is read concurrently and all the changes are computed before any of them is applied.
+    - Only the listed services and the options that are set are managed.
+extends_documentation_fragment:
+    - ctera.ctera.ctera
+    - ctera.ctera.vgateway
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  services:
+    description: The desired state of each managed service
+    type: dict
+    required: True
+    suboptions:
+      smb:
+        description: SMB configuration
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable SMB
+            type: bool
+            default: True
+          packet_signing:
+            description: Packet signing type
+            type: str
+            choices:
+              - Disabled
+              - If client agrees
+              - Required
+          idle_disconnect_time:
+            description: Client Idle Disconnect Time (minutes)
+            type: int
+          compatibility_mode:
+            description: Use compatibility mode
+            type: bool
+          unix_extensions:
+            description: Unix Extensions Mode
+            type: bool
+          abe_enabled:
+            description: Hide unreadable files and folders
+            type: bool
+      nfs:
+        description: NFS configuration
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable NFS
+            type: bool
+            default: True
+          async_write:
+            description: Use asynchronous writes
+            type: bool
+          aggregate_writes:
+            description: Aggregate write requests
+            type: bool
+      ftp:
+        description: FTP configuration
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable FTP
+            type: bool
+            default: True
+          require_ssl:
+            description: Allow only SSL/TLS connections
+            type: bool
+          max_connections_per_ip:
+            description: Maximum Connections per Client
+            type: int
+          banner_message:
+            description: FTP Banner Message
+            type: str
+          allow_anonymous_ftp:
+            description: Allow anonymous FTP downloads
+            type: bool
+          anonymous_ftp_folder:
+            description: Anonymous FTP Directory
+            type: str
+          anonymous_download_limit:
+            description: Limit download bandwidth of anonymous connection in KB/sec per connection. 0 for unlimited
+            type: int
+      rsync:
+        description: RSync configuration
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable RSync
+            type: bool
+            default: True
+          port:
+            description: RSync Port
+            type: int
+          max_connections:
+            description: Maximum Connections
+            type: int
+      afp:
+        description:
+        - AFP configuration
+        - AFP can only be disabled
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable AFP
+            type: bool
+            default: False
+      telnet:
+        description:
+        - Telnet configuration
+        - The state of the Telnet daemon cannot be read, therefore it is always reported as changed
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable Telnet
+            type: bool
+            default: True
+          code:
+            description:
+            - Telnet Authorization code
+            - Required when C(enabled=True)
+            type: str
+      snmp:
+        description: SNMP configuration
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable SNMP
+            type: bool
+            default: True
+          port:
+            description: SNMP server port
+            type: int
+          community_str:
+            description: SNMP v2c community string
+            type: str
+          username:
+            description: SNMP v3 authentication user name
+            type: str
+          password:
+            description: SNMP v3 authentication user password
+            type: str
+          update_password:
+            description: If True, the password will be updated
+            type: bool
+            default: False
+      syslog:
+        description: Syslog configuration
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable Syslog
+            type: bool
+            default: True
+          server:
+            description:
+            - Syslog server address
+            - Required when C(enabled=True) and Syslog is disabled
+            type: str
+          port:
+            description: Syslog server port
+            type: int
+          proto:
+            description: Syslog server communication protocol
+            type: str
+            choices: ['TCP', 'UDP']
+          min_severity:
+            description: Minimal log severity to report to syslog
+            type: str
+            choices: ['emergency', 'alert', 'critical', 'error', 'warning', 'notice', 'info', 'debug']
+      ntp:
+        description: NTP configuration
+        type: dict
+        suboptions:
+          enabled:
+            description: Enable NTP
+            type: bool
+            default: True
+          servers:
+            description:
+            - A list of NTP servers
+            - Required when C(enabled=True)
+            type: list
+            elements: str
+  read_workers:
+    description: Maximum number of service configurations that are read concurrently
+    type: int
+    default: 4
+  read_timeout:
+    description: Number of seconds to wait for the configuration of a single service
+    type: int
+    default: 60
+
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+- name: Branch filer services baseline
+  ctera_filer_services:
+    services:
+      smb:
+        packet_signing: 'If client agrees'
+        abe_enabled: True
+      nfs:
+        async_write: True
+      ftp:
+        enabled: False
+      rsync:
+        enabled: False
+      afp:
+        enabled: False
+      snmp:
+        port: 161
+        community_str: 'MpPcKl2sArSdTLZ4URj4'
+      syslog:
+        server: 'syslog.ctera.com'
+        min_severity: 'error'
+      ntp:
+        servers:
+          - 0.pool.ntp.org
+          - 1.pool.ntp.org
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
+'''
+
+RETURN = '''
+services:
+  description: The result of each managed service
+  returned: Always
+  type: dict
+  sample:
+    smb:
+      changed: True
+      msg: SMB configuration updated
+    ftp:
+      changed: False
+      msg: FTP already disabled
+'''
+
+import functools
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_executor import BoundedExecutor, TaskResult
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
+
+
+class CteraFilerServices(CteraFilerBase):
+    # the order in which the changes are applied
+    _services = ['smb', 'nfs', 'ftp', 'rsync', 'afp', 'telnet', 'snmp', 'syslog', 'ntp']
+    _labels = dict(smb='SMB', nfs='NFS', ftp='FTP', rsync='RSync', afp='AFP', telnet='Telnet', snmp='SNMP', syslog='Syslog', ntp='NTP')
+
+    def __init__(self):
+        super().__init__(dict(
+            services=dict(type='dict', required=True, options={
+                name: dict(type='dict', options=dict(
+                    enabled=dict(type='bool', default=name != 'afp'),  # AFP can only be disabled
+                    **ctera_filer_service_specs.argument_spec(name, defaults=False)
+                )) for name in CteraFilerServices._services
+            }),
+            read_workers=dict(type='int', required=False, default=4),
+            read_timeout=dict(type='int', required=False, default=60)
+        ))
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Failed to manage the filer services'
+
+    def _execute(self):
+        desired = {name: dict(config) for name, config in self.parameters['services'].items() if config is not None}
+        current = self._read_configurations(desired.keys())
+        plans = {name: self._plan(name, current.get(name), desired[name]) for name in self._services if name in desired}
+        results = {name: self._apply(CteraFilerServices._labels[name], actions) for name, actions in plans.items()}
+        self._set_result(results)
+
+    def _readers(self):
+        readers = {name: functools.partial(self._read_share_config, name) for name in ctera_filer_service_specs.SHARE_CONFIG_SERVICES}
+        readers.update(
+            afp=lambda: dict(enabled=not self._ctera_filer.afp.is_disabled()),
+            snmp=lambda: dict(
+                enabled=self._ctera_filer.snmp.is_enabled(),
+                **ctera_filer_converters.snmp_config_to_dict(self._ctera_filer.snmp.get_configuration())
+            ),
+            syslog=lambda: ctera_filer_converters.syslog_config_to_dict(self._ctera_filer.syslog.get_configuration()),
+            ntp=lambda: ctera_filer_converters.ntp_config_to_dict(self._ctera_filer.ntp.get_configuration())
+        )
+        return readers
+
+    def _read_share_config(self, name):
+        converter = ctera_filer_service_specs.SHARE_CONFIG_SERVICES[name][1]
+        return converter(getattr(self._ctera_filer, name).get_configuration())
+
+    def _read_configurations(self, names):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        readers = self._readers()
+        executor = BoundedExecutor(self.parameters['read_workers'], self.parameters['read_timeout'])
+        results = executor.run({name: readers[name] for name in names if name in readers})
+        failed = {name: result.error for name, result in results.items() if result.status != TaskResult.DONE}
+        if failed:
+            raise CTERAException(message='Failed to read the configuration of: %s' % ', '.join(
+                '%s (%s)' % (name, failed[name]) for name in sorted(failed)
+            ))
+        return {name: result.value for name, result in results.items()}
+
+    def _plan(self, name, current, desired):
+        ''' :return: a list of (message, action) that bring the service from the current to the desired configuration '''
+        if name in ctera_filer_service_specs.SHARE_CONFIG_SERVICES:
+            return self._plan_share_config(name, current, desired)
+        return getattr(self, '_plan_%s' % name)(current, desired)
+
+    def _plan_share_config(self, name, current, desired):
+        from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
+        mode_field = ctera_filer_service_specs.SHARE_CONFIG_SERVICES[name][0]
+        label = CteraFilerServices._labels[name]
+        manager = getattr(self._ctera_filer, name)
+        enabled = desired.pop('enabled')
+        is_enabled = current[mode_field] == gateway_enum.Mode.Enabled
+        if not enabled:
+            return [('%s disabled' % label, manager.disable)] if is_enabled else []
+        actions = []
+        enable, modified_attributes = CteraFilerShareConfigBase.plan_enable(current, desired, mode_field)
+        if enable:
+            actions.append(('%s enabled' % label, manager.enable))
+        if modified_attributes:
+            actions.append(('%s configuration updated' % label, functools.partial(manager.modify, **modified_attributes)))
+        return actions
+
+    def _plan_afp(self, current, desired):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        if desired['enabled']:
+            raise CTERAException(message='AFP can only be disabled')
+        return [('AFP disabled', self._ctera_filer.afp.disable)] if current['enabled'] else []
+
+    def _plan_telnet(self, current, desired):  # pylint: disable=unused-argument
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        if not desired['enabled']:
+            return [('Telnet disabled', self._ctera_filer.telnet.disable)]
+        if desired.get('code') is None:
+            raise CTERAException(message='Telnet code is required to enable Telnet')
+        return [('Telnet enabled', functools.partial(self._ctera_filer.telnet.enable, desired['code']))]
+
+    def _plan_snmp(self, current, desired):
+        enabled = desired.pop('enabled')
+        update_password = desired.pop('update_password')
+        if not enabled:
+            return [('SNMP disabled', self._ctera_filer.snmp.disable)] if current['enabled'] else []
+        if not current['enabled']:
+            enable_params = {k: v for k, v in desired.items() if k in ctera_filer_service_specs.ENABLE_PARAMS['snmp'] and v is not None}
+            return [('SNMP enabled', functools.partial(self._ctera_filer.snmp.enable, **enable_params))]
+        if not update_password:
+            desired.pop('password', None)
+        modified_attributes = ctera_compare.get_modified_attributes(current, desired)
+        return [('SNMP configuration updated', functools.partial(self._ctera_filer.snmp.modify, **modified_attributes))] if modified_attributes else []
+
+    def _plan_syslog(self, current, desired):
+        from cterasdk import CTERAException, gateway_enum  # pylint: disable=import-outside-toplevel
+        enabled = desired.pop('enabled')
+        is_enabled = current['mode'] == gateway_enum.Mode.Enabled
+        if not enabled:
+            return [('Syslog disabled', self._ctera_filer.syslog.disable)] if is_enabled else []
+        if not is_enabled:
+            if desired.get('server') is None:
+                raise CTERAException(message='Syslog server is required to enable Syslog')
+            enable_params = {k: v for k, v in desired.items() if k in ctera_filer_service_specs.ENABLE_PARAMS['syslog'] and v is not None}
+            return [('Syslog enabled', functools.partial(self._ctera_filer.syslog.enable, **enable_params))]
+        modified_attributes = ctera_compare.get_modified_attributes(current, desired)
+        return [('Syslog configuration updated', functools.partial(self._ctera_filer.syslog.modify, **modified_attributes))] if modified_attributes else []
+
+    def _plan_ntp(self, current, desired):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        if not desired['enabled']:
+            return [('NTP disabled', self._ctera_filer.ntp.disable)] if current['enabled'] else []
+        servers = desired.get('servers')
+        if servers is None:
+            raise CTERAException(message='NTP servers are required to enable NTP')
+        if not current['enabled']:
+            return [('NTP enabled', functools.partial(self._ctera_filer.ntp.enable, servers))]
+        if ctera_compare.compare_lists(current['servers'] or [], servers, False):
+            return [('NTP configuration updated', functools.partial(self._ctera_filer.ntp.enable, servers))]
+        return []
+
+    @staticmethod
+    def _apply(label, actions):
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
+        if not actions:
+            return dict(changed=False, msg='%s configuration did not change' % label)
+        messages = []
+        for message, action in actions:
+            try:
+                action()
+            except CTERAException as error:
+                messages.append('Failed: %s. Exception: %s' % (message, tojsonstr(error, False)))
+                return dict(changed=len(messages) > 1, failed=True, msg=', '.join(messages))
+            messages.append(message)
+        return dict(changed=True, msg=', '.join(messages))
+
+    def _set_result(self, results):
+        changed = [name for name in self._services if name in results and results[name]['changed']]
+        failed = [name for name in self._services if name in results and results[name].get('failed')]
+        return_value = self.ansible_module.ctera_return_value().put(services=results)
+        if changed:
+            return_value.changed()
+        if failed:
+            return_value.failed().msg('Failed to manage services: %s' % ', '.join(failed))
+        elif changed:
+            return_value.msg('Changed services: %s' % ', '.join(changed))
+        else:
+            return_value.skipped().msg('Services did not change')
+
+
+def main():  # pragma: no cover
+    CteraFilerServices().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -22,6 +22,7 @@ description:
     - This module does not handle the creation of the directory and share creation will fail if the directory does not exist
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -69,6 +70,17 @@ options:
         - ReadOnly
         - None
         required: True
+  acl_mode:
+    description:
+    - How a modified C(acl) is applied to an existing share
+    - C(replace) rewrites the entire access control list of the share
+    - C(incremental) only adds and removes the entries that differ from the current access control list,
+      leaving other entries untouched. Principal names are compared case insensitively
+    - The filer only sets the entire access control list of a share. C(incremental) writes the merged list
+      with a single request that carries the access control list alone, without reading it again
+    type: str
+    choices: ['replace', 'incremental']
+    default: 'replace'
   access:
     description: The Windows File Sharing authentication mode
     type: str
@@ -136,6 +148,19 @@ options:
         - ReadWrite
         - ReadOnly
         - None
+  trusted_nfs_clients_mode:
+    description:
+    - How a modified C(trusted_nfs_clients) is applied to an existing share
+    - C(replace) rewrites the entire list of trusted NFS clients of the share
+    - C(incremental) only adds and removes the entries that differ from the current list, by address and netmask,
+      leaving other entries and the clients that use them untouched.
+      Entries with the same permission whose subnets overlap or are adjacent are collapsed before they are compared,
+      and before a new share is created with them
+    - The filer only sets the entire list of trusted NFS clients of a share. C(incremental) writes the merged list
+      with a single request that carries the list alone, without reading it again
+    type: str
+    choices: ['replace', 'incremental']
+    default: 'replace'
 
 '''
 
@@ -153,6 +178,29 @@ EXAMPLES = r'''
     ctera_host: "{{ ctera_filer_hostname }}"
     ctera_user: "{{ ctera_filer_user }}"
     ctera_password: "{{ ctera_filer_password }}"
+
+- name: grant a single principal access without rewriting the entire access control list
+  ctera_filer_share:
+    name: demo
+    acl_mode: incremental
+    acl:
+      - { name: 'Everyone', principal_type: 'LocalGroup', perm: 'ReadOnly' }
+      - { name: 'CTERA\Support', principal_type: 'DomainGroup', perm: 'ReadWrite' }
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
+
+- name: trust an additional NFS client subnet without rewriting the other entries
+  ctera_filer_share:
+    name: demo
+    trusted_nfs_clients_mode: incremental
+    trusted_nfs_clients:
+      - { address: '192.168.0.0', netmask: '255.255.254.0', perm: 'ReadWrite' }
+      - { address: '192.168.1.0', netmask: '255.255.255.0', perm: 'ReadWrite' }  # collapsed into 192.168.0.0/23
+      - { address: 'backup.example.com', netmask: '255.255.255.255', perm: 'ReadOnly' }
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
 '''
 
 RETURN = '''
@@ -164,70 +212,22 @@ name:
 '''
 
 
-import os
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_base import CteraFilerShareBase
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
 
-try:
-    from cterasdk import CTERAException, gateway_enum, gateway_types
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
-
-class CteraFilerShare(CteraFilerBase):
-    _add_params = [
-        'name',
-        'directory',
-        'acl',
-        'access',
-        'csc',
-        'dir_permissions',
-        'comment',
-        'export_to_afp',
-        'export_to_ftp',
-        'export_to_nfs',
-        'export_to_pc_agent',
-        'export_to_rsync',
-        'indexed',
-        'trusted_nfs_clients'
-    ]
+class CteraFilerShare(CteraFilerShareBase):
 
     def __init__(self):
         super().__init__(dict(
             state=dict(required=False, choices=['present', 'absent'], default='present'),
-            name=dict(type='str', required=True),
-            directory=dict(type='str', required=False),
-            acl=dict(
-                type='list',
-                required=False,
-                elements='dict',
-                options=dict(
-                    principal_type=dict(required=True, choices=['LocalUser', 'LocalGroup', 'DomainUser', 'DomainGroup']),
-                    name=dict(required=True),
-                    perm=dict(required=True, choices=['ReadWrite', 'ReadOnly', 'None']),
-                )
-            ),
-            access=dict(required=False, choices=['winAclMode', 'authenticated'], default='winAclMode'),
-            csc=dict(required=False, choices=['manual', 'documents', 'disabled'], default='manual'),
-            dir_permissions=dict(required=False, type='int', default=777),
-            comment=dict(type='str', required=False),
-            export_to_afp=dict(type='bool', required=False, default=False),
-            export_to_ftp=dict(type='bool', required=False, default=False),
-            export_to_nfs=dict(type='bool', required=False, default=False),
-            export_to_pc_agent=dict(type='bool', required=False, default=False),
-            export_to_rsync=dict(type='bool', required=False, default=False),
-            indexed=dict(type='bool', required=False, default=False),
-            trusted_nfs_clients=dict(
-                type='list',
-                elements='dict',
-                options=dict(
-                    address=dict(required=True),
-                    netmask=dict(required=True),
-                    perm=dict(required=True, choices=['ReadWrite', 'ReadOnly', 'None']),
-                )
-            )
+            acl_mode=dict(required=False, choices=['replace', 'incremental'], default='replace'),
+            trusted_nfs_clients_mode=dict(required=False, choices=['replace', 'incremental'], default='replace'),
+            **CteraFilerShareBase.share_argument_spec()
         ))
+        self._acl_mode = 'replace'
+        self._trusted_nfs_clients_mode = 'replace'
 
     @property
     def _generic_failure_message(self):  # pragma: no cover
@@ -235,6 +235,10 @@ class CteraFilerShare(CteraFilerBase):
 
     def _execute(self):
         state = self.parameters.pop('state')
+        self._acl_mode = self.parameters.pop('acl_mode', 'replace')
+        self._trusted_nfs_clients_mode = self.parameters.pop('trusted_nfs_clients_mode', 'replace')
+        if self._trusted_nfs_clients_mode == 'incremental' and self.parameters.get('trusted_nfs_clients') is not None:
+            self.parameters['trusted_nfs_clients'] = self._collapse_trusted_nfs_clients(self.parameters['trusted_nfs_clients'])
         share = self._get_share()
         if state == 'present':
             self._ensure_present(share)
@@ -242,13 +246,14 @@ class CteraFilerShare(CteraFilerBase):
             self._ensure_absent(share)
 
     def _get_share(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         share = None
         try:
             share = self._ctera_filer.shares.get(name=self.parameters['name'])
         except CTERAException as error:
             if error.response.code != 404:  # pylint: disable=no-member
                 raise
-        return self._to_share_dict(share) if share else None
+        return ctera_filer_converters.share_to_dict(share) if share else None
 
     def _ensure_present(self, share):
         if share:
@@ -257,32 +262,50 @@ class CteraFilerShare(CteraFilerBase):
             self._add_share()
 
     def _add_share(self):
-        add_params = {k: v for k, v in self.parameters.items() if k in CteraFilerShare._add_params}
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        add_params = {k: v for k, v in self.parameters.items() if k in CteraFilerShareBase.add_params}
         if add_params.get('directory') is None:
             raise CTERAException(message="Cannot create new share without a directory")
-        if add_params.get('acl') is not None:
-            add_params['acl'] = [self._make_ShareAccessControlEntry(acl_entry) for acl_entry in add_params['acl']]
-        if add_params.get('trusted_nfs_clients') is not None:
-            add_params['trusted_nfs_clients'] = [
-                self._make_NFSv3AccessControlEntry(trusted_nfs_clients_entry) for trusted_nfs_clients_entry in add_params['trusted_nfs_clients']
-            ]
-        self._ctera_filer.shares.add(**add_params)
+        self._ctera_filer.shares.add(**self.to_share_params(add_params))
         self.ansible_module.ctera_return_value().changed().msg('Share created').put(name=self.parameters['name'])
 
     def _handle_modify(self, share):
-        modified_attributes = ctera_common.get_modified_attributes(share, self.parameters)
+        modified_attributes = self.get_modified_share_attributes(share, self.parameters)
+        incremental_changes = False
+        if self._acl_mode == 'incremental' and 'acl' in modified_attributes:
+            self._update_acl(share['acl'], modified_attributes.pop('acl'))
+            incremental_changes = True
+        if self._trusted_nfs_clients_mode == 'incremental' and 'trusted_nfs_clients' in modified_attributes:
+            self._update_trusted_nfs_clients(share['trusted_nfs_clients'], modified_attributes.pop('trusted_nfs_clients'))
+            incremental_changes = True
         if modified_attributes:
-            if modified_attributes.get('acl') is not None:
-                modified_attributes['acl'] = [self._make_ShareAccessControlEntry(acl_entry) for acl_entry in modified_attributes['acl']]
-            if modified_attributes.get('trusted_nfs_clients') is not None:
-                modified_attributes['trusted_nfs_clients'] = [
-                    self._make_NFSv3AccessControlEntry(trusted_nfs_clients_entry) for trusted_nfs_clients_entry in modified_attributes['trusted_nfs_clients']
-                ]
-            self._ctera_filer.shares.modify(self.parameters['name'], **modified_attributes)
+            self._ctera_filer.shares.modify(self.parameters['name'], **self.to_share_params(modified_attributes))
+        if modified_attributes or incremental_changes:
             self.ansible_module.ctera_return_value().changed().msg('Share modified').put(name=self.parameters['name'])
         else:
             self.ansible_module.ctera_return_value().skipped().msg('Share details did not change').put(name=self.parameters['name'])
 
+    def _update_acl(self, current_acl, desired_acl):
+        acl = self._merge_list(current_acl, desired_acl, ignore_case=True)
+        self._ctera_filer.shares.set_acl(self.parameters['name'], [self._make_ShareAccessControlEntry(acl_entry) for acl_entry in acl])
+
+    def _update_trusted_nfs_clients(self, current_clients, desired_clients):
+        clients = self._merge_list(current_clients, desired_clients)
+        self._ctera_filer.shares.set_trusted_nfs_clients(self.parameters['name'], [self._make_NFSv3AccessControlEntry(entry) for entry in clients])
+
+    @staticmethod
+    def _merge_list(current, desired, ignore_case=False):
+        '''
+        The filer only sets the entire list of a share, and the per-entry operations of the SDK read and write it back as well.
+        So the added entries are appended to the current entries that are kept, and the list is written once.
+
+        :param bool ignore_case: compare the entries case insensitively, as the diff does
+        :return: the current entries that are not removed, in their order, followed by the added entries
+        '''
+        diff = ctera_compare.diff_lists(current, desired, ignore_case=ignore_case)
+        removed = {ctera_compare.hashable_key(entry, ignore_case) for entry in diff.removed}
+        return [entry for entry in current if ctera_compare.hashable_key(entry, ignore_case) not in removed] + diff.added
+
     def _ensure_absent(self, share):
         if share:
             self._ctera_filer.shares.delete(self.parameters['name'])
@@ -290,60 +313,6 @@ class CteraFilerShare(CteraFilerBase):
         else:
             self.ansible_module.ctera_return_value().skipped().msg('Share does not exist').put(name=self.parameters['name'])
 
-    @staticmethod
-    def _make_ShareAccessControlEntry(acl_dict):
-        return gateway_types.ShareAccessControlEntry(principal_type=acl_dict['principal_type'], name=acl_dict['name'], perm=acl_dict['perm'])
-
-    @staticmethod
-    def _make_NFSv3AccessControlEntry(trusted_nfs_clients_dict):
-        return gateway_types.NFSv3AccessControlEntry(
-            address=trusted_nfs_clients_dict['address'],
-            netmask=trusted_nfs_clients_dict['netmask'],
-            perm=trusted_nfs_clients_dict['perm']
-        )
-
-    @staticmethod
-    def _to_share_dict(share_obj):
-        share_dict = {}
-        share_dict['name'] = share_obj.name
-        share_dict['directory'] = os.path.join(share_obj.volume, share_obj.directory[1:])
-        share_dict['acl'] = [CteraFilerShare._to_acl_dict(acl_entry) for acl_entry in share_obj.acl]
-        share_dict['access'] = share_obj.access
-        share_dict['csc'] = share_obj.clientSideCaching
-        share_dict['dir_permissions'] = share_obj.dirPermissions
-        share_dict['comment'] = share_obj.comment
-        share_dict['export_to_afp'] = share_obj.exportToAFP
-        share_dict['export_to_ftp'] = share_obj.exportToFTP
-        share_dict['export_to_nfs'] = share_obj.exportToNFS
-        share_dict['export_to_pc_agent'] = share_obj.exportToPCAgent
-        share_dict['export_to_rsync'] = share_obj.exportToRSync
-        share_dict['indexed'] = share_obj.indexed
-        share_dict['trusted_nfs_clients'] = [
-            CteraFilerShare._to_trusted_nfs_clients_dict(trusted_nfs_clients_entry) for trusted_nfs_clients_entry in share_obj.trustedNFSClients
-        ]
-        return share_dict
-
-    @staticmethod
-    def _to_acl_dict(acl_obj):
-        acl_dict = {}
-        acl_dict['perm'] = acl_obj.permissions.allowedFileAccess
-        acl_dict['principal_type'] = acl_obj.principal2._classname  # pylint: disable=protected-access
-        if acl_dict['principal_type'] in [gateway_enum.PrincipalType.LU, gateway_enum.PrincipalType.LG]:
-            name = acl_obj.principal2.ref
-            name = name[name.rfind('#') + 1:]
-        else:
-            name = acl_obj.principal2.name
-        acl_dict['name'] = name
-        return acl_dict
-
-    @staticmethod
-    def _to_trusted_nfs_clients_dict(trusted_nfs_clients_obj):
-        return {
-            'address': trusted_nfs_clients_obj.address,
-            'netmask': trusted_nfs_clients_obj.netmask,
-            'perm': trusted_nfs_clients_obj.accessLevel
-        }
-
 
 def main():  # pragma: no cover
     CteraFilerShare().run()
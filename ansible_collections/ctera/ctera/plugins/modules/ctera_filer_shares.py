@@ -0,0 +1,270 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_shares
+short_description: CTERA Filer bulk share configuration and management
+description:
+    - Reconcile the shares of the filer with a list of desired shares.
+    - All the shares are retrieved in a single call and only the required add, modify and delete calls are issued, in a single session.
+    - This module does not handle the creation of the directories and share creation will fail if the directory does not exist
+extends_documentation_fragment:
+    - ctera.ctera.ctera
+    - ctera.ctera.vgateway
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  shares:
+    description: List of desired shares
+    type: list
+    elements: dict
+    required: True
+    suboptions:
+      state:
+        description:
+        - Whether the specified share should exist or not.
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+      name:
+        description: The name of the share
+        required: True
+        type: str
+      directory:
+        description:
+        - The directory to share
+        - Required when C(state=present) and the share does not exist
+        type: str
+      acl:
+        description: List of Access Control Entries
+        type: list
+        elements: dict
+        suboptions:
+          principal_type:
+            description: The principal type
+            type: str
+            choices:
+            - LocalUser
+            - LocalGroup
+            - DomainUser
+            - DomainGroup
+            required: True
+          name:
+            description: The name of the user or group
+            type: str
+            required: True
+          perm:
+            description: The file access permission
+            type: str
+            choices:
+            - ReadWrite
+            - ReadOnly
+            - None
+            required: True
+      access:
+        description: The Windows File Sharing authentication mode
+        type: str
+        choices:
+        - winAclMode
+        - authenticated
+        default: winAclMode
+      csc:
+        description: The client side caching (offline files) configuration
+        type: str
+        choices:
+        - manual
+        - documents
+        - disabled
+        default: manual
+      dir_permissions:
+        description: Directory Permission
+        type: int
+        default: 777
+      export_to_afp:
+        description: Export the share to AFP
+        type: bool
+        default: False
+      export_to_ftp:
+        description: Export the share to FTP
+        type: bool
+        default: False
+      export_to_nfs:
+        description: Export the share to NFS
+        type: bool
+        default: False
+      export_to_pc_agent:
+        description: Export the share to PC Agent
+        type: bool
+        default: False
+      export_to_rsync:
+        description: Export the share to RSync
+        type: bool
+        default: False
+      indexed:
+        description: Enabled indexing
+        type: bool
+        default: False
+      comment:
+        description: Comment
+        type: str
+      trusted_nfs_clients:
+        description: Trusted NFS v3 clients
+        type: list
+        elements: dict
+        suboptions:
+          address:
+            description: IP address, hostname or fully qualified domain name of client machine
+            type: str
+            required: True
+          netmask:
+            description: Subnet mask
+            type: str
+            required: True
+          perm:
+            description: File access permission
+            type: str
+            required: True
+            choices:
+            - ReadWrite
+            - ReadOnly
+            - None
+  exclusive:
+    description: Delete the existing shares that are not listed in I(shares)
+    type: bool
+    default: False
+'''
+
+EXAMPLES = r'''
+- name: reconcile shares
+  ctera_filer_shares:
+    shares:
+      - name: demo
+        directory: /main/public/demo
+        acl:
+          - { name: 'Everyone', principal_type: 'LocalGroup', perm: 'ReadWrite' }
+        access: authenticated
+      - name: old
+        state: absent
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
+
+- name: remove every share that is not listed
+  ctera_filer_shares:
+    shares: "{{ filer_shares }}"
+    exclusive: True
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
+'''
+
+RETURN = '''
+shares:
+  description: The result of each managed share
+  returned: Always
+  type: list
+  elements: dict
+  sample:
+    - name: demo
+      changed: True
+      msg: Share created
+    - name: old
+      changed: False
+      msg: Share does not exist
+'''
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_base import CteraFilerShareBase
+
+
+class CteraFilerShares(CteraFilerShareBase):
+
+    def __init__(self):
+        share_options = CteraFilerShareBase.share_argument_spec()
+        share_options['state'] = dict(required=False, choices=['present', 'absent'], default='present')
+        super().__init__(dict(
+            shares=dict(type='list', required=True, elements='dict', options=share_options),
+            exclusive=dict(type='bool', required=False, default=False)
+        ))
+        self._reject_duplicate_shares()
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Share management failed'
+
+    def _reject_duplicate_shares(self):
+        duplicates = ctera_common.get_duplicates(share['name'] for share in self.parameters['shares'])
+        if duplicates:
+            self.ansible_module.fail_json(msg='Shares are listed more than once: %s' % ', '.join(duplicates))
+
+    def _execute(self):
+        current_shares = self._get_shares()
+        results = []
+        for desired_share in self.parameters['shares']:
+            desired_share = ctera_common.get_parameters(desired_share)
+            state = desired_share.pop('state')
+            share = current_shares.pop(desired_share['name'], None)
+            if state == 'present':
+                results.append(self._run_share_operation(desired_share['name'], self._ensure_present, share, desired_share))
+            else:
+                results.append(self._run_share_operation(desired_share['name'], self._ensure_absent, share, desired_share['name']))
+        if self.parameters['exclusive']:
+            for name, share in current_shares.items():
+                results.append(self._run_share_operation(name, self._ensure_absent, share, name))
+        self._set_result(results)
+
+    def _get_shares(self):
+        return {share.name: ctera_filer_converters.share_to_dict(share) for share in self._ctera_filer.shares.get()}
+
+    @staticmethod
+    def _run_share_operation(name, operation, *args):
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
+        try:
+            changed, msg = operation(*args)
+            return dict(name=name, changed=changed, msg=msg)
+        except CTERAException as error:
+            return dict(name=name, changed=False, failed=True, msg='Share management failed. Exception: %s' % tojsonstr(error, False))
+
+    def _ensure_present(self, share, desired_share):
+        return self.ensure_share_present(self._ctera_filer, share, desired_share)
+
+    def _ensure_absent(self, share, name):
+        return self.ensure_share_absent(self._ctera_filer, share, name)
+
+    def _set_result(self, results):
+        changed = [result['name'] for result in results if result['changed']]
+        failed = [result['name'] for result in results if result.get('failed')]
+        return_value = self.ansible_module.ctera_return_value().put(shares=results)
+        if changed:
+            return_value.changed()
+        if failed:
+            return_value.failed().msg('Failed to manage shares: %s' % ', '.join(failed))
+        elif changed:
+            return_value.msg('Changed shares: %s' % ', '.join(changed))
+        else:
+            return_value.skipped().msg('Shares did not change')
+
+
+def main():  # pragma: no cover
+    CteraFilerShares().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
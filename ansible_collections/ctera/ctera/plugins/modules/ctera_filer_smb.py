@@ -21,6 +21,7 @@ description:
     - Enable/Disable/Modify the SMB configuration of the CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -70,25 +71,13 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_config_base import CteraFilerShareConfigBase
 
 
 class CteraFilerSmb(CteraFilerShareConfigBase):
     def __init__(self):
-        super().__init__(
-            dict(
-                packet_signing=dict(
-                    type='str',
-                    required=False,
-                    default='Disabled',
-                    choices=['Disabled', 'If client agrees', 'Required']
-                ),
-                idle_disconnect_time=dict(type='int', required=False, default=10),
-                compatibility_mode=dict(type='bool', required=False, default=False),
-                unix_extensions=dict(type='bool', required=False, default=True),
-                abe_enabled=dict(type='bool', required=False, default=False),
-            ),
-        )
+        super().__init__(ctera_filer_service_specs.argument_spec('smb'))
 
     @property
     def _share_type(self):
@@ -99,7 +88,7 @@ class CteraFilerSmb(CteraFilerShareConfigBase):
         return self._ctera_filer.smb
 
     def _to_config_dict(self, config):
-        return {k: v for k, v in config.__dict__.items() if not k.startswith("_")}
+        return ctera_filer_service_specs.SHARE_CONFIG_SERVICES['smb'][1](config)
 
 
 def main():  # pragma: no cover
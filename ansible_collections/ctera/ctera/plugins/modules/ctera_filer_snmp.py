@@ -21,6 +21,7 @@ description:
     - Enable or Disable SNMP.
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -77,21 +78,17 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
 
 
 class CteraFilerSNMP(CteraFilerBase):
-    _enable_params = ['port', 'community_str', 'username', 'password']
-
     def __init__(self):
         super().__init__(dict(
             enabled=dict(type='bool', required=False, default=True),
-            port=dict(type='int', required=False),
-            community_str=dict(type='str', required=False),
-            username=dict(type='str', required=False),
-            password=dict(type='str', required=False, no_log=True),
-            update_password=dict(type='bool', default=False, no_log=True)
+            **ctera_filer_service_specs.argument_spec('snmp')
         ))
 
     @property
@@ -106,14 +103,14 @@ class CteraFilerSNMP(CteraFilerBase):
             if snmp_enabled:
                 if not update_password:
                     self.parameters.pop('password', None)
-                modified_attributes = ctera_common.get_modified_attributes(self._get_snmp_config(), self.parameters)
+                modified_attributes = ctera_compare.get_modified_attributes(self._get_snmp_config(), self.parameters)
                 if modified_attributes:
                     self._ctera_filer.snmp.modify(**modified_attributes)
                     self.ansible_module.ctera_return_value().changed().msg('Modified SNMP configuration')
                 else:
                     self.ansible_module.ctera_return_value().skipped().msg("No change made to the SNMP configuration")
             else:
-                enable_params = {k: v for k, v in self.parameters.items() if k in CteraFilerSNMP._enable_params}
+                enable_params = {k: v for k, v in self.parameters.items() if k in ctera_filer_service_specs.ENABLE_PARAMS['snmp']}
                 self._ctera_filer.snmp.enable(**enable_params)
                 self.ansible_module.ctera_return_value().changed().msg('Enabled SNMP')
         else:
@@ -124,13 +121,7 @@ class CteraFilerSNMP(CteraFilerBase):
                 self.ansible_module.ctera_return_value().skipped().msg("SNMP is already disabled")
 
     def _get_snmp_config(self):
-        snmp_config = self._ctera_filer.snmp.get_configuration()
-        return dict(
-            port=snmp_config.port,
-            community_str=snmp_config.readCommunity,
-            username=snmp_config.snmpV3.username if snmp_config.snmpV3 is not None else None,
-            password=snmp_config.snmpV3.password if snmp_config.snmpV3 is not None else None
-        )
+        return ctera_filer_converters.snmp_config_to_dict(self._ctera_filer.snmp.get_configuration())
 
 
 def main():  # pragma: no cover
@@ -0,0 +1,555 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_state
+short_description: Bring a CTERA-Networks filer to a desired state in a single session
+description:
+    - Reconcile the hostname, timezone, NTP, cloud services, license, users, volumes, shares, cloud cache and network of the filer
+      from a single desired state document.
+    - The sections are applied in dependency order. Sections that do not depend on each other are applied concurrently.
+    - Volumes and users are applied before shares, cloud services before the license and the cloud cache,
+      and the network is applied last, since changing the IP configuration may drop the session.
+    - A section whose dependency failed is skipped.
+    - Only the listed sections are managed. Users, volumes and shares are created, modified or deleted according to their I(state),
+      with the same logic as the M(ctera_filer_users), M(ctera_filer_volume) and M(ctera_filer_shares) modules.
+    - The first user of the filer is not created by this module. Run M(ctera_filer_first_user) before it on a new filer.
+extends_documentation_fragment:
+    - ctera.ctera.ctera
+    - ctera.ctera.vgateway
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  desired_state:
+    description: The desired state of the filer
+    type: dict
+    required: True
+    suboptions:
+      hostname:
+        description: The hostname of the filer
+        type: str
+      timezone:
+        description: The timezone of the filer
+        type: str
+      ntp_servers:
+        description: List of NTP servers. NTP is enabled if it is disabled
+        type: list
+        elements: str
+      cloud_services:
+        description: Connection to the CTERA Portal
+        type: dict
+        suboptions:
+          server:
+            description: Address of the Portal
+            type: str
+            required: True
+          user:
+            description: User for the Portal connection
+            type: str
+            required: True
+          password:
+            description: Password of the user
+            type: str
+            required: True
+          ctera_license:
+            description: CTERA License
+            type: str
+            choices: ['EV8', 'EV16', 'EV32', 'EV64', 'EV128']
+            default: 'EV16'
+          force_reconnect:
+            description: Reconnect to the Portal if the connection details have not changed
+            type: bool
+            default: False
+          sso:
+            description: Whether to enable SSO
+            type: bool
+            default: False
+          trust_certificate:
+            description: Trust the Portal certificate
+            type: bool
+            default: False
+      license:
+        description: The license of the filer
+        type: str
+        choices: ['EV8', 'EV16', 'EV32', 'EV64', 'EV128']
+      users:
+        description: List of local users
+        type: list
+        elements: dict
+        suboptions:
+          username:
+            description: The name of the user
+            type: str
+            required: True
+          state:
+            description: Whether the user should exist or not
+            type: str
+            choices: ['present', 'absent']
+            default: 'present'
+          password:
+            description:
+            - The password of the user
+            - Required when the user does not exist
+            type: str
+          full_name:
+            description: The full name of the user
+            type: str
+          email:
+            description: The e-mail address of the user
+            type: str
+          uid:
+            description: ID for the user
+            type: str
+      volumes:
+        description: List of volumes
+        type: list
+        elements: dict
+        suboptions:
+          name:
+            description: Name of the volume
+            type: str
+            required: True
+          state:
+            description: Whether the volume should exist or not
+            type: str
+            choices: ['present', 'absent']
+            default: 'present'
+          size:
+            description: Size of the volume
+            type: int
+          filesystem:
+            description: Filesystem type
+            type: str
+          device:
+            description: Name of the device to use for the volume
+            type: str
+          passphrase:
+            description: Passphrase for the volume
+            type: str
+      shares:
+        description: List of shares
+        type: list
+        elements: dict
+        suboptions:
+          name:
+            description: The name of the share
+            required: True
+            type: str
+          state:
+            description: Whether the share should exist or not
+            type: str
+            choices: ['present', 'absent']
+            default: 'present'
+          directory:
+            description:
+            - The directory to share
+            - Required when the share does not exist
+            type: str
+          acl:
+            description: List of Access Control Entries
+            type: list
+            elements: dict
+            suboptions:
+              principal_type:
+                description: The principal type
+                type: str
+                choices:
+                - LocalUser
+                - LocalGroup
+                - DomainUser
+                - DomainGroup
+                required: True
+              name:
+                description: The name of the user or group
+                type: str
+                required: True
+              perm:
+                description: The file access permission
+                type: str
+                choices:
+                - ReadWrite
+                - ReadOnly
+                - None
+                required: True
+          access:
+            description: The Windows File Sharing authentication mode
+            type: str
+            choices:
+            - winAclMode
+            - authenticated
+            default: winAclMode
+          csc:
+            description: The client side caching (offline files) configuration
+            type: str
+            choices:
+            - manual
+            - documents
+            - disabled
+            default: manual
+          dir_permissions:
+            description: Directory Permission
+            type: int
+            default: 777
+          export_to_afp:
+            description: Export the share to AFP
+            type: bool
+            default: False
+          export_to_ftp:
+            description: Export the share to FTP
+            type: bool
+            default: False
+          export_to_nfs:
+            description: Export the share to NFS
+            type: bool
+            default: False
+          export_to_pc_agent:
+            description: Export the share to PC Agent
+            type: bool
+            default: False
+          export_to_rsync:
+            description: Export the share to RSync
+            type: bool
+            default: False
+          indexed:
+            description: Enabled indexing
+            type: bool
+            default: False
+          comment:
+            description: Comment
+            type: str
+          trusted_nfs_clients:
+            description: Trusted NFS v3 clients
+            type: list
+            elements: dict
+            suboptions:
+              address:
+                description: IP address, hostname or fully qualified domain name of client machine
+                type: str
+                required: True
+              netmask:
+                description: Subnet mask
+                type: str
+                required: True
+              perm:
+                description: File access permission
+                type: str
+                required: True
+                choices:
+                - ReadWrite
+                - ReadOnly
+                - None
+      cloud_cache:
+        description: Cloud cache and cloud sync
+        type: dict
+        suboptions:
+          enabled:
+            description: Whether the cloud cache is enabled
+            type: bool
+            default: True
+          sync_enabled:
+            description: Whether cloud sync is enabled. Ignored when the cloud cache is disabled
+            type: bool
+            default: True
+          force_eviction:
+            description: Force the execution of the file eviction process
+            type: bool
+            default: False
+          refresh_folders:
+            description: Whether to execute refresh folders
+            type: bool
+            default: False
+      network:
+        description: IP configuration
+        type: dict
+        suboptions:
+          mode:
+            description: IP addressing mode
+            type: str
+            choices: ['dynamic', 'static']
+            default: 'dynamic'
+          address:
+            description: Static IP address
+            type: str
+          subnet:
+            description: Subnet mask
+            type: str
+          gateway:
+            description: Default gateway
+            type: str
+          primary_dns_server:
+            description: Primary DNS server
+            type: str
+          secondary_dns_server:
+            description:
+            - Secondary DNS server
+            - Requires I(primary_dns_server)
+            type: str
+  workers:
+    description: Maximum number of sections that are applied concurrently
+    type: int
+    default: 4
+  step_timeout:
+    description: Number of seconds to wait for a single section
+    type: int
+    default: 600
+
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+- name: Bootstrap a branch filer
+  ctera_filer_state:
+    desired_state:
+      hostname: branch-01
+      timezone: '(GMT-05:00) Eastern Time (US , Canada)'
+      ntp_servers:
+        - 0.pool.ntp.org
+      cloud_services:
+        server: portal.ctera.com
+        user: service
+        password: "{{ portal_service_password }}"
+      license: EV32
+      volumes:
+        - name: main
+      users:
+        - username: alice
+          password: "{{ alice_password }}"
+        - username: bob
+          state: absent
+      shares:
+        - name: public
+          directory: /main/public
+          acl:
+            - { name: 'alice', principal_type: 'LocalUser', perm: 'ReadWrite' }
+      cloud_cache:
+        enabled: True
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
+'''
+
+RETURN = '''
+steps:
+  description: The result of each managed section
+  returned: Always
+  type: dict
+  sample:
+    volumes:
+      status: done
+      changed: True
+      msg: 'main: Volume created'
+      elapsed: 1.208
+    shares:
+      status: skipped
+      changed: False
+      msg: Skipped since volumes did not complete
+      elapsed: null
+elapsed:
+  description: Number of seconds it took to apply all the sections
+  returned: Always
+  type: float
+  sample: 3.517
+'''
+
+import time
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_executor import DependencyExecutor, set_step_results, timed
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_cloud_cache_base import CteraFilerCloudCacheBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_cloud_services_base import CteraFilerCloudServicesBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_hostname_base import CteraFilerHostnameBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_license_base import CteraFilerLicenseBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_network_base import CteraFilerNetworkBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_ntp_base import CteraFilerNtpBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_base import CteraFilerShareBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_timezone_base import CteraFilerTimezoneBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_user_base import CteraFilerUserBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_volume_base import CteraFilerVolumeBase
+
+
+class CteraFilerState(CteraFilerBase):
+    _steps = ['hostname', 'timezone', 'ntp_servers', 'cloud_services', 'license', 'users', 'volumes', 'shares', 'cloud_cache', 'network']
+    _dependencies = dict(
+        license=['cloud_services'],
+        shares=['volumes', 'users'],
+        cloud_cache=['cloud_services', 'volumes'],
+        network=[step for step in _steps if step != 'network']
+    )
+    # step: the key of the items of the step
+    _item_keys = dict(users='username', volumes='name', shares='name')
+
+    def __init__(self):
+        super().__init__(dict(
+            desired_state=dict(type='dict', required=True, options=dict(
+                hostname=dict(type='str'),
+                timezone=dict(type='str'),
+                ntp_servers=dict(type='list', elements='str'),
+                cloud_services=dict(type='dict', options=CteraFilerCloudServicesBase.cloud_services_argument_spec()),
+                license=dict(type='str', choices=CteraFilerLicenseBase.licenses),
+                users=dict(type='list', elements='dict', options=CteraFilerState._with_state(CteraFilerUserBase.user_argument_spec())),
+                volumes=dict(type='list', elements='dict', options=CteraFilerState._with_state(CteraFilerVolumeBase.volume_argument_spec())),
+                shares=dict(type='list', elements='dict', options=CteraFilerState._with_state(CteraFilerShareBase.share_argument_spec())),
+                cloud_cache=dict(type='dict', options=CteraFilerCloudCacheBase.cloud_cache_argument_spec()),
+                network=dict(
+                    type='dict',
+                    options=CteraFilerNetworkBase.network_argument_spec(),
+                    required_if=CteraFilerNetworkBase.network_required_if,
+                    required_by=CteraFilerNetworkBase.network_required_by
+                )
+            )),
+            workers=dict(type='int', required=False, default=4),
+            step_timeout=dict(type='int', required=False, default=600)
+        ))
+        self._reject_duplicate_items()
+
+    @staticmethod
+    def _with_state(item_argument_spec):
+        item_argument_spec['state'] = dict(required=False, choices=['present', 'absent'], default='present')
+        return item_argument_spec
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Failed to apply the desired state'
+
+    def _reject_duplicate_items(self):
+        for step, key in CteraFilerState._item_keys.items():
+            duplicates = ctera_common.get_duplicates(item[key] for item in self.parameters['desired_state'].get(step) or [])
+            if duplicates:
+                self.ansible_module.fail_json(msg='%s are listed more than once: %s' % (step.capitalize(), ', '.join(duplicates)))
+
+    def _execute(self):
+        desired_state = {step: value for step, value in self.parameters['desired_state'].items() if value is not None}
+        steps = [step for step in CteraFilerState._steps if step in desired_state]
+        tasks = {step: timed(getattr(self, '_ensure_%s' % step), desired_state[step]) for step in steps}
+        dependencies = {
+            step: [dependency for dependency in CteraFilerState._dependencies.get(step, []) if dependency in tasks] for step in steps
+        }
+        self._configure_sdk(desired_state)
+        start = time.monotonic()
+        results = DependencyExecutor(self.parameters['workers'], self.parameters['step_timeout']).run(tasks, dependencies)
+        set_step_results(self.ansible_module.ctera_return_value(), results, round(time.monotonic() - start, 3), 'Filer is in the desired state')
+
+    @staticmethod
+    def _configure_sdk(desired_state):
+        ''' Sets the global configuration of the SDK before the steps run, since the steps run in worker threads '''
+        if 'cloud_services' in desired_state:
+            CteraFilerCloudServicesBase.configure_sdk(desired_state['cloud_services'])
+
+    @staticmethod
+    def _from_messages(messages):
+        ''' :return: whether the step changed, and its message, from the changed and skipped messages of a step '''
+        if messages['changed']:
+            return True, ', '.join(messages['changed'])
+        return False, ', '.join(messages['skipped'])
+
+    def _ensure_hostname(self, hostname):
+        messages = dict(changed=[], skipped=[])
+        CteraFilerHostnameBase.ensure_hostname(self._ctera_filer, self._ctera_filer.config.get_hostname(), hostname, messages)
+        return CteraFilerState._from_messages(messages)
+
+    def _ensure_timezone(self, timezone):
+        messages = dict(changed=[], skipped=[])
+        CteraFilerTimezoneBase.ensure_timezone(self._ctera_filer, self._ctera_filer.timezone.get_timezone(), timezone, messages)
+        return CteraFilerState._from_messages(messages)
+
+    def _ensure_ntp_servers(self, ntp_servers):
+        messages = dict(changed=[], skipped=[])
+        ntp_config = ctera_filer_converters.ntp_config_to_dict(self._ctera_filer.ntp.get_configuration())
+        CteraFilerNtpBase.ensure_ntp_enabled(self._ctera_filer, ntp_config, ntp_servers, messages)
+        return CteraFilerState._from_messages(messages)
+
+    def _ensure_cloud_services(self, cloud_services):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        messages = dict(changed=[], skipped=[])
+        error = CteraFilerCloudServicesBase.ensure_connected(self._ctera_filer, self._ctera_filer.services.get_status(), cloud_services, messages)
+        if error:
+            raise CTERAException(message=error)
+        return CteraFilerState._from_messages(messages)
+
+    def _ensure_license(self, license_type):
+        messages = dict(changed=[], skipped=[])
+        CteraFilerLicenseBase.ensure_license(self._ctera_filer, self._ctera_filer.licenses.get(), license_type, messages)
+        return CteraFilerState._from_messages(messages)
+
+    def _ensure_users(self, users):
+        current_users = {user.username: ctera_filer_converters.user_to_dict(user) for user in self._ctera_filer.users.get()}
+        return self._ensure_items('users', users, current_users, CteraFilerUserBase.ensure_user_present, CteraFilerUserBase.ensure_user_absent)
+
+    def _ensure_volumes(self, volumes):
+        current_volumes = {volume.name: ctera_filer_converters.object_to_dict(volume) for volume in self._ctera_filer.volumes.get()}
+        return self._ensure_items(
+            'volumes', volumes, current_volumes, CteraFilerVolumeBase.ensure_volume_present, CteraFilerVolumeBase.ensure_volume_absent
+        )
+
+    def _ensure_shares(self, shares):
+        current_shares = {share.name: ctera_filer_converters.share_to_dict(share) for share in self._ctera_filer.shares.get()}
+        return self._ensure_items('shares', shares, current_shares, CteraFilerShareBase.ensure_share_present, CteraFilerShareBase.ensure_share_absent)
+
+    def _ensure_items(self, step, desired_items, current_items, ensure_present, ensure_absent):
+        '''
+        Brings each of the items of a step to its desired state, with the helpers of the module of the item
+
+        :return: whether any of the items changed, and a message of the changes
+        '''
+        key = CteraFilerState._item_keys[step]
+        changes = []
+        for desired_item in desired_items:
+            desired_item = ctera_common.get_parameters(desired_item)
+            state = desired_item.pop('state')
+            name = desired_item[key]
+            if state == 'present':
+                changed, msg = ensure_present(self._ctera_filer, current_items.get(name), desired_item)
+            else:
+                changed, msg = ensure_absent(self._ctera_filer, current_items.get(name), name)
+            if changed:
+                changes.append('%s: %s' % (name, msg))
+        return (True, ', '.join(changes)) if changes else (False, '%s did not change' % step.capitalize())
+
+    def _ensure_cloud_cache(self, cloud_cache):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        if not self._ctera_filer.services.connected():
+            raise CTERAException(message='Filer is not connected to Cloud Services')
+        messages = dict(changed=[], skipped=[])
+        is_cache_enabled = self._ctera_filer.cache.is_enabled()
+        if cloud_cache['enabled']:
+            CteraFilerCloudCacheBase.ensure_cache_enabled(self._ctera_filer, is_cache_enabled, cloud_cache, messages)
+        else:
+            CteraFilerCloudCacheBase.ensure_cache_disabled(self._ctera_filer, is_cache_enabled, messages)
+        return CteraFilerState._from_messages(messages)
+
+    def _ensure_network(self, network):
+        current_config = ctera_filer_converters.network_config_to_dict(self._ctera_filer.network.ifconfig().ip)
+        network = ctera_common.get_parameters(network)
+        messages = dict(changed=[], skipped=[])
+        if network['mode'] == 'static':
+            CteraFilerNetworkBase.ensure_static(self._ctera_filer, current_config, network, messages)
+        else:
+            CteraFilerNetworkBase.ensure_dynamic(self._ctera_filer, current_config, network, messages)
+        return CteraFilerState._from_messages(messages)
+
+
+def main():  # pragma: no cover
+    CteraFilerState().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
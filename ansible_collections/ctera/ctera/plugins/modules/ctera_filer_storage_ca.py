@@ -21,6 +21,7 @@ description:
     - Import and update the Edge Filer's Storage CA certificate.
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -53,11 +54,6 @@ RETURN = r''' # '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
 
-try:
-    from cterasdk.lib import X509Certificate
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraFilerStorageCA(CteraFilerBase):
     _create_params = ['certificate', 'force_update']
@@ -75,6 +71,7 @@ class CteraFilerStorageCA(CteraFilerBase):
         return 'Storage CA certificate Management Failed'
 
     def _execute(self):
+        from cterasdk.lib import X509Certificate  # pylint: disable=import-outside-toplevel
         current_storage_ca = self._get_storage_ca()
         new_storage_ca = X509Certificate.load_certificate(self.parameters['certificate'])
         if not current_storage_ca or self.parameters['force_update'] or \
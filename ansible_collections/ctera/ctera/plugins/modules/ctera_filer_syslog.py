@@ -21,6 +21,7 @@ description:
     - Enable/Disable/Modify the Syslog configuration of the CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -32,7 +33,9 @@ options:
     type: bool
     default: True
   server:
-    description: Syslog server address. Required if C(enabled=True)
+    description:
+    - Syslog server address
+    - Required if C(enabled=True)
     type: str
   port:
     description: Syslog server port
@@ -47,7 +50,7 @@ options:
       - UDP
     default: UDP
   min_severity:
-    description: Minimal log severity to report tp syslog
+    description: Minimal log severity to report to syslog
     type: str
     choices:
       - emergency
@@ -82,30 +85,17 @@ server:
 '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-
-try:
-    from cterasdk import gateway_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
 
 
 class CteraFilerSyslog(CteraFilerBase):
-    _enable_params = ['server', 'port', 'proto', 'min_severity']
-
     def __init__(self):
         super().__init__(
             dict(
                 enabled=dict(type='bool', required=False, default=True),
-                server=dict(type='str', required=False),
-                port=dict(type='int', required=False, default=514),
-                proto=dict(type='str', required=False, default='UDP', choices=['TCP', 'UDP']),
-                min_severity=dict(
-                    type='str',
-                    required=False,
-                    default='info',
-                    choices=['emergency', 'alert', 'critical', 'error', 'warning', 'notice', 'info', 'debug']
-                )
+                **ctera_filer_service_specs.argument_spec('syslog')
             ),
             required_if=[('enabled', True, ['server'])]
         )
@@ -123,19 +113,21 @@ class CteraFilerSyslog(CteraFilerBase):
             self._ensure_disabled(current_config)
 
     def _ensure_enabled(self, current_config):
+        from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
         if current_config['mode'] == gateway_enum.Mode.Enabled:
-            modified_attributes = ctera_common.get_modified_attributes(current_config, self.parameters)
+            modified_attributes = ctera_compare.get_modified_attributes(current_config, self.parameters)
             if modified_attributes:
                 self._ctera_filer.syslog.modify(**modified_attributes)
                 self.ansible_module.ctera_return_value().changed().msg('Updated Syslog server configuration').put(server=self.parameters['server'])
             else:
                 self.ansible_module.ctera_return_value().msg('Syslog server details did not change').put(server=self.parameters['server'])
         else:
-            enable_params = {k: v for k, v in self.parameters.items() if k in CteraFilerSyslog._enable_params}
+            enable_params = {k: v for k, v in self.parameters.items() if k in ctera_filer_service_specs.ENABLE_PARAMS['syslog']}
             self._ctera_filer.syslog.enable(**enable_params)
             self.ansible_module.ctera_return_value().changed().msg('Syslog server enabled')
 
     def _ensure_disabled(self, current_config):
+        from cterasdk import gateway_enum  # pylint: disable=import-outside-toplevel
         if current_config['mode'] == gateway_enum.Mode.Enabled:
             self._ctera_filer.syslog.disable()
             self.ansible_module.ctera_return_value().changed().msg('Syslog server disabled')
@@ -147,9 +139,7 @@ class CteraFilerSyslog(CteraFilerBase):
 
     @staticmethod
     def _to_config_dict(config):
-        config_dict = {k: v for k, v in config.__dict__.items() if not k.startswith("_")}
-        config_dict['min_severity'] = config_dict.pop('minSeverity', None)
-        return config_dict
+        return ctera_filer_converters.syslog_config_to_dict(config)
 
 
 def main():  # pragma: no cover
@@ -21,6 +21,7 @@ description:
     - Enable or Disable Telnet.
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -34,7 +35,8 @@ options:
     default: True
   code:
     description:
-    - Telnet Authorization code. Required if C(enabled) is True
+    - Telnet Authorization code
+    - Required if C(enabled) is True
     type: str
 '''
 
@@ -56,6 +58,7 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
 
 
@@ -64,7 +67,7 @@ class CteraFilerTelnet(CteraFilerBase):
         super().__init__(
             dict(
                 enabled=dict(type='bool', required=False, default=True),
-                code=dict(type='str', required=False, no_log=True)
+                **ctera_filer_service_specs.argument_spec('telnet')
             ),
             required_if=[
                 ('enabled', True, ['code'])
@@ -21,6 +21,7 @@ description:
     - Set the timezone of  the CTERA-Networks filer
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -58,10 +59,10 @@ current_timezone:
   sample: "(GMT-06:00) Central Time (US , Canada)"
 '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_timezone_base import CteraFilerTimezoneBase
 
 
-class CteraFilerTimezone(CteraFilerBase):
+class CteraFilerTimezone(CteraFilerTimezoneBase):
 
     def __init__(self):
         super().__init__(dict(timezone=dict(type='str', required=True)))
@@ -73,11 +74,12 @@ class CteraFilerTimezone(CteraFilerBase):
     def _execute(self):
         timezone = self.parameters['timezone']
         current_timezone = self._ctera_filer.timezone.get_timezone()
-        if timezone != current_timezone:
-            self._ctera_filer.timezone.set_timezone(timezone)
-            self.ansible_module.ctera_return_value().changed().msg('Changed timezone').put(previous_timezone=current_timezone, current_timezone=timezone)
+        messages = dict(changed=[], skipped=[])
+        self.ensure_timezone(self._ctera_filer, current_timezone, timezone, messages)
+        if messages['changed']:
+            self.ansible_module.ctera_return_value().changed().msg(messages['changed'][0]).put(previous_timezone=current_timezone, current_timezone=timezone)
         else:
-            self.ansible_module.ctera_return_value().msg('No update required to the current timezone').put(current_timezone=current_timezone)
+            self.ansible_module.ctera_return_value().msg(messages['skipped'][0]).put(current_timezone=current_timezone)
 
 
 def main():  # pragma: no cover
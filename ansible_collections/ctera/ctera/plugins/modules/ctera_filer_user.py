@@ -21,6 +21,7 @@ description:
     - Create, modify and delete users.
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -89,26 +90,17 @@ uid:
   sample: XXX
 '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_user_base import CteraFilerUserBase
 
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
 
-
-class CteraFilerUser(CteraFilerBase):
-    _create_params = ['username', 'password', 'full_name', 'email', 'uid']
+class CteraFilerUser(CteraFilerUserBase):
 
     def __init__(self):
         super().__init__(dict(
             state=dict(required=False, choices=['present', 'absent'], default='present'),
-            username=dict(type='str', required=True),
-            password=dict(type='str', required=False, no_log=True),
-            full_name=dict(type='str', required=False),
-            email=dict(type='str', required=False),
-            uid=dict(type='str', required=False)
+            **CteraFilerUserBase.user_argument_spec()
         ))
 
     @property
@@ -124,24 +116,26 @@ class CteraFilerUser(CteraFilerBase):
             self._ensure_absent(user)
 
     def _get_user(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         user = None
         try:
             user = self._ctera_filer.users.get(name=self.parameters['username'])
         except CTERAException as error:
             if error.response.code != 404:  # pylint: disable=no-member
                 raise
-        return self._to_user_dict(user) if user else None
+        return ctera_filer_converters.user_to_dict(user) if user else None
 
     def _ensure_present(self, user):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         if user:
-            modified_attributes = ctera_common.get_modified_attributes(user, self.parameters)
+            modified_attributes = ctera_compare.get_modified_attributes(user, self.parameters)
             if modified_attributes:
                 self._ctera_filer.users.modify(self.parameters['username'], **modified_attributes)
                 self.ansible_module.ctera_return_value().changed().msg('User modified').put(username=self.parameters['username'], **modified_attributes)
             else:
                 self.ansible_module.ctera_return_value().skipped().msg('User details did not change').put(username=self.parameters['username'])
         else:
-            create_params = {k: v for k, v in self.parameters.items() if k in CteraFilerUser._create_params}
+            create_params = {k: v for k, v in self.parameters.items() if k in CteraFilerUserBase.create_params}
             if create_params.get('password') is None:
                 raise CTERAException(message="Cannot create new user without a password")
             self._ctera_filer.users.add(**create_params)
@@ -154,14 +148,6 @@ class CteraFilerUser(CteraFilerBase):
         else:
             self.ansible_module.ctera_return_value().skipped().msg('User already does not exist').put(username=self.parameters['username'])
 
-    @staticmethod
-    def _to_user_dict(user):
-        user_dict = {k: v for k, v in user.__dict__.items() if not k.startswith("_")}
-        full_name = user_dict.pop('fullName', None)
-        if full_name is not None:
-            user_dict['full_name'] = full_name
-        return user_dict
-
 
 def main():  # pragma: no cover
     CteraFilerUser().run()
@@ -0,0 +1,179 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_filer_users
+short_description: CTERA-Networks Filer bulk user configuration and management
+description:
+    - Reconcile the local users of the filer with a list of desired users.
+    - All the local users are retrieved in a single call and only the required add, modify and delete calls are issued, in a single session.
+extends_documentation_fragment:
+    - ctera.ctera.ctera
+    - ctera.ctera.vgateway
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  users:
+    description: List of desired users
+    type: list
+    elements: dict
+    required: True
+    suboptions:
+      state:
+        description:
+        - Whether the specified user should exist or not.
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+      username:
+        description: The name of the user
+        required: True
+        type: str
+      email:
+        description: The e-mail address of the user
+        type: str
+      full_name:
+        description: The full name of the user
+        type: str
+      password:
+        description:
+        - The password of the user
+        - Required when C(state=present) and the user does not exist
+        type: str
+      uid:
+        description: ID for the user
+        type: str
+  exclusive:
+    description:
+    - Delete the existing local users that are not listed in I(users)
+    - The user of the current session is never deleted
+    type: bool
+    default: False
+'''
+
+EXAMPLES = '''
+- name: seed service accounts
+  ctera_filer_users:
+    users:
+      - username: 'alice'
+        email: 'walice@wonderland.com'
+        full_name: 'Alice Wonderland'
+        password: 'su@p3rsecret!!'
+      - username: 'bob'
+        state: absent
+    ctera_host: "{{ ctera_filer_hostname }}"
+    ctera_user: "{{ ctera_filer_user }}"
+    ctera_password: "{{ ctera_filer_password }}"
+'''
+
+RETURN = '''
+users:
+  description: The result of each managed user
+  returned: Always
+  type: list
+  elements: dict
+  sample:
+    - username: alice
+      changed: True
+      msg: User created
+    - username: bob
+      changed: False
+      msg: User already does not exist
+'''
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_user_base import CteraFilerUserBase
+
+
+class CteraFilerUsers(CteraFilerUserBase):
+
+    def __init__(self):
+        user_options = CteraFilerUserBase.user_argument_spec()
+        user_options['state'] = dict(required=False, choices=['present', 'absent'], default='present')
+        super().__init__(dict(
+            users=dict(type='list', required=True, elements='dict', options=user_options),
+            exclusive=dict(type='bool', required=False, default=False)
+        ))
+        self._reject_duplicate_users()
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'User management failed'
+
+    def _reject_duplicate_users(self):
+        duplicates = ctera_common.get_duplicates(user['username'] for user in self.parameters['users'])
+        if duplicates:
+            self.ansible_module.fail_json(msg='Users are listed more than once: %s' % ', '.join(duplicates))
+
+    def _execute(self):
+        current_users = self._get_users()
+        results = []
+        for desired_user in self.parameters['users']:
+            desired_user = ctera_common.get_parameters(desired_user)
+            state = desired_user.pop('state')
+            user = current_users.pop(desired_user['username'], None)
+            if state == 'present':
+                results.append(self._run_user_operation(desired_user['username'], self._ensure_present, user, desired_user))
+            else:
+                results.append(self._run_user_operation(desired_user['username'], self._ensure_absent, user, desired_user['username']))
+        if self.parameters['exclusive']:
+            current_users.pop(self._ctera_filer.session().user.name, None)
+            for username, user in current_users.items():
+                results.append(self._run_user_operation(username, self._ensure_absent, user, username))
+        self._set_result(results)
+
+    def _get_users(self):
+        return {user.username: ctera_filer_converters.user_to_dict(user) for user in self._ctera_filer.users.get()}
+
+    @staticmethod
+    def _run_user_operation(username, operation, *args):
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
+        try:
+            changed, msg = operation(*args)
+            return dict(username=username, changed=changed, msg=msg)
+        except CTERAException as error:
+            return dict(username=username, changed=False, failed=True, msg='User management failed. Exception: %s' % tojsonstr(error, False))
+
+    def _ensure_present(self, user, desired_user):
+        return self.ensure_user_present(self._ctera_filer, user, desired_user)
+
+    def _ensure_absent(self, user, username):
+        return self.ensure_user_absent(self._ctera_filer, user, username)
+
+    def _set_result(self, results):
+        changed = [result['username'] for result in results if result['changed']]
+        failed = [result['username'] for result in results if result.get('failed')]
+        return_value = self.ansible_module.ctera_return_value().put(users=results)
+        if changed:
+            return_value.changed()
+        if failed:
+            return_value.failed().msg('Failed to manage users: %s' % ', '.join(failed))
+        elif changed:
+            return_value.msg('Changed users: %s' % ', '.join(changed))
+        else:
+            return_value.skipped().msg('Users did not change')
+
+
+def main():  # pragma: no cover
+    CteraFilerUsers().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -21,6 +21,7 @@ description:
     - Create, modify and delete volumes.
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -80,26 +81,16 @@ size:
   sample: 1024
 '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_base import CteraFilerBase
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_converters
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_volume_base import CteraFilerVolumeBase
 
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
 
-
-class CteraFilerVolume(CteraFilerBase):
-    _create_params = ['name', 'size', 'filesystem', 'device', 'passphrase']
+class CteraFilerVolume(CteraFilerVolumeBase):
 
     def __init__(self):
         super().__init__(dict(
             state=dict(required=False, choices=['present', 'absent'], default='present'),
-            name=dict(type='str', required=True),
-            size=dict(type='int', required=False),
-            filesystem=dict(type='str', required=False),
-            device=dict(type='str', required=False),
-            passphrase=dict(type='str', required=False, no_log=True)
+            **CteraFilerVolumeBase.volume_argument_spec()
         ))
 
     @property
@@ -115,32 +106,20 @@ class CteraFilerVolume(CteraFilerBase):
             self._ensure_absent(volume)
 
     def _ensure_present(self, volume):
-        if volume:
-            modified_attributes = ctera_common.get_modified_attributes(volume, self.parameters)
-            if modified_attributes:
-                desired_size = modified_attributes.get('size')
-                if desired_size is not None:
-                    self._ctera_filer.volumes.modify(self.parameters['name'], size=desired_size)
-                    self.ansible_module.ctera_return_value().changed().msg('Volume  modified').put(
-                        name=self.parameters['name'], size=desired_size)
-                else:
-                    self.ansible_module.ctera_return_value().skipped().msg('Currently you can only modify the volume size').put(
-                        name=self.parameters['name'])
-            else:
-                self.ansible_module.ctera_return_value().skipped().msg('Volume details did not change').put(name=self.parameters['name'])
-        else:
-            create_params = {k: v for k, v in self.parameters.items() if k in CteraFilerVolume._create_params}
-            self._ctera_filer.volumes.add(**create_params)
-            self.ansible_module.ctera_return_value().changed().msg('Volume created').put(**create_params)
+        self._set_result(*self.ensure_volume_present(self._ctera_filer, volume, self.parameters))
 
     def _ensure_absent(self, volume):
-        if volume:
-            self._ctera_filer.volumes.delete(self.parameters['name'])
-            self.ansible_module.ctera_return_value().changed().msg('Volume deleted').put(name=self.parameters['name'])
+        self._set_result(*self.ensure_volume_absent(self._ctera_filer, volume, self.parameters['name']))
+
+    def _set_result(self, changed, msg):
+        return_value = self.ansible_module.ctera_return_value().msg(msg).put(name=self.parameters['name'])
+        if changed:
+            return_value.changed()
         else:
-            self.ansible_module.ctera_return_value().skipped().msg('Volume already does not exist').put(name=self.parameters['name'])
+            return_value.skipped()
 
     def _get_volume(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         volume = None
         try:
             volume = self._ctera_filer.volumes.get(name=self.parameters['name'])
@@ -151,8 +130,7 @@ class CteraFilerVolume(CteraFilerBase):
 
     @staticmethod
     def _to_volume_dict(volume):
-        volume_dict = {k: v for k, v in volume.__dict__.items() if not k.startswith("_")}
-        return volume_dict
+        return ctera_filer_converters.object_to_dict(volume)
 
 
 def main():  # pragma: no cover
@@ -21,6 +21,7 @@ description:
     - Enable or Disable First Time Wizard.
 extends_documentation_fragment:
     - ctera.ctera.ctera
+    - ctera.ctera.vgateway
 
 author:
     - Saimon Michelson (@saimonation)
@@ -67,11 +67,6 @@ RETURN = r''' # '''
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
-try:
-    from cterasdk.lib import X509Certificate
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraPortalCertificate(CteraPortalBase):
     _create_params = ['private_key', 'server_certificate', 'certificate_chain', 'force_update']
@@ -91,6 +86,7 @@ class CteraPortalCertificate(CteraPortalBase):
         return 'SSL certificate management failed'
 
     def _execute(self):
+        from cterasdk.lib import X509Certificate  # pylint: disable=import-outside-toplevel
         current_cert_thumbprint = self._get_thumbprint()
         new_cert_thumbprint = X509Certificate.load_certificate(self.parameters['server_certificate']).sha1_fingerprint
         if self.parameters['force_update'] or current_cert_thumbprint != new_cert_thumbprint:
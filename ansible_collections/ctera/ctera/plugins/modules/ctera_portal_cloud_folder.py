@@ -82,11 +82,6 @@ name:
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
-try:
-    from cterasdk import CTERAException, portal_types
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraPortalCloudFolder(CteraPortalBase):
     def __init__(self):
@@ -121,6 +116,7 @@ class CteraPortalCloudFolder(CteraPortalBase):
             self._ensure_absent(cloud_folder)
 
     def _get_cloud_folder(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         cloud_folder = None
         try:
             cloud_folder = self._ctera_portal.cloudfs.find(
@@ -161,6 +157,7 @@ class CteraPortalCloudFolder(CteraPortalBase):
 
     @staticmethod
     def _make_user_account(user_details):
+        from cterasdk import portal_types  # pylint: disable=import-outside-toplevel
         return portal_types.UserAccount(**user_details) if user_details else None
 
 
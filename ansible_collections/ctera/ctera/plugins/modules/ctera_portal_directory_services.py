@@ -94,11 +94,6 @@ RETURN = '''#'''
 from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
-try:
-    from cterasdk import CTERAException, portal_types
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraPortalDirectoryServices(CteraPortalBase):
     _connect_params = ['domain', 'username', 'password', 'ou', 'ssl', 'krb', 'domain_controllers']
@@ -147,6 +142,7 @@ class CteraPortalDirectoryServices(CteraPortalBase):
 
     @staticmethod
     def _create_domain_controllers_from_list(domain_controllers):
+        from cterasdk import CTERAException, portal_types  # pylint: disable=import-outside-toplevel
         if domain_controllers:
             if len(domain_controllers) > 2:
                 raise CTERAException("Cannot set more than two static domain controllers")
@@ -83,14 +83,9 @@ RETURN = r'''#'''
 
 import os
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
-try:
-    from cterasdk import CTERAException, portal_types
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraPortalDirectoryServicesAccessControl(CteraPortalBase):
     _access_control_params = ['acl']
@@ -127,6 +122,7 @@ class CteraPortalDirectoryServicesAccessControl(CteraPortalBase):
             self._ensure_absent(current_acl)
 
     def _get_access_control_rules(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         acl = None
         try:
             acl = self._ctera_portal.directoryservice.get_access_control()
@@ -136,6 +132,7 @@ class CteraPortalDirectoryServicesAccessControl(CteraPortalBase):
         return self._create_access_control_index(acl)
 
     def _create_access_control_entries(self, acl):
+        from cterasdk import CTERAException, portal_types  # pylint: disable=import-outside-toplevel
         access_control_entries = []
         for ace in acl:
             principal_type = ace['principal_type']
@@ -157,7 +154,7 @@ class CteraPortalDirectoryServicesAccessControl(CteraPortalBase):
         return access_control_index
 
     def _ensure_present(self, current_acl, new_acl):
-        diff = ctera_common.compare_lists(list(current_acl.keys()), list(new_acl.keys()), get_list_diff=False)
+        diff = ctera_compare.compare_lists(list(current_acl.keys()), list(new_acl.keys()), get_list_diff=False)
         if diff:
             self._ctera_portal.directoryservice.set_access_control(new_acl.values())
             self.ansible_module.ctera_return_value().changed().msg('Configured access control rules')
@@ -0,0 +1,165 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_portal_facts
+short_description: Gather facts of a CTERA-Networks Portal
+description:
+    - List the tenants, plans, storage nodes, servers and local users of the Portal.
+    - Only the selected fields of each object are retrieved from the Portal, and the collections are retrieved page by page.
+extends_documentation_fragment:
+    - ctera.ctera.vportal
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  gather_subset:
+    description:
+    - List of collections to retrieve
+    - C(tenants), C(storage_nodes) and C(servers) require browsing the Global Administration Portal
+    - C(users) lists the local users of I(tenant)
+    type: list
+    elements: str
+    choices: ['tenants', 'plans', 'storage_nodes', 'servers', 'users']
+    default: ['tenants', 'plans', 'storage_nodes', 'servers', 'users']
+  fields:
+    description:
+    - Dictionary of collection name to the list of fields to retrieve for each object of the collection
+    - The C(name) field is always retrieved
+    - Collections that are not listed retrieve their default fields, which do not include secrets
+    type: dict
+  limit:
+    description:
+    - Maximal number of objects to retrieve of each collection
+    - The collections that had more objects are listed in I(truncated)
+    type: int
+    default: 1000
+'''
+
+EXAMPLES = '''
+- name: list the names and roles of the local users of a tenant
+  ctera_portal_facts:
+    tenant: 'acme'
+    gather_subset:
+      - users
+    fields:
+      users: ['role']
+    limit: 50000
+    ctera_host: "{{ ctera_portal_hostname }}"
+    ctera_user: "{{ ctera_portal_user }}"
+    ctera_password: "{{ ctera_portal_password }}"
+'''
+
+RETURN = '''
+ansible_facts:
+  description: The retrieved collections
+  returned: Always
+  type: dict
+  contains:
+    ctera_portal:
+      description: Dictionary of collection name to the list of retrieved objects
+      type: dict
+      sample:
+        users:
+          - name: alice
+            role: EndUser
+truncated:
+  description: The collections that had more than I(limit) objects
+  returned: Always
+  type: list
+  elements: str
+  sample: ['users']
+'''
+
+import itertools
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
+
+
+class CteraPortalFacts(CteraPortalBase):
+    _default_fields = dict(
+        tenants=['name', 'displayName', 'externalPortalId', 'companyName', 'comment', 'plan', 'activationStatus'],
+        plans=[
+            'name', 'retentionPolicy', 'vGateways4', 'vGateways8', 'appliances', 'vGateways32', 'vGateways64', 'vGateways128',
+            'workstationAgents', 'serverAgents', 'cloudDrives', 'cloudDrivesLite', 'storage'
+        ],
+        storage_nodes=['name', 'bucket', 'storage', 'endPoint', 'useHttps', 'directUpload', 's3Endpoint', 'httpsOnly', 'readOnly', 'dedicatedPortal'],
+        servers=['name', 'isApplicationServer', 'renderingServer', 'publicIpaddr', 'allowUserLogin', 'replicationSettings'],
+        users=['name', 'email', 'firstName', 'lastName', 'role', 'company', 'comment']
+    )
+
+    def __init__(self):
+        subsets = list(CteraPortalFacts._default_fields.keys())
+        super().__init__(dict(
+            gather_subset=dict(type='list', elements='str', required=False, choices=subsets, default=subsets),
+            fields=dict(type='dict', required=False),
+            limit=dict(type='int', required=False, default=1000)
+        ), supports_check_mode=True)
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Failed to gather facts'
+
+    @property
+    def _listers(self):
+        return dict(
+            tenants=self._ctera_portal.portals.list_tenants,
+            plans=self._ctera_portal.plans.list_plans,
+            storage_nodes=self._ctera_portal.buckets.list_buckets,
+            servers=self._ctera_portal.servers.list_servers,
+            users=self._ctera_portal.users.list_local_users
+        )
+
+    def _execute(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        fields = self.parameters.get('fields', {})
+        unsupported = set(fields.keys()) - set(CteraPortalFacts._default_fields.keys())
+        if unsupported:
+            raise CTERAException(message='Unsupported collections in fields: %s' % ', '.join(sorted(unsupported)))
+        listers = self._listers
+        facts = {}
+        truncated = []
+        for subset in self.parameters['gather_subset']:
+            include = fields.get(subset) or CteraPortalFacts._default_fields[subset]
+            # read one object beyond the limit to tell whether the collection was truncated, without paging any further
+            objects = list(itertools.islice(listers[subset](include=include), self.parameters['limit'] + 1))
+            if len(objects) > self.parameters['limit']:
+                objects.pop()
+                truncated.append(subset)
+            facts[subset] = [self._to_fact(ctera_object) for ctera_object in objects]
+        self.ansible_module.ctera_return_value().msg('Gathered %d collections' % len(facts)).put(
+            ansible_facts=dict(ctera_portal=facts),
+            truncated=truncated
+        )
+
+    @staticmethod
+    def _to_fact(value):
+        if isinstance(value, list):
+            return [CteraPortalFacts._to_fact(item) for item in value]
+        if isinstance(value, dict) or hasattr(value, '__dict__'):
+            items = value.items() if isinstance(value, dict) else value.__dict__.items()
+            return {k: CteraPortalFacts._to_fact(v) for k, v in items if not k.startswith("_")}
+        return value
+
+
+def main():  # pragma: no cover
+    CteraPortalFacts().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
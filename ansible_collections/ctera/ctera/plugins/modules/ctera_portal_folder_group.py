@@ -80,11 +80,6 @@ name:
 
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
-try:
-    from cterasdk import CTERAException, portal_types
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraPortalFolderGroup(CteraPortalBase):
     def __init__(self):
@@ -116,6 +111,7 @@ class CteraPortalFolderGroup(CteraPortalBase):
             self._ensure_absent(folder_group)
 
     def _get_folder_group(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         folder_group = []
         try:
             folder_group = self._ctera_portal.cloudfs.get(self.parameters['name'])
@@ -125,6 +121,7 @@ class CteraPortalFolderGroup(CteraPortalBase):
 
     @staticmethod
     def _make_user_account(user_details):
+        from cterasdk import portal_types  # pylint: disable=import-outside-toplevel
         return portal_types.UserAccount(**user_details) if user_details else None
 
     @staticmethod
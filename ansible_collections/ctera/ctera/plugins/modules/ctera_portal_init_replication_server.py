@@ -55,11 +55,6 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
-try:
-    from cterasdk import portal_enum
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
 
@@ -87,6 +82,7 @@ class CteraPortalInitReplication(CteraPortalBase):
         self._configure_replication_server()
 
     def _is_already_configured(self):
+        from cterasdk import portal_enum  # pylint: disable=import-outside-toplevel
         setup_status = self._ctera_portal.setup.get_setup_status()
         return setup_status.wizard == portal_enum.SetupWizardStage.Finish
 
@@ -98,34 +98,18 @@ name:
   type: str
   sample: admin
 '''
-import datetime
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_local_user_base import CteraPortalLocalUserBase
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
-try:
-    from cterasdk import CTERAException, portal_types
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
-
-class CteraPortalLocalUser(CteraPortalBase):
-    _create_params = ['name', 'email', 'first_name', 'last_name', 'password', 'role', 'company', 'comment', 'password_change']
+class CteraPortalLocalUser(CteraPortalLocalUserBase):
 
     def __init__(self):
         super().__init__(
             dict(
                 state=dict(required=False, choices=['present', 'absent'], default='present'),
-                name=dict(type='str', required=True),
-                email=dict(type='str', required=False),
-                first_name=dict(type='str', required=False),
-                last_name=dict(type='str', required=False),
-                password=dict(type='str', required=False, no_log=True),
                 update_password=dict(type='bool', default=False),
-                role=dict(type='str', required=False, choices=['Disabled', 'EndUser', 'ReadWriteAdmin', 'ReadOnlyAdmin', 'Support'], default='Disabled'),
-                company=dict(type='str', required=False),
-                comment=dict(type='str', required=False),
-                password_change=dict(type='raw', required=False, default=False, no_log=True)
+                **CteraPortalLocalUserBase.user_argument_spec()
             )
         )
 
@@ -142,26 +126,22 @@ class CteraPortalLocalUser(CteraPortalBase):
             self._ensure_absent(user)
 
     def _get_user(self):
+        from cterasdk import CTERAException, portal_types  # pylint: disable=import-outside-toplevel
         user = None
         try:
-            user = self._ctera_portal.users.get(portal_types.UserAccount(self.parameters['name']), include=CteraPortalLocalUser._create_params)
+            user = self._ctera_portal.users.get(portal_types.UserAccount(self.parameters['name']), include=CteraPortalLocalUserBase.create_params)
         except CTERAException:
             pass
         return self._to_user_dict(user) if user else None
 
-    @staticmethod
-    def _translate_password_change(password_change):
-        if isinstance(password_change, str):
-            return datetime.datetime.strptime(password_change, '%Y-%m-%d').date()
-        return password_change
-
     def _ensure_present(self, user):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         update_password = self.parameters.pop('update_password')
         if user:
             self.parameters.pop('password_change', None)
             if not update_password:
                 self.parameters.pop('password', None)
-            modified_attributes = ctera_common.get_modified_attributes(user, self.parameters)
+            modified_attributes = ctera_compare.get_modified_attributes(user, self.parameters)
             if modified_attributes:
                 self._ctera_portal.users.modify(self.parameters['name'], **modified_attributes)
                 self.ansible_module.ctera_return_value().changed().msg('User modified').put(name=self.parameters['name'])
@@ -169,13 +149,14 @@ class CteraPortalLocalUser(CteraPortalBase):
                 self.ansible_module.ctera_return_value().skipped().msg('User details did not change').put(name=self.parameters['name'])
         else:
             self.parameters['password_change'] = self._translate_password_change(self.parameters['password_change'])
-            create_params = {k: v for k, v in self.parameters.items() if k in CteraPortalLocalUser._create_params}
+            create_params = {k: v for k, v in self.parameters.items() if k in CteraPortalLocalUserBase.create_params}
             if create_params.get('password') is None:
                 raise CTERAException(message="Cannot create new user without a password")
             self._ctera_portal.users.add(**create_params)
             self.ansible_module.ctera_return_value().changed().msg('User created').put(**create_params)
 
     def _ensure_absent(self, user):
+        from cterasdk import portal_types  # pylint: disable=import-outside-toplevel
         if user:
             self._ctera_portal.users.delete(portal_types.UserAccount(self.parameters['name']))
             self.ansible_module.ctera_return_value().changed().msg('User deleted').put(name=self.parameters['name'])
@@ -0,0 +1,378 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_portal_local_users
+short_description: CTERA-Networks Portal bulk user provisioning
+description:
+    - Create, modify and delete many local users of a tenant in a single session.
+    - The existing users are listed page by page and indexed by name, so every desired user is resolved without an additional request.
+    - User names are matched case insensitively. The index is updated as users are created and deleted,
+      so a user that is listed more than once is created or deleted once.
+    - Desired users can be passed inline, or streamed from a CSV or JSON Lines file on the managed host without loading the file to memory.
+extends_documentation_fragment:
+    - ctera.ctera.vportal
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  users:
+    description:
+    - List of desired users
+    - Processed before the users of I(src)
+    type: list
+    elements: dict
+    suboptions:
+      state:
+        description:
+        - Whether the specified user should exist or not.
+        type: str
+        choices: ['present', 'absent']
+        default: 'present'
+      name:
+        description: The name of the user
+        required: True
+        type: str
+      email:
+        description: The e-mail address of the user
+        type: str
+      first_name:
+        description: The first name of the user
+        type: str
+      last_name:
+        description: The last name of the user
+        type: str
+      password:
+        description:
+        - The password of the user
+        - Required when C(state=present) and the user does not exist
+        type: str
+      role:
+        description:
+        - User role of the user
+        - Users that do not exist are created with the C(Disabled) role if not set
+        type: str
+        choices: ['Disabled', 'EndUser', 'ReadWriteAdmin', 'ReadOnlyAdmin', 'Support']
+      company:
+        description: The name of the company of the user
+        type: str
+      comment:
+        description: Additional comment for the user
+        type: str
+      password_change:
+        description:
+        - Whether to enforce a password change when the user is created
+        - Pass a string in the format of '%Y-%m-%d' for a specific date, integer for days from creation, or True for immediate , defaults to False.
+        type: raw
+        default: False
+  src:
+    description:
+    - Path of a file on the managed host with the desired users
+    - Each record holds the same keys as the elements of I(users)
+    - The module fails without managing any user if the file cannot be read
+    - Lines of a JSON Lines file that are not a JSON object are reported in I(failures), the other lines are still processed
+    type: path
+  src_format:
+    description:
+    - The format of I(src)
+    - If not set, deduced from the file extension, C(.csv) for CSV and anything else for JSON Lines
+    type: str
+    choices: ['csv', 'jsonl']
+  update_password:
+    description: If True, the password of existing users will be updated
+    type: bool
+    default: False
+'''
+
+EXAMPLES = '''
+- name: provision tenant users from a CSV file
+  ctera_portal_local_users:
+    tenant: 'acme'
+    src: '/var/lib/provisioning/users.csv'
+    ctera_host: "{{ ctera_portal_hostname }}"
+    ctera_user: "{{ ctera_portal_user }}"
+    ctera_password: "{{ ctera_portal_password }}"
+
+- name: create and delete users
+  ctera_portal_local_users:
+    users:
+      - name: 'alice'
+        email: 'walice@wonderland.com'
+        first_name: 'Alice'
+        last_name: 'Wonderland'
+        password: 'su@p3rsecret!!'
+        role: 'EndUser'
+      - name: 'bob'
+        state: absent
+    ctera_host: "{{ ctera_portal_hostname }}"
+    ctera_user: "{{ ctera_portal_user }}"
+    ctera_password: "{{ ctera_portal_password }}"
+'''
+
+RETURN = '''
+created:
+  description: Number of users created
+  returned: Always
+  type: int
+  sample: 120
+modified:
+  description: Number of users modified
+  returned: Always
+  type: int
+  sample: 3
+deleted:
+  description: Number of users deleted
+  returned: Always
+  type: int
+  sample: 0
+unchanged:
+  description: Number of users that did not change
+  returned: Always
+  type: int
+  sample: 49877
+failures:
+  description: The users that could not be managed. Only the first 100 failures are listed
+  returned: Always
+  type: list
+  elements: dict
+  sample:
+    - name: carol
+      msg: Cannot create new user without a password
+    - name: null
+      line: 12
+      msg: Invalid JSON on line 12. Expecting value
+failure_count:
+  description: Number of users that could not be managed, including the failures that are not listed
+  returned: Always
+  type: int
+  sample: 2
+elapsed:
+  description: Duration of the reconciliation in seconds
+  returned: Always
+  type: float
+  sample: 41.3
+throughput:
+  description: Number of desired users processed per second
+  returned: Always
+  type: float
+  sample: 1212.4
+'''
+
+import contextlib
+import csv
+import json
+import os
+import time
+
+from ansible.module_utils.parsing.convert_bool import boolean
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_local_user_base import CteraPortalLocalUserBase
+
+
+class CteraPortalLocalUsers(CteraPortalLocalUserBase):
+    _compared_params = ['email', 'first_name', 'last_name', 'role', 'company', 'comment']
+    _portal_fields = ['email', 'firstName', 'lastName', 'role', 'company', 'comment']
+    _max_failures = 100
+
+    def __init__(self):
+        user_options = CteraPortalLocalUserBase.user_argument_spec()
+        user_options['role'].pop('default')
+        user_options['state'] = dict(required=False, choices=['present', 'absent'], default='present')
+        super().__init__(dict(
+            users=dict(type='list', required=False, elements='dict', options=user_options),
+            src=dict(type='path', required=False),
+            src_format=dict(type='str', required=False, choices=['csv', 'jsonl']),
+            update_password=dict(type='bool', default=False)
+        ))
+        self._counters = dict(created=0, modified=0, deleted=0, unchanged=0)
+        self._failures = []
+        self._failure_count = 0
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'User management failed'
+
+    def _execute(self):
+        start = time.monotonic()
+        try:
+            src_context = self._open_src()
+        except (IOError, OSError) as error:
+            self.ansible_module.ctera_return_value().failed().msg('Failed to read %s. Exception: %s' % (self.parameters['src'], error))
+            return
+        with src_context as src_file:
+            current_users = self._get_users()
+            processed = 0
+            for record in self._desired_users(src_file):
+                self._reconcile(current_users, record)
+                processed += 1
+        elapsed = time.monotonic() - start
+        self._set_result(processed, elapsed)
+
+    def _get_users(self):
+        ''' :return: a dictionary of the lower case user name to the tuple of the compared attributes, built from a paged listing '''
+        return {
+            user.name.lower(): tuple(getattr(user, field, None) for field in CteraPortalLocalUsers._portal_fields)
+            for user in self._ctera_portal.users.list_local_users(include=CteraPortalLocalUsers._portal_fields)
+        }
+
+    def _open_src(self):
+        ''' Opened before any user is managed, so that a missing or unreadable file changes nothing '''
+        src = self.parameters.get('src')
+        return open(src, 'r') if src else contextlib.nullcontext()
+
+    def _desired_users(self, src_file):
+        for user in self.parameters.get('users', []):
+            yield ctera_common.get_parameters(user)
+        if src_file is not None:
+            src = self.parameters['src']
+            src_format = self.parameters.get('src_format') or ('csv' if os.path.splitext(src)[1].lower() == '.csv' else 'jsonl')
+            records = csv.DictReader(src_file) if src_format == 'csv' else self._read_json_lines(src_file)
+            for record in records:
+                yield self._to_user_params(record)
+
+    def _read_json_lines(self, src_file):
+        ''' Lines that are not a JSON object are recorded as failures, and the following lines are still processed '''
+        for line_number, line in enumerate(src_file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as error:
+                self._add_failure(dict(name=None, line=line_number, msg='Invalid JSON on line %d. %s' % (line_number, error)))
+                continue
+            if not isinstance(record, dict):
+                self._add_failure(dict(name=None, line=line_number, msg='Line %d is not a JSON object' % line_number))
+                continue
+            yield record
+
+    @staticmethod
+    def _to_user_params(record):
+        ''' Normalize a record of a file to the format of the elements of the users option '''
+        user = {k: v for k, v in record.items() if v not in [None, '']}
+        user.setdefault('state', 'present')
+        password_change = user.get('password_change')
+        if isinstance(password_change, str):
+            if password_change.isdigit():
+                user['password_change'] = int(password_change)
+            elif not password_change[0].isdigit():
+                user['password_change'] = boolean(password_change)
+        return user
+
+    def _reconcile(self, current_users, user):
+        from cterasdk import CTERAException, tojsonstr  # pylint: disable=import-outside-toplevel
+        name = user.get('name')
+        try:
+            self._validate_user(user)
+            if user['state'] == 'present':
+                self._ensure_present(current_users, user)
+            else:
+                self._ensure_absent(current_users, name)
+        except CTERAException as error:
+            self._add_failure(dict(name=name, msg='User management failed. Exception: %s' % tojsonstr(error, False)))
+        except (TypeError, ValueError) as error:
+            self._add_failure(dict(name=name, msg='Invalid user. %s' % error))
+
+    def _add_failure(self, failure):
+        ''' Failures are counted, and only the first ones are listed, so that a broken file does not inflate the result '''
+        self._failure_count += 1
+        if len(self._failures) < CteraPortalLocalUsers._max_failures:
+            self._failures.append(failure)
+
+    @staticmethod
+    def _validate_user(user):
+        if not user.get('name'):
+            raise ValueError('Missing user name')
+        unsupported = set(user.keys()) - set(CteraPortalLocalUserBase.create_params) - {'state'}
+        if unsupported:
+            raise ValueError('Unsupported parameters: %s' % ', '.join(sorted(unsupported)))
+        if user['state'] not in ['present', 'absent']:
+            raise ValueError('Invalid state: %s' % user['state'])
+        if user.get('role') not in [None] + CteraPortalLocalUserBase._roles:
+            raise ValueError('Invalid role: %s' % user['role'])
+
+    def _ensure_present(self, current_users, user):
+        ''' :param dict current_users: updated with the attributes that were applied to the user '''
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        key = user['name'].lower()
+        current_user = current_users.get(key)
+        if current_user is not None:
+            modified_attributes = {
+                k: user[k] for k, current_value in zip(CteraPortalLocalUsers._compared_params, current_user)
+                if k in user and ctera_compare.cmp(user[k], current_value) != 0
+            }
+            if self.parameters['update_password'] and user.get('password'):
+                modified_attributes['password'] = user['password']
+            if modified_attributes:
+                self._ctera_portal.users.modify(user['name'], **modified_attributes)
+                current_users[key] = tuple(
+                    modified_attributes.get(k, current_value) for k, current_value in zip(CteraPortalLocalUsers._compared_params, current_user)
+                )
+                self._counters['modified'] += 1
+            else:
+                self._counters['unchanged'] += 1
+        else:
+            create_params = {k: v for k, v in user.items() if k in CteraPortalLocalUserBase.create_params}
+            if create_params.get('password') is None:
+                raise CTERAException(message="Cannot create new user without a password")
+            create_params.setdefault('role', 'Disabled')
+            create_params['password_change'] = self._translate_password_change(create_params.get('password_change', False))
+            self._ctera_portal.users.add(**create_params)
+            current_users[key] = tuple(create_params.get(k) for k in CteraPortalLocalUsers._compared_params)
+            self._counters['created'] += 1
+
+    def _ensure_absent(self, current_users, name):
+        ''' :param dict current_users: the user is removed from it once deleted '''
+        from cterasdk import portal_types  # pylint: disable=import-outside-toplevel
+        if current_users.get(name.lower()) is not None:
+            self._ctera_portal.users.delete(portal_types.UserAccount(name))
+            del current_users[name.lower()]
+            self._counters['deleted'] += 1
+        else:
+            self._counters['unchanged'] += 1
+
+    def _set_result(self, processed, elapsed):
+        return_value = self.ansible_module.ctera_return_value().put(
+            failures=self._failures,
+            failure_count=self._failure_count,
+            elapsed=round(elapsed, 3),
+            throughput=round(processed / elapsed, 1) if elapsed else float(processed),
+            **self._counters
+        )
+        changed = self._counters['created'] + self._counters['modified'] + self._counters['deleted']
+        if changed:
+            return_value.changed()
+        summary = 'Created: %d, Modified: %d, Deleted: %d, Unchanged: %d' % (
+            self._counters['created'], self._counters['modified'], self._counters['deleted'], self._counters['unchanged']
+        )
+        if self._failures:
+            return_value.failed().msg('Failed to manage %d users. %s' % (self._failure_count, summary))
+        elif changed:
+            return_value.msg(summary)
+        else:
+            return_value.skipped().msg('Users did not change')
+
+
+def main():  # pragma: no cover
+    CteraPortalLocalUsers().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
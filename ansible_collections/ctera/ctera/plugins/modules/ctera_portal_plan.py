@@ -109,14 +109,9 @@ name:
   type: str
   sample: example
 '''
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
 
 class CteraPortalPlan(CteraPortalBase):
     _create_params = ['name', 'email', 'first_name', 'last_name', 'password', 'role', 'company', 'comment', 'password_change']
@@ -160,6 +155,7 @@ class CteraPortalPlan(CteraPortalBase):
             self._ensure_absent(plan)
 
     def _get_plan(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         plan = None
         try:
             plan = self._ctera_portal.plans.get(
@@ -186,7 +182,7 @@ class CteraPortalPlan(CteraPortalBase):
 
     def _ensure_present(self, plan):
         if plan:
-            modified_attributes = ctera_common.get_modified_attributes(plan, self.parameters)
+            modified_attributes = ctera_compare.get_modified_attributes(plan, self.parameters)
             if modified_attributes:
                 self._ctera_portal.plans.modify(self.parameters['name'], **self._translate_params_obj(modified_attributes))
                 self.ansible_module.ctera_return_value().changed().msg('Plan modified').put(name=self.parameters['name'])
@@ -82,16 +82,10 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
 
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
-
 class CteraPortalServer(CteraPortalBase):
 
     def __init__(self):
@@ -117,7 +111,7 @@ class CteraPortalServer(CteraPortalBase):
     def _execute(self):
         server = self._get_server()
         if server:
-            modified_attributes = ctera_common.get_modified_attributes(server, self.parameters)
+            modified_attributes = ctera_compare.get_modified_attributes(server, self.parameters)
             if modified_attributes:
                 self._ctera_portal.servers.modify(self.parameters['name'], **modified_attributes)
                 self.ansible_module.ctera_return_value().changed().msg('Server modified').put(name=self.parameters['name'])
@@ -125,6 +119,7 @@ class CteraPortalServer(CteraPortalBase):
                 self.ansible_module.ctera_return_value().skipped().msg('Server configuration did not change').put(name=self.parameters['name'])
 
     def _get_server(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         server = None
         try:
             server = self._ctera_portal.servers.get(
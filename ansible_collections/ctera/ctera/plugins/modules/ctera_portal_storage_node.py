@@ -103,9 +103,17 @@ RETURN = r''' # '''
 
 import copy
 
-try:
-    from cterasdk import CTERAException, portal_enum, portal_types
-    _VARIABLE_FIELD_NAMES = {
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
+
+
+class UnsupportedBucketType(Exception):
+    pass
+
+
+def _variable_field_names():
+    from cterasdk import portal_enum  # pylint: disable=import-outside-toplevel
+    return {
         'access_key': {
             'default': 'awsAccessKey',
             portal_enum.BucketType.Azure: 'accountName'
@@ -123,15 +131,6 @@ try:
             portal_enum.BucketType.AWS: 'httpsOnly'
         }
     }
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
-from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
-
-
-class UnsupportedBucketType(Exception):
-    pass
 
 
 class CteraPortalStorageNode(CteraPortalBase):
@@ -179,6 +178,7 @@ class CteraPortalStorageNode(CteraPortalBase):
         return 'Storage Node Management failed'
 
     def _execute(self):
+        from cterasdk import portal_enum  # pylint: disable=import-outside-toplevel
         state = self.parameters.pop('state')
         storage_node = self._get_storage_node()
         if state == 'present':
@@ -205,6 +205,7 @@ class CteraPortalStorageNode(CteraPortalBase):
 
     @staticmethod
     def _get_bucket_params(bucket_dict):
+        from cterasdk import portal_enum  # pylint: disable=import-outside-toplevel
         bucket_params = copy.deepcopy(bucket_dict)
         bucket_params.pop('bucket_type')
         params_with_default = ['https', 'direct']
@@ -217,6 +218,7 @@ class CteraPortalStorageNode(CteraPortalBase):
 
     @staticmethod
     def _get_bucket_object_type(bucket_type):
+        from cterasdk import portal_enum, portal_types  # pylint: disable=import-outside-toplevel
         bucket_object_type = None
         if bucket_type == portal_enum.BucketType.Azure:
             bucket_object_type = portal_types.AzureBlob
@@ -244,7 +246,7 @@ class CteraPortalStorageNode(CteraPortalBase):
         messages = []
         changed = False
 
-        modified_attributes = ctera_common.get_modified_attributes(storage_node, self.parameters)
+        modified_attributes = ctera_compare.get_modified_attributes(storage_node, self.parameters)
         if 'bucket_info' in modified_attributes:
             messages.append("Modifying the bucket info is currently not supported")
             modified_attributes.pop('bucket_info')
@@ -270,6 +272,7 @@ class CteraPortalStorageNode(CteraPortalBase):
             self.ansible_module.ctera_return_value().skipped().msg('Storage Node already does not exist').put(name=self.parameters['name'])
 
     def _get_storage_node(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         storage_node = None
         try:
             storage_node = self._ctera_portal.buckets.get(self.parameters['name'], include=CteraPortalStorageNode._bucket_fields)
@@ -288,11 +291,12 @@ class CteraPortalStorageNode(CteraPortalBase):
 
     @staticmethod
     def _get_bucket_info(storage_node_obj):
+        variable_field_names = _variable_field_names()
         bucket_info_dict = {
             field: getattr(
                 storage_node_obj,
-                _VARIABLE_FIELD_NAMES[field].get(storage_node_obj.storage, _VARIABLE_FIELD_NAMES[field]['default'])
-            ) for field in _VARIABLE_FIELD_NAMES
+                variable_field_names[field].get(storage_node_obj.storage, variable_field_names[field]['default'])
+            ) for field in variable_field_names
         }
         bucket_info_dict.update(
             {
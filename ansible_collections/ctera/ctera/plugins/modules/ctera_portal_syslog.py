@@ -72,16 +72,10 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
 
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
-
 class CteraPortalSyslog(CteraPortalBase):
 
     def __init__(self):
@@ -110,7 +104,7 @@ class CteraPortalSyslog(CteraPortalBase):
     def _ensure_enabled(self):
         if self._ctera_portal.syslog.is_enabled():
             syslog_config = self._get_current_syslog_config()
-            modified_attributes = ctera_common.get_modified_attributes(syslog_config, self.parameters)
+            modified_attributes = ctera_compare.get_modified_attributes(syslog_config, self.parameters)
             if modified_attributes:
                 self._ctera_portal.syslog.modify(**modified_attributes)
                 self.ansible_module.ctera_return_value().changed().msg('Syslog server configuration was modified')
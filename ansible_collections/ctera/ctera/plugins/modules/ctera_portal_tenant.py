@@ -69,12 +69,7 @@ EXAMPLES = '''
 
 RETURN = r''' # '''
 
-try:
-    from cterasdk import CTERAException
-except ImportError:  # pragma: no cover
-    pass  # caught by ctera_common
-
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
 from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_base import CteraPortalBase
 
 
@@ -126,7 +121,7 @@ class CteraPortalTenant(CteraPortalBase):
             changed = True
             messages.append('Tenant was undeleted')
 
-        modified_attributes = ctera_common.get_modified_attributes(tenant, self.parameters)
+        modified_attributes = ctera_compare.get_modified_attributes(tenant, self.parameters)
         if modified_attributes:
             new_plan = modified_attributes.pop('plan', None)
             if new_plan is not None:
@@ -153,6 +148,7 @@ class CteraPortalTenant(CteraPortalBase):
             self.ansible_module.ctera_return_value().skipped().msg('Tenant already does not exist').put(name=self.parameters['name'])
 
     def _get_tenant(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
         tenant = None
         try:
             tenant = self._ctera_portal.portals.get(
@@ -0,0 +1,506 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+ANSIBLE_METADATA = {
+    'metadata_version': '1.1',
+    'status': ['preview'],
+    'supported_by': 'community'
+}
+
+DOCUMENTATION = '''
+---
+module: ctera_portal_tenant_state
+short_description: Onboard a CTERA Portal tenant from a single desired state document
+description:
+    - Create the tenant if it does not exist and subscribe it to a plan.
+    - Browse into the tenant once and reconcile its directory services, access control rules, local users, folder groups and cloud folders.
+    - Sections that do not depend on each other are applied concurrently.
+      Local users and folder groups are created concurrently, and the cloud folders of different owners are created concurrently.
+    - A section whose dependency failed is skipped.
+    - Objects are created or modified, and never deleted.
+extends_documentation_fragment:
+    - ctera.ctera.ctera
+
+author:
+    - Saimon Michelson (@saimonation)
+    - Ygal Blum (@ygalblum)
+
+options:
+  name:
+    description: The name of the tenant
+    required: True
+    type: str
+  display_name:
+    description: The display name of the tenant. Used when the tenant is created
+    type: str
+  billing_id:
+    description: The billing ID of the tenant. Used when the tenant is created
+    type: str
+  company:
+    description: The company name of the tenant. Used when the tenant is created
+    type: str
+  comment:
+    description: Comment. Used when the tenant is created
+    type: str
+  plan:
+    description: The plan of the tenant
+    type: str
+  directory_services:
+    description: Active Directory connection of the tenant
+    type: dict
+    suboptions:
+      domain:
+        description: Active Directory domain to connect to
+        type: str
+        required: True
+      username:
+        description: User Name to communicate with the Active Directory Service
+        type: str
+        required: True
+      password:
+        description: Password of the user to communicate with the Active Directory Service
+        type: str
+        required: True
+      ou:
+        description: The OU path to use when connecting to the active directory services
+        type: str
+      ssl:
+        description: Connect to the Active Directory using SSL
+        type: bool
+      krb:
+        description: Connect to the Active Directory using Kerberos
+        type: bool
+      domain_controllers:
+        description: Connect to a primary and a secondary domain controllers
+        type: list
+        elements: str
+  access_control:
+    description: Active Directory access control rules of the tenant
+    type: list
+    elements: dict
+    suboptions:
+      principal_type:
+        description: Principal type
+        type: str
+        required: True
+        choices: ['group', 'user']
+      domain:
+        description: Domain of the principal
+        type: str
+        required: True
+      name:
+        description: Name of the principal
+        type: str
+        required: True
+      role:
+        description: The role of the principal
+        type: str
+        required: True
+        choices: ['ReadWriteAdmin', 'ReadOnlyAdmin', 'Support', 'EndUser', 'Disabled']
+  users:
+    description: Local users of the tenant
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description: User name
+        required: True
+        type: str
+      email:
+        description: E-mail address of the user
+        type: str
+      first_name:
+        description: First name of the user
+        type: str
+      last_name:
+        description: Last name of the user
+        type: str
+      password:
+        description:
+        - Password of the user
+        - Required when the user does not exist
+        type: str
+      role:
+        description: User role. Users are created with C(Disabled) when it is not set
+        type: str
+        choices: ['Disabled', 'EndUser', 'ReadWriteAdmin', 'ReadOnlyAdmin', 'Support']
+      company:
+        description: Company name of the user
+        type: str
+      comment:
+        description: Comment
+        type: str
+      password_change:
+        description:
+        - Require the user to change the password on the first login, a date of a password change, or a number of days
+        type: raw
+        default: False
+  folder_groups:
+    description: Folder groups of the tenant
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description: The name of the folder group
+        required: True
+        type: str
+      owner:
+        description: The folder group owner
+        type: dict
+        suboptions:
+          name:
+            description: The user name
+            required: True
+            type: str
+          directory:
+            description: The fully-qualified name of the user directory, if the user belongs to one
+            type: str
+  cloud_folders:
+    description: Cloud folders of the tenant
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description: The name of the cloud folder
+        required: True
+        type: str
+      group:
+        description: The folder group to which the cloud folder belongs
+        required: True
+        type: str
+      owner:
+        description: The cloud folder owner
+        type: dict
+        required: True
+        suboptions:
+          name:
+            description: The user name
+            required: True
+            type: str
+          directory:
+            description: The fully-qualified name of the user directory, if the user belongs to one
+            type: str
+      winacls:
+        description: Use Windows ACLs
+        type: bool
+        default: True
+  workers:
+    description: Maximum number of objects that are created concurrently
+    type: int
+    default: 8
+  step_timeout:
+    description: Number of seconds to wait for a single section
+    type: int
+    default: 600
+
+requirements:
+    - cterasdk
+'''
+
+EXAMPLES = '''
+- name: Onboard a tenant
+  ctera_portal_tenant_state:
+    name: acme
+    display_name: ACME
+    plan: Good
+    users:
+      - name: alice
+        email: alice@acme.com
+        first_name: Alice
+        last_name: Wonderland
+        password: "{{ alice_password }}"
+        role: EndUser
+      - name: bob
+        email: bob@acme.com
+        first_name: Bob
+        last_name: Builder
+        password: "{{ bob_password }}"
+        role: EndUser
+    folder_groups:
+      - name: acme
+    cloud_folders:
+      - { name: alice, group: acme, owner: { name: alice } }
+      - { name: bob, group: acme, owner: { name: bob } }
+    ctera_host: "{{ ctera_portal_hostname }}"
+    ctera_user: "{{ ctera_portal_user }}"
+    ctera_password: "{{ ctera_portal_password }}"
+'''
+
+RETURN = '''
+steps:
+  description: The result of each managed section
+  returned: Always
+  type: dict
+  sample:
+    tenant:
+      status: done
+      changed: True
+      msg: Tenant was created
+      elapsed: 0.814
+    cloud_folders:
+      status: done
+      changed: True
+      msg: 'Created: alice, bob'
+      elapsed: 1.301
+elapsed:
+  description: Number of seconds it took to apply all the sections
+  returned: Always
+  type: float
+  sample: 4.102
+'''
+
+import time
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_compare
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_executor import BoundedExecutor, DependencyExecutor, TaskResult, set_step_results, timed
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_local_user_base import CteraPortalLocalUserBase
+
+
+class CteraPortalTenantState(CteraPortalLocalUserBase):
+    _tenant_create_params = ['name', 'display_name', 'billing_id', 'company', 'plan', 'comment']
+    _steps = ['directory_services', 'access_control', 'users', 'folder_groups', 'cloud_folders']
+    _dependencies = dict(
+        access_control=['directory_services'],
+        folder_groups=['directory_services', 'users'],
+        cloud_folders=['directory_services', 'users', 'folder_groups']
+    )
+    _compared_user_params = ['email', 'first_name', 'last_name', 'role', 'company', 'comment']
+    _portal_user_fields = ['email', 'firstName', 'lastName', 'role', 'company', 'comment']
+    _directory_services_connect_params = ['domain', 'username', 'password', 'ou', 'ssl', 'krb']
+    _item_keys = dict(
+        users=lambda user: user['name'],
+        folder_groups=lambda folder_group: folder_group['name'],
+        cloud_folders=lambda cloud_folder: '%s/%s' % (cloud_folder['owner']['name'], cloud_folder['name'])
+    )
+
+    def __init__(self):
+        user_options = CteraPortalLocalUserBase.user_argument_spec()
+        user_options['role'].pop('default')
+        owner_options = dict(name=dict(type='str', required=True), directory=dict(type='str'))
+        super().__init__(dict(
+            name=dict(type='str', required=True),
+            display_name=dict(type='str'),
+            billing_id=dict(type='str'),
+            company=dict(type='str'),
+            comment=dict(type='str'),
+            plan=dict(type='str'),
+            directory_services=dict(type='dict', options=dict(
+                domain=dict(type='str', required=True),
+                username=dict(type='str', required=True),
+                password=dict(type='str', required=True, no_log=True),
+                ou=dict(type='str'),
+                ssl=dict(type='bool'),
+                krb=dict(type='bool'),
+                domain_controllers=dict(type='list', elements='str')
+            )),
+            access_control=dict(type='list', elements='dict', options=dict(
+                principal_type=dict(type='str', required=True, choices=['group', 'user']),
+                domain=dict(type='str', required=True),
+                name=dict(type='str', required=True),
+                role=dict(type='str', required=True, choices=['ReadWriteAdmin', 'ReadOnlyAdmin', 'Support', 'EndUser', 'Disabled'])
+            )),
+            users=dict(type='list', elements='dict', options=user_options),
+            folder_groups=dict(type='list', elements='dict', options=dict(
+                name=dict(type='str', required=True),
+                owner=dict(type='dict', options=owner_options)
+            )),
+            cloud_folders=dict(type='list', elements='dict', options=dict(
+                name=dict(type='str', required=True),
+                group=dict(type='str', required=True),
+                owner=dict(type='dict', required=True, options=owner_options),
+                winacls=dict(type='bool', default=True)
+            )),
+            workers=dict(type='int', required=False, default=8),
+            step_timeout=dict(type='int', required=False, default=600)
+        ))
+        self._reject_duplicate_items()
+
+    @property
+    def _generic_failure_message(self):  # pragma: no cover
+        return 'Tenant onboarding failed'
+
+    def _reject_duplicate_items(self):
+        for step, key in CteraPortalTenantState._item_keys.items():
+            duplicates = ctera_common.get_duplicates(key(item) for item in self.parameters.get(step) or [])
+            if duplicates:
+                self.ansible_module.fail_json(msg='%s are listed more than once: %s' % (step.capitalize().replace('_', ' '), ', '.join(duplicates)))
+
+    def _execute(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        start = time.monotonic()
+        try:
+            results = dict(tenant=TaskResult(TaskResult.DONE, value=timed(self._ensure_tenant)()))
+        except CTERAException as error:
+            results = dict(tenant=TaskResult(TaskResult.ERROR, error=str(error)))
+        if results['tenant'].status == TaskResult.DONE:
+            self._ctera_portal.portals.browse(self.parameters['name'])
+            steps = [step for step in CteraPortalTenantState._steps if self.parameters.get(step) is not None]
+            tasks = {step: timed(getattr(self, '_ensure_%s' % step)) for step in steps}
+            dependencies = {
+                step: [dependency for dependency in CteraPortalTenantState._dependencies.get(step, []) if dependency in tasks] for step in steps
+            }
+            results.update(DependencyExecutor(len(steps), self.parameters['step_timeout']).run(tasks, dependencies))
+        set_step_results(
+            self.ansible_module.ctera_return_value().put(name=self.parameters['name']), results, round(time.monotonic() - start, 3),
+            'Tenant is in the desired state'
+        )
+
+    def _ensure_tenant(self):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        tenant = None
+        try:
+            tenant = self._ctera_portal.portals.get(self.parameters['name'], include=['name', 'plan', 'activationStatus'])
+        except CTERAException:
+            pass
+        if tenant is None:
+            create_params = {k: v for k, v in self.parameters.items() if k in CteraPortalTenantState._tenant_create_params and v is not None}
+            self._ctera_portal.portals.add(**create_params)
+            return True, 'Tenant was created'
+        messages = []
+        if tenant.activationStatus == 'Disabled':
+            self._ctera_portal.portals.undelete(self.parameters['name'])
+            messages.append('Tenant was undeleted')
+        plan = self.parameters.get('plan')
+        if plan is not None:
+            current_plan = self._ctera_portal.get(tenant.plan) if tenant.plan else None
+            if current_plan is None or current_plan.name != plan:
+                self._ctera_portal.portals.subscribe(self.parameters['name'], plan)
+                messages.append('Plan was changed')
+        return (True, ', '.join(messages)) if messages else (False, 'Tenant details did not change')
+
+    def _ensure_directory_services(self):
+        from cterasdk import CTERAException, portal_types  # pylint: disable=import-outside-toplevel
+        directory_services = self.parameters['directory_services']
+        connected_domain = self._ctera_portal.directoryservice.get_connected_domain()
+        if connected_domain:
+            if connected_domain == directory_services['domain'] and self._ctera_portal.directoryservice.connected():
+                return False, 'The tenant is already connected to Active Directory'
+            self._ctera_portal.directoryservice.disconnect()
+        connect_params = {
+            k: v for k, v in directory_services.items() if k in CteraPortalTenantState._directory_services_connect_params and v is not None
+        }
+        domain_controllers = directory_services.get('domain_controllers')
+        if domain_controllers:
+            if len(domain_controllers) > 2:
+                raise CTERAException(message="Cannot set more than two static domain controllers")
+            connect_params['domain_controllers'] = portal_types.DomainControllers(*domain_controllers)
+        self._ctera_portal.directoryservice.connect(**connect_params)
+        return True, 'Connected to Active Directory'
+
+    def _ensure_access_control(self):
+        from cterasdk import CTERAException, portal_types  # pylint: disable=import-outside-toplevel
+        acl = []
+        for ace in self.parameters['access_control']:
+            account_type = portal_types.GroupAccount if ace['principal_type'] == 'group' else portal_types.UserAccount
+            acl.append(portal_types.AccessControlEntry(account_type(ace['name'], ace['domain']), ace['role']))
+        current_acl = []
+        try:
+            current_acl = self._ctera_portal.directoryservice.get_access_control()
+        except CTERAException as error:
+            if error.response.code != 404:  # pylint: disable=no-member
+                raise
+        if not ctera_compare.compare_lists(
+                ['#'.join([str(ace.account), ace.role]) for ace in current_acl or []],
+                ['#'.join([str(ace.account), ace.role]) for ace in acl], get_list_diff=False):
+            return False, 'Access control details did not change'
+        self._ctera_portal.directoryservice.set_access_control(acl)
+        return True, 'Configured access control rules'
+
+    def _ensure_users(self):
+        current_users = {
+            user.name: tuple(getattr(user, field, None) for field in CteraPortalTenantState._portal_user_fields)
+            for user in self._ctera_portal.users.list_local_users(include=CteraPortalTenantState._portal_user_fields)
+        }
+        tasks = {}
+        for user in self.parameters['users']:
+            user = ctera_common.get_parameters(user)
+            current_user = current_users.get(user['name'])
+            if current_user is None:
+                tasks[user['name']] = lambda user=user: self._create_user(user)
+            else:
+                modified_attributes = {
+                    k: user[k] for k, current_value in zip(CteraPortalTenantState._compared_user_params, current_user)
+                    if k in user and ctera_compare.cmp(user[k], current_value) != 0
+                }
+                if modified_attributes:
+                    tasks[user['name']] = lambda name=user['name'], attributes=modified_attributes: self._ctera_portal.users.modify(
+                        name, **attributes)
+        return self._run_batch(tasks)
+
+    def _create_user(self, user):
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        create_params = {k: v for k, v in user.items() if k in CteraPortalLocalUserBase.create_params}
+        if create_params.get('password') is None:
+            raise CTERAException(message="Cannot create new user without a password")
+        create_params.setdefault('role', 'Disabled')
+        create_params['password_change'] = self._translate_password_change(create_params.get('password_change', False))
+        self._ctera_portal.users.add(**create_params)
+
+    def _ensure_folder_groups(self):
+        current_folder_groups = {folder_group.name for folder_group in self._ctera_portal.cloudfs.list_folder_groups(include=['name'])}
+        tasks = {
+            folder_group['name']: lambda folder_group=folder_group: self._ctera_portal.cloudfs.mkfg(
+                folder_group['name'], user=self._make_user_account(folder_group.get('owner'))
+            )
+            for folder_group in self.parameters['folder_groups'] if folder_group['name'] not in current_folder_groups
+        }
+        return self._run_batch(tasks)
+
+    def _ensure_cloud_folders(self):
+        current_cloud_folders = {
+            (cloud_folder.name, cloud_folder.owner.split('/')[-1])
+            for cloud_folder in self._ctera_portal.cloudfs.list_folders(include=['name', 'owner'])
+        }
+        # the cloud folders of an owner are created one after the other, and the folders of different owners concurrently
+        owners = {}
+        for cloud_folder in self.parameters['cloud_folders']:
+            if (cloud_folder['name'], cloud_folder['owner']['name']) not in current_cloud_folders:
+                owners.setdefault(cloud_folder['owner']['name'], []).append(cloud_folder)
+        tasks = {owner: lambda cloud_folders=cloud_folders: self._create_cloud_folders(cloud_folders) for owner, cloud_folders in owners.items()}
+        return self._run_batch(tasks, lambda owner: ', '.join(cloud_folder['name'] for cloud_folder in owners[owner]))
+
+    def _create_cloud_folders(self, cloud_folders):
+        for cloud_folder in cloud_folders:
+            self._ctera_portal.cloudfs.mkdir(
+                cloud_folder['name'],
+                cloud_folder['group'],
+                self._make_user_account(cloud_folder['owner']),
+                winacls=cloud_folder['winacls']
+            )
+
+    @staticmethod
+    def _make_user_account(user_details):
+        from cterasdk import portal_types  # pylint: disable=import-outside-toplevel
+        return portal_types.UserAccount(**user_details) if user_details else None
+
+    def _run_batch(self, tasks, describe=str):
+        '''
+        Runs the creation or modification of independent objects concurrently
+        :param dict tasks: Object key to callable
+        :param describe: Returns the description of the objects of a key
+        :return: tuple of changed and message
+        '''
+        from cterasdk import CTERAException  # pylint: disable=import-outside-toplevel
+        if not tasks:
+            return False, 'Objects did not change'
+        results = BoundedExecutor(self.parameters['workers'], self.parameters['step_timeout']).run(tasks)
+        applied = [describe(key) for key, result in results.items() if result.status == TaskResult.DONE]
+        failed = ['%s (%s)' % (describe(key), result.error) for key, result in results.items() if result.status != TaskResult.DONE]
+        if failed:
+            raise CTERAException(message='Applied: %s. Failed: %s' % (', '.join(applied) or 'None', ', '.join(failed)))
+        return True, 'Applied: %s' % ', '.join(applied)
+
+
+def main():  # pragma: no cover
+    CteraPortalTenantState().run()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
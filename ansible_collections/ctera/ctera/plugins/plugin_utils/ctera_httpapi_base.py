@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2020, CTERA Networks Ltd.
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.plugins.httpapi import HttpApiBase
+
+try:
+    from cterasdk import CTERAException, tojsonstr, config
+    HAS_CTERASDK = True
+except ImportError:  # pragma: no cover
+    HAS_CTERASDK = False
+
+
+class CteraHttpApiBase(HttpApiBase):
+    """
+    Keeps a single logged in CTERA session in the persistent connection process.
+    Modules running over this connection adopt the session id returned by get_session()
+    instead of logging in and out on every task.
+    """
+
+    def __init__(self, connection):
+        super().__init__(connection)
+        self._ctera_host = None
+
+    def _create_ctera_host(self, host, port, https):  # pragma: no cover
+        raise NotImplementedError("Implementing class must implement _create_ctera_host")
+
+    def login(self, username, password):
+        if not HAS_CTERASDK:  # pragma: no cover
+            raise AnsibleConnectionFailure('The CTERA httpapi plugins require cterasdk. Install using \'pip install cterasdk\'')
+        config.http['ssl'] = 'Consent' if self.connection.get_option('validate_certs') else 'Trust'
+        self._ctera_host = self._create_ctera_host(
+            self.connection.get_option('host'),
+            self.connection.get_option('port'),
+            self.connection.get_option('use_ssl')
+        )
+        try:
+            self._ctera_host.login(username, password)
+        except CTERAException as error:
+            self._ctera_host = None
+            raise AnsibleConnectionFailure('Login failed. Exception: %s' % tojsonstr(error, False))
+
+    def logout(self):
+        if self._ctera_host is not None:
+            try:
+                self._ctera_host.logout()
+            except CTERAException:
+                pass
+            self._ctera_host = None
+
+    def get_session(self):
+        if self._ctera_host is None:
+            self.connection._connect()  # pylint: disable=protected-access
+        return dict(
+            host=self._ctera_host.host(),
+            port=self._ctera_host.port(),
+            https=self._ctera_host.https(),
+            trust_certificate=not self.connection.get_option('validate_certs'),
+            session_id=self._ctera_host.get_session_id()
+        )
+
+    def send_request(self, data, **message_kwargs):
+        if self._ctera_host is None:
+            self.connection._connect()  # pylint: disable=protected-access
+        return tojsonstr(self._ctera_host.get(data), False)
@@ -0,0 +1,73 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Micro-benchmark of ctera_compare.compare_lists against the previous membership based implementation.
+
+Usage: python -m tests.benchmarks.bench_list_diff [size]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import sys
+import timeit
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_compare as ctera_compare
+
+
+def membership_compare_lists(current, desired, get_list_diff):
+    ''' The implementation of compare_lists that tests membership with "in", for reference '''
+    desired_diff_list = [item for item in desired if item not in current]
+    current_diff_list = [item for item in current if item not in desired]
+    if desired_diff_list or current_diff_list:
+        if get_list_diff:
+            return desired_diff_list
+        return desired
+    return []
+
+
+def make_acl(size, offset=0):
+    return [
+        dict(principal_type='LU', name='user%d' % i, perm='RW' if i % 2 else 'RO')
+        for i in range(offset, offset + size)
+    ]
+
+
+def bench(size, repeat=3):
+    current = make_acl(size)
+    desired = list(reversed(make_acl(size, offset=size // 100)))  # 1% of the entries replaced
+    assert ctera_compare.compare_lists(current, desired, True) == membership_compare_lists(current, desired, True)
+    results = {}
+    for name, compare in [('membership', membership_compare_lists), ('hashed', ctera_compare.compare_lists)]:
+        results[name] = min(timeit.repeat(lambda compare=compare: compare(current, desired, True), number=1, repeat=repeat))
+    return results
+
+
+def main(argv):
+    size = int(argv[1]) if len(argv) > 1 else 10000
+    results = bench(size)
+    for name, seconds in results.items():
+        print('%-10s %10.4f s' % (name, seconds))
+    print('speedup    %10.1fx' % (results['membership'] / results['hashed']))
+
+
+if __name__ == '__main__':
+    main(sys.argv)
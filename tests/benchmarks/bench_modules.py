@@ -0,0 +1,376 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the modules against the Gateway and Portal simulators.
+
+Every scenario runs the main function of a module in process against a fresh simulator, at each of the object counts
+and injected round trip times. A scenario records the wall time of the task, the number of HTTP round trips by method,
+and the CPU time spent in the attribute comparison helpers of ctera_compare. The single object scenarios run twice,
+so that the round trips of both the path that applies the change and the path that finds nothing to change are recorded.
+
+The results are written as JSON. The run fails if the module of any scenario fails. It does not start with a cterasdk
+older than the minimum version of the modules, whose scenarios would fail on the missing SDK APIs. When a baseline is
+given, the run also fails if any scenario makes more round trips than it did in the baseline, so regressions in round
+trip counts are caught regardless of the speed of the host.
+
+Usage: python -m tests.benchmarks.bench_modules [--sizes 10,1000,10000] [--rtt 0,0.005] [--scenario NAME]
+                                               [--output results.json] [--baseline baseline.json]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import collections
+import contextlib
+import functools
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+import warnings
+
+from cterasdk import config
+from cterasdk.edge import types as gateway_types
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_common as ctera_common
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_compare as ctera_compare
+from tests.simulator.gateway import GatewaySimulator, make_object
+from tests.simulator.portal import PortalSimulator
+from tests.simulator.runner import run_module
+
+
+Scenario = collections.namedtuple('Scenario', ['name', 'module', 'simulator', 'args', 'seed', 'scaled'])
+
+
+def scenario(name, module, simulator, args, seed=None, scaled=False):
+    '''
+    :param str name: Name of the scenario in the results
+    :param str module: Name of the module to run
+    :param simulator: Class of the simulator to run the module against, or a function that returns a simulator
+    :param args: Arguments of the task, or a function of the object count that returns them
+    :param seed: Function of the simulator and the object count that creates the existing objects
+    :param bool scaled: Whether the scenario runs at each object count. Otherwise it runs once, creating and then finding a single object
+    '''
+    return Scenario(name, 'ansible_collections.ctera.ctera.plugins.modules.%s' % module, simulator, args, seed, scaled)
+
+
+class ComparisonTimer:
+    ''' Accumulates the CPU time of the thread that runs the module in the attribute comparison helpers of ctera_compare.
+        Nested calls are included in the time of every helper, and counted once in the total
+    '''
+
+    functions = ['get_modified_attributes', 'compare_lists', 'diff_lists']
+
+    def __init__(self):
+        self.calls = collections.Counter()
+        self.seconds = collections.Counter()
+        self.total = 0
+        self._depth = 0
+
+    def _timed(self, name, function):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            self._depth += 1
+            start = time.thread_time()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.thread_time() - start
+                self._depth -= 1
+                self.calls[name] += 1
+                self.seconds[name] += elapsed
+                if self._depth == 0:
+                    self.total += elapsed
+        return timed
+
+    @contextlib.contextmanager
+    def patched(self):
+        originals = {name: getattr(ctera_compare, name) for name in ComparisonTimer.functions}
+        modified_attributes = ctera_compare.AttributeComparator.modified_attributes
+        for name, function in originals.items():
+            setattr(ctera_compare, name, self._timed(name, function))
+        ctera_compare.AttributeComparator.modified_attributes = self._timed('AttributeComparator.modified_attributes', modified_attributes)
+        try:
+            yield self
+        finally:
+            for name, function in originals.items():
+                setattr(ctera_compare, name, function)
+            ctera_compare.AttributeComparator.modified_attributes = modified_attributes
+
+    def summary(self):
+        return dict(
+            cpu=round(self.total, 6),
+            functions={name: dict(calls=self.calls[name], cpu=round(self.seconds[name], 6)) for name in sorted(self.calls)}
+        )
+
+
+def make_share(name, acl_size=0):
+    share = make_object(
+        'ShareConfig', name=name, volume='main', directory='/%s' % name, access='winAclMode', clientSideCaching='manual',
+        dirPermissions=777, comment=None, exportToAFP=False, exportToFTP=False, exportToNFS=False, exportToPCAgent=False,
+        exportToRSync=False, indexed=False, trustedNFSClients=[]
+    )
+    share.acl = [gateway_types.ShareAccessControlEntry(**entry).to_server_object() for entry in make_acl(acl_size)]
+    return share
+
+
+def make_acl(size, offset=0):
+    return [
+        dict(principal_type='LocalUser', name='user%d' % i, perm='ReadWrite' if i % 2 else 'ReadOnly')
+        for i in range(offset, offset + size)
+    ]
+
+
+def seed_shares(simulator, size):
+    for i in range(size):
+        simulator.store.add('config/fileservices/share', make_share('share%d' % i))
+
+
+def seed_acl(simulator, size):
+    simulator.store.add('config/fileservices/share', make_share('acl', acl_size=size))
+
+
+def seed_filer_users(simulator, size):
+    for i in range(size):
+        simulator.add_user('user%d' % i, 'password', full_name='User %d' % i)
+
+
+def seed_portal_users(simulator, size):
+    for i in range(size):
+        simulator.add_user('user%d' % i, 'password', role='EndUser', email='user%d@example.com' % i, firstName='User', lastName='Number%d' % i)
+
+
+def seed_tenant(simulator, size):  # pylint: disable=unused-argument
+    simulator.add_plan('gold')
+
+
+def seed_tenant_user(simulator, size):
+    seed_tenant(simulator, size)
+    simulator.add_tenant('acme', plan='gold')
+    simulator.add_user('alice', 'password', tenant='acme', role='EndUser')
+    simulator.store.add('portals/acme/foldersGroups', make_object('FolderGroup', name='alice', owner=None, disabled=False))
+
+
+SCENARIOS = [
+    scenario(
+        'filer_shares_noop', 'ctera_filer_shares', GatewaySimulator,
+        lambda size: dict(shares=[dict(name='share%d' % i, directory='main/share%d' % i, acl=[]) for i in range(size)]),
+        seed=seed_shares, scaled=True
+    ),
+    scenario(
+        'filer_shares_create', 'ctera_filer_shares', GatewaySimulator,
+        lambda size: dict(shares=[dict(name='share%d' % i, directory='main/share%d' % i) for i in range(size)]),
+        scaled=True
+    ),
+    scenario(
+        'filer_share_acl_incremental', 'ctera_filer_share', GatewaySimulator,
+        lambda size: dict(name='acl', directory='main/acl', acl_mode='incremental', acl=make_acl(size, offset=max(size // 100, 1))),
+        seed=seed_acl, scaled=True
+    ),
+    scenario(
+        'filer_users_noop', 'ctera_filer_users', GatewaySimulator,
+        lambda size: dict(users=[dict(username='user%d' % i, full_name='User %d' % i) for i in range(size)]),
+        seed=seed_filer_users, scaled=True
+    ),
+    scenario(
+        'portal_local_users_noop', 'ctera_portal_local_users', PortalSimulator,
+        lambda size: dict(users=[
+            dict(name='user%d' % i, email='user%d@example.com' % i, first_name='User', last_name='Number%d' % i, role='EndUser') for i in range(size)
+        ]),
+        seed=seed_portal_users, scaled=True
+    ),
+    scenario('filer_share', 'ctera_filer_share', GatewaySimulator, dict(name='demo', directory='main/demo', comment='benchmark')),
+    scenario('filer_user', 'ctera_filer_user', GatewaySimulator, dict(username='alice', password='password', full_name='Alice')),
+    scenario('filer_hostname', 'ctera_filer_hostname', GatewaySimulator, dict(hostname='benchmark')),
+    scenario('filer_location', 'ctera_filer_location', GatewaySimulator, dict(location='lab')),
+    scenario('filer_timezone', 'ctera_filer_timezone', GatewaySimulator, dict(timezone='(GMT+02:00) Jerusalem')),
+    scenario('filer_ntp', 'ctera_filer_ntp', GatewaySimulator, dict(servers=['0.pool.ntp.org', '1.pool.ntp.org'])),
+    scenario('filer_syslog', 'ctera_filer_syslog', GatewaySimulator, dict(server='syslog.example.com')),
+    scenario('filer_snmp', 'ctera_filer_snmp', GatewaySimulator, dict(community_str='public')),
+    scenario('filer_ftp', 'ctera_filer_ftp', GatewaySimulator, dict(banner_message='benchmark')),
+    scenario('filer_nfs', 'ctera_filer_nfs', GatewaySimulator, dict(async_write=False)),
+    scenario('filer_rsync', 'ctera_filer_rsync', GatewaySimulator, dict(max_connections=20)),
+    scenario('filer_smb', 'ctera_filer_smb', GatewaySimulator, dict(packet_signing='If client agrees')),
+    scenario('filer_telnet', 'ctera_filer_telnet', GatewaySimulator, dict(enabled=True, code='benchmark')),
+    scenario('filer_facts', 'ctera_filer_facts', GatewaySimulator, dict()),
+    scenario('filer_volume', 'ctera_filer_volume', GatewaySimulator, dict(name='data', size=512)),
+    scenario('filer_volume_delete', 'ctera_filer_volume', GatewaySimulator, dict(name='main', state='absent')),
+    scenario('filer_array', 'ctera_filer_array', GatewaySimulator, dict(array_name='array', level='linear', members=['SATA1'])),
+    scenario('filer_network', 'ctera_filer_network', GatewaySimulator, dict(mode='dynamic', primary_dns_server='8.8.8.8')),
+    scenario('filer_async_io', 'ctera_filer_async_io', GatewaySimulator, dict(enabled=True)),
+    scenario('filer_license', 'ctera_filer_license', GatewaySimulator, dict(license='EV32')),
+    scenario('filer_domain_controllers', 'ctera_filer_domain_controllers', GatewaySimulator, dict(domain_controllers=['10.0.0.1'])),
+    scenario('filer_wizard', 'ctera_filer_wizard', GatewaySimulator, dict(enabled=True)),
+    scenario('filer_cloud_cache', 'ctera_filer_cloud_cache', GatewaySimulator, dict(enabled=False)),
+    scenario(
+        'filer_first_user', 'ctera_filer_first_user', functools.partial(GatewaySimulator, users={}),
+        dict(ctera_user='admin', ctera_password='password', email='admin@example.com')
+    ),
+    scenario('filer_services', 'ctera_filer_services', GatewaySimulator, dict(services=dict(
+        smb=dict(enabled=True, packet_signing='Required'), rsync=dict(enabled=True, port=8730), syslog=dict(enabled=True, server='syslog.example.com')
+    ))),
+    scenario('filer_state', 'ctera_filer_state', GatewaySimulator, dict(desired_state=dict(
+        hostname='benchmark',
+        volumes=[dict(name='data', size=512)],
+        users=[dict(username='alice', password='password')],
+        shares=[dict(name='demo', directory='data/demo')]
+    ))),
+    scenario('portal_plan', 'ctera_portal_plan', PortalSimulator, dict(name='gold')),
+    scenario('portal_tenant', 'ctera_portal_tenant', PortalSimulator, dict(name='acme', plan='gold'), seed=seed_tenant),
+    scenario('portal_local_user', 'ctera_portal_local_user', PortalSimulator, dict(
+        name='alice', email='alice@example.com', first_name='Alice', last_name='Smith', password='password'
+    )),
+    scenario('portal_folder_group', 'ctera_portal_folder_group', PortalSimulator, dict(name='benchmark', tenant='acme'), seed=seed_tenant_user),
+    scenario(
+        'portal_cloud_folder', 'ctera_portal_cloud_folder', PortalSimulator,
+        dict(name='benchmark', group='alice', owner=dict(name='alice'), tenant='acme'), seed=seed_tenant_user
+    ),
+    scenario('portal_tenant_state', 'ctera_portal_tenant_state', PortalSimulator, dict(
+        name='acme', plan='gold',
+        users=[dict(name='bob', email='bob@example.com', first_name='Bob', last_name='Builder', password='password', role='EndUser')],
+        folder_groups=[dict(name='bob')],
+        cloud_folders=[dict(name='bob', group='bob', owner=dict(name='bob'))]
+    ), seed=seed_tenant_user),
+    scenario('portal_facts', 'ctera_portal_facts', PortalSimulator, dict()),
+]
+
+
+def run(scenario_, size, rtt):
+    '''
+    Runs the module of the scenario against a fresh simulator
+
+    :return: the measurements of every run of the module
+    '''
+    module = importlib.import_module(scenario_.module)
+    simulator = scenario_.simulator()
+    if scenario_.seed is not None:
+        scenario_.seed(simulator, size)
+    args = scenario_.args(size) if callable(scenario_.args) else scenario_.args
+    runs = []
+    with simulator:
+        simulator.latency = rtt
+        for phase in ['apply'] if scenario_.scaled else ['apply', 'noop']:
+            simulator.reset_requests()
+            timer = ComparisonTimer()
+            with timer.patched():
+                start, cpu = time.perf_counter(), time.process_time()
+                try:
+                    result = run_module(module, simulator.connection_args(**args))
+                except Exception as error:  # pylint: disable=broad-except
+                    result = dict(failed=True, msg='%s: %s' % (type(error).__name__, error))
+                wall, cpu = time.perf_counter() - start, time.process_time() - cpu
+            runs.append(dict(
+                scenario=scenario_.name,
+                phase=phase,
+                size=size,
+                rtt=rtt,
+                changed=result.get('changed', False),
+                failed=result.get('failed', False),
+                msg=result.get('msg') if result.get('failed') else None,
+                wall=round(wall, 6),
+                process_cpu=round(cpu, 6),
+                round_trips=simulator.round_trips(),
+                round_trips_by_method={method: simulator.round_trips(method) for method in ['GET', 'PUT', 'POST', 'DELETE']},
+                compare=timer.summary()
+            ))
+    return runs
+
+
+def key(result):
+    return '%s/%s/%d/%g' % (result['scenario'], result['phase'], result['size'], result['rtt'])
+
+
+def failures(results):
+    ''' :return: a message for every result whose module failed '''
+    return ['%s: %s' % (key(result), result['msg']) for result in results if result['failed']]
+
+
+def regressions(results, baseline):
+    '''
+    :return: a message for every result that makes more round trips than its counterpart in the baseline.
+             Failed results are reported by failures, and failed baseline results are not a reference
+    '''
+    previous = {key(result): result for result in baseline['results'] if not result.get('failed')}
+    messages = []
+    for result in results:
+        expected = previous.get(key(result))
+        if expected is not None and not result['failed'] and result['round_trips'] > expected['round_trips']:
+            messages.append('%s: %d round trips, %d in the baseline' % (key(result), result['round_trips'], expected['round_trips']))
+    return messages
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='bench_modules', description='Benchmark of the modules against the CTERA simulators')
+    parser.add_argument('--sizes', default='10,1000,10000', help='Comma separated object counts of the scaled scenarios')
+    parser.add_argument('--rtt', default='0,0.005', help='Comma separated round trip times to inject, in seconds')
+    parser.add_argument('--scenario', action='append', help='Name of a scenario to run, all of them if omitted')
+    parser.add_argument('--output', help='Path of the JSON results, printed if omitted')
+    parser.add_argument('--baseline', help='Path of the JSON results of a previous run, to fail on round trip regressions')
+    return parser.parse_args(argv[1:])
+
+
+def main(argv):
+    args = parse_args(argv)
+    if not ctera_common.is_supported_cterasdk(ctera_common.cterasdk_version()):
+        sys.stderr.write('cterasdk %s or later is required, found %s\n' % (ctera_common.CTERASDK_MIN_VERSION, ctera_common.cterasdk_version()))
+        return 2
+    # the simulators serve a self signed certificate. requests verifies it against these bundles even when the SDK trusts it
+    for variable in ['REQUESTS_CA_BUNDLE', 'CURL_CA_BUNDLE']:
+        os.environ.pop(variable, None)
+    config.http['ssl'] = 'Trust'
+    warnings.simplefilter('ignore')
+    logging.disable(logging.INFO)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    rtts = [float(rtt) for rtt in args.rtt.split(',')]
+    results = []
+    for scenario_ in SCENARIOS:
+        if args.scenario and scenario_.name not in args.scenario:
+            continue
+        for size in sizes if scenario_.scaled else [1]:
+            for rtt in rtts:
+                for result in run(scenario_, size, rtt):
+                    results.append(result)
+                    sys.stderr.write('%-45s %6s %10.4f s %6d round trips%s\n' % (
+                        key(result), result['phase'], result['wall'], result['round_trips'], ' FAILED' if result['failed'] else ''
+                    ))
+    document = json.dumps(dict(sizes=sizes, rtt=rtts, results=results), indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(document)
+    else:
+        print(document)
+    messages = failures(results)
+    for message in messages:
+        sys.stderr.write('Failed: %s\n' % message)
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            regressed = regressions(results, json.load(f))
+        for message in regressed:
+            sys.stderr.write('Round trip regression: %s\n' % message)
+        messages.extend(regressed)
+    return 1 if messages else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
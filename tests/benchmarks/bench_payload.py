@@ -0,0 +1,165 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the size of the AnsiballZ payload of the modules.
+
+Ansible ships every module to the managed node in a zip archive, together with the module_utils that it imports,
+directly or through other module_utils. AnsiballZ finds them by walking all the imports of the source, including the
+imports inside of functions, so a module_utils file is shipped with every module that can reach it.
+
+For every module, the benchmark reports the module_utils of the collection that it ships and their deflated size,
+which this collection controls. With --ansiballz, the payload is also built with the module builder of Ansible, and the
+size of the wrapper and of the whole archive, which includes the module_utils of Ansible itself, are reported.
+
+Usage: python -m tests.benchmarks.bench_payload [--module NAME] [--ansiballz] [--output results.json]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import ast
+import base64
+import io
+import json
+import os
+import pkgutil
+import re
+import sys
+import zipfile
+
+
+# The collection is not imported, so that the collection loader of Ansible can be installed to build the payloads
+COLLECTIONS_PATH = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PLUGINS_PATH = os.path.join(COLLECTIONS_PATH, 'ansible_collections', 'ctera', 'ctera', 'plugins')
+MODULES_PATH = os.path.join(PLUGINS_PATH, 'modules')
+MODULE_UTILS_PATH = os.path.join(PLUGINS_PATH, 'module_utils')
+MODULE_UTILS = 'ansible_collections.ctera.ctera.plugins.module_utils'
+
+
+def _imported_module_utils(path):
+    ''' :return: the names of the module_utils of the collection that the source imports, anywhere in it '''
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            if node.module == MODULE_UTILS:
+                names.update(alias.name for alias in node.names)
+            elif node.module.startswith(MODULE_UTILS + '.'):
+                names.add(node.module.split('.')[-1])
+        elif isinstance(node, ast.Import):
+            names.update(alias.name.split('.')[-1] for alias in node.names if alias.name.startswith(MODULE_UTILS + '.'))
+    return names
+
+
+def module_utils_closure(module_name):
+    ''' :return: the sorted names of the module_utils of the collection that are shipped with the module '''
+    shipped = set()
+    pending = list(_imported_module_utils(os.path.join(MODULES_PATH, module_name + '.py')))
+    while pending:
+        name = pending.pop()
+        if name not in shipped:
+            shipped.add(name)
+            pending.extend(_imported_module_utils(os.path.join(MODULE_UTILS_PATH, name + '.py')))
+    return sorted(shipped)
+
+
+def collection_payload(module_name):
+    '''
+    Deflates the module and the module_utils of the collection that it ships, as AnsiballZ does
+
+    :return: the shipped module_utils, and the size of the files before and after compression
+    '''
+    paths = [os.path.join(MODULES_PATH, module_name + '.py')]
+    closure = module_utils_closure(module_name)
+    paths.extend(os.path.join(MODULE_UTILS_PATH, name + '.py') for name in closure)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for path in paths:
+            archive.write(path, os.path.basename(path))
+        infolist = archive.infolist()
+    return dict(
+        module=module_name,
+        module_utils=closure,
+        size=sum(info.file_size for info in infolist),
+        compressed_size=sum(info.compress_size for info in infolist)
+    )
+
+
+def ansiballz_payload(module_name):
+    ''' :return: the size of the AnsiballZ wrapper of the module, and of the archive in it, as built by Ansible '''
+    from ansible.executor.module_common import modify_module  # pylint: disable=import-outside-toplevel
+    from ansible.parsing.dataloader import DataLoader  # pylint: disable=import-outside-toplevel
+    from ansible.template import Templar  # pylint: disable=import-outside-toplevel
+    built = modify_module(
+        module_name='ctera.ctera.%s' % module_name,
+        module_path=os.path.join(MODULES_PATH, module_name + '.py'),
+        module_args={},
+        templar=Templar(loader=DataLoader()),
+        task_vars=dict(ansible_python_interpreter=sys.executable),
+        module_compression='ZIP_DEFLATED'
+    )
+    wrapper = built[0] if isinstance(built, tuple) else built.b_module_data
+    archive = base64.b64decode(max(re.findall(rb'[A-Za-z0-9+/=]{1000,}', wrapper), key=len))
+    infolist = zipfile.ZipFile(io.BytesIO(archive)).infolist()
+    return dict(wrapper_size=len(wrapper), archive_size=len(archive), archive_files=len(infolist))
+
+
+def _install_collection_loader():
+    from ansible.utils.collection_loader._collection_finder import _AnsibleCollectionFinder  # pylint: disable=import-outside-toplevel
+    _AnsibleCollectionFinder(paths=[COLLECTIONS_PATH])._install()  # pylint: disable=protected-access
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='bench_payload', description='Benchmark of the size of the AnsiballZ payload of the modules')
+    parser.add_argument('--module', action='append', help='Name of a module to measure, all of them if omitted')
+    parser.add_argument('--ansiballz', action='store_true', help='Build the payload with the module builder of Ansible as well')
+    parser.add_argument('--output', help='Path of the JSON results, printed if omitted')
+    return parser.parse_args(argv[1:])
+
+
+def main(argv):
+    args = parse_args(argv)
+    names = args.module or sorted(module.name for module in pkgutil.iter_modules([MODULES_PATH]))
+    if args.ansiballz:
+        _install_collection_loader()
+    results = []
+    for name in names:
+        result = collection_payload(name)
+        if args.ansiballz:
+            result.update(ansiballz_payload(name))
+        results.append(result)
+        sys.stderr.write('%-50s %8d bytes deflated  %2d module_utils%s\n' % (
+            name, result['compressed_size'], len(result['module_utils']),
+            '  archive %8d bytes' % result['archive_size'] if args.ansiballz else ''
+        ))
+    document = json.dumps(dict(results=results), indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(document)
+    else:
+        print(document)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,123 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the startup time of the modules.
+
+Every sample runs in a fresh interpreter, the way Ansible runs a module on the managed node. A sample records the time
+to import the module, the time until the module exits on a task that fails argument validation, whether the CTERA SDK
+was imported by then, and the time that importing the SDK would have added. The modules import the SDK only once their
+arguments were validated, so the import time of the SDK is the saving per task that fails validation, and the time
+that every other task spends on it.
+
+The results are written as JSON, with the median of the samples of every module.
+
+Usage: python -m tests.benchmarks.bench_startup [--module NAME] [--repeat 5] [--output results.json]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import importlib
+import json
+import pkgutil
+import statistics
+import subprocess
+import sys
+import time
+
+import ansible_collections.ctera.ctera.plugins.modules as modules
+
+
+def sample(module_name):
+    '''
+    Measures the startup of a module in this interpreter, which must not have imported it yet
+
+    :return: the measurements of the module, in seconds
+    '''
+    from tests.simulator.runner import run_module  # pylint: disable=import-outside-toplevel
+    start = time.perf_counter()
+    module = importlib.import_module('%s.%s' % (modules.__name__, module_name))
+    imported = time.perf_counter()
+    result = run_module(module, dict())  # every module requires arguments, the connection arguments at least
+    exited = time.perf_counter()
+    sdk_imported = 'cterasdk' in sys.modules
+    importlib.import_module('cterasdk')
+    return dict(
+        import_time=imported - start,
+        validation_failure_time=exited - start,
+        validation_failed=result.get('failed', False),
+        sdk_imported=sdk_imported,
+        sdk_import_time=time.perf_counter() - exited if not sdk_imported else 0.0
+    )
+
+
+def run(module_name, repeat):
+    ''' :return: the median of the measurements of the samples of the module, each taken in a fresh interpreter '''
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-W', 'ignore', '-m', 'tests.benchmarks.bench_startup', '--sample', module_name],
+            check=True, stdout=subprocess.PIPE, universal_newlines=True
+        ).stdout
+        samples.append(json.loads(output))
+    result = dict(module=module_name, samples=len(samples))
+    for field in ['import_time', 'validation_failure_time', 'sdk_import_time']:
+        result[field] = round(statistics.median(sample_[field] for sample_ in samples), 6)
+    for field in ['validation_failed', 'sdk_imported']:
+        result[field] = any(sample_[field] for sample_ in samples)
+    return result
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='bench_startup', description='Benchmark of the startup time of the modules')
+    parser.add_argument('--module', action='append', help='Name of a module to measure, all of them if omitted')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of fresh interpreters to sample every module in')
+    parser.add_argument('--output', help='Path of the JSON results, printed if omitted')
+    parser.add_argument('--sample', help=argparse.SUPPRESS)
+    return parser.parse_args(argv[1:])
+
+
+def main(argv):
+    args = parse_args(argv)
+    if args.sample:
+        print(json.dumps(sample(args.sample)))
+        return 0
+    names = args.module or sorted(module.name for module in pkgutil.iter_modules(modules.__path__))
+    results = []
+    for name in names:
+        result = run(name, args.repeat)
+        results.append(result)
+        sys.stderr.write('%-50s import %8.4f s  failed validation %8.4f s  SDK %s %8.4f s\n' % (
+            name, result['import_time'], result['validation_failure_time'],
+            'imported' if result['sdk_imported'] else 'deferred', result['sdk_import_time']
+        ))
+    document = json.dumps(dict(repeat=args.repeat, results=results), indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(document)
+    else:
+        print(document)
+    return 1 if any(result['sdk_imported'] or not result['validation_failed'] for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
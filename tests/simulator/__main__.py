@@ -0,0 +1,58 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Serves a simulated Edge Filer or Portal until interrupted.
+
+Usage: python -m tests.simulator {gateway,portal} [--port PORT] [--latency SECONDS] [--http]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import argparse
+import sys
+import threading
+
+from tests.simulator.gateway import GatewaySimulator
+from tests.simulator.portal import PortalSimulator
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog='python -m tests.simulator')
+    parser.add_argument('kind', choices=['gateway', 'portal'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0, help='seconds to delay each response by')
+    parser.add_argument('--http', action='store_true', help='serve HTTP instead of HTTPS')
+    args = parser.parse_args(argv[1:])
+    simulator_class = GatewaySimulator if args.kind == 'gateway' else PortalSimulator
+    with simulator_class(latency=args.latency, host=args.host, port=args.port, https=not args.http) as simulator:
+        print('Serving a simulated %s at %s://%s:%d, log in as admin/password' % (
+            args.kind, 'http' if args.http else 'https', simulator.host, simulator.port
+        ))
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -0,0 +1,215 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Simulator of the CTERA Edge Filer (Gateway) API, served under /admingui/api.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+from cterasdk.common import Object
+
+from tests.simulator.server import CteraSimulator, SimulatorError
+from tests.simulator.store import ObjectStore
+
+
+def make_object(classname=None, **kwargs):
+    obj = Object()
+    if classname:
+        obj._classname = classname  # pylint: disable=protected-access
+    for key, value in kwargs.items():
+        setattr(obj, key, value)
+    return obj
+
+
+def default_state(hostname='vGateway'):
+    ''' :return: the configuration and status tree of a freshly installed Edge Filer with a single volume '''
+    disabled = 'disabled'
+    return make_object(
+        config=make_object(
+            auth=make_object(users=[]),
+            backup=None,
+            cloudsync=make_object(
+                mode='enabled',
+                cloudExtender=make_object(operationMode='CachingGateway', selectedFolders=None),
+                excludeFiles=None
+            ),
+            device=make_object(hostname=hostname, location=None, activeLicenseType='EV16', telnet=disabled),
+            fileservices=make_object(
+                share=[],
+                afp=make_object(mode=disabled),
+                cifs=make_object(
+                    mode='enabled', packetSigning='Disabled', idleDisconnectTime=0, compatibilityMode=False,
+                    cifsUnixExtensions=True, hideUnreadable=False, robustMutexes=False, aioReadThreshold=0,
+                    aioWriteThreshold=0, type='workgroup', workgroup='CTERA', domain=None, passwordServer=None,
+                    minClientProtocol='SMB2', maxClientProtocol='SMB3', minServerProtocol='SMB2', maxServerProtocol='SMB3',
+                    idMapping=make_object(map=[])
+                ),
+                ftp=make_object(
+                    mode=disabled, AllowAnonymousFTP=False, AnonymousDownloadLimit=0, AnonymousFTPFolder=None,
+                    BannerMessage=None, MaxConnectionsPerIP=5, RequireSSL=False
+                ),
+                nfs=make_object(mode=disabled, aggregateWrites='enabled', nfsv4enabled=False, **{'async': 'disabled'}),
+                rsync=make_object(server=disabled, port=873, maxConnections=10)
+            ),
+            gui=make_object(openFirstTimeWizard=False, adminRemoteAccessSSO=False),
+            logging=make_object(syslog=make_object(mode=disabled, server=None, port=514, proto='UDP', minSeverity='info')),
+            network=make_object(ports=[make_object(ethernet=make_object(mtu=1500), ip=make_object(
+                DHCPMode='enabled', address='192.168.0.10', netmask='255.255.255.0', gateway='192.168.0.1',
+                DNSServer1='192.168.0.1', DNSServer2=None
+            ))]),
+            services=None,
+            snmp=make_object(mode=disabled, port=161, readCommunity=None, snmpV3=make_object(
+                mode=disabled, username=None, password=None, authenticationPassword=None, privacyPassword=None
+            )),
+            storage=make_object(arrays=[], volumes=[]),
+            time=make_object(TimeZone='(GMT-05:00) Eastern Time (US , Canada)', NTPMode='enabled', NTPServer=[])
+        ),
+        defaults=make_object(BackupSettings=make_object('BackupSettings', backupPolicy=make_object(includeSets=[]))),
+        nosession=make_object(logininfo=make_object(isfirstlogin=True, hostname=hostname)),
+        proc=make_object(
+            backup=make_object(backupStatus=make_object(serviceStatus=make_object(id='Off'))),
+            bgtasks=[],
+            cloudsync=make_object(serviceStatus=make_object(id='Synced'))
+        ),
+        status=make_object(
+            device=make_object(runningFirmware='7.0'),
+            fileservices=make_object(cifs=make_object(joinStatus=1)),
+            network=make_object(ports=[make_object(ip=make_object(address='192.168.0.10'))]),
+            services=make_object(
+                CTERAPortal=make_object(connectionState='Disconnected', serverList=None),
+                userDisplayName=None
+            ),
+            storage=make_object(arrays=[], disks=[make_object(name='SATA1', availableCapacity=1048576)])
+        )
+    )
+
+
+class GatewaySimulator(CteraSimulator):
+    ''' Serves an Edge Filer at http://host:port/admingui/api.
+        Portals may serve the same simulator to relay the requests to a managed device
+    '''
+
+    session_cookie = '_cteraSessionId_'
+
+    def __init__(self, hostname='vGateway', volumes=None, users=None, latency=0, host='127.0.0.1', port=0, https=True):
+        '''
+        :param list[str] volumes: Names of the volumes to create, defaults to a single volume named main
+        :param dict users: Passwords of the users to create by user name, defaults to admin. The first login wizard is pending if empty
+        '''
+        super().__init__(ObjectStore(default_state(hostname)), latency=latency, host=host, port=port, https=https)
+        for username, password in (users if users is not None else dict(admin='password')).items():
+            self.add_user(username, password)
+        for volume in volumes if volumes is not None else ['main']:
+            self.store.add('config/storage/volumes', make_object('Volume', name=volume, device='SATA1', fileSystemType='xfs', size=1024))
+        self.register_method('listPhysicalFolders', self._list_physical_folders)
+        self.register_method('startTelnetd', self._set_telnet('enabled'))
+        self.register_method('stopTelnetd', self._set_telnet('disabled'))
+        self.register_method('joinDomain', self._join_domain)
+        self.register_method('enumDiscoveredDomains', lambda session, path, param: [])
+        for name in ['reboot', 'poweroff', 'reset2default', 'reconnect', 'forceExecuteEvictor', 'refreshPaths', 'start', 'pause', 'resume']:
+            self.register_method(name, lambda session, path, param: None)
+
+    def add_user(self, username, password, full_name=None, email=None):
+        self.store.add('config/auth/users', make_object('UserConfig', username=username, password=password, fullName=full_name, email=email, uid=None))
+        self.store.put('nosession/logininfo/isfirstlogin', False)
+
+    def _authenticate(self, username, password):
+        path = 'config/auth/users/%s' % username
+        return self.store.exists(path) and self.store.resolve(path).password == password
+
+    def _route(self, path):
+        prefix = '/admingui/api'
+        if not path.startswith(prefix):
+            raise SimulatorError(404, 'Unknown path %s' % path)
+        return self.route_api(path[len(prefix):])
+
+    def route_api(self, api_path):
+        '''
+        :return: the handler of a path relative to the API, which portals that relay requests to the device share
+        '''
+        if api_path == '/login':
+            return self.login, api_path
+        if api_path == '/logout':
+            return self.logout, api_path
+        if api_path == '/nosession/createfirstuser':
+            return self._create_first_user, api_path
+        if api_path.startswith('/nosession'):
+            return self.serve, api_path
+        return self.api, api_path
+
+    def serve(self, request):
+        segments = [segment for segment in request.path.split('/') if segment]
+        if segments[:3] == ['config', 'fileservices', 'share'] and request.method in ('POST', 'PUT') and len(segments) <= 4:
+            value = request.value()
+            for share in value if isinstance(value, list) else [getattr(value, 'param', value)]:
+                GatewaySimulator._normalize_share(share)
+        return super().serve(request)
+
+    def post(self, request):
+        if request.operation == 'db query':  # the queries of the filer match a single key, and are not paged
+            param = request.value().param
+            return self.store.query(request.path, None, predicate=lambda item: getattr(item, param.key, None) == param.value).objects
+        return super().post(request)
+
+    @staticmethod
+    def _normalize_share(share):
+        ''' The directory of a share is stored relative to its volume, with a leading slash '''
+        directory = getattr(share, 'directory', None)
+        if directory is not None and not directory.startswith('/'):
+            share.directory = '/' + directory
+
+    def get(self, request):
+        path = request.path.strip('/')
+        if path == 'currentuser':
+            return make_object(username=request.session.username)
+        if path.startswith('status/storage/volumes'):
+            return self._volume_status(path)
+        return super().get(request)
+
+    def _volume_status(self, path):
+        ''' Volumes are mounted as soon as they are added '''
+        volumes = [make_object(name=volume.name, status='ok') for volume in self.store.get('config/storage/volumes')]
+        return ObjectStore(make_object(volumes=volumes)).get(path[len('status/storage/'):])
+
+    def _create_first_user(self, request):
+        user = request.value()
+        with self.lock:
+            self.add_user(user.username, user.password, full_name=getattr(user, 'fullName', None), email=getattr(user, 'email', None))
+
+    def _list_physical_folders(self, session, path, param):  # pylint: disable=unused-argument
+        return [
+            make_object(name=volume.name, type='volume', fullpath='/%s' % volume.name)
+            for volume in self.store.get('config/storage/volumes')
+        ]
+
+    def _set_telnet(self, mode):
+        def set_telnet(session, path, param):  # pylint: disable=unused-argument
+            if mode == 'enabled' and self.store.get('config/device/telnet') == mode:
+                return 'telnetd already running'
+            self.store.put('config/device/telnet', mode)
+            return 'OK'
+        return set_telnet
+
+    def _join_domain(self, session, path, param):  # pylint: disable=unused-argument
+        self.store.put('config/fileservices/cifs/type', 'domain')
+        self.store.put('config/fileservices/cifs/domain', param.name)
+        self.store.put('status/fileservices/cifs/joinStatus', 0)
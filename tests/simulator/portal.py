@@ -0,0 +1,263 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Simulator of the CTERA Portal API, served under /admin/api and /ServicesPortal/api.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import itertools
+import uuid
+
+from tests.simulator.gateway import GatewaySimulator, make_object
+from tests.simulator.server import CteraSimulator, SimulatorError
+from tests.simulator.store import ObjectStore
+
+
+def default_plan():
+    quotas = dict(
+        (item, make_object(amount=0)) for item in [
+            'vGateways4', 'vGateways8', 'appliances', 'vGateways32', 'vGateways64', 'vGateways128',
+            'workstationAgents', 'serverAgents', 'cloudDrives', 'cloudDrivesLite', 'storage'
+        ]
+    )
+    return make_object(
+        'Plan',
+        name=None,
+        retentionPolicy=make_object(retainAll=24, hourly=24, daily=7, weekly=4, monthly=12, quarterly=0, yearly=0, retainDeleted=7),
+        **quotas
+    )
+
+
+def default_state():
+    ''' :return: the tree of an initialized Portal with a single server and no tenants '''
+    return make_object(
+        users=[],
+        portals=[],
+        plans=[],
+        locations=[],
+        servers=[make_object('Server', name='server', isApplicationServer=True, renderingServer=False, replicationSettings=None, bgTasks=[])],
+        defaults=make_object(Plan=default_plan()),
+        public=make_object(publicInfo=make_object(isAdmin=True, version='7.0')),
+        setup=make_object(status=make_object(general=make_object(wizard=0), description='Initialized'))
+    )
+
+
+class PortalSimulator(CteraSimulator):
+    ''' Serves a Portal at http://host:port/admin and http://host:port/ServicesPortal.
+        Tenant collections are resolved in the tenant that the session browses, or in the global administration otherwise.
+        Devices that are added to a tenant are served by a GatewaySimulator that the portal relays the remote commands to
+    '''
+
+    session_cookie = 'JSESSIONID'
+    contexts = ('admin', 'ServicesPortal')
+    tenant_collections = ('users', 'devices', 'foldersGroups', 'cloudDrives', 'domains')
+
+    _uids = itertools.count(1000)
+    _tasks = itertools.count(1)
+
+    def __init__(self, users=None, latency=0, host='127.0.0.1', port=0, https=True):
+        '''
+        :param dict users: Passwords of the global administrators to create by user name, defaults to admin
+        '''
+        super().__init__(ObjectStore(default_state()), latency=latency, host=host, port=port, https=https)
+        self.devices = {}
+        for username, password in (users if users is not None else dict(admin='password')).items():
+            self.add_user(username, password)
+        self.register_method('subscribe', self._subscribe)
+        self.register_method('delete', self._delete)
+        self.register_method('moveFromTrashcan', self._undelete)
+        self.register_method('createFolderGroup', self._create_folder_group)
+        self.register_method('deleteGroup', self._delete_folder_group)
+        self.register_method('addCloudDrive', self._add_cloud_drive)
+        self.register_method('singleSignOn', self._single_sign_on)
+        self.register_method('updateAccounts', self._background_task)
+        self.register_method('updatePortals', self._background_task)
+        self.register_method('getTaskStatus', lambda session, path, param: self.store.get(param))
+
+    def add_user(self, username, password, tenant=None, role='ReadWriteAdmin', **kwargs):
+        '''
+        :param str tenant: Name of the tenant of the user, a global administrator if None
+        '''
+        kwargs.setdefault('displayName', username)
+        user = make_object('PortalUser', name=username, password=password, role=role, uid=next(PortalSimulator._uids), **kwargs)
+        return self.store.add('portals/%s/users' % tenant if tenant else 'users', user)
+
+    def add_tenant(self, name, plan=None):
+        tenant = make_object(
+            'TeamPortal', name=name, displayName=None, plan=None, activationStatus='Enabled', isDeleted=False,
+            users=[], devices=[], foldersGroups=[], cloudDrives=[], domains=[]
+        )
+        self.store.add('portals', tenant)
+        if plan:
+            self._subscribe(None, 'portals/%s' % name, plan)
+
+    def add_plan(self, name):
+        plan = default_plan()
+        plan.name = name
+        return self.store.add('plans', plan)
+
+    def add_device(self, tenant, name, device_type='vGateway', gateway=None):
+        '''
+        Adds a device to the tenant, whose remote commands are served by the simulator of the device
+
+        :return: the simulator of the device
+        '''
+        portal = self.store.resolve('portals/%s' % tenant).baseObjectRef
+        self.store.add('portals/%s/devices' % tenant, make_object('Device', name=name, portal=portal, deviceType=device_type))
+        self.devices[name] = gateway or GatewaySimulator(hostname=name)
+        return self.devices[name]
+
+    def _authenticate(self, username, password):
+        path = 'users/%s' % username
+        return self.store.exists(path) and self.store.resolve(path).password == password
+
+    def _route(self, path):
+        segments = path.split('/', 3)
+        if len(segments) < 3 or segments[1] not in PortalSimulator.contexts:
+            raise SimulatorError(404, 'Unknown path %s' % path)
+        area = segments[2]
+        remainder = '/' + (segments[3] if len(segments) > 3 else '')
+        if area == 'api':
+            if remainder == '/login':
+                return self.login, remainder
+            if remainder == '/logout':
+                return self.logout, remainder
+            return self.api, remainder
+        if area in ('public', 'setup', 'startup'):
+            return self.serve, '/%s%s' % (area, remainder)
+        if area == 'devicecmdnew':
+            _tenant, device, device_path = (remainder.strip('/').split('/', 2) + [''])[:3]
+            return self._relay(device), '/' + device_path
+        if area == 'devices':
+            device, device_path = (remainder.strip('/').split('/', 1) + [''])[:2]
+            prefix = 'admingui/api'
+            if not device_path.startswith(prefix):
+                raise SimulatorError(404, 'Unknown path %s' % path)
+            return self._relay(device), device_path[len(prefix):] or '/'
+        raise SimulatorError(404, 'Unknown path %s' % path)
+
+    def _relay(self, name):
+        '''
+        :return: a handler that serves a request of the session of the portal with the simulator of the device
+        '''
+        if name not in self.devices:
+            raise SimulatorError(404, 'Device not found %s' % name)
+        device = self.devices[name]
+
+        def relay(request):
+            session = self.session(request)
+            if request.path == '/ssologin':
+                return None
+            handler, request.path = device.route_api(request.path)
+            if handler not in (device.serve, device.api):
+                raise SimulatorError(400, 'Unsupported remote command %s' % request.path)
+            request.session = session
+            return device.serve(request)
+        return relay
+
+    def api(self, request):
+        request.session = self.session(request)
+        request.path = self._scope(request.session, request.path)
+        return self.serve(request)
+
+    def _scope(self, session, path):
+        ''' :return: the path in the store of the tenant collections of the session '''
+        segments = [segment for segment in path.split('/') if segment]
+        if segments and segments[0] == 'teamPortals':
+            segments[0] = 'portals'
+        if session.tenant and segments and segments[0] in PortalSimulator.tenant_collections:
+            segments = ['portals', session.tenant] + segments
+        return '/'.join(segments)
+
+    def get(self, request):
+        if request.path == 'currentSession':
+            return make_object(username=request.session.username, role='ReadWriteAdmin', tenant=request.session.tenant)
+        if request.path == 'currentPortal':
+            return request.session.tenant
+        return super().get(request)
+
+    def serve(self, request):
+        if request.method == 'PUT' and request.path == 'currentPortal':
+            tenant = request.value() or None
+            if tenant and not self.store.exists('portals/%s' % tenant):
+                raise SimulatorError(404, 'Tenant not found %s' % tenant)
+            request.session.tenant = tenant
+            return None
+        return super().serve(request)
+
+    def post(self, request):
+        if request.operation == 'db query':
+            return self._query(request.path, request.value().param)
+        if request.operation == 'db add' and request.path.rstrip('/').endswith('users'):
+            request.value().param.uid = next(PortalSimulator._uids)  # assigned by the portal, like to the users that add_user creates
+        return super().post(request)
+
+    def _query(self, path, param):
+        ''' Cloud drives are filtered by the uid of their owner and exclude the deleted ones unless requested '''
+        if path.split('/')[-1] != 'cloudDrives':
+            return self.store.query(path, param)
+        uid = getattr(param, 'ownedBy', None)
+        owners = [user.baseObjectRef for user in self.store.resolve(self._scope_of(path, 'users')) if user.uid == uid]
+        include_deleted = getattr(param, 'includeDeleted', False)
+        return self.store.query(path, param, predicate=lambda cloud_drive: (
+            (include_deleted or not cloud_drive.isDeleted) and (uid is None or cloud_drive.owner in owners)
+        ))
+
+    @staticmethod
+    def _scope_of(path, collection):
+        ''' :return: the path of the collection in the tenant of another tenant collection '''
+        return '/'.join(path.split('/')[:-1] + [collection])
+
+    def _subscribe(self, session, path, param):  # pylint: disable=unused-argument
+        self.store.put('%s/plan' % path, self.store.resolve('plans/%s' % param).baseObjectRef)
+
+    def _delete(self, session, path, param):  # pylint: disable=unused-argument
+        if path.startswith('portals/'):
+            self.store.put('%s/isDeleted' % path, True)
+        else:
+            self.store.delete(path)
+
+    def _undelete(self, session, path, param):  # pylint: disable=unused-argument
+        self.store.put('%s/isDeleted' % path, False)
+
+    def _create_folder_group(self, session, path, param):  # pylint: disable=unused-argument
+        folder_group = make_object('FolderGroup', name=param.name, owner=param.owner, disabled=param.disabled)
+        return self.store.add(self._scope(session, 'foldersGroups'), folder_group)
+
+    def _delete_folder_group(self, session, path, param):  # pylint: disable=unused-argument
+        self.store.delete(path)
+
+    def _add_cloud_drive(self, session, path, param):  # pylint: disable=unused-argument
+        cloud_drive = make_object('CloudDrive', name=param.name, owner=param.owner, group=param.group, isDeleted=False)
+        return self.store.add(self._scope(session, 'cloudDrives'), cloud_drive)
+
+    @staticmethod
+    def _single_sign_on(session, path, param):  # pylint: disable=unused-argument
+        return uuid.uuid4().hex
+
+    def _background_task(self, session, path, param):  # pylint: disable=unused-argument
+        task_id = next(PortalSimulator._tasks)
+        self.store.add('servers/server/bgTasks', make_object(
+            'BackgroundTask', id=task_id, name=str(task_id), status='completed', startTime=None, endTime=None
+        ))
+        return 'servers/server/bgTasks/%d' % task_id
@@ -0,0 +1,60 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Runs the main function of a module in process, the way Ansible runs it on the managed node.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import contextlib
+import io
+import json
+
+from ansible.module_utils import basic
+from ansible.module_utils.common.text.converters import to_bytes
+
+
+def run_module(module, args):
+    '''
+    :param module: The module, whose main function is run
+    :param dict args: The arguments of the task
+    :return: the result of the module
+    '''
+    stdout = io.StringIO()
+    with _module_args(args), contextlib.redirect_stdout(stdout):
+        try:
+            module.main()
+        except SystemExit:
+            pass
+    return json.loads(stdout.getvalue())
+
+
+@contextlib.contextmanager
+def _module_args(args):
+    original = basic._ANSIBLE_ARGS  # pylint: disable=protected-access
+    basic._ANSIBLE_ARGS = to_bytes(json.dumps(dict(ANSIBLE_MODULE_ARGS=args)))  # pylint: disable=protected-access
+    if hasattr(basic, '_ANSIBLE_PROFILE'):  # the serialization profile of the module arguments, as of ansible-core 2.19
+        basic._ANSIBLE_PROFILE = 'legacy'  # pylint: disable=protected-access
+    try:
+        yield
+    finally:
+        basic._ANSIBLE_ARGS = original  # pylint: disable=protected-access
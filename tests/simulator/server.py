@@ -0,0 +1,376 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+HTTP server that speaks the XML protocol of the CTERA API on top of an ObjectStore.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import collections
+import datetime
+import http.cookies
+import http.server
+import os
+import re
+import ssl
+import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+
+from cterasdk.common import Object
+from cterasdk.convert import fromxmlstr, toxmlstr
+
+from tests.simulator.store import NotFound
+
+
+Request = collections.namedtuple('Request', ['method', 'path', 'operation', 'status'])
+
+
+class SimulatorError(Exception):
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Fault:
+    ''' An error response injected in place of the responses to the requests that match the method and the path pattern '''
+
+    def __init__(self, status=500, method=None, path=None, count=1, message='Injected fault'):
+        '''
+        :param int status: HTTP status of the error response
+        :param str method: HTTP method of the requests to fail, any method if None
+        :param str path: Regular expression searched for in the URL path of the requests to fail, any path if None
+        :param int count: Number of requests to fail, all of them if None
+        '''
+        self.status = status
+        self.method = method
+        self.path = re.compile(path) if path else None
+        self.count = count
+        self.message = message
+
+    def matches(self, method, path):
+        if self.count is not None and self.count <= 0:
+            return False
+        if self.method is not None and self.method != method:
+            return False
+        return self.path is None or self.path.search(path) is not None
+
+
+class Session:
+
+    def __init__(self, username, tenant=None):
+        self.username = username
+        self.tenant = tenant
+
+
+class CteraSimulator:
+    ''' Base of the Gateway and Portal simulators.
+        Serves the objects of the store over HTTP on the loopback interface from a background thread.
+        Every request is delayed by the latency and recorded, so the round trips of a task can be counted
+    '''
+
+    session_cookie = None
+
+    def __init__(self, store, latency=0, host='127.0.0.1', port=0, https=True):
+        '''
+        :param tests.simulator.store.ObjectStore store: The state of the simulated host
+        :param latency: Seconds to delay each response by, or a function of the method and the path that returns them
+        :param bool https: Serve HTTPS with a self signed certificate
+        '''
+        self.store = store
+        self.latency = latency
+        self.https = https
+        self.lock = threading.RLock()
+        self.sessions = {}
+        self.requests = []
+        self._faults = []
+        self._methods = {}
+        self._address = (host, port)
+        self._server = None
+        self._thread = None
+
+    def start(self):
+        self._server = http.server.ThreadingHTTPServer(self._address, _RequestHandler)
+        self._server.daemon_threads = True
+        if self.https:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(*_self_signed_certificate())
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+        self._server.simulator = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name=type(self).__name__, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def host(self):
+        return self._server.server_address[0]
+
+    @property
+    def port(self):
+        return self._server.server_address[1]
+
+    def connection_args(self, **kwargs):
+        ''' :return: the connection arguments of a module that manages the simulated host '''
+        args = dict(
+            ctera_host=self.host, ctera_port=self.port, ctera_https=self.https, ctera_trust_certificate=True,
+            ctera_user='admin', ctera_password='password'
+        )
+        args.update(kwargs)
+        return args
+
+    def inject_fault(self, status=500, method=None, path=None, count=1, message='Injected fault'):
+        fault = Fault(status=status, method=method, path=path, count=count, message=message)
+        with self.lock:
+            self._faults.append(fault)
+        return fault
+
+    def clear_faults(self):
+        with self.lock:
+            self._faults = []
+
+    def register_method(self, name, function):
+        '''
+        Registers the handler of a user-defined method of the CTERA API
+
+        :param str name: Name of the method
+        :param function: Called with the session, the path and the parameter of the request, returns the response
+        '''
+        self._methods[name] = function
+
+    def reset_requests(self):
+        with self.lock:
+            self.requests = []
+
+    def round_trips(self, method=None):
+        ''' :return: the number of requests served, optionally only those of the method '''
+        with self.lock:
+            return len([request for request in self.requests if method is None or request.method == method])
+
+    def add_user(self, username, password):  # pragma: no cover
+        raise NotImplementedError("Implementing classes must implement add_user")
+
+    def _authenticate(self, username, password):  # pragma: no cover
+        raise NotImplementedError("Implementing classes must implement _authenticate")
+
+    def _route(self, path):  # pragma: no cover
+        '''
+        :return: the handler of the URL path, and the path of the API that it addresses
+        '''
+        raise NotImplementedError("Implementing classes must implement _route")
+
+    def _delay(self, method, path):
+        latency = self.latency(method, path) if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+
+    def _fault(self, method, path):
+        with self.lock:
+            for fault in self._faults:
+                if fault.matches(method, path):
+                    if fault.count is not None:
+                        fault.count -= 1
+                    return fault
+        return None
+
+    def dispatch(self, method, url, headers, body):
+        '''
+        :return: the status, the XML body and the session cookie of the response
+        '''
+        parsed = urllib.parse.urlparse(url)
+        path = urllib.parse.unquote(parsed.path)
+        self._delay(method, path)
+        cookies = {}
+        operation = None
+        fault = self._fault(method, path)
+        try:
+            if fault is not None:
+                raise SimulatorError(fault.status, fault.message)
+            handler, api_path = self._route(path)
+            request = _Request(self, method, api_path, urllib.parse.parse_qs(parsed.query), headers, body)
+            operation = request.operation
+            status, response = 200, handler(request)
+            cookies = request.cookies
+        except SimulatorError as error:
+            status, response = error.status, _error_object(error.message)
+        except NotFound as error:
+            status, response = 404, _error_object('Object not found: %s' % error)
+        with self.lock:
+            self.requests.append(Request(method, path, operation, status))
+        return status, toxmlstr(response) or b'', cookies
+
+    def session(self, request):
+        session_id = request.session_id
+        with self.lock:
+            session = self.sessions.get(session_id) if session_id else None
+        if session is None:
+            raise SimulatorError(403, 'Not logged in')
+        return session
+
+    def login(self, request):
+        form = urllib.parse.parse_qs(request.body.decode('utf-8'))
+        username = (form.get('username') or form.get('j_username') or [None])[0]
+        password = (form.get('password') or form.get('j_password') or [None])[0]
+        with self.lock:
+            if not self._authenticate(username, password):
+                raise SimulatorError(401, 'Wrong username or password')
+            session_id = uuid.uuid4().hex
+            self.sessions[session_id] = Session(username)
+        request.cookies[self.session_cookie] = session_id
+
+    def logout(self, request):
+        with self.lock:
+            self.sessions.pop(request.session_id, None)
+
+    def api(self, request):
+        ''' Serves the schema objects of an authenticated session '''
+        request.session = self.session(request)
+        return self.serve(request)
+
+    def serve(self, request):
+        with self.lock:
+            if request.method == 'GET':
+                return self.get(request)
+            if request.method == 'PUT':
+                self.store.put(request.path, request.value())
+                return None
+            if request.method == 'DELETE':
+                self.store.delete(request.path)
+                return None
+            if request.method == 'POST':
+                return self.post(request)
+        raise SimulatorError(405, 'Unsupported method %s' % request.method)
+
+    def get(self, request):
+        if request.path.strip('/').startswith('objs/'):
+            return self.store.find_reference(request.path)
+        return self.store.get(request.path)
+
+    def post(self, request):
+        command = request.value()
+        if request.operation == 'db add':
+            return self.store.add(request.path, command.param)
+        if request.operation == 'db get-multi':
+            return self.store.get_multi(request.path, command.param)
+        if request.operation == 'db query':
+            return self.store.query(request.path, command.param)
+        if command.type == 'user-defined' and command.name in self._methods:
+            return self._methods[command.name](request.session, request.path, command.param)
+        raise SimulatorError(400, 'Unsupported %s method %s' % (command.type, command.name))
+
+
+class _Request:
+
+    def __init__(self, simulator, method, path, params, headers, body):
+        self.method = method
+        self.path = path
+        self.params = params
+        self.body = body
+        self.session = None
+        self.cookies = {}
+        self._value = None
+        self.session_id = None
+        cookie = http.cookies.SimpleCookie(headers.get('Cookie') or '')
+        if simulator.session_cookie in cookie:
+            self.session_id = cookie[simulator.session_cookie].value
+        self.operation = None
+        if method == 'POST' and body and body.startswith(b'<'):
+            command = self.value()
+            if isinstance(command, Object):
+                self.operation = '%s %s' % (getattr(command, 'type', None), getattr(command, 'name', None))
+
+    def value(self):
+        if self._value is None and self.body:
+            self._value = fromxmlstr(self.body.decode('utf-8'))
+        return self._value
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, response, cookies = self.server.simulator.dispatch(self.command, self.path, self.headers, body)
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(response)))
+        for name, value in cookies.items():
+            self.send_header('Set-Cookie', '%s=%s; Path=/' % (name, value))
+        self.end_headers()
+        self.wfile.write(response)
+
+    do_GET = do_PUT = do_POST = do_DELETE = _handle
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def _error_object(message):
+    error = Object()
+    error.msg = message
+    return error
+
+
+_certificate = None
+
+
+def _self_signed_certificate():
+    ''' :return: the paths of the certificate and the private key that all the simulators serve, created on first use '''
+    global _certificate  # pylint: disable=global-statement
+    if _certificate is None:
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, 'ctera-simulator')])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        certificate = x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key()).serial_number(
+            x509.random_serial_number()
+        ).not_valid_before(now - datetime.timedelta(days=1)).not_valid_after(now + datetime.timedelta(days=30)).sign(key, hashes.SHA256())
+        directory = tempfile.mkdtemp(prefix='ctera-simulator-')
+        certificate_path, key_path = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+        with open(certificate_path, 'wb') as f:
+            f.write(certificate.public_bytes(serialization.Encoding.PEM))
+        with open(key_path, 'wb') as f:
+            f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.TraditionalOpenSSL, serialization.NoEncryption()))
+        _certificate = (certificate_path, key_path)
+    return _certificate
@@ -0,0 +1,211 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-memory tree of CTERA schema objects, addressed by the paths of the CTERA API.
+"""
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import copy
+import fnmatch
+import itertools
+
+from cterasdk.common import Object
+
+
+class NotFound(Exception):
+    pass
+
+
+class ObjectStore:
+    ''' Resolves API paths against a tree of Objects and lists.
+        A path segment addresses an attribute of an Object, or the element of a list whose name (or username) matches it
+    '''
+
+    _ids = itertools.count(1)
+
+    def __init__(self, root=None, tenant=''):
+        self.root = root if root is not None else Object()
+        self._tenant = tenant
+
+    @staticmethod
+    def _segments(path):
+        return [segment for segment in path.split('/') if segment]
+
+    @staticmethod
+    def _key(item):
+        for attr in ['name', 'username']:
+            value = getattr(item, attr, None)
+            if value is not None:
+                return value
+        return None
+
+    def _child(self, parent, segment):
+        if isinstance(parent, list):
+            for item in parent:
+                if ObjectStore._key(item) == segment:
+                    return item
+            if segment.isdigit() and int(segment) < len(parent):
+                return parent[int(segment)]
+            raise NotFound(segment)
+        if isinstance(parent, Object) and segment in parent.__dict__:
+            return parent.__dict__[segment]
+        raise NotFound(segment)
+
+    def resolve(self, path):
+        node = self.root
+        for segment in ObjectStore._segments(path):
+            node = self._child(node, segment)
+        return node
+
+    def exists(self, path):
+        try:
+            self.resolve(path)
+        except NotFound:
+            return False
+        return True
+
+    def get(self, path):
+        return copy.deepcopy(self.resolve(path))
+
+    def put(self, path, value):
+        '''
+        Sets the value at the path. An Object is merged into the stored Object, like the schema of the host
+        keeps the attributes that a request omits, such as the snmpV3 settings of an SNMP enable request
+        '''
+        segments = ObjectStore._segments(path)
+        parent = self.resolve('/'.join(segments[:-1]))
+        if isinstance(parent, list):
+            current = self._child(parent, segments[-1])
+            parent[parent.index(current)] = ObjectStore._merge(current, value)
+        elif isinstance(parent, Object):
+            setattr(parent, segments[-1], ObjectStore._merge(parent.__dict__.get(segments[-1]), value))
+        else:
+            raise NotFound(path)
+
+    @staticmethod
+    def _merge(current, value):
+        value = copy.deepcopy(value)
+        if isinstance(current, Object) and isinstance(value, Object):
+            merged = copy.deepcopy(current)
+            merged.__dict__.update(value.__dict__)
+            return merged
+        return value
+
+    def add(self, path, value):
+        '''
+        Appends an object to the list at the path, creating the list if it does not exist
+        :return: the reference of the added object
+        '''
+        segments = ObjectStore._segments(path)
+        parent = self.resolve('/'.join(segments[:-1]))
+        collection = parent.__dict__.setdefault(segments[-1], []) if isinstance(parent, Object) else self._child(parent, segments[-1])
+        if not isinstance(collection, list):
+            raise NotFound(path)
+        value = copy.deepcopy(value)
+        if isinstance(value, Object) and getattr(value, 'baseObjectRef', None) is None:
+            value.baseObjectRef = 'objs/%d/%s/%s/%s' % (
+                next(ObjectStore._ids), self._tenant, getattr(value, '_classname', None) or 'Object', ObjectStore._key(value)
+            )
+        collection.append(value)
+        return getattr(value, 'baseObjectRef', None)
+
+    def delete(self, path):
+        segments = ObjectStore._segments(path)
+        parent = self.resolve('/'.join(segments[:-1]))
+        current = self._child(parent, segments[-1])
+        if isinstance(parent, list):
+            parent.remove(current)
+        else:
+            delattr(parent, segments[-1])
+
+    def find_reference(self, reference):
+        ''' :return: the object whose baseObjectRef is the reference, which may be missing empty segments like a path '''
+        segments = ObjectStore._segments(reference)
+        for item in ObjectStore._walk(self.root):
+            if ObjectStore._segments(getattr(item, 'baseObjectRef', None) or '') == segments:
+                return copy.deepcopy(item)
+        raise NotFound(reference)
+
+    @staticmethod
+    def _walk(node):
+        if isinstance(node, list):
+            for item in node:
+                yield from ObjectStore._walk(item)
+        elif isinstance(node, Object):
+            yield node
+            for value in node.__dict__.values():
+                yield from ObjectStore._walk(value)
+
+    def get_multi(self, path, paths):
+        ''' :return: an Object with the value of each of the relative paths, None if the path does not exist '''
+        result = Object()
+        for relative_path in paths:
+            try:
+                value = self.get(path + '/' + relative_path.lstrip('/'))
+            except NotFound:
+                value = None
+            setattr(result, relative_path.strip('/').split('/')[-1], value)
+        return result
+
+    def query(self, path, param, predicate=None):
+        '''
+        :param predicate: Additional condition that the objects must meet, if not None
+        :return: a page of the objects of the list at the path that match the filters of the query parameters
+        '''
+        try:
+            objects = self.resolve(path)
+        except NotFound:
+            objects = []
+        matched = [
+            item for item in objects
+            if all(ObjectStore._match(item, query_filter) for query_filter in getattr(param, 'filters', None) or [])
+            and (predicate is None or predicate(item))
+        ]
+        start = getattr(param, 'startFrom', None) or 0
+        limit = getattr(param, 'countLimit', None) or len(matched)
+        page = Object()
+        page.hasMore = start + limit < len(matched)
+        page.objects = [ObjectStore._include(item, getattr(param, 'include', None)) for item in matched[start:start + limit]]
+        return page
+
+    @staticmethod
+    def _include(item, include):
+        if not include:
+            return copy.deepcopy(item)
+        result = Object()
+        for field in include:
+            setattr(result, field, copy.deepcopy(getattr(item, field, None)))
+        return result
+
+    @staticmethod
+    def _match(item, query_filter):
+        value = getattr(item, query_filter.field, None)
+        restriction = query_filter.restriction
+        if restriction == 'eq':
+            return value == query_filter.value
+        if restriction == 'ne':
+            return value != query_filter.value
+        if restriction in ('like', 'notLike'):
+            like = value is not None and fnmatch.fnmatch(str(value), '*%s*' % query_filter.value)
+            return like if restriction == 'like' else not like
+        raise NotImplementedError('Unsupported query restriction %s' % restriction)
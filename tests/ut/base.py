@@ -1,9 +1,34 @@
 from __future__ import (absolute_import, division, print_function)
 
+import collections
 from unittest import TestCase
 import unittest.mock as mock
 
 
+READ_PREFIXES = ('get', 'list', 'is_', 'find')
+READ_METHODS = ('browse', 'browse_global_admin', 'connected', 'device', 'ifconfig', 'sso_enabled')
+LOCAL_METHODS = ('session',)  # served by the SDK without a request
+
+
+def count_calls(handle):
+    """
+    Count the SDK calls that were made through a mocked CTERA handle, each of which is a round trip to the host.
+    The handle records the calls of its attributes, including mocks that a test assigned to them.
+    Calls of the objects that the SDK returned are not round trips, and are not counted.
+
+    :return: the number of reads and writes
+    """
+    calls = collections.Counter()
+    for name, _args, _kwargs in handle.mock_calls:
+        if '(' in name:
+            continue
+        method = name.split('.')[-1]
+        if method in LOCAL_METHODS:
+            continue
+        calls['reads' if method.startswith(READ_PREFIXES) or method in READ_METHODS else 'writes'] += 1
+    return calls['reads'], calls['writes']
+
+
 class BaseTest(TestCase):
 
     def patch_call(self, module_path, **patch_kwargs):
@@ -11,3 +36,12 @@ class BaseTest(TestCase):
         call_patcher = mock.patch(module_path, **patch_kwargs)
         self.addCleanup(call_patcher.stop)
         return call_patcher.start()
+
+    def assert_max_calls(self, handle, reads=None, writes=None):
+        """Assert that a mocked CTERA handle was called at most the given number of reads and writes, if not None."""
+        actual_reads, actual_writes = count_calls(handle)
+        calls = [name for name, _args, _kwargs in handle.mock_calls if '(' not in name and name.split('.')[-1] not in LOCAL_METHODS]
+        if reads is not None:
+            self.assertLessEqual(actual_reads, reads, 'Read budget exceeded: %s' % calls)
+        if writes is not None:
+            self.assertLessEqual(actual_writes, writes, 'Write budget exceeded: %s' % calls)
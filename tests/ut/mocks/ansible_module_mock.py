@@ -1,4 +1,5 @@
 trust_certificate = False
+socket_path = None
 
 class AnsibleModuleMock():
 
@@ -9,8 +10,12 @@ class AnsibleModuleMock():
             ctera_https=True,
             ctera_port=None,
             ctera_password='password',
-            ctera_trust_certificate=trust_certificate
+            ctera_trust_certificate=trust_certificate,
+            ctera_session_cache=False,
+            ctera_session_cache_ttl=300,
+            ctera_profile=False
         )
+        self._socket_path = socket_path
         self.fail_dict = {}
         self.exit_dict = {}
 
@@ -70,6 +70,7 @@ class CteraFilerBaseMock(CteraRunnerBase):
         self._ctera_filer.share_mock.disable = mock.MagicMock()
         self._ctera_filer.share_mock.modify = mock.MagicMock()
         self.ansible_module = mock.MagicMock()
+        self.parameters = mock.MagicMock()
         self.ansible_return_value = AnsibleReturnValue()
         self.ansible_module.ctera_return_value = mock.MagicMock(return_value=self.ansible_return_value)
 
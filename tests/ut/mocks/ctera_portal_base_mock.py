@@ -15,6 +15,7 @@ class CteraPortalBaseMock(CteraRunnerBase):
         self._ctera_portal.users.list_domain_users = mock.MagicMock()
         self._ctera_portal.users.modify = mock.MagicMock()
 
+        self.parameters = mock.MagicMock()
         self.ansible_module = mock.MagicMock()
         self.ansible_return_value = AnsibleReturnValue()
         self.ansible_module.ctera_return_value = mock.MagicMock(return_value=self.ansible_return_value)
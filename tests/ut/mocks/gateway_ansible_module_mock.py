@@ -6,6 +6,10 @@ def mock_gateway_ansible_module(test, path):
     obj_mock.params = {}
     obj_mock.ctera_filer = mock.MagicMock()
     obj_mock.ctera_logout = mock.MagicMock()
+    obj_mock.ctera_reused_session = mock.MagicMock(return_value=False)
+    obj_mock.ctera_fleet = mock.MagicMock(return_value=None)
+    obj_mock.ctera_instrument = mock.MagicMock(side_effect=lambda ctera_host: ctera_host)
+    obj_mock.ctera_portal_mode = mock.MagicMock(return_value=False)
     obj_mock.ctera_exit = mock.MagicMock()
     obj_mock.ctera_return_value = mock.MagicMock()
     return obj_mock
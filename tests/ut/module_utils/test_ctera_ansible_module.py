@@ -43,6 +43,9 @@ class TestCteraAnsibleModule(BaseTest):  #pylint: disable=too-many-public-method
             "ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.ctera_common.AnsibleReturnValue"
         )
         self.ansible_return_value_object_mock = self.ansible_return_value_class_mock.return_value
+        self.cterasdk_version_mock = self.patch_call(
+            "ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.ctera_common.cterasdk_version", return_value='2.18.5'
+        )
 
     def test_no_cterasdk(self):
         cterasdk_imp_err = "Failed to import"
@@ -51,6 +54,11 @@ class TestCteraAnsibleModule(BaseTest):  #pylint: disable=too-many-public-method
         ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
         self.assertDictEqual(ansible_module.fail_dict, dict(msg=mock.ANY, exception=cterasdk_imp_err))
 
+    def test_unsupported_cterasdk(self):
+        self.cterasdk_version_mock.return_value = '2.13.2'
+        ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
+        self.assertDictEqual(ansible_module.fail_dict, dict(msg='cterasdk 2.18.5 or later is required, found 2.13.2'))
+
     @staticmethod
     def test_ctera_portal_logout():
         ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
@@ -81,6 +89,33 @@ class TestCteraAnsibleModule(BaseTest):  #pylint: disable=too-many-public-method
             self.assertDictEqual(ansible_module.exit_dict, expected_dict)
             self.assertDictEqual(ansible_module.fail_dict, {})
 
+    def test_profile(self):
+        profiler_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.ApiProfiler")
+        self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.__init__", new=_mock_init(dict(
+            ctera_host='192.168.1.1', ctera_user='admin', ctera_password='password', ctera_trust_certificate=False,
+            ctera_session_cache=False, ctera_profile=True
+        )))
+        self.ansible_return_value_object_mock.has_failed.return_value = False
+        ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
+        ctera_host = mock.MagicMock()
+        self.assertEqual(ansible_module.ctera_instrument(ctera_host), ctera_host)
+        profiler_class_mock.return_value.instrument.assert_called_once_with(ctera_host)
+        ansible_module._ctera_host = ctera_host  # pylint: disable=protected-access
+        ansible_module.ctera_login()
+        ansible_module.ctera_logout()
+        self.assertListEqual(profiler_class_mock.return_value.timed.call_args_list, [mock.call('login'), mock.call('logout')])
+        ansible_module.ctera_exit()
+        self.ansible_return_value_object_mock.put.assert_called_once_with(ctera_timings=profiler_class_mock.return_value.summary.return_value)
+
+    def test_profile_disabled(self):
+        profiler_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.ApiProfiler")
+        ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
+        ansible_module._ctera_host = mock.MagicMock()  # pylint: disable=protected-access
+        ansible_module.ctera_login()
+        ansible_module.ctera_exit()
+        profiler_class_mock.assert_not_called()
+        self.ansible_return_value_object_mock.put.assert_not_called()
+
     def test_trust_certificate(self):
         for trust in [True, False]:
             self._test_trust_certificate(trust)
@@ -89,3 +124,105 @@ class TestCteraAnsibleModule(BaseTest):  #pylint: disable=too-many-public-method
         ansible_module_mock.trust_certificate = trust
         ctera_ansible_module.CteraAnsibleModule(dict())
         self.assertEqual(ctera_config.http['ssl'], 'Trust' if trust else 'Consent')
+
+    def test_missing_connection_arguments(self):
+        params = dict(ctera_host=None, ctera_user='admin', ctera_password=None, ctera_trust_certificate=False, ctera_session_cache=False, ctera_profile=False)
+        self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.__init__", new=_mock_init(params))
+        ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
+        self.assertDictEqual(ansible_module.fail_dict, dict(msg='missing required arguments: ctera_host, ctera_password'))
+
+    def test_persistent_session(self):
+        session = dict(host='192.168.1.2', port=443, https=True, trust_certificate=True, session_id='abcd')
+        self.patch_call("tests.ut.mocks.ansible_module_mock.socket_path", new='/tmp/ctera.socket')
+        connection_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.Connection")
+        connection_class_mock.return_value.get_session.return_value = session
+        ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
+        connection_class_mock.assert_called_once_with('/tmp/ctera.socket')
+        self.assertEqual(ctera_config.http['ssl'], 'Trust')
+        self.assertEqual(ansible_module.ctera_host_address(), ('192.168.1.2', 443, True))
+        ansible_module._ctera_host = mock.MagicMock()  # pylint: disable=protected-access
+        ansible_module.ctera_login()
+        ansible_module._ctera_host.set_session_id.assert_called_once_with('abcd')  # pylint: disable=protected-access
+        ansible_module._ctera_host.login.assert_not_called()  # pylint: disable=protected-access
+        ansible_module.ctera_logout()
+        ansible_module._ctera_host.logout.assert_not_called()  # pylint: disable=protected-access
+
+    def test_persistent_session_failed(self):
+        self.patch_call("tests.ut.mocks.ansible_module_mock.socket_path", new='/tmp/ctera.socket')
+        connection_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.Connection")
+        connection_class_mock.return_value.get_session.side_effect = ctera_ansible_module.ConnectionError('No such socket')
+        fail_json_mock = self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.fail_json", side_effect=SystemExit)
+        self.assertRaises(SystemExit, ctera_ansible_module.CteraAnsibleModule, dict())
+        fail_json_mock.assert_called_once_with(msg=mock.ANY)
+
+
+def _mock_init(params):
+    def init(self, _argument_spec, **_kwargs):
+        self.params = params
+        self._socket_path = None  # pylint: disable=protected-access
+        self.fail_dict = {}
+        self.exit_dict = {}
+    return init
+
+
+class TestCteraAnsibleModuleSessionCache(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ansible_module_mock.mock_bases(self, ctera_ansible_module.CteraAnsibleModule)
+        self.session_cache_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.SessionCache")
+        self.session_cache_mock = self.session_cache_class_mock.return_value
+
+    def _ansible_module(self):
+        params = dict(
+            ctera_host='192.168.1.1',
+            ctera_port=None,
+            ctera_user='admin',
+            ctera_password='password',
+            ctera_trust_certificate=False,
+            ctera_session_cache=True,
+            ctera_session_cache_ttl=300,
+            ctera_profile=False
+        )
+        self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.__init__", new=_mock_init(params))
+        ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
+        self.session_cache_class_mock.assert_called_once_with('192.168.1.1', None, 'admin', 300, scope=None)
+        ansible_module._ctera_host = mock.MagicMock()  # pylint: disable=protected-access
+        ansible_module._ctera_host.get_session_id.return_value = 'abcd'  # pylint: disable=protected-access
+        return ansible_module
+
+    def test_cache_disabled(self):
+        ansible_module = ctera_ansible_module.CteraAnsibleModule(dict())
+        self.session_cache_class_mock.assert_not_called()
+        self.assertFalse(ansible_module.ctera_reused_session())
+
+    def test_cache_miss(self):
+        self.session_cache_mock.load.return_value = None
+        self.session_cache_mock.store.return_value = True
+        ansible_module = self._ansible_module()
+        ansible_module.ctera_login()
+        ansible_module._ctera_host.login.assert_called_once_with('admin', 'password')  # pylint: disable=protected-access
+        self.session_cache_mock.store.assert_called_once_with('abcd')
+        ansible_module.ctera_logout()
+        ansible_module._ctera_host.logout.assert_not_called()  # pylint: disable=protected-access
+
+    def test_cache_hit(self):
+        self.session_cache_mock.load.return_value = 'cached'
+        ansible_module = self._ansible_module()
+        ansible_module.ctera_login()
+        ansible_module._ctera_host.set_session_id.assert_called_once_with('cached')  # pylint: disable=protected-access
+        ansible_module._ctera_host.login.assert_not_called()  # pylint: disable=protected-access
+        self.assertTrue(ansible_module.ctera_reused_session())
+        ansible_module.ctera_logout()
+        ansible_module._ctera_host.logout.assert_not_called()  # pylint: disable=protected-access
+
+    def test_cache_rejected(self):
+        self.session_cache_mock.load.return_value = 'cached'
+        self.session_cache_mock.store.return_value = False
+        ansible_module = self._ansible_module()
+        ansible_module._ctera_host.set_session_id.side_effect = CTERAException()  # pylint: disable=protected-access
+        ansible_module.ctera_login()
+        self.session_cache_mock.invalidate.assert_called_once_with()
+        ansible_module._ctera_host.login.assert_called_once_with('admin', 'password')  # pylint: disable=protected-access
+        ansible_module.ctera_logout()
+        ansible_module._ctera_host.logout.assert_called_once_with()  # pylint: disable=protected-access
@@ -21,6 +21,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import subprocess
+import sys
 import unittest
 import unittest.mock as mock
 
@@ -80,73 +82,9 @@ class TestCteraCommon(unittest.TestCase):  #pylint: disable=too-many-public-meth
         filtered_parameters = ctera_common.filter_parameters(all_parameters, filter_keys)
         self.assertDictEqual(dict(first='a'), filtered_parameters)
 
-    def test_cmp_int(self):
-        self.assertEqual(ctera_common.cmp(1, 1), 0)
-        self.assertNotEqual(ctera_common.cmp(1, 2), 0)
-
-    def test_cmp_str(self):
-        self.assertEqual(ctera_common.cmp("hello", "hello"), 0)
-        self.assertNotEqual(ctera_common.cmp("hello", "world"), 0)
-
-    def test_cmp_list(self):
-        self.assertEqual(ctera_common.cmp(["hello"], ["hello"]), 0)
-        self.assertNotEqual(ctera_common.cmp(["hello"], ["world"]), 0)
-
-    def test_cmp_mix(self):
-        self.assertNotEqual(ctera_common.cmp(1, "hello"), 0)
-        self.assertNotEqual(ctera_common.cmp("hello", ["hello"]), 0)
-
-    def test_cmp_none(self):
-        self.assertNotEqual(ctera_common.cmp(None, 1), 0)
-
-    def test_compare_lists_equal(self):
-        current = ["hello", "world"]
-        self.assertListEqual(ctera_common.compare_lists(current, current, False), [])
-
-    def test_compare_lists_equal_reorder(self):
-        current = ["hello", "world"]
-        desired = ["world", "hello"]
-        self.assertListEqual(ctera_common.compare_lists(current, desired, False), [])
-
-    def test_compare_lists_get_desired(self):
-        current = ["hello", "world"]
-        desired = ["hello", "bar"]
-        self.assertListEqual(ctera_common.compare_lists(current, desired, False), desired)
-
-    def test_compare_lists_get_desired_diff(self):
-        current = ["hello", "world"]
-        desired = ["hello", "bar"]
-        self.assertListEqual(ctera_common.compare_lists(current, desired, True), ["bar"])
-
-    def test_get_modified_attributes_empty(self):
-        current = dict(first='a', second='b')
-        self.assertDictEqual(ctera_common.get_modified_attributes(None, {}), {})
-        self.assertDictEqual(ctera_common.get_modified_attributes({}, {}), {})
-        self.assertDictEqual(ctera_common.get_modified_attributes({}, current), {})
-
-    def test_get_modified_attributes_equal(self):
-        current = dict(first='a', second='b')
-        self.assertDictEqual(ctera_common.get_modified_attributes(current, current), {})
-
-    def test_get_modified_attributes_not_in_desired(self):
-        current = dict(first='a', second='b')
-        desired = dict(third='c')
-        self.assertDictEqual(ctera_common.get_modified_attributes(current, desired), {})
-
-    def test_get_modified_attributes_modified(self):
-        current = dict(first='a', second='b', third='c')
-        desired = dict(first='a', second='c')
-        self.assertDictEqual(ctera_common.get_modified_attributes(current, desired), dict(second='c'))
-
-    def test_get_modified_attributes_with_list(self):
-        current = dict(first='a', second=['b'], third='c')
-        desired = dict(first='a', second=['c'])
-        self.assertDictEqual(ctera_common.get_modified_attributes(current, desired), dict(second=['c']))
-
-    def test_get_modified_attributes_with__equal_list(self):
-        current = dict(first='a', second=['b'], third='c')
-        desired = dict(first='a', second=['b'], third='d')
-        self.assertDictEqual(ctera_common.get_modified_attributes(current, desired), dict(third='d'))
+    def test_get_duplicates(self):
+        self.assertListEqual(ctera_common.get_duplicates(['b', 'a', 'b', 'c', 'a', 'b']), ['a', 'b'])
+        self.assertListEqual(ctera_common.get_duplicates(['a', 'b']), [])
 
     def test_set_result_single_change(self):
         self._test_set_result_only_changed(["changed"])
@@ -216,3 +154,45 @@ class TestCteraCommon(unittest.TestCase):  #pylint: disable=too-many-public-meth
         ctera_host.get.assert_called_once_with(path)
         self.assertFalse(exists)
         self.assertEqual(actual_return, None)
+
+    def test_import_cterasdk(self):
+        with mock.patch.object(ctera_common, 'HAS_CTERASDK', True), mock.patch.object(ctera_common, 'CTERASDK_IMP_ERR', None):
+            self.assertTrue(ctera_common.import_cterasdk())
+            self.assertIsNone(ctera_common.CTERASDK_IMP_ERR)
+
+    def test_import_cterasdk_not_installed(self):
+        with mock.patch.object(ctera_common, 'HAS_CTERASDK', False), mock.patch.object(ctera_common.importlib, 'import_module') as import_module:
+            self.assertFalse(ctera_common.import_cterasdk())
+            import_module.assert_not_called()
+
+    def test_import_cterasdk_failed(self):
+        with mock.patch.object(ctera_common, 'HAS_CTERASDK', True), mock.patch.object(ctera_common, 'CTERASDK_IMP_ERR', None), \
+                mock.patch.object(ctera_common.importlib, 'import_module', side_effect=ImportError('No module named requests')):
+            self.assertFalse(ctera_common.import_cterasdk())
+            self.assertFalse(ctera_common.HAS_CTERASDK)
+            self.assertIn('No module named requests', ctera_common.CTERASDK_IMP_ERR)
+
+    def test_is_supported_cterasdk(self):
+        for version, supported in [('2.18.5', True), ('2.18.8', True), ('2.19.0', True), ('3.0', True), ('2.18.4', False), ('2.13.2', False),
+                                   ('2.9.10', False), (None, True)]:
+            self.assertEqual(ctera_common.is_supported_cterasdk(version), supported, version)
+
+    def test_cterasdk_version(self):
+        with mock.patch.object(ctera_common.importlib_metadata, 'version', return_value='2.18.8') as version:
+            self.assertEqual(ctera_common.cterasdk_version(), '2.18.8')
+            version.assert_called_once_with('cterasdk')
+
+    def test_cterasdk_version_not_found(self):
+        with mock.patch.object(ctera_common.importlib_metadata, 'version', side_effect=ctera_common.importlib_metadata.PackageNotFoundError('cterasdk')):
+            self.assertIsNone(ctera_common.cterasdk_version())
+
+    def test_modules_defer_cterasdk_import(self):
+        script = (
+            "import importlib, pkgutil, sys\n"
+            "import ansible_collections.ctera.ctera.plugins.modules as modules\n"
+            "for module in pkgutil.iter_modules(modules.__path__):\n"
+            "    importlib.import_module('%s.%s' % (modules.__name__, module.name))\n"
+            "print(sorted(name for name in sys.modules if name.split('.')[0] == 'cterasdk'))\n"
+        )
+        output = subprocess.run([sys.executable, '-c', script], check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+        self.assertEqual(output.strip(), '[]')
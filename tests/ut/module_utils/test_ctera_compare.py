@@ -0,0 +1,193 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+import unittest
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_compare as ctera_compare
+
+
+class TestCteraCompare(unittest.TestCase):  #pylint: disable=too-many-public-methods
+
+    def test_cmp_int(self):
+        self.assertEqual(ctera_compare.cmp(1, 1), 0)
+        self.assertNotEqual(ctera_compare.cmp(1, 2), 0)
+
+    def test_cmp_str(self):
+        self.assertEqual(ctera_compare.cmp("hello", "hello"), 0)
+        self.assertNotEqual(ctera_compare.cmp("hello", "world"), 0)
+
+    def test_cmp_list(self):
+        self.assertEqual(ctera_compare.cmp(["hello"], ["hello"]), 0)
+        self.assertNotEqual(ctera_compare.cmp(["hello"], ["world"]), 0)
+
+    def test_cmp_mix(self):
+        self.assertNotEqual(ctera_compare.cmp(1, "hello"), 0)
+        self.assertNotEqual(ctera_compare.cmp("hello", ["hello"]), 0)
+
+    def test_cmp_none(self):
+        self.assertNotEqual(ctera_compare.cmp(None, 1), 0)
+
+    def test_compare_lists_equal(self):
+        current = ["hello", "world"]
+        self.assertListEqual(ctera_compare.compare_lists(current, current, False), [])
+
+    def test_compare_lists_equal_reorder(self):
+        current = ["hello", "world"]
+        desired = ["world", "hello"]
+        self.assertListEqual(ctera_compare.compare_lists(current, desired, False), [])
+
+    def test_compare_lists_get_desired(self):
+        current = ["hello", "world"]
+        desired = ["hello", "bar"]
+        self.assertListEqual(ctera_compare.compare_lists(current, desired, False), desired)
+
+    def test_compare_lists_get_desired_diff(self):
+        current = ["hello", "world"]
+        desired = ["hello", "bar"]
+        self.assertListEqual(ctera_compare.compare_lists(current, desired, True), ["bar"])
+
+    def test_compare_lists_of_dicts(self):
+        current = [dict(name='alice', perm='RW'), dict(name='bob', perm='RO')]
+        desired = [dict(perm='RO', name='bob'), dict(name='alice', perm='RO')]
+        self.assertListEqual(ctera_compare.compare_lists(current, desired, True), [dict(name='alice', perm='RO')])
+        self.assertListEqual(ctera_compare.compare_lists(current, list(reversed(current)), False), [])
+
+    def test_diff_lists(self):
+        current = [dict(name='alice', perm='RW'), dict(name='bob', perm='RO'), dict(name='carol', perm='RO')]
+        desired = [dict(name='carol', perm='RO'), dict(name='dave', perm='RO'), dict(perm='RW', name='alice')]
+        diff = ctera_compare.diff_lists(current, desired)
+        self.assertTrue(diff)
+        self.assertListEqual(diff.added, [dict(name='dave', perm='RO')])
+        self.assertListEqual(diff.removed, [dict(name='bob', perm='RO')])
+        self.assertListEqual(diff.unchanged, [dict(name='carol', perm='RO'), dict(name='alice', perm='RW')])
+
+    def test_diff_lists_equal(self):
+        current = [dict(name='alice', groups=['a', 'b']), 'hello', 3, None]
+        self.assertFalse(ctera_compare.diff_lists(current, list(reversed(current))))
+
+    def test_diff_lists_nested_list_order(self):
+        diff = ctera_compare.diff_lists([dict(groups=['a', 'b'])], [dict(groups=['b', 'a'])])
+        self.assertListEqual(diff.added, [dict(groups=['b', 'a'])])
+
+    def test_diff_lists_ignore_case(self):
+        current = ['Hello', dict(name='Alice')]
+        desired = ['hello', dict(name='alice')]
+        self.assertTrue(ctera_compare.diff_lists(current, desired))
+        self.assertFalse(ctera_compare.diff_lists(current, desired, ignore_case=True))
+
+    def test_diff_lists_sets(self):
+        diff = ctera_compare.diff_lists([{'a', 'b'}], [{'b', 'a'}, {'c'}])
+        self.assertListEqual(diff.added, [{'c'}])
+        self.assertListEqual(diff.removed, [])
+
+    def test_diff_lists_unhashable(self):
+        diff = ctera_compare.diff_lists([bytearray(b'a')], [bytearray(b'a'), bytearray(b'b')])
+        self.assertListEqual(diff.added, [bytearray(b'b')])
+        self.assertListEqual(diff.removed, [])
+
+    def test_get_modified_attributes_empty(self):
+        current = dict(first='a', second='b')
+        self.assertDictEqual(ctera_compare.get_modified_attributes(None, {}), {})
+        self.assertDictEqual(ctera_compare.get_modified_attributes({}, {}), {})
+        self.assertDictEqual(ctera_compare.get_modified_attributes({}, current), {})
+
+    def test_get_modified_attributes_equal(self):
+        current = dict(first='a', second='b')
+        self.assertDictEqual(ctera_compare.get_modified_attributes(current, current), {})
+
+    def test_get_modified_attributes_not_in_desired(self):
+        current = dict(first='a', second='b')
+        desired = dict(third='c')
+        self.assertDictEqual(ctera_compare.get_modified_attributes(current, desired), {})
+
+    def test_get_modified_attributes_modified(self):
+        current = dict(first='a', second='b', third='c')
+        desired = dict(first='a', second='c')
+        self.assertDictEqual(ctera_compare.get_modified_attributes(current, desired), dict(second='c'))
+
+    def test_get_modified_attributes_with_list(self):
+        current = dict(first='a', second=['b'], third='c')
+        desired = dict(first='a', second=['c'])
+        self.assertDictEqual(ctera_compare.get_modified_attributes(current, desired), dict(second=['c']))
+
+    def test_get_modified_attributes_with__equal_list(self):
+        current = dict(first='a', second=['b'], third='c')
+        desired = dict(first='a', second=['b'], third='d')
+        self.assertDictEqual(ctera_compare.get_modified_attributes(current, desired), dict(third='d'))
+
+    _comparator_spec = dict(
+        name=dict(type='str'),
+        size=dict(type='int'),
+        servers=dict(type='list', elements='str'),
+        acl=dict(type='list', elements='dict', options=dict(name=dict(), perm=dict(), inherit=dict(type='bool'))),
+        owner=dict(type='dict', options=dict(name=dict(), uid=dict(type='int'))),
+    )
+
+    def test_comparator_equal(self):
+        current = dict(
+            name='Share', size=1, servers=['a', 'b'],
+            acl=[dict(name='alice', perm='RO', inherit=True), dict(name='bob', perm='RW', inherit=False)],
+            owner=dict(name='admin', uid=0)
+        )
+        desired = dict(
+            name='share', size=1, servers=['B', 'a'],
+            acl=[dict(name='Bob', perm='rw', inherit=False), dict(name='alice', perm='RO', inherit=True)],
+            owner=dict(name='Admin', uid=0)
+        )
+        comparator = ctera_compare.AttributeComparator(self._comparator_spec)
+        self.assertDictEqual(comparator.modified_attributes(current, desired), {})
+
+    def test_comparator_modified(self):
+        current = dict(name='share', size=1, servers=['a'], acl=[dict(name='alice', perm='RO', inherit=True)], owner=dict(name='admin', uid=0))
+        desired = dict(name='other', size=2, servers=['a', 'b'], acl=[dict(name='alice', perm='RW', inherit=True)], owner=dict(name='admin', uid=1))
+        comparator = ctera_compare.AttributeComparator(self._comparator_spec)
+        self.assertDictEqual(comparator.modified_attributes(current, desired), desired)
+
+    def test_comparator_skips_unset_options(self):
+        current = dict(name='share', size=1, acl=[dict(name='alice', perm='RO', inherit=True)], owner=dict(name='admin', uid=0))
+        desired = dict(name=None, acl=[dict(name='alice', perm='RO', inherit=None)], owner=dict(name='admin', uid=None))
+        comparator = ctera_compare.AttributeComparator(self._comparator_spec)
+        self.assertDictEqual(comparator.modified_attributes(None, desired), {})
+        self.assertDictEqual(comparator.modified_attributes(current, desired), {})
+
+    def test_comparator_ordered_and_case_sensitive(self):
+        current = dict(name='share', servers=['a', 'b'])
+        desired = dict(name='Share', servers=['b', 'a'])
+        comparator = ctera_compare.AttributeComparator(self._comparator_spec, ordered=['servers'], case_sensitive=['name'])
+        self.assertDictEqual(comparator.modified_attributes(current, desired), desired)
+
+    def test_comparator_list_diff(self):
+        current = dict(servers=['a'], acl=[dict(name='alice', perm='RO')])
+        desired = dict(servers=['A', 'b'], acl=[dict(name='alice', perm='RO'), dict(name='bob', perm='RW')])
+        comparator = ctera_compare.AttributeComparator(self._comparator_spec)
+        self.assertDictEqual(
+            comparator.modified_attributes(current, desired, get_list_diff=True),
+            dict(servers=['b'], acl=[dict(name='bob', perm='RW')])
+        )
+
+    def test_comparator_unknown_option(self):
+        current = dict(extra='a', other=['b'])
+        desired = dict(extra='A', other=['c'])
+        comparator = ctera_compare.AttributeComparator(self._comparator_spec)
+        self.assertDictEqual(comparator.modified_attributes(current, desired), dict(other=['c']))
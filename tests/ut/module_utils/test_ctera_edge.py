@@ -40,8 +40,10 @@ class TestCteraEdge(BaseTest):  #pylint: disable=too-many-public-methods
         super().setUp()
         ansible_module_mock.mock_bases(self, ctera_ansible_module.CteraAnsibleModule)
 
-        self.gateway_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_edge.Gateway")
+        self.gateway_class_mock = self.patch_call("cterasdk.Gateway")
         self.gateway_object_mock = self.gateway_class_mock.return_value
+        self.global_admin_class_mock = self.patch_call("cterasdk.GlobalAdmin")
+        self.global_admin_object_mock = self.global_admin_class_mock.return_value
 
         self.ansible_return_value_class_mock = self.patch_call(
             "ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.ctera_common.AnsibleReturnValue"
@@ -68,3 +70,116 @@ class TestCteraEdge(BaseTest):  #pylint: disable=too-many-public-methods
         self.gateway_class_mock.assert_called_once_with('192.168.1.1', https=True, port=None)
         gateway_ansible_module.ctera_filer(login=False)
         self.gateway_object_mock.login.assert_not_called()
+
+    def test_fleet(self):
+        self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.__init__", new=_mock_init(dict(
+            ctera_host=None,
+            ctera_fleet=[
+                dict(ctera_host='filer1', ctera_https=None, ctera_port=None, ctera_user=None, ctera_password=None),
+                dict(ctera_host='filer2', ctera_https=False, ctera_port=8080, ctera_user=None, ctera_password='secret')
+            ]
+        )))
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        self.gateway_class_mock.assert_not_called()
+        self.assertListEqual(gateway_ansible_module.ctera_fleet(), [
+            dict(ctera_host='filer1', ctera_https=True, ctera_port=None, ctera_user='admin', ctera_password='password'),
+            dict(ctera_host='filer2', ctera_https=False, ctera_port=8080, ctera_user='admin', ctera_password='secret')
+        ])
+        self.assertListEqual(gateway_ansible_module._required_connection_arguments(), [])
+
+    def test_fleet_member(self):
+        self.gateway_class_mock.reset_mock()
+        member = ctera_edge.GatewayFleetMember(
+            _gateway_ansible_module_mock(), dict(ctera_host='filer1', ctera_https=True, ctera_port=None, ctera_user='admin', ctera_password='password')
+        )
+        self.gateway_class_mock.assert_called_once_with('filer1', https=True, port=None)
+        self.assertEqual(member.ctera_filer(), self.gateway_object_mock)
+        self.gateway_object_mock.login.assert_called_once_with('admin', 'password')
+        self.assertFalse(member.ctera_reused_session())
+        member.ctera_logout()
+        member.ctera_logout()
+        self.gateway_object_mock.logout.assert_called_once_with()
+
+    def test_fleet_member_missing_credentials(self):
+        member = ctera_edge.GatewayFleetMember(
+            _gateway_ansible_module_mock(), dict(ctera_host='filer1', ctera_https=True, ctera_port=None, ctera_user=None, ctera_password=None)
+        )
+        self.assertRaises(ctera_edge.GatewayFleetMemberExit, member.ctera_filer)
+        self.gateway_object_mock.login.assert_not_called()
+        self.ansible_return_value_object_mock.failed.assert_called_once_with()
+
+    def test_portal(self):
+        self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.__init__", new=_mock_init(dict(ctera_fleet=None, ctera_portal=_portal_params)))
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        self.gateway_class_mock.assert_not_called()
+        self.global_admin_class_mock.assert_called_once_with('portal.ctera.com', port=None, https=True)
+        self.assertListEqual(gateway_ansible_module._required_connection_arguments(), ['ctera_host'])
+        self.assertEqual(gateway_ansible_module.ctera_filer(), self.global_admin_object_mock.devices.device.return_value)
+        self.assertEqual(gateway_ansible_module.ctera_remote_filer('filer2'), self.global_admin_object_mock.devices.device.return_value)
+        self.global_admin_object_mock.login.assert_called_once_with('admin', 'password')
+        self.assertListEqual(
+            self.global_admin_object_mock.devices.device.call_args_list,
+            [mock.call('192.168.1.1', tenant='acme'), mock.call('filer2', tenant='acme')]
+        )
+        gateway_ansible_module.ctera_logout()
+        gateway_ansible_module.ctera_logout()
+        self.global_admin_object_mock.logout.assert_called_once_with()
+        self.gateway_object_mock.login.assert_not_called()
+
+    def test_portal_device_not_found(self):
+        self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.__init__", new=_mock_init(dict(ctera_fleet=None, ctera_portal=_portal_params)))
+        self.global_admin_object_mock.devices.device.side_effect = CTERAException()
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module.ctera_filer()
+        self.ansible_return_value_object_mock.failed.assert_called_once_with()
+
+    def test_portal_login_failed(self):
+        self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.__init__", new=_mock_init(dict(ctera_fleet=None, ctera_portal=_portal_params)))
+        self.global_admin_object_mock.login.side_effect = CTERAException()
+        gateway_ansible_module = ctera_edge.GatewayAnsibleModule(dict())
+        gateway_ansible_module.ctera_portal_login()
+        self.global_admin_object_mock.login.assert_called_once_with('admin', 'password')
+        self.ansible_return_value_object_mock.failed.assert_called_once_with()
+
+    def test_fleet_member_portal(self):
+        ansible_module = mock.MagicMock()
+        ansible_module.ctera_portal_mode.return_value = True
+        self.gateway_class_mock.reset_mock()
+        member = ctera_edge.GatewayFleetMember(
+            ansible_module, dict(ctera_host='filer1', ctera_https=True, ctera_port=None, ctera_user=None, ctera_password=None)
+        )
+        self.gateway_class_mock.assert_not_called()
+        self.assertEqual(member.ctera_filer(), ansible_module.ctera_remote_filer.return_value)
+        ansible_module.ctera_remote_filer.assert_called_once_with('filer1')
+        member.ctera_logout()
+        ansible_module.ctera_remote_filer.return_value.logout.assert_not_called()
+
+
+_portal_params = dict(ctera_host='portal.ctera.com', ctera_https=True, ctera_port=None, ctera_user='admin', ctera_password='password', tenant='acme')
+
+
+def _gateway_ansible_module_mock():
+    ansible_module = mock.MagicMock()
+    ansible_module.ctera_portal_mode.return_value = False
+    ansible_module.ctera_instrument.side_effect = lambda ctera_host: ctera_host
+    return ansible_module
+
+
+def _mock_init(params):
+    def init(self, _argument_spec, **_kwargs):
+        self.params = dict(
+            ctera_host='192.168.1.1',
+            ctera_user='admin',
+            ctera_https=True,
+            ctera_port=None,
+            ctera_password='password',
+            ctera_trust_certificate=False,
+            ctera_session_cache=False,
+            ctera_session_cache_ttl=300,
+            ctera_profile=False
+        )
+        self.params.update(params)
+        self._socket_path = None  # pylint: disable=protected-access
+        self.fail_dict = {}
+        self.exit_dict = {}
+    return init
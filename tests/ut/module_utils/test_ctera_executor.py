@@ -0,0 +1,145 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import threading
+
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_common import AnsibleReturnValue
+from ansible_collections.ctera.ctera.plugins.module_utils.ctera_executor import (
+    BoundedExecutor, DependencyExecutor, TaskResult, set_step_results, timed
+)
+from tests.ut.base import BaseTest
+
+
+class TestBoundedExecutor(BaseTest):
+
+    def test_run(self):
+        results = BoundedExecutor(2, 10).run(dict(a=lambda: 1, b=lambda: 2, c=lambda: 3))
+        self.assertListEqual(list(results.keys()), ['a', 'b', 'c'])
+        self.assertListEqual([result.status for result in results.values()], [TaskResult.DONE] * 3)
+        self.assertListEqual([result.value for result in results.values()], [1, 2, 3])
+
+    def test_run_error(self):
+        def fail():
+            raise ValueError('Testing Failure')
+        results = BoundedExecutor(2, 10).run(dict(a=fail, b=lambda: 2))
+        self.assertEqual(results['a'].status, TaskResult.ERROR)
+        self.assertEqual(results['a'].error, 'Testing Failure')
+        self.assertEqual(results['b'].status, TaskResult.DONE)
+
+    def test_run_bounded(self):
+        lock = threading.Lock()
+        counters = dict(running=0, max_running=0)
+
+        def task():
+            with lock:
+                counters['running'] += 1
+                counters['max_running'] = max(counters['max_running'], counters['running'])
+            threading.Event().wait(0.01)
+            with lock:
+                counters['running'] -= 1
+
+        results = BoundedExecutor(3, 10).run({i: task for i in range(12)})
+        self.assertEqual(len(results), 12)
+        self.assertLessEqual(counters['max_running'], 3)
+
+    def test_run_timeout(self):
+        hung = threading.Event()
+        self.addCleanup(hung.set)
+        results = BoundedExecutor(1, 0.1).run(dict(a=hung.wait, b=lambda: 2))
+        self.assertEqual(results['a'].status, TaskResult.TIMEOUT)
+        # the worker of the hung task was replaced
+        self.assertEqual(results['b'].status, TaskResult.DONE)
+        self.assertEqual(results['b'].value, 2)
+
+
+class TestDependencyExecutor(BaseTest):
+
+    def test_run_in_dependency_order(self):
+        order = []
+        lock = threading.Lock()
+
+        def task(key):
+            def run():
+                with lock:
+                    order.append(key)
+                return key
+            return run
+
+        results = DependencyExecutor(4, 10).run(
+            {key: task(key) for key in ['shares', 'volumes', 'users', 'network']},
+            dict(shares=['volumes', 'users'], network=['shares', 'volumes', 'users'])
+        )
+        self.assertListEqual(list(results.keys()), ['shares', 'volumes', 'users', 'network'])
+        self.assertTrue(all(result.status == TaskResult.DONE for result in results.values()))
+        self.assertEqual(set(order[:2]), {'volumes', 'users'})
+        self.assertListEqual(order[2:], ['shares', 'network'])
+
+    def test_skip_dependents_of_failed_task(self):
+        def fail():
+            raise ValueError('Testing Failure')
+        results = DependencyExecutor(2, 10).run(
+            dict(volumes=fail, shares=lambda: 1, network=lambda: 2, hostname=lambda: 3),
+            dict(shares=['volumes'], network=['shares'])
+        )
+        self.assertEqual(results['volumes'].status, TaskResult.ERROR)
+        self.assertEqual(results['shares'].status, TaskResult.SKIPPED)
+        self.assertEqual(results['shares'].error, 'Skipped since volumes did not complete')
+        self.assertEqual(results['network'].status, TaskResult.SKIPPED)
+        self.assertEqual(results['hostname'].status, TaskResult.DONE)
+
+    def test_invalid_graph(self):
+        self.assertRaises(ValueError, DependencyExecutor(2, 10).run, dict(a=lambda: 1), dict(a=['b']))
+        self.assertRaises(ValueError, DependencyExecutor(2, 10).run, dict(a=lambda: 1, b=lambda: 2), dict(a=['b'], b=['a']))
+
+
+class TestStepResults(BaseTest):
+
+    def test_timed(self):
+        changed, msg, elapsed = timed(lambda name: (True, 'Changed %s' % name), 'a')()
+        self.assertTrue(changed)
+        self.assertEqual(msg, 'Changed a')
+        self.assertGreaterEqual(elapsed, 0)
+
+    def test_set_step_results_changed(self):
+        return_value = AnsibleReturnValue()
+        set_step_results(return_value, dict(a=TaskResult(TaskResult.DONE, value=(False, 'Unchanged', 0.1)),
+                                            b=TaskResult(TaskResult.DONE, value=(True, 'Changed', 0.2))), 0.3, 'In the desired state')
+        self.assertTrue(return_value.param.changed)
+        self.assertEqual(return_value.param.msg, 'Changed: b')
+        self.assertEqual(return_value.param.elapsed, 0.3)
+        self.assertDictEqual(return_value.param.steps['b'], dict(status=TaskResult.DONE, changed=True, msg='Changed', elapsed=0.2))
+
+    def test_set_step_results_failed(self):
+        return_value = AnsibleReturnValue()
+        set_step_results(return_value, dict(a=TaskResult(TaskResult.DONE, value=(True, 'Changed', 0.1)),
+                                            b=TaskResult(TaskResult.ERROR, error='Testing Failure')), 0.3, 'In the desired state')
+        self.assertTrue(return_value.param.changed)
+        self.assertTrue(return_value.param.failed)
+        self.assertEqual(return_value.param.msg, 'Failed to apply: b')
+        self.assertDictEqual(return_value.param.steps['b'], dict(status=TaskResult.ERROR, changed=False, msg='Testing Failure', elapsed=None))
+
+    def test_set_step_results_unchanged(self):
+        return_value = AnsibleReturnValue()
+        set_step_results(return_value, dict(a=TaskResult(TaskResult.DONE, value=(False, 'Unchanged', 0.1))), 0.1, 'In the desired state')
+        self.assertTrue(return_value.param.skipped)
+        self.assertEqual(return_value.param.msg, 'In the desired state')
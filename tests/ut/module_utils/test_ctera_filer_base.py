@@ -1,9 +1,11 @@
+import unittest.mock as mock
+
 try:
     from cterasdk import CTERAException
 except ImportError:  # pragma: no cover
     pass
 
-from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_base
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common, ctera_filer_base
 from tests.ut.mocks.gateway_ansible_module_mock import mock_gateway_ansible_module
 from tests.ut.base import BaseTest
 
@@ -26,6 +28,25 @@ class CteraFilerTestChild(ctera_filer_base.CteraFilerBase):
         if not self._success:
             raise CTERAException("Testing Failure")
 
+class CteraFilerFleetTestChild(ctera_filer_base.CteraFilerBase):
+
+    def __init__(self):
+        super().__init__({})
+        self.parameters = dict(name='share')
+
+    @property
+    def _generic_failure_message(self):
+        return "Test Child"
+
+    def _execute(self):
+        self.parameters.pop('name')
+        if self._ctera_filer.host_name == 'filer2':
+            raise CTERAException("Testing Failure")
+        if self._ctera_filer.host_name == 'filer3':
+            self.ansible_module.fail_json(msg='Invalid parameters')
+        self.ansible_module.ctera_return_value().changed().msg(self._ctera_filer.host_name)
+
+
 class TestCteraFilerBase(BaseTest):  #pylint: disable=too-many-public-methods
 
     def setUp(self):
@@ -49,3 +70,69 @@ class TestCteraFilerBase(BaseTest):  #pylint: disable=too-many-public-methods
         self.assertTrue(runner.generic_failure_message_called)
         self._obj_mock.ctera_logout.assert_called_once_with()
         self._obj_mock.ctera_exit.assert_called_once_with()
+
+    def test_run_fleet(self):
+        gateway_class_mock = self.patch_call("cterasdk.Gateway")
+        gateway_class_mock.side_effect = lambda host, **kwargs: mock.MagicMock(host_name=host)
+        self._obj_mock.params = dict(ctera_fleet_workers=2, ctera_fleet_timeout=10)
+        self._obj_mock.ctera_fleet.return_value = [
+            dict(ctera_host=host, ctera_https=True, ctera_port=None, ctera_user='admin', ctera_password='password')
+            for host in ['filer1', 'filer2', 'filer3']
+        ]
+        return_value = ctera_common.AnsibleReturnValue()
+        self._obj_mock.ctera_return_value.return_value = return_value
+        runner = CteraFilerFleetTestChild()
+        runner.run()
+        self._obj_mock.ctera_filer.assert_not_called()
+        self._obj_mock.ctera_portal_login.assert_not_called()
+        self._obj_mock.ctera_logout.assert_called_once_with()
+        self._obj_mock.ctera_exit.assert_called_once_with()
+        fleet = return_value.param.fleet
+        self.assertDictEqual(fleet['filer1'], dict(failed=False, changed=True, msg='filer1'))
+        self.assertTrue(fleet['filer2']['failed'])
+        self.assertTrue(fleet['filer2']['msg'].startswith('Test Child Exception:'))
+        self.assertDictEqual(fleet['filer3'], dict(failed=True, msg='Invalid parameters'))
+        self.assertTrue(return_value.param.changed)
+        self.assertEqual(return_value.param.msg, 'Failed on 2 of 3 hosts: filer2, filer3')
+        self.assertDictEqual(runner.parameters, dict(name='share'))
+
+    def test_run_fleet_login_failed(self):
+        gateway_class_mock = self.patch_call("cterasdk.Gateway")
+        gateway_class_mock.return_value.login.side_effect = CTERAException()
+        self._obj_mock.params = dict(ctera_fleet_workers=2, ctera_fleet_timeout=10)
+        self._obj_mock.ctera_fleet.return_value = [dict(ctera_host='filer1', ctera_https=True, ctera_port=None, ctera_user='admin', ctera_password='password')]
+        return_value = ctera_common.AnsibleReturnValue()
+        self._obj_mock.ctera_return_value.return_value = return_value
+        CteraFilerFleetTestChild().run()
+        self.assertTrue(return_value.param.fleet['filer1']['msg'].startswith('Login failed.'))
+        gateway_class_mock.return_value.logout.assert_not_called()
+        self.assertTrue(return_value.has_failed())
+
+    def test_run_fleet_through_portal(self):
+        gateway_class_mock = self.patch_call("cterasdk.Gateway")
+        self._obj_mock.params = dict(ctera_fleet_workers=2, ctera_fleet_timeout=10)
+        self._obj_mock.ctera_portal_mode.return_value = True
+        self._obj_mock.ctera_remote_filer.side_effect = lambda name: mock.MagicMock(host_name=name)
+        self._obj_mock.ctera_fleet.return_value = [
+            dict(ctera_host=host, ctera_https=True, ctera_port=None, ctera_user=None, ctera_password=None) for host in ['filer1', 'filer4']
+        ]
+        return_value = ctera_common.AnsibleReturnValue()
+        self._obj_mock.ctera_return_value.return_value = return_value
+        CteraFilerFleetTestChild().run()
+        gateway_class_mock.assert_not_called()
+        self._obj_mock.ctera_portal_login.assert_called_once_with()
+        self.assertListEqual(sorted(call[0][0] for call in self._obj_mock.ctera_remote_filer.call_args_list), ['filer1', 'filer4'])
+        self._obj_mock.ctera_logout.assert_called_once_with()
+        self.assertEqual(return_value.param.msg, 'Completed on 2 hosts')
+
+    def test_run_fleet_duplicate_hosts(self):
+        gateway_class_mock = self.patch_call("cterasdk.Gateway")
+        self._obj_mock.params = dict(ctera_fleet_workers=2, ctera_fleet_timeout=10)
+        self._obj_mock.ctera_fleet.return_value = [
+            dict(ctera_host=host, ctera_https=True, ctera_port=None, ctera_user='admin', ctera_password='password')
+            for host in ['filer1', 'filer2', 'filer1']
+        ]
+        CteraFilerFleetTestChild().run()
+        self._obj_mock.fail_json.assert_called_once_with(msg='Hosts are listed more than once in ctera_fleet: filer1')
+        gateway_class_mock.assert_not_called()
+        self._obj_mock.ctera_exit.assert_not_called()
@@ -0,0 +1,68 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest
+
+import munch
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_converters as ctera_filer_converters
+
+
+class TestCteraFilerConverters(unittest.TestCase):
+
+    def test_user_to_dict(self):
+        user = munch.Munch(username='alice', fullName='Alice', email='alice@example.com', _classname='user')
+        self.assertDictEqual(ctera_filer_converters.user_to_dict(user), dict(username='alice', full_name='Alice', email='alice@example.com'))
+
+    def test_share_to_dict(self):
+        share = munch.Munch(
+            name='demo', volume='main', directory='/dir', acl=[], access='winAclMode', clientSideCaching='manual', dirPermissions=777,
+            comment='', exportToAFP=False, exportToFTP=False, exportToNFS=True, exportToPCAgent=False, exportToRSync=False, indexed=False,
+            trustedNFSClients=[munch.Munch(address='10.0.0.1', netmask='255.255.255.255', accessLevel='RO')]
+        )
+        share_dict = ctera_filer_converters.share_to_dict(share)
+        self.assertEqual(share_dict['directory'], 'main/dir')
+        self.assertEqual(share_dict['csc'], 'manual')
+        self.assertListEqual(share_dict['trusted_nfs_clients'], [dict(address='10.0.0.1', netmask='255.255.255.255', perm='RO')])
+
+    def test_share_acl_entry_to_dict_local(self):
+        expected_acl_dict = dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')
+        acl_entry = munch.Munch(
+            permissions=munch.Munch(allowedFileAccess='ReadWrite'),
+            principal2=munch.Munch(
+                _classname='LocalGroup',
+                ref='#Admins'
+            )
+        )
+        self.assertDictEqual(expected_acl_dict, ctera_filer_converters.share_acl_entry_to_dict(acl_entry))
+
+    def test_share_acl_entry_to_dict_domain(self):
+        expected_acl_dict = dict(principal_type='DomainGroup', name='Admins', perm='ReadWrite')
+        acl_entry = munch.Munch(
+            permissions=munch.Munch(allowedFileAccess='ReadWrite'),
+            principal2=munch.Munch(
+                _classname='DomainGroup',
+                name='Admins'
+            )
+        )
+        self.assertDictEqual(expected_acl_dict, ctera_filer_converters.share_acl_entry_to_dict(acl_entry))
@@ -0,0 +1,43 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
+
+
+class TestCteraFilerServiceSpecs(unittest.TestCase):
+
+    def test_argument_spec(self):
+        spec = ctera_filer_service_specs.argument_spec('rsync')
+        self.assertDictEqual(spec, dict(
+            port=dict(type='int', required=False, default=873),
+            max_connections=dict(type='int', required=False, default=25)
+        ))
+        spec['port']['default'] = 874
+        self.assertEqual(ctera_filer_service_specs.argument_spec('rsync')['port']['default'], 873)
+
+    def test_argument_spec_without_defaults(self):
+        spec = ctera_filer_service_specs.argument_spec('snmp', defaults=False)
+        self.assertListEqual([name for name, option in spec.items() if 'default' in option], ['update_password'])
+        self.assertNotIn('default', ctera_filer_service_specs.argument_spec('syslog', defaults=False)['port'])
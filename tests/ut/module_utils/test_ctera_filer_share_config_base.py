@@ -82,6 +82,31 @@ class TestCteraFilerAsyncIO(BaseTest):
         self.assertDictEqual(expected_dict, share_config._get_current_config())
         self.assertTrue(share_config.called__to_config_dict)
 
+    def test__get_current_config_snapshot(self):
+        share_config = ShareConfigMock()
+        share_config._ctera_filer.share_mock.get_configuration = mock.MagicMock(
+            side_effect=[munch.Munch(mode='disabled'), munch.Munch(mode='enabled')]
+        )
+        self.assertDictEqual(share_config._get_current_config(), dict(mode='disabled'))
+        self.assertEqual(share_config._ctera_filer.share_mock.get_configuration.call_count, 1)
+
+    def test__execute_round_trips(self):
+        for is_enabled, desired_enabled, change_attributes, reads, writes in [
+            (True, True, False, 1, 0),  # no-op
+            (True, True, True, 1, 1),  # modify
+            (False, True, True, 1, 2),  # enable and modify
+            (False, True, False, 1, 1),  # enable
+            (True, False, False, 1, 1),  # disable
+            (False, False, False, 1, 0)  # already disabled
+        ]:
+            share_config = ShareConfigMock()
+            share_config._ctera_filer.share_mock.get_configuration = mock.MagicMock(side_effect=[
+                munch.Munch(mode='enabled' if is_enabled else 'disabled', size=1024), munch.Munch(mode='enabled', size=1024)
+            ])
+            share_config.parameters = dict(enabled=desired_enabled, mode='enabled', size=2048 if change_attributes else 1024)
+            share_config._execute()
+            self.assert_max_calls(share_config._ctera_filer, reads=reads, writes=writes)
+
     def test__ensure_enabled(self):
         for is_enabled in [True, False]:
             for change_attributes in [True, False]:
@@ -94,16 +119,16 @@ class TestCteraFilerAsyncIO(BaseTest):
             name='name',
             size=1024,
         )
-        after_enable_attributes = copy.deepcopy(current_attributes)
-        after_enable_attributes['mode'] = 'enabled'
-        desired_attributes = copy.deepcopy(after_enable_attributes)
+        desired_attributes = copy.deepcopy(current_attributes)
+        desired_attributes['mode'] = 'enabled'
         if change_attributes:
             desired_attributes['size'] = 2048
         share_config = ShareConfigMock()
-        share_config._get_current_config = mock.MagicMock(return_value=after_enable_attributes)
+        share_config._get_current_config = mock.MagicMock()
         share_config.parameters = desired_attributes
 
         share_config._ensure_enabled(current_attributes)
+        share_config._get_current_config.assert_not_called()
         if is_enabled:
             share_config._ctera_filer.share_mock.enable.assert_not_called()
         else:
@@ -113,6 +138,16 @@ class TestCteraFilerAsyncIO(BaseTest):
         else:
             share_config._ctera_filer.share_mock.modify.assert_not_called()
 
+    def test_plan_enable(self):
+        for current_mode, desired, expected in [
+            ('enabled', dict(size=1024), (False, {})),
+            ('enabled', dict(size=2048), (False, dict(size=2048))),
+            ('disabled', dict(size=1024), (True, {})),
+            ('disabled', dict(mode='enabled', size=2048), (True, dict(size=2048)))
+        ]:
+            plan = ctera_filer_share_config_base.CteraFilerShareConfigBase.plan_enable(dict(mode=current_mode, size=1024), desired, 'mode')
+            self.assertEqual(plan, expected)
+
     def test__ensure_disabled(self):
         for is_enabled in [True, False]:
             self._test__ensure_disabled(is_enabled)
@@ -40,7 +40,7 @@ class TestCteraPortal(BaseTest):  #pylint: disable=too-many-public-methods
         super().setUp()
         ansible_module_mock.mock_bases(self, ctera_ansible_module.CteraAnsibleModule)
 
-        self.portal_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal.GlobalAdmin")
+        self.portal_class_mock = self.patch_call("cterasdk.GlobalAdmin")
         self.portal_object_mock = self.portal_class_mock.return_value
 
         self.ansible_return_value_class_mock = self.patch_call(
@@ -75,3 +75,14 @@ class TestCteraPortal(BaseTest):  #pylint: disable=too-many-public-methods
         self.portal_class_mock.assert_called_once_with('192.168.1.1', https=True, port=None)
         portal_ansible_module.ctera_portal(login=False)
         self.portal_object_mock.login.assert_not_called()
+
+    def test_session_cache_scoped_by_tenant(self):
+        session_cache_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.module_utils.ctera_ansible_module.SessionCache")
+        mock_init = ansible_module_mock.AnsibleModuleMock.__init__
+
+        def init(ansible_module, argument_spec, **kwargs):
+            mock_init(ansible_module, argument_spec, **kwargs)
+            ansible_module.params.update(ctera_session_cache=True, tenant='acme')
+        self.patch_call("tests.ut.mocks.ansible_module_mock.AnsibleModuleMock.__init__", new=init)
+        ctera_portal.PortalAnsibleModule(dict())
+        session_cache_class_mock.assert_called_once_with('192.168.1.1', None, 'admin', 300, scope='acme')
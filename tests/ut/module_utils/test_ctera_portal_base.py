@@ -95,3 +95,13 @@ class TestCteraPortalBase(BaseTest):  #pylint: disable=too-many-public-methods
         self.assertFalse(runner.generic_failure_message_called)
         self._obj_mock.ctera_logout.assert_called_once_with()
         self._obj_mock.ctera_exit.assert_called_once_with()
+
+    def test_run_reused_session_default_tenant(self):
+        portal_mock = PortalMock()
+        runner = CteraPortalTestChild(True)
+        runner.parameters = dict(tenant=None)
+        self._obj_mock.ctera_portal = mock.MagicMock(return_value=portal_mock)
+        self._obj_mock.ctera_reused_session = mock.MagicMock(return_value=True)
+        runner.run()
+        self.assertTrue(portal_mock.portals.browse_global_admin_called)
+        self.assertIsNone(portal_mock.portals.browse_tenant)
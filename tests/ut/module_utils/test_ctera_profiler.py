@@ -0,0 +1,84 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import datetime
+
+import requests
+
+try:
+    from cterasdk import Gateway
+except ImportError:  # pragma: no cover
+    pass
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_profiler as ctera_profiler
+from tests.ut.base import BaseTest
+
+
+def _response(method, url, status, content, elapsed, headers=None):
+    response = requests.models.Response()
+    response.request = requests.Request(method, url).prepare()
+    response.url = url
+    response.status_code = status
+    response._content = content  # pylint: disable=protected-access
+    response.headers.update(headers or {})
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    return response
+
+
+class TestCteraProfiler(BaseTest):
+
+    def test_instrument(self):
+        profiler = ctera_profiler.ApiProfiler()
+        gateway = Gateway('192.168.1.1')
+        self.assertIs(profiler.instrument(gateway), gateway)
+        profiler.instrument(gateway)
+        hooks = gateway._ctera_client.http_client.session.hooks['response']  # pylint: disable=protected-access
+        self.assertEqual(len([hook for hook in hooks if hook == profiler._record]), 1)  # pylint: disable=protected-access
+
+    def test_instrument_unknown_handle(self):
+        handle = object()
+        self.assertIs(ctera_profiler.ApiProfiler().instrument(handle), handle)
+
+    def test_summary(self):
+        profiler = ctera_profiler.ApiProfiler()
+        share_url = 'https://192.168.1.1/admingui/api/config/fileservices/share'
+        profiler._record(_response('GET', share_url, 200, b'<obj/>', 0.25))  # pylint: disable=protected-access
+        profiler._record(_response('GET', share_url + '?x=1', 200, b'<obj></obj>', 0.5))  # pylint: disable=protected-access
+        profiler._record(  # pylint: disable=protected-access
+            _response('PUT', 'https://192.168.1.1/admingui/api/config/fileservices/share/public', 500, b'', 0.125, {'Content-Length': '42'})
+        )
+        profiler._record(  # pylint: disable=protected-access
+            _response('GET', 'https://192.168.1.1/admingui/api/proc/logs', 200, None, 0.125), stream=True
+        )
+        with profiler.timed('login'):
+            pass
+        summary = profiler.summary()
+        self.assertEqual(summary['requests'], 4)
+        self.assertEqual(summary['elapsed'], 1.0)
+        self.assertDictEqual(summary['calls'][2], dict(
+            host='192.168.1.1', method='PUT', path='/admingui/api/config/fileservices/share/public', status=500, bytes=42, elapsed=0.125
+        ))
+        self.assertEqual(summary['calls'][3]['bytes'], 0)
+        self.assertDictEqual(summary['operations']['GET /admingui/api/config/fileservices/share'], dict(count=2, elapsed=0.75, max=0.5, bytes=17))
+        self.assertGreaterEqual(summary['login'], 0)
+        self.assertEqual(summary['logout'], 0)
+        self.assertGreaterEqual(summary['total'], 0)
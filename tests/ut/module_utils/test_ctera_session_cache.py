@@ -0,0 +1,86 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest.mock as mock
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_session_cache as ctera_session_cache
+from tests.ut.base import BaseTest
+
+
+class TestCteraSessionCache(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self._parent = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._parent)
+        self._directory = os.path.join(self._parent, 'cache')
+
+    def _cache(self, user='admin', ttl=300, scope=None):
+        return ctera_session_cache.SessionCache('192.168.1.1', None, user, ttl, directory=self._directory, scope=scope)
+
+    def test_empty(self):
+        self.assertIsNone(self._cache().load())
+
+    def test_store_and_load(self):
+        cache = self._cache()
+        self.assertTrue(cache.store('abcd'))
+        self.assertEqual(self._cache().load(), 'abcd')
+        self.assertIsNone(self._cache(user='other').load())
+        self.assertEqual(stat.S_IMODE(os.stat(self._directory).st_mode), 0o700)
+        cache_file = os.path.join(self._directory, os.listdir(self._directory)[0])
+        self.assertEqual(stat.S_IMODE(os.stat(cache_file).st_mode), 0o600)
+
+    def test_scope(self):
+        self._cache(scope='tenant').store('abcd')
+        self._cache(scope='other').store('efgh')
+        self.assertEqual(self._cache(scope='tenant').load(), 'abcd')
+        self.assertEqual(self._cache(scope='other').load(), 'efgh')
+        self.assertIsNone(self._cache().load())
+
+    def test_store_no_session(self):
+        self.assertFalse(self._cache().store(None))
+
+    def test_expired(self):
+        cache = self._cache()
+        cache.store('abcd')
+        with mock.patch('time.time', return_value=10 ** 10):
+            self.assertIsNone(cache.load())
+        self.assertListEqual(os.listdir(self._directory), [])
+
+    def test_invalidate(self):
+        cache = self._cache()
+        cache.store('abcd')
+        cache.invalidate()
+        self.assertIsNone(cache.load())
+        cache.invalidate()
+
+    def test_shared_directory(self):
+        os.makedirs(self._directory, 0o777)
+        os.chmod(self._directory, 0o777)
+        cache = self._cache()
+        self.assertFalse(cache.store('abcd'))
+        self.assertIsNone(cache.load())
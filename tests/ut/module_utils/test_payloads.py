@@ -0,0 +1,71 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import pkgutil
+import unittest
+
+from tests.benchmarks import bench_payload
+
+
+MAX_COMPRESSED_SIZE = 32 * 1024  # bytes of the module and the module_utils of the collection that it ships, deflated
+# ctera_filer_state ships the base of every filer step that it runs
+MAX_COMPRESSED_SIZES = dict(ctera_filer_state=40 * 1024)
+
+
+class TestPayloads(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        names = sorted(module.name for module in pkgutil.iter_modules([bench_payload.MODULES_PATH]))
+        cls.payloads = {name: bench_payload.collection_payload(name) for name in names}
+
+    def _report(self):
+        return '\n'.join(
+            '%-50s %8d bytes deflated  %s' % (name, payload['compressed_size'], ' '.join(payload['module_utils']))
+            for name, payload in self.payloads.items()
+        )
+
+    def test_payload_size(self):
+        oversized = [
+            name for name, payload in self.payloads.items() if payload['compressed_size'] > MAX_COMPRESSED_SIZES.get(name, MAX_COMPRESSED_SIZE)
+        ]
+        self.assertEqual(oversized, [], 'Payloads larger than their budget:\n%s' % self._report())
+
+    def test_portal_and_gateway_module_utils_are_separate(self):
+        for name, payload in self.payloads.items():
+            if name.startswith('ctera_portal_'):
+                foreign = [util for util in payload['module_utils'] if util.startswith(('ctera_edge', 'ctera_filer'))]
+            else:
+                foreign = [util for util in payload['module_utils'] if util.startswith('ctera_portal')]
+            self.assertEqual(foreign, [], '%s ships %s' % (name, foreign))
+
+    def test_compare_shipped_only_when_used(self):
+        for name, payload in self.payloads.items():
+            paths = [os.path.join(bench_payload.MODULES_PATH, name + '.py')]
+            paths.extend(os.path.join(bench_payload.MODULE_UTILS_PATH, util + '.py') for util in payload['module_utils'])
+            used = False
+            for path in paths:
+                with open(path) as f:
+                    used = used or 'ctera_compare.' in f.read()
+            self.assertEqual('ctera_compare' in payload['module_utils'], used, name)
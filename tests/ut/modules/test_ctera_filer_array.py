@@ -74,6 +74,7 @@ class TestCteraFilerArray(BaseTest):
         array.parameters = dict(array_name='array')
         array._ctera_filer.array.get = mock.MagicMock(return_value=munch.Munch(array_object_dict))
         self.assertDictEqual(expected_array_dict, array._get_array())
+        self.assert_max_calls(array._ctera_filer, reads=1, writes=0)
 
     def test__get_array_doesnt_exist(self):
         array = ctera_filer_array.CteraFilerArray()
@@ -92,27 +93,31 @@ class TestCteraFilerArray(BaseTest):
             for change_attributes in [True, False]:
                 self._test_ensure_present(is_present, change_attributes)
 
-    @staticmethod
-    def _test_ensure_present(is_present, change_attributes):
+    def _test_ensure_present(self, is_present, change_attributes):
         current_attributes = dict(
             array_name='array',
             level='linear',
             members=['VIRT2', 'VIRT3']
         )
         array = ctera_filer_array.CteraFilerArray()
-        array.parameters = current_attributes
-        array._ensure_present(current_attributes if is_present else None)
+        array.parameters = dict(state='present', **current_attributes)
+        if is_present:
+            array._ctera_filer.array.get.return_value = munch.Munch(current_attributes)
+        else:
+            array._ctera_filer.array.get.side_effect = CTERAException(response=munch.Munch(code=404))
+        array._execute()
+        array._ctera_filer.array.get.assert_called_once_with(name='array')
         if is_present:
             array._ctera_filer.array.add.assert_not_called()
         else:
             array._ctera_filer.array.add.assert_called_once_with(**current_attributes)
+        self.assert_max_calls(array._ctera_filer, reads=1, writes=0 if is_present else 1)
 
     def test_ensure_absent(self):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         name = 'array'
         array = ctera_filer_array.CteraFilerArray()
         array.parameters = dict(array_name=name)
@@ -121,3 +126,4 @@ class TestCteraFilerArray(BaseTest):
             array._ctera_filer.array.delete.assert_called_once_with(name)
         else:
             array._ctera_filer.array.delete.assert_not_called()
+        self.assert_max_calls(array._ctera_filer, reads=0, writes=1 if is_present else 0)
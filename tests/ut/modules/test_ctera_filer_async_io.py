@@ -46,6 +46,7 @@ class TestCteraFilerAsyncIO(BaseTest):
             async_io._ctera_filer.aio.enable.assert_not_called()  # pylint: disable=protected-access
             async_io._ctera_filer.aio.disable.assert_not_called()  # pylint: disable=protected-access
             self.assertFalse(hasattr(async_io.ansible_return_value.param, 'changed'))
+            self.assert_max_calls(async_io._ctera_filer, reads=1, writes=0)  # pylint: disable=protected-access
             self.assertEqual(async_io.ansible_return_value.param.msg, 'asynchronous I/O is already %sabled' % ('en' if desired else 'dis'))
         else:
             if desired:
@@ -56,4 +57,5 @@ class TestCteraFilerAsyncIO(BaseTest):
                 async_io._ctera_filer.aio.disable.assert_called_once_with()  # pylint: disable=protected-access
                 async_io._ctera_filer.aio.enable.assert_not_called()  # pylint: disable=protected-access
             self.assertTrue(async_io.ansible_return_value.param.changed)
+            self.assert_max_calls(async_io._ctera_filer, reads=1, writes=1)  # pylint: disable=protected-access
             self.assertEqual(async_io.ansible_return_value.param.msg, '%sabled asynchronous I/O' % ('En' if desired else 'Dis'))
@@ -44,9 +44,11 @@ class TestCteraFilerBackup(BaseTest):
         backup.run()
         if is_configured:
             backup._ctera_filer.backup.configure.assert_not_called()  # pylint: disable=protected-access
+            self.assert_max_calls(backup._ctera_filer, reads=1, writes=0)  # pylint: disable=protected-access
             self.assertFalse(hasattr(backup.ansible_return_value.param, 'changed'))
             self.assertEqual(backup.ansible_return_value.param.msg, 'Cloud Backup is already configured')
         else:
             backup._ctera_filer.backup.configure.assert_called_once_with(expected_passphrase)  # pylint: disable=protected-access
+            self.assert_max_calls(backup._ctera_filer, reads=1, writes=1)  # pylint: disable=protected-access
             self.assertTrue(backup.ansible_return_value.param.changed)
             self.assertEqual(backup.ansible_return_value.param.msg, 'Configured cloud backup')
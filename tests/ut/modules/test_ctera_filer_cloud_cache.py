@@ -25,6 +25,7 @@ __metaclass__ = type
 
 import unittest.mock as mock
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_cloud_cache_base as ctera_filer_cloud_cache_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_cloud_cache as ctera_filer_cloud_cache
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -34,7 +35,7 @@ class TestCteraFilerCloudCache(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_cloud_cache.CteraFilerCloudSync)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_cloud_cache_base.CteraFilerCloudCacheBase)
 
     def test_not_connected(self):
         for desired in [True, False]:
@@ -62,15 +63,15 @@ class TestCteraFilerCloudCache(BaseTest):
         cloud_cache._ctera_filer.services.connected.return_value = True
         cloud_cache._ctera_filer.cache.is_enabled.return_value = current
         cloud_cache.parameters = dict(enabled=desired)
-        cloud_cache._ensure_cache_enabled = mock.MagicMock()
-        cloud_cache._ensure_cache_disabled = mock.MagicMock()
+        cloud_cache.ensure_cache_enabled = mock.MagicMock()
+        cloud_cache.ensure_cache_disabled = mock.MagicMock()
         cloud_cache._execute()
         if desired:
-            cloud_cache._ensure_cache_enabled.assert_called_once_with(current)
-            cloud_cache._ensure_cache_disabled.assert_not_called()
+            cloud_cache.ensure_cache_enabled.assert_called_once_with(cloud_cache._ctera_filer, current, cloud_cache.parameters, mock.ANY)
+            cloud_cache.ensure_cache_disabled.assert_not_called()
         else:
-            cloud_cache._ensure_cache_enabled.assert_not_called()
-            cloud_cache._ensure_cache_disabled.assert_called_once_with(current)
+            cloud_cache.ensure_cache_enabled.assert_not_called()
+            cloud_cache.ensure_cache_disabled.assert_called_once_with(cloud_cache._ctera_filer, current, mock.ANY)
 
     def test__ensure_cache_enabled(self):
         for is_cache_enabled in [True, False]:
@@ -84,9 +85,10 @@ class TestCteraFilerCloudCache(BaseTest):
         cloud_cache = ctera_filer_cloud_cache.CteraFilerCloudSync()
         cloud_cache.parameters = dict(force_eviction=force_eviction, sync_enabled=desired_sync)
         cloud_cache._ctera_filer.sync.is_enabled.return_value = current_sync
-        cloud_cache._ensure_sync_enabled = mock.MagicMock()
-        cloud_cache._ensure_sync_disabled = mock.MagicMock()
-        cloud_cache._ensure_cache_enabled(is_cache_enabled)
+        messages = dict(skipped=[], changed=[])
+        with mock.patch.object(ctera_filer_cloud_cache_base.CteraFilerCloudCacheBase, 'ensure_sync_enabled') as ensure_sync_enabled, \
+                mock.patch.object(ctera_filer_cloud_cache_base.CteraFilerCloudCacheBase, 'ensure_sync_disabled') as ensure_sync_disabled:
+            cloud_cache.ensure_cache_enabled(cloud_cache._ctera_filer, is_cache_enabled, cloud_cache.parameters, messages)
         if is_cache_enabled:
             cloud_cache._ctera_filer.cache.enable.assert_not_called()
         else:
@@ -97,14 +99,12 @@ class TestCteraFilerCloudCache(BaseTest):
             cloud_cache._ctera_filer.cache.force_eviction.assert_called_once_with()
         else:
             cloud_cache._ctera_filer.cache.force_eviction.assert_not_called()
+        self.assert_max_calls(cloud_cache._ctera_filer, reads=1, writes=int(not is_cache_enabled) + int(force_eviction))
         if desired_sync:
-            cloud_cache._ensure_sync_enabled.assert_called_once_with(current_sync, mock.ANY)
-        else:
-            cloud_cache._ensure_sync_disabled.assert_called_once_with(current_sync, mock.ANY)
-        if expected_changed:
-            self.assertTrue(cloud_cache.ansible_return_value.param.changed)
+            ensure_sync_enabled.assert_called_once_with(cloud_cache._ctera_filer, current_sync, cloud_cache.parameters, messages)
         else:
-            self.assertFalse(hasattr(cloud_cache.ansible_return_value.param, 'changed'))
+            ensure_sync_disabled.assert_called_once_with(cloud_cache._ctera_filer, current_sync, messages)
+        self.assertEqual(bool(messages['changed']), expected_changed)
 
     def test__ensure_cache_disabled(self):
         for is_cache_enabled in [True, False]:
@@ -112,15 +112,20 @@ class TestCteraFilerCloudCache(BaseTest):
 
     def _test__ensure_cache_disabled(self, is_cache_enabled):
         cloud_cache = ctera_filer_cloud_cache.CteraFilerCloudSync()
-        cloud_cache._ensure_cache_disabled(is_cache_enabled)
+        cloud_cache.parameters = dict(enabled=False)
+        cloud_cache._ctera_filer.services.connected.return_value = True
+        cloud_cache._ctera_filer.cache.is_enabled.return_value = is_cache_enabled
+        cloud_cache._execute()
         if is_cache_enabled:
             cloud_cache._ctera_filer.cache.disable.assert_called_once_with()
+            self.assert_max_calls(cloud_cache._ctera_filer, reads=2, writes=1)
             self.assertTrue(cloud_cache.ansible_return_value.param.changed)
-            self.assertEqual(cloud_cache.ansible_return_value.param.msg, 'Cloud cache was disabled')
+            self.assertEqual(cloud_cache.ansible_return_value.param.msg, 'Changed: Cloud cache was disabled')
         else:
             cloud_cache._ctera_filer.cache.disable.assert_not_called()
+            self.assert_max_calls(cloud_cache._ctera_filer, reads=2, writes=0)
             self.assertTrue(cloud_cache.ansible_return_value.param.skipped)
-            self.assertEqual(cloud_cache.ansible_return_value.param.msg, 'Cloud cache is already disabled')
+            self.assertEqual(cloud_cache.ansible_return_value.param.msg, 'Skipped: Cloud cache is already disabled')
 
     def test__ensure_sync_enabled(self):
         for is_sync_enabled in [True, False]:
@@ -134,7 +139,7 @@ class TestCteraFilerCloudCache(BaseTest):
         cloud_cache = ctera_filer_cloud_cache.CteraFilerCloudSync()
         cloud_cache.parameters = dict(refresh_folders=refresh_folders)
         cloud_cache._ctera_filer.volumes.get.return_value = [{}] if volume_exists else []
-        cloud_cache._ensure_sync_enabled(is_sync_enabled, messages)
+        cloud_cache.ensure_sync_enabled(cloud_cache._ctera_filer, is_sync_enabled, cloud_cache.parameters, messages)
         if is_sync_enabled:
             cloud_cache._ctera_filer.sync.unsuspend.assert_not_called()
             expected_messages['skipped'].append('Cloud sync was already enabled')
@@ -162,7 +167,7 @@ class TestCteraFilerCloudCache(BaseTest):
     def _test__ensure_sync_disabled(self, is_sync_enabled):
         messages = dict(skipped=[], changed=[])
         cloud_cache = ctera_filer_cloud_cache.CteraFilerCloudSync()
-        cloud_cache._ensure_sync_disabled(is_sync_enabled, messages)
+        cloud_cache.ensure_sync_disabled(cloud_cache._ctera_filer, is_sync_enabled, messages)
         if is_sync_enabled:
             cloud_cache._ctera_filer.sync.suspend.assert_called_once_with()
             self.assertEqual(messages['changed'], ['Cloud sync was disabled'])
@@ -43,6 +43,7 @@ class TestCteraFilerDeviceReboot(BaseTest):
         device_reboot.parameters = dict(wait=wait)
         device_reboot._execute()
         device_reboot._ctera_filer.power.reboot.assert_called_once_with(wait)
+        self.assert_max_calls(device_reboot._ctera_filer, reads=0, writes=1)
         self.assertEqual(
             device_reboot.ansible_return_value.param.msg,
             'Filer is up and running' if wait else 'Rebooting device'
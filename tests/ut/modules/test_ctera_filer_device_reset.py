@@ -43,6 +43,7 @@ class TestCteraFilerDeviceReset(BaseTest):
         device_reset.parameters = dict(wait=wait)
         device_reset._execute()
         device_reset._ctera_filer.power.reset.assert_called_once_with(wait)
+        self.assert_max_calls(device_reset._ctera_filer, reads=0, writes=1)
         self.assertEqual(
             device_reset.ansible_return_value.param.msg,
             'Filer is up and running' if wait else 'Resetting device'
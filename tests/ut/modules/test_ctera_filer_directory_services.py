@@ -43,8 +43,7 @@ class TestCteraFilerDirectoryServices(BaseTest):
             for desired in [True, False]:
                 self._test__execute(is_connected, desired)
 
-    @staticmethod
-    def _test__execute(is_connected, desired):
+    def _test__execute(self, is_connected, desired):
         domain_dict = dict(domain='example.com' if is_connected else '')
         directory_services = ctera_filer_directory_services.CteraFilerDirectoryServices()
         directory_services._ctera_filer.directoryservice.get_connected_domain.return_value = munch.Munch(domain_dict)
@@ -58,6 +57,7 @@ class TestCteraFilerDirectoryServices(BaseTest):
         else:
             directory_services._ensure_connected.assert_not_called()
             directory_services._ensure_disconnected.assert_called_once_with(domain_dict)
+        self.assert_max_calls(directory_services._ctera_filer, reads=1, writes=0)
 
     def test__ensure_connected(self):
         for is_connected in [True, False]:
@@ -86,6 +86,7 @@ class TestCteraFilerDirectoryServices(BaseTest):
         directory_services._ctera_filer.directoryservice.connect.assert_called_once_with(**connect_parameters)
         self.assertEqual(directory_services.ansible_return_value.param.msg, 'Connected to Active Directory')
         self.assertTrue(directory_services.ansible_return_value.param.changed)
+        self.assert_max_calls(directory_services._ctera_filer, reads=0, writes=1)
 
     def test__handle_modify(self):
         for change_domain in [True, False]:
@@ -109,6 +110,7 @@ class TestCteraFilerDirectoryServices(BaseTest):
         else:
             directory_services._ctera_filer.directoryservice.disconnect.assert_called_once_with()
             directory_services._do_connect.assert_called_once_with()
+        self.assert_max_calls(directory_services._ctera_filer, reads=1, writes=1 if change_domain or force_reconnect else 0)
 
     def test__ensure_disconnected(self):
         for is_connected in [True, False]:
@@ -125,3 +127,4 @@ class TestCteraFilerDirectoryServices(BaseTest):
         else:
             directory_services._ctera_filer.directoryservice.disconnect.assert_not_called()
             self.assertEqual(directory_services.ansible_return_value.param.msg, 'The Edge Filer is already not connected to Active Directory')
+        self.assert_max_calls(directory_services._ctera_filer, reads=0, writes=1 if is_connected else 0)
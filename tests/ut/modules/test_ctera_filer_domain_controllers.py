@@ -54,9 +54,11 @@ class TestCteraFilerDomainControllers(BaseTest):
         dc._ctera_filer.directoryservice.get_static_domain_controller.assert_called_once()
         if changed:
             dc._ctera_filer.directoryservice.set_static_domain_controller.assert_called_once_with(' '.join(domain_controllers))
+            self.assert_max_calls(dc._ctera_filer, reads=1, writes=1)
             self.assertTrue(dc.ansible_return_value.param.changed)
         else:
             dc._ctera_filer.directoryservice.set_static_domain_controller.assert_not_called()
+            self.assert_max_calls(dc._ctera_filer, reads=1, writes=0)
             self.assertTrue(dc.ansible_return_value.param.skipped)
 
     def test_ensure_absent(self):
@@ -73,7 +75,9 @@ class TestCteraFilerDomainControllers(BaseTest):
         dc._execute()
         if changed:
             dc._ctera_filer.directoryservice.remove_static_domain_controller.assert_called_once()
+            self.assert_max_calls(dc._ctera_filer, reads=1, writes=1)
             self.assertTrue(dc.ansible_return_value.param.changed)
         else:
             dc._ctera_filer.directoryservice.remove_static_domain_controller.assert_not_called()
+            self.assert_max_calls(dc._ctera_filer, reads=1, writes=0)
             self.assertTrue(dc.ansible_return_value.param.skipped)
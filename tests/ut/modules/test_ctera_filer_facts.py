@@ -0,0 +1,90 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import munch
+
+try:
+    from cterasdk import CTERAException, gateway_enum
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_facts as ctera_filer_facts
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerFacts(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_facts.CteraFilerFacts)
+
+    @staticmethod
+    def _facts(gather_subset):
+        facts = ctera_filer_facts.CteraFilerFacts()
+        facts.parameters = dict(gather_subset=gather_subset, gather_workers=4, gather_timeout=60)
+        return facts
+
+    def test_gather_subset(self):
+        facts = self._facts(['ntp', 'users', 'license'])
+        facts._ctera_filer.ntp.get_configuration.return_value = munch.Munch(NTPMode=gateway_enum.Mode.Enabled, NTPServer=['0.pool.ntp.org'])
+        facts._ctera_filer.users.get.return_value = [munch.Munch(username='alice', fullName='Alice', _classname='user')]
+        facts._ctera_filer.licenses.get.return_value = 'EV16'
+        facts._execute()
+        param = facts.ansible_return_value.param
+        self.assertDictEqual(param.ansible_facts, dict(ctera_filer=dict(
+            license='EV16',
+            ntp=dict(enabled=True, servers=['0.pool.ntp.org']),
+            users=[dict(username='alice', full_name='Alice')]
+        )))
+        self.assertListEqual(sorted(param.timings.keys()), ['license', 'ntp', 'users'])
+        facts._ctera_filer.shares.get.assert_not_called()
+        self.assert_max_calls(facts._ctera_filer, reads=3, writes=0)
+
+    def test_gather_all_but_excluded(self):
+        facts = self._facts(['all', '!users', '!shares'])
+        facts._execute()
+        param = facts.ansible_return_value.param
+        self.assertEqual(len(param.ansible_facts['ctera_filer']), len(facts._subsets) - 2)
+        self.assertNotIn('users', param.ansible_facts['ctera_filer'])
+        self.assertNotIn('password', param.ansible_facts['ctera_filer']['snmp'])
+        facts._ctera_filer.users.get.assert_not_called()
+        self.assert_max_calls(facts._ctera_filer, writes=0)
+
+    def test_gather_failure(self):
+        facts = self._facts(['aio', 'cache'])
+        facts._ctera_filer.aio.is_enabled.side_effect = CTERAException('Testing Failure')
+        facts._ctera_filer.cache.is_enabled.return_value = False
+        facts._execute()
+        param = facts.ansible_return_value.param
+        self.assertDictEqual(param.ansible_facts, dict(ctera_filer=dict(cache=dict(enabled=False))))
+        self.assertEqual(len(param.warnings), 1)
+        self.assertTrue(param.warnings[0].startswith('Failed to gather aio.'))
+        self.assertFalse(facts.ansible_return_value.has_failed())
+        self.assert_max_calls(facts._ctera_filer, reads=2, writes=0)
+
+    def test_unsupported_subset(self):
+        facts = self._facts(['ntp', 'foo'])
+        self.assertRaises(CTERAException, facts._execute)
@@ -56,6 +56,8 @@ class TestCteraFilerFirstUser(BaseTest):
             first_user._ctera_filer.users.add_first_user.assert_called_once_with(username, password, email=email if with_email else '')
             self.assertEqual(first_user.ansible_return_value.param.msg, 'User created')
             self.assertTrue(first_user.ansible_return_value.param.changed)
+            self.assert_max_calls(first_user._ctera_filer, reads=1, writes=1)
         else:
             self.assertEqual(first_user.ansible_return_value.param.msg, 'First user was already created')
+            self.assert_max_calls(first_user._ctera_filer, reads=1, writes=0)
         self.assertEqual(first_user.ansible_return_value.param.user, username)
@@ -23,6 +23,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_hostname_base as ctera_filer_hostname_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_hostname as ctera_filer_hostname
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -32,7 +33,7 @@ class TestCteraFilerHostname(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_hostname.CteraFilerHostname)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_hostname_base.CteraFilerHostnameBase)
 
     def test_execute(self):
         for change_name in [True, False]:
@@ -47,12 +48,14 @@ class TestCteraFilerHostname(BaseTest):
         hostname._execute()
         if change_name:
             hostname._ctera_filer.config.set_hostname.assert_called_once_with(new_name)
+            self.assert_max_calls(hostname._ctera_filer, reads=1, writes=1)
             self.assertTrue(hostname.ansible_return_value.param.changed)
             self.assertEqual(hostname.ansible_return_value.param.msg, 'Changed hostname')
             self.assertEqual(hostname.ansible_return_value.param.previous_hostname, current_name)
             self.assertEqual(hostname.ansible_return_value.param.current_hostname, new_name)
         else:
             hostname._ctera_filer.config.set_hostname.assert_not_called()
+            self.assert_max_calls(hostname._ctera_filer, reads=1, writes=0)
             self.assertFalse(hasattr(hostname.ansible_return_value.param, 'changed'))
             self.assertEqual(hostname.ansible_return_value.param.msg, 'No update required to the current hostname')
             self.assertEqual(hostname.ansible_return_value.param.current_hostname, current_name)
@@ -23,6 +23,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_license_base as ctera_filer_license_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_license as ctera_filer_license
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -32,7 +33,7 @@ class TestCteraFilerLicense(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_license.CteraFilerLicense)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_license_base.CteraFilerLicenseBase)
 
     def test_execute(self):
         for change_license in [True, False]:
@@ -47,10 +48,12 @@ class TestCteraFilerLicense(BaseTest):
         ctera_license._execute()
         if change_license:
             ctera_license._ctera_filer.licenses.apply.assert_called_once_with(new_license)
+            self.assert_max_calls(ctera_license._ctera_filer, reads=1, writes=1)
             self.assertTrue(ctera_license.ansible_return_value.param.changed)
             self.assertEqual(ctera_license.ansible_return_value.param.msg, 'License applied')
         else:
             ctera_license._ctera_filer.licenses.apply.assert_not_called()
+            self.assert_max_calls(ctera_license._ctera_filer, reads=1, writes=0)
             self.assertFalse(hasattr(ctera_license.ansible_return_value.param, 'changed'))
             self.assertTrue(ctera_license.ansible_return_value.param.skipped)
             self.assertEqual(ctera_license.ansible_return_value.param.msg, 'License has not changed')
@@ -47,12 +47,14 @@ class TestCteraFilerLocation(BaseTest):
         location._execute()
         if change_location:
             location._ctera_filer.config.set_location.assert_called_once_with(new_location)
+            self.assert_max_calls(location._ctera_filer, reads=1, writes=1)
             self.assertTrue(location.ansible_return_value.param.changed)
             self.assertEqual(location.ansible_return_value.param.msg, 'Changed location')
             self.assertEqual(location.ansible_return_value.param.previous_location, current_location)
             self.assertEqual(location.ansible_return_value.param.current_location, new_location)
         else:
             location._ctera_filer.config.set_location.assert_not_called()
+            self.assert_max_calls(location._ctera_filer, reads=1, writes=0)
             self.assertFalse(hasattr(location.ansible_return_value.param, 'changed'))
             self.assertEqual(location.ansible_return_value.param.msg, 'No update required to the current location')
             self.assertEqual(location.ansible_return_value.param.current_location, current_location)
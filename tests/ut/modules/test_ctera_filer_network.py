@@ -27,6 +27,7 @@ import copy
 import unittest.mock as mock
 import munch
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_network_base as ctera_filer_network_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_network as ctera_filer_network
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -37,7 +38,7 @@ class TestCteraFilerNetwork(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_network.CteraFilerNetwork)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_network_base.CteraFilerNetworkBase)
 
     def test__execute(self):
         for current_mode in TestCteraFilerNetwork._mode_options:
@@ -50,15 +51,46 @@ class TestCteraFilerNetwork(BaseTest):
         network.parameters = dict(mode=desired_mode)
         current_config_dict = dict(mode=current_mode)
         network._get_current_config = mock.MagicMock(return_value=current_config_dict)
-        network._ensure_dynamic = mock.MagicMock()
-        network._ensure_static = mock.MagicMock()
+        network.ensure_dynamic = mock.MagicMock()
+        network.ensure_static = mock.MagicMock()
         network._execute()
         if desired_mode == 'dynamic':
-            network._ensure_dynamic.assert_called_once_with(current_config_dict)
-            network._ensure_static.assert_not_called()
+            network.ensure_dynamic.assert_called_once_with(network._ctera_filer, current_config_dict, network.parameters, mock.ANY)
+            network.ensure_static.assert_not_called()
         else:
-            network._ensure_static.assert_called_once_with(current_config_dict)
-            network._ensure_dynamic.assert_not_called()
+            network.ensure_static.assert_called_once_with(network._ctera_filer, current_config_dict, network.parameters, mock.ANY)
+            network.ensure_dynamic.assert_not_called()
+
+    def test__execute_static(self):
+        for current_mode in TestCteraFilerNetwork._mode_options:
+            for change_attributes in [True, False]:
+                self._test__execute_static(current_mode, change_attributes)
+
+    def _test__execute_static(self, current_mode, change_attributes):
+        desired_config = dict(
+            address='192.168.1.1',
+            subnet='255.255.255.0',
+            gateway='192.168.1.2',
+            primary_dns_server='192.168.1.3'
+        )
+        network = ctera_filer_network.CteraFilerNetwork()
+        network.parameters = dict(mode='static', **desired_config)
+        network._ctera_filer.network.ifconfig.return_value = munch.Munch(ip=munch.Munch(
+            DHCPMode='enabled' if current_mode == 'dynamic' else 'disabled',
+            address='192.168.1.10' if change_attributes else desired_config['address'],
+            netmask=desired_config['subnet'],
+            gateway=desired_config['gateway'],
+            DNSServer1=desired_config['primary_dns_server'],
+            DNSServer2=None
+        ))
+        network._execute()
+        network._ctera_filer.network.ifconfig.assert_called_once_with()
+        if current_mode == 'dynamic' or change_attributes:
+            network._ctera_filer.network.set_static_ipaddr.assert_called_once_with(**desired_config)
+            self.assert_max_calls(network._ctera_filer, reads=1, writes=1)
+        else:
+            network._ctera_filer.network.set_static_ipaddr.assert_not_called()
+            self.assert_max_calls(network._ctera_filer, reads=1, writes=0)
 
     def test__ensure_dynamic(self):
         for current_mode in TestCteraFilerNetwork._mode_options:
@@ -69,17 +101,17 @@ class TestCteraFilerNetwork(BaseTest):
     def _test__ensure_dynamic(current_mode, primary_dns_server):
         network = ctera_filer_network.CteraFilerNetwork()
         network.parameters = dict(primary_dns_server=primary_dns_server)
-        current_config_dict = dict(mode=current_mode)
-        network._ensure_dns_servers = mock.MagicMock()
-        network._ensure_dynamic(current_config_dict)
+        current_config_dict = dict(mode=current_mode, primary_dns_server='8.8.4.4', secondary_dns_server=None)
+        messages = dict(changed=[], skipped=[])
+        network.ensure_dynamic(network._ctera_filer, current_config_dict, network.parameters, messages)
         if current_mode == 'dynamic':
             network._ctera_filer.network.enable_dhcp.assert_not_called()
         else:
             network._ctera_filer.network.enable_dhcp.assert_called_once_with()
         if primary_dns_server:
-            network._ensure_dns_servers.assert_called_once_with(current_config_dict, mock.ANY)
+            network._ctera_filer.network.set_static_nameserver.assert_called_once_with(primary_dns_server, secondary_dns_server=None)
         else:
-            network._ensure_dns_servers.assert_not_called()
+            network._ctera_filer.network.set_static_nameserver.assert_not_called()
 
     def test__ensure_dns_servers(self):
         for change_primary in [True, False]:
@@ -95,12 +127,14 @@ class TestCteraFilerNetwork(BaseTest):
         network.parameters = dict(primary_dns_server=desired_primary, secondary_dns_server=desired_secondary)
         current_config_dict = dict(primary_dns_server=current_primary, secondary_dns_server=current_secondary)
         messages = dict(changed=[], skipped=[])
-        network._ensure_dns_servers(current_config_dict, messages)
+        network.ensure_dns_servers(network._ctera_filer, current_config_dict, network.parameters, messages)
         if change_primary or change_secondary:
             network._ctera_filer.network.set_static_nameserver.assert_called_once_with(desired_primary, secondary_dns_server=desired_secondary)
+            self.assert_max_calls(network._ctera_filer, reads=0, writes=1)
             self.assertEqual(messages['changed'], ['DNS Servers were set'])
         else:
             network._ctera_filer.network.set_static_nameserver.assert_not_called()
+            self.assert_max_calls(network._ctera_filer, reads=0, writes=0)
             self.assertEqual(messages['skipped'], ['DNS Servers did not change'])
 
     def test__ensure_static(self):
@@ -108,8 +142,7 @@ class TestCteraFilerNetwork(BaseTest):
             for change_attributes in [True, False]:
                 self._test__ensure_static(current_mode, change_attributes)
 
-    @staticmethod
-    def _test__ensure_static(current_mode, change_attributes):
+    def _test__ensure_static(self, current_mode, change_attributes):
         desired_config = dict(
             address='192.168.1.1',
             subnet='255.255.255.0',
@@ -125,11 +158,16 @@ class TestCteraFilerNetwork(BaseTest):
                 current_config_dict['address'] = '192.168.1.10'
         network = ctera_filer_network.CteraFilerNetwork()
         network.parameters = desired_config
-        network._ensure_static(current_config_dict)
+        messages = dict(changed=[], skipped=[])
+        network.ensure_static(network._ctera_filer, current_config_dict, network.parameters, messages)
         if current_mode == 'dynamic' or change_attributes:
             network._ctera_filer.network.set_static_ipaddr.assert_called_once_with(**desired_config)
+            self.assert_max_calls(network._ctera_filer, reads=0, writes=1)
+            self.assertEqual(messages['changed'], ['IP Configuration set'])
         else:
             network._ctera_filer.network.set_static_ipaddr.assert_not_called()
+            self.assert_max_calls(network._ctera_filer, reads=0, writes=0)
+            self.assertEqual(messages['skipped'], ['IP Configuration did not change'])
 
     def test__get_current_config(self):
         expected_dict = dict(
@@ -23,9 +23,9 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
-import unittest.mock as mock
 import munch
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_ntp_base as ctera_filer_ntp_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_ntp as ctera_filer_ntp
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -35,65 +35,43 @@ class TestCteraFilerNtp(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_ntp.CteraFilerNtp)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_ntp_base.CteraFilerNtpBase)
 
-    def test__execute(self):
-        for is_enabled in [True, False]:
-            self._test__execute(is_enabled)
-
-    @staticmethod
-    def _test__execute(is_enabled):
-        ntp = ctera_filer_ntp.CteraFilerNtp()
-        ntp.parameters = dict(state='enabled' if is_enabled else 'disabled')
-        current_config_dict = dict()
-        ntp._ctera_filer.ntp.get_configuration = mock.MagicMock(return_value=current_config_dict)
-        ntp._ensure_enabled = mock.MagicMock()
-        ntp._ensure_disabled = mock.MagicMock()
-        ntp._execute()
-        if is_enabled:
-            ntp._ensure_enabled.assert_called_once_with(current_config_dict)
-            ntp._ensure_disabled.assert_not_called()
-        else:
-            ntp._ensure_disabled.assert_called_once_with(current_config_dict)
-            ntp._ensure_enabled.assert_not_called()
-
-    def test__ensure_enabled(self):
-        for current_is_enabled in [True, False]:
-            for change_attributes in [True, False]:
-                self._test__ensure_enabled(current_is_enabled, change_attributes)
-
-    @staticmethod
-    def _test__ensure_enabled(current_is_enabled, change_attributes):
+    def _ntp(self, state, current_is_enabled, servers=None):
         ntp = ctera_filer_ntp.CteraFilerNtp()
-        current_config = dict(
+        ntp.parameters = dict(state=state, servers=servers)
+        ntp._ctera_filer.ntp.get_configuration.return_value = munch.Munch(
             NTPMode='enabled' if current_is_enabled else 'disabled',
             NTPServer=['0.pool.ntp.org']
         )
-        ntp_servers = current_config['NTPServer']
-        if change_attributes:
-            ntp_servers = ['1.pool.ntp.org']
-        ntp.parameters = dict(servers=ntp_servers)
-        ntp._ensure_enabled(munch.Munch(current_config))
-        if current_is_enabled:
-            if change_attributes:
-                ntp._ctera_filer.ntp.enable.assert_called_once_with(ntp_servers)
+        ntp._execute()
+        return ntp
+
+    def test_ensure_enabled(self):
+        for current_is_enabled, servers, message in [
+            (True, ['0.pool.ntp.org'], 'NTP configuration did not change'),
+            (True, ['1.pool.ntp.org'], 'Updated NTP configuration'),
+            (False, ['0.pool.ntp.org'], 'Enabled NTP')
+        ]:
+            ntp = self._ntp('enabled', current_is_enabled, servers)
+            changed = message != 'NTP configuration did not change'
+            if changed:
+                ntp._ctera_filer.ntp.enable.assert_called_once_with(servers)
+                self.assertTrue(ntp.ansible_return_value.param.changed)
             else:
                 ntp._ctera_filer.ntp.enable.assert_not_called()
-        else:
-            ntp._ctera_filer.ntp.enable.assert_called_once_with(ntp_servers)
+                self.assertTrue(ntp.ansible_return_value.param.skipped)
+            self.assert_max_calls(ntp._ctera_filer, reads=1, writes=1 if changed else 0)
+            self.assertEqual(ntp.ansible_return_value.param.msg, message)
+            self.assertEqual(ntp.ansible_return_value.param.servers, servers)
 
-    def test__ensure_disabled(self):
+    def test_ensure_disabled(self):
         for current_is_enabled in [True, False]:
-            self._test__ensure_disabled(current_is_enabled)
-
-    @staticmethod
-    def _test__ensure_disabled(current_is_enabled):
-        ntp = ctera_filer_ntp.CteraFilerNtp()
-        current_config = dict(
-            NTPMode='enabled' if current_is_enabled else 'disabled'
-        )
-        ntp._ensure_disabled(munch.Munch(current_config))
-        if current_is_enabled:
-            ntp._ctera_filer.ntp.disable.assert_called_once()
-        else:
-            ntp._ctera_filer.ntp.disable.assert_not_called()
+            ntp = self._ntp('disabled', current_is_enabled)
+            if current_is_enabled:
+                ntp._ctera_filer.ntp.disable.assert_called_once_with()
+                self.assertEqual(ntp.ansible_return_value.param.msg, 'Disabled NTP')
+            else:
+                ntp._ctera_filer.ntp.disable.assert_not_called()
+                self.assertEqual(ntp.ansible_return_value.param.msg, 'NTP is already disabled')
+            self.assert_max_calls(ntp._ctera_filer, reads=1, writes=1 if current_is_enabled else 0)
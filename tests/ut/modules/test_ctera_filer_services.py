@@ -0,0 +1,166 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import importlib
+import munch
+import yaml
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_filer_service_specs
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_services as ctera_filer_services
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+def _nfs_config(mode, async_write):
+    config = munch.Munch(mode=mode, aggregateWrites='enabled')
+    setattr(config, 'async', 'enabled' if async_write else 'disabled')
+    return config
+
+
+class TestCteraFilerServices(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_services.CteraFilerServices)
+
+    @staticmethod
+    def _services(services):
+        filer_services = ctera_filer_services.CteraFilerServices()
+        filer_services.parameters = dict(services=services, read_workers=4, read_timeout=10)
+        return filer_services
+
+    def test_documentation_matches_the_service_modules(self):
+        services_doc = yaml.safe_load(ctera_filer_services.DOCUMENTATION)['options']['services']['suboptions']
+        self.assertListEqual(sorted(services_doc), sorted(ctera_filer_services.CteraFilerServices._services))
+        for name, service_doc in services_doc.items():
+            options_doc = {option: doc for option, doc in service_doc['suboptions'].items() if option != 'enabled'}
+            self.assertListEqual(sorted(options_doc), sorted(ctera_filer_service_specs.argument_spec(name)), name)
+            try:
+                module = importlib.import_module('ansible_collections.ctera.ctera.plugins.modules.ctera_filer_%s' % name)
+            except ImportError:  # AFP has no module of its own
+                continue
+            module_doc = yaml.safe_load(module.DOCUMENTATION)['options']
+            for option, doc in options_doc.items():
+                # the first line of the description is shared, the rest describes the behavior of the module
+                self.assertEqual(self._first_line(doc['description']), self._first_line(module_doc[option]['description']), (name, option))
+                for field in ['type', 'elements', 'choices']:
+                    self.assertEqual(doc.get(field), module_doc[option].get(field), (name, option, field))
+
+    @staticmethod
+    def _first_line(description):
+        return description[0] if isinstance(description, list) else description
+
+    def test_no_change(self):
+        filer_services = self._services(dict(
+            smb=dict(enabled=True, abe_enabled=True, packet_signing=None),
+            ftp=dict(enabled=False, require_ssl=None),
+            ntp=dict(enabled=True, servers=['0.pool.ntp.org']),
+            nfs=None
+        ))
+        filer_services._ctera_filer.smb.get_configuration.return_value = munch.Munch(mode='enabled', abe_enabled=True, packet_signing='Disabled')
+        filer_services._ctera_filer.ftp.get_configuration.return_value = munch.Munch(
+            mode='disabled', AllowAnonymousFTP=False, AnonymousDownloadLimit=0, AnonymousFTPFolder=None,
+            BannerMessage='', MaxConnectionsPerIP=5, RequireSSL=False
+        )
+        filer_services._ctera_filer.ntp.get_configuration.return_value = munch.Munch(NTPMode='enabled', NTPServer=['0.pool.ntp.org'])
+        filer_services._execute()
+        filer_services._ctera_filer.nfs.get_configuration.assert_not_called()
+        for manager in [filer_services._ctera_filer.smb, filer_services._ctera_filer.ftp, filer_services._ctera_filer.ntp]:
+            manager.enable.assert_not_called()
+            manager.disable.assert_not_called()
+        filer_services._ctera_filer.smb.modify.assert_not_called()
+        self.assertTrue(filer_services.ansible_return_value.param.skipped)
+        self.assertEqual(sorted(filer_services.ansible_return_value.param.services.keys()), ['ftp', 'ntp', 'smb'])
+        self.assert_max_calls(filer_services._ctera_filer, reads=3, writes=0)
+
+    def test_enable_and_modify(self):
+        filer_services = self._services(dict(
+            nfs=dict(enabled=True, async_write=True, aggregate_writes=None),
+            rsync=dict(enabled=False, port=None, max_connections=None),
+            syslog=dict(enabled=True, server='syslog.example.com', port=None, proto=None, min_severity='error'),
+            snmp=dict(enabled=True, port=161, community_str='public', username=None, password='secret', update_password=False)
+        ))
+        filer_services._ctera_filer.nfs.get_configuration.return_value = _nfs_config('disabled', False)
+        filer_services._ctera_filer.rsync.get_configuration.return_value = munch.Munch(server='enabled', port=873, maxConnections=25)
+        filer_services._ctera_filer.syslog.get_configuration.return_value = munch.Munch(
+            mode='disabled', server=None, port=514, proto='UDP', minSeverity='info'
+        )
+        filer_services._ctera_filer.snmp.is_enabled.return_value = True
+        filer_services._ctera_filer.snmp.get_configuration.return_value = munch.Munch(port=161, readCommunity='private', snmpV3=None)
+        filer_services._execute()
+        filer_services._ctera_filer.nfs.enable.assert_called_once_with()
+        filer_services._ctera_filer.nfs.modify.assert_called_once_with(async_write=True)
+        filer_services._ctera_filer.nfs.get_configuration.assert_called_once_with()
+        filer_services._ctera_filer.rsync.disable.assert_called_once_with()
+        filer_services._ctera_filer.syslog.enable.assert_called_once_with(server='syslog.example.com', min_severity='error')
+        filer_services._ctera_filer.snmp.modify.assert_called_once_with(community_str='public')
+        self.assertTrue(filer_services.ansible_return_value.param.changed)
+        self.assertEqual(filer_services.ansible_return_value.param.msg, 'Changed services: nfs, rsync, snmp, syslog')
+        self.assertEqual(filer_services.ansible_return_value.param.services['nfs']['msg'], 'NFS enabled, NFS configuration updated')
+        self.assert_max_calls(filer_services._ctera_filer, reads=5, writes=5)
+
+    def test_afp_and_telnet(self):
+        filer_services = self._services(dict(afp=dict(enabled=False), telnet=dict(enabled=True, code='code')))
+        filer_services._ctera_filer.afp.is_disabled.return_value = False
+        filer_services._execute()
+        filer_services._ctera_filer.afp.disable.assert_called_once_with()
+        filer_services._ctera_filer.telnet.enable.assert_called_once_with('code')
+        self.assert_max_calls(filer_services._ctera_filer, reads=1, writes=2)
+
+    def test_invalid_desired_state_fails_before_writes(self):
+        filer_services = self._services(dict(nfs=dict(enabled=False), afp=dict(enabled=True)))
+        filer_services._ctera_filer.nfs.get_configuration.return_value = _nfs_config('enabled', True)
+        filer_services._ctera_filer.afp.is_disabled.return_value = True
+        self.assertRaises(CTERAException, filer_services._execute)
+        filer_services._ctera_filer.nfs.disable.assert_not_called()
+        self.assert_max_calls(filer_services._ctera_filer, writes=0)
+
+    def test_read_failure(self):
+        filer_services = self._services(dict(ntp=dict(enabled=False)))
+        filer_services._ctera_filer.ntp.get_configuration.side_effect = CTERAException(message='timeout')
+        self.assertRaises(CTERAException, filer_services._execute)
+        filer_services._ctera_filer.ntp.disable.assert_not_called()
+
+    def test_apply_failure(self):
+        filer_services = self._services(dict(
+            nfs=dict(enabled=True, async_write=False, aggregate_writes=None),
+            ntp=dict(enabled=False, servers=None)
+        ))
+        filer_services._ctera_filer.nfs.get_configuration.return_value = _nfs_config('disabled', True)
+        filer_services._ctera_filer.nfs.modify.side_effect = CTERAException(message='error')
+        filer_services._ctera_filer.ntp.get_configuration.return_value = munch.Munch(NTPMode='enabled', NTPServer=[])
+        filer_services._execute()
+        filer_services._ctera_filer.ntp.disable.assert_called_once_with()
+        result = filer_services.ansible_return_value.param
+        self.assertTrue(result.failed)
+        self.assertTrue(result.changed)
+        self.assertEqual(result.msg, 'Failed to manage services: nfs')
+        self.assertTrue(result.services['nfs']['changed'])
+        self.assertTrue(result.services['nfs']['msg'].startswith('NFS enabled, Failed: NFS configuration updated.'))
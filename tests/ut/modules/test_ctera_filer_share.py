@@ -32,6 +32,7 @@ try:
 except ImportError:  # pragma: no cover
     pass  # caught by ctera_common
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_base as ctera_filer_share_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_share as ctera_filer_share
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -41,7 +42,7 @@ class TestCteraFilerShare(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_share.CteraFilerShare)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_share_base.CteraFilerShareBase)
 
     def test__execute(self):
         for is_present in [True, False]:
@@ -85,9 +86,22 @@ class TestCteraFilerShare(BaseTest):
                 }
             ]
         )
-        share_object_dict = copy.deepcopy(expected_share_dict)
-        share_object_dict['volume'] = 'main'
-        share_object_dict['directory'] = '/public/demo'
+        share = ctera_filer_share.CteraFilerShare()
+        share.parameters = dict(name='demo')
+        share._ctera_filer.shares.get.return_value = self._share_object(expected_share_dict)
+        self.assertDictEqual(expected_share_dict, share._get_share())
+
+    @staticmethod
+    def _share_object(share_dict):
+        share_object_dict = copy.deepcopy(share_dict)
+        share_object_dict['volume'], share_object_dict['directory'] = share_object_dict['directory'].strip('/').split('/', 1)
+        share_object_dict['directory'] = '/' + share_object_dict['directory']
+        share_object_dict['acl'] = [
+            munch.Munch(
+                principal2=munch.Munch(_classname=elem['principal_type'], ref='#config#auth#groups#' + elem['name'], name=elem['name']),
+                permissions=munch.Munch(allowedFileAccess=elem['perm'])
+            ) for elem in share_object_dict['acl']
+        ]
         share_object_dict['clientSideCaching'] = share_object_dict.pop('csc')
         share_object_dict['dirPermissions'] = share_object_dict.pop('dir_permissions')
         share_object_dict['exportToAFP'] = share_object_dict.pop('export_to_afp')
@@ -102,10 +116,7 @@ class TestCteraFilerShare(BaseTest):
                 'accessLevel': elem['perm']
             }) for elem in share_object_dict.pop('trusted_nfs_clients')
         ]
-        share = ctera_filer_share.CteraFilerShare()
-        share.parameters = dict(name='demo')
-        share._ctera_filer.shares.get = mock.MagicMock(return_value=munch.Munch(share_object_dict))
-        self.assertDictEqual(expected_share_dict, share._get_share())
+        return munch.Munch(share_object_dict)
 
     def test__get_share_doesnt_exist(self):
         share = ctera_filer_share.CteraFilerShare()
@@ -119,28 +130,6 @@ class TestCteraFilerShare(BaseTest):
         share._ctera_filer.shares.get = mock.MagicMock(side_effect=CTERAException(response=munch.Munch(code=401)))
         self.assertRaises(CTERAException, share._get_share)
 
-    def test__to_acl_dict_local(self):
-        expected_acl_dict = dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')
-        acl_obj = munch.Munch(
-            permissions=munch.Munch(allowedFileAccess='ReadWrite'),
-            principal2=munch.Munch(
-                _classname='LocalGroup',
-                ref='#Admins'
-            )
-        )
-        self.assertDictEqual(expected_acl_dict, ctera_filer_share.CteraFilerShare()._to_acl_dict(acl_obj))
-
-    def test__to_acl_dict_domain(self):
-        expected_acl_dict = dict(principal_type='DomainGroup', name='Admins', perm='ReadWrite')
-        acl_obj = munch.Munch(
-            permissions=munch.Munch(allowedFileAccess='ReadWrite'),
-            principal2=munch.Munch(
-                _classname='DomainGroup',
-                name='Admins'
-            )
-        )
-        self.assertDictEqual(expected_acl_dict, ctera_filer_share.CteraFilerShare()._to_acl_dict(acl_obj))
-
     def test_ensure_present(self):
         for is_present in [True, False]:
             self._test_ensure_present(is_present)
@@ -185,18 +174,19 @@ class TestCteraFilerShare(BaseTest):
         share.parameters = add_params
         share._add_share()
         share._ctera_filer.shares.add.assert_called_with(**expected_params)
+        self.assert_max_calls(share._ctera_filer, reads=0, writes=1)
         self._verify_acl_dict(acl_dict, share._ctera_filer.shares.add.call_args[1]['acl'][0])
         self._verify_trusted_nfs_clients_dict(trusted_nfs_clients_dict, share._ctera_filer.shares.add.call_args[1]['trusted_nfs_clients'][0])
 
-    def test__handle_modify(self):
+    def test__execute_modify(self):
         for change_attributes in [True, False]:
-            self._test__handle_modify(change_attributes)
+            self._test__execute_modify(change_attributes)
 
-    def _test__handle_modify(self, change_attributes):
+    def _test__execute_modify(self, change_attributes):
         acl_dict = dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')
         current_attributes = dict(
             name='demo',
-            directory='/main/public/demo',
+            directory='main/public/demo',
             acl=[acl_dict],
             access='winAclMode',
             csc='manual',
@@ -218,8 +208,10 @@ class TestCteraFilerShare(BaseTest):
             desired_attributes['acl'] = [desired_acl_dict]
             desired_attributes['trusted_nfs_clients'] = [desired_trusted_nfs_clients]
         share = ctera_filer_share.CteraFilerShare()
-        share.parameters = desired_attributes
-        share._handle_modify(current_attributes)
+        share.parameters = dict(state='present', **desired_attributes)
+        share._ctera_filer.shares.get.return_value = self._share_object(current_attributes)
+        share._execute()
+        share._ctera_filer.shares.get.assert_called_once_with(name='demo')
         if change_attributes:
             share._ctera_filer.shares.modify.assert_called_with(
                 desired_attributes['name'],
@@ -229,8 +221,159 @@ class TestCteraFilerShare(BaseTest):
             )
             self._verify_acl_dict(desired_acl_dict, share._ctera_filer.shares.modify.call_args[1]['acl'][0])
             self._verify_trusted_nfs_clients_dict(desired_trusted_nfs_clients, share._ctera_filer.shares.modify.call_args[1]['trusted_nfs_clients'][0])
+            self.assert_max_calls(share._ctera_filer, reads=1, writes=1)
         else:
             share._ctera_filer.shares.modify.assert_not_called()
+            self.assert_max_calls(share._ctera_filer, reads=1, writes=0)
+
+    def test__handle_modify_reordered_acl(self):
+        current_attributes = dict(
+            name='demo',
+            acl=[
+                dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'),
+                dict(principal_type='DomainUser', name='CORP\\alice', perm='ReadOnly')
+            ],
+            trusted_nfs_clients=[dict(address='192.168.1.0', netmask='255.255.255.0', perm='ReadOnly')]
+        )
+        share = ctera_filer_share.CteraFilerShare()
+        share.parameters = dict(
+            name='demo',
+            acl=[
+                dict(principal_type='DomainUser', name='corp\\Alice', perm='ReadOnly'),
+                dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite')
+            ],
+            trusted_nfs_clients=[dict(address='192.168.1.0', netmask='255.255.255.0', perm='ReadOnly')]
+        )
+        share._handle_modify(current_attributes)
+        share._ctera_filer.shares.modify.assert_not_called()
+        self.assert_max_calls(share._ctera_filer, reads=0, writes=0)
+
+    def test__handle_modify_incremental_acl(self):
+        current_attributes = dict(
+            name='demo',
+            comment='comment',
+            acl=[
+                dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'),
+                dict(principal_type='LocalGroup', name='Everyone', perm='ReadOnly'),
+                dict(principal_type='LocalUser', name='bob', perm='ReadOnly')
+            ]
+        )
+        desired_acl = [
+            dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'),
+            dict(principal_type='LocalGroup', name='Everyone', perm='ReadWrite'),
+            dict(principal_type='LocalUser', name='alice', perm='ReadOnly')
+        ]
+        share = ctera_filer_share.CteraFilerShare()
+        share._acl_mode = 'incremental'
+        share.parameters = dict(name='demo', comment='comment', acl=desired_acl)
+        share._handle_modify(current_attributes)
+        share._ctera_filer.shares.modify.assert_not_called()
+        share._ctera_filer.shares.remove_acl.assert_not_called()
+        share._ctera_filer.shares.add_acl.assert_not_called()
+        share._ctera_filer.shares.set_acl.assert_called_once_with('demo', mock.ANY)
+        acl = share._ctera_filer.shares.set_acl.call_args[0][1]
+        self.assertEqual(len(acl), 3)
+        self._verify_acl_dict(current_attributes['acl'][0], acl[0])
+        self._verify_acl_dict(desired_acl[1], acl[1])
+        self._verify_acl_dict(desired_acl[2], acl[2])
+        self.assert_max_calls(share._ctera_filer, reads=0, writes=1)
+        self.assertTrue(share.ansible_module.ctera_return_value().param.changed)
+
+    def test__handle_modify_incremental_acl_case_change(self):
+        current_attributes = dict(name='demo', acl=[
+            dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'),
+            dict(principal_type='DomainUser', name='CORP\\alice', perm='ReadOnly')
+        ])
+        share = ctera_filer_share.CteraFilerShare()
+        share._acl_mode = 'incremental'
+        share.parameters = dict(name='demo', acl=[
+            dict(principal_type='LocalGroup', name='Admins', perm='ReadWrite'),
+            dict(principal_type='DomainUser', name='corp\\Alice', perm='ReadWrite')
+        ])
+        share._handle_modify(current_attributes)
+        acl = share._ctera_filer.shares.set_acl.call_args[0][1]
+        self.assertEqual([(ace.name, ace.perm) for ace in acl], [('Admins', 'ReadWrite'), ('corp\\Alice', 'ReadWrite')])
+        self.assert_max_calls(share._ctera_filer, reads=0, writes=1)
+
+    def test__handle_modify_incremental_acl_with_other_attributes(self):
+        current_attributes = dict(name='demo', comment='comment', acl=[dict(principal_type='LocalUser', name='bob', perm='ReadOnly')])
+        share = ctera_filer_share.CteraFilerShare()
+        share._acl_mode = 'incremental'
+        share.parameters = dict(name='demo', comment='new comment', acl=[])
+        share._handle_modify(current_attributes)
+        share._ctera_filer.shares.modify.assert_called_once_with('demo', comment='new comment')
+        share._ctera_filer.shares.set_acl.assert_called_once_with('demo', [])
+        self.assert_max_calls(share._ctera_filer, reads=0, writes=2)
+
+    def test__execute_incremental_trusted_nfs_clients(self):
+        current_attributes = dict(
+            name='demo',
+            trusted_nfs_clients=[
+                dict(address='10.0.8.0', netmask='255.255.255.0', perm='ReadWrite'),
+                dict(address='10.0.1.0', netmask='255.255.255.0', perm='ReadOnly'),
+                dict(address='10.0.2.0', netmask='255.255.255.0', perm='ReadOnly')
+            ]
+        )
+        share = ctera_filer_share.CteraFilerShare()
+        share.parameters = dict(state='present', name='demo', trusted_nfs_clients_mode='incremental', trusted_nfs_clients=[
+            dict(address='10.0.8.0', netmask='255.255.255.0', perm='ReadWrite'),
+            dict(address='10.0.8.128', netmask='255.255.255.128', perm='ReadWrite'),
+            dict(address='10.0.1.0', netmask='255.255.255.0', perm='ReadWrite'),
+            dict(address='10.0.3.0', netmask='255.255.255.0', perm='ReadOnly')
+        ])
+        share._get_share = mock.MagicMock(return_value=current_attributes)
+        share._execute()
+        share._ctera_filer.shares.modify.assert_not_called()
+        share._ctera_filer.shares.remove_trusted_nfs_clients.assert_not_called()
+        share._ctera_filer.shares.add_trusted_nfs_clients.assert_not_called()
+        share._ctera_filer.shares.set_trusted_nfs_clients.assert_called_once_with('demo', mock.ANY)
+        clients = share._ctera_filer.shares.set_trusted_nfs_clients.call_args[0][1]
+        self.assertEqual(len(clients), 3)
+        self._verify_trusted_nfs_clients_dict(dict(address='10.0.8.0', netmask='255.255.255.0', perm='ReadWrite'), clients[0])
+        self._verify_trusted_nfs_clients_dict(dict(address='10.0.1.0', netmask='255.255.255.0', perm='ReadWrite'), clients[1])
+        self._verify_trusted_nfs_clients_dict(dict(address='10.0.3.0', netmask='255.255.255.0', perm='ReadOnly'), clients[2])
+        self.assert_max_calls(share._ctera_filer, reads=0, writes=1)
+        self.assertTrue(share.ansible_module.ctera_return_value().param.changed)
+
+    def test__execute_incremental_trusted_nfs_clients_unchanged(self):
+        trusted_nfs_clients = [dict(address='10.0.0.0', netmask='255.255.255.0', perm='ReadWrite')]
+        share = ctera_filer_share.CteraFilerShare()
+        share.parameters = dict(state='present', name='demo', trusted_nfs_clients_mode='incremental',
+                                trusted_nfs_clients=trusted_nfs_clients + [dict(address='10.0.0.7', netmask='255.255.255.255', perm='ReadWrite')])
+        share._get_share = mock.MagicMock(return_value=dict(name='demo', trusted_nfs_clients=trusted_nfs_clients))
+        share._execute()
+        share._ctera_filer.shares.set_trusted_nfs_clients.assert_not_called()
+        self.assert_max_calls(share._ctera_filer, reads=0, writes=0)
+        self.assertTrue(share.ansible_module.ctera_return_value().param.skipped)
+
+    def test__execute_incremental_trusted_nfs_clients_new_share(self):
+        share = ctera_filer_share.CteraFilerShare()
+        share.parameters = dict(state='present', name='demo', directory='/main/public/demo', trusted_nfs_clients_mode='incremental', trusted_nfs_clients=[
+            dict(address='192.168.0.0', netmask='255.255.255.0', perm='ReadWrite'),
+            dict(address='192.168.1.0', netmask='255.255.255.0', perm='ReadWrite')
+        ])
+        share._get_share = mock.MagicMock(return_value=None)
+        share._execute()
+        clients = share._ctera_filer.shares.add.call_args[1]['trusted_nfs_clients']
+        self.assertEqual(len(clients), 1)
+        self._verify_trusted_nfs_clients_dict(dict(address='192.168.0.0', netmask='255.255.254.0', perm='ReadWrite'), clients[0])
+        self.assert_max_calls(share._ctera_filer, reads=0, writes=1)
+
+    def test__collapse_trusted_nfs_clients(self):
+        collapsed = ctera_filer_share_base.CteraFilerShareBase._collapse_trusted_nfs_clients([
+            dict(address='nfs.example.com', netmask='255.255.255.255', perm='ReadOnly'),
+            dict(address='192.168.0.0', netmask='255.255.255.0', perm='ReadWrite'),
+            dict(address='192.168.1.0', netmask='255.255.255.0', perm='ReadWrite'),
+            dict(address='192.168.1.10', netmask='255.255.255.255', perm='ReadWrite'),
+            dict(address='192.168.1.10', netmask='255.255.255.255', perm='ReadOnly'),
+            dict(address='10.0.0.5', netmask='255.0.0.0', perm='ReadOnly')
+        ])
+        self.assertEqual(collapsed, [
+            dict(address='nfs.example.com', netmask='255.255.255.255', perm='ReadOnly'),
+            dict(address='192.168.0.0', netmask='255.255.254.0', perm='ReadWrite'),
+            dict(address='10.0.0.5', netmask='255.0.0.0', perm='ReadOnly'),
+            dict(address='192.168.1.10', netmask='255.255.255.255', perm='ReadOnly')
+        ])
 
     def _verify_acl_dict(self, acl_dict, actual_acl):
         expected_acl = gateway_types.ShareAccessControlEntry(**acl_dict)
@@ -266,13 +409,14 @@ class TestCteraFilerShare(BaseTest):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         name = 'demo'
         share = ctera_filer_share.CteraFilerShare()
         share.parameters = dict(name=name)
         share._ensure_absent(share.parameters if is_present else None)
         if is_present:
             share._ctera_filer.shares.delete.assert_called_once_with(name)
+            self.assert_max_calls(share._ctera_filer, reads=0, writes=1)
         else:
             share._ctera_filer.shares.delete.assert_not_called()
+            self.assert_max_calls(share._ctera_filer, reads=0, writes=0)
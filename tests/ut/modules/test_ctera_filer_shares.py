@@ -0,0 +1,145 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_share_base as ctera_filer_share_base
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_shares as ctera_filer_shares
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+def _share_dict(name, **kwargs):
+    share_dict = dict(
+        name=name,
+        directory='main/public/%s' % name,
+        acl=[],
+        access='winAclMode',
+        csc='manual',
+        dir_permissions=777,
+        comment='comment',
+        export_to_afp=False,
+        export_to_ftp=False,
+        export_to_nfs=False,
+        export_to_pc_agent=False,
+        export_to_rsync=False,
+        indexed=False,
+        trusted_nfs_clients=[]
+    )
+    share_dict.update(kwargs)
+    return share_dict
+
+
+class TestCteraFilerShares(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_share_base.CteraFilerShareBase)
+
+    def _shares(self, desired_shares, current_shares, exclusive=False):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(shares=desired_shares, exclusive=exclusive)
+        shares._get_shares = mock.MagicMock(return_value={share['name']: share for share in current_shares})
+        shares._execute()
+        return shares
+
+    def test__get_shares(self):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares._ctera_filer.shares.get = mock.MagicMock(return_value=[munch.Munch(name='demo'), munch.Munch(name='other')])
+        with mock.patch.object(ctera_filer_shares.ctera_filer_converters, 'share_to_dict', side_effect=lambda share: dict(name=share.name)):
+            self.assertDictEqual(shares._get_shares(), dict(demo=dict(name='demo'), other=dict(name='other')))
+        shares._ctera_filer.shares.get.assert_called_once_with()
+        self.assert_max_calls(shares._ctera_filer, reads=1, writes=0)
+
+    def test_no_change(self):
+        shares = self._shares([dict(_share_dict('demo'), state='present')], [_share_dict('demo')])
+        shares._ctera_filer.shares.add.assert_not_called()
+        shares._ctera_filer.shares.modify.assert_not_called()
+        shares._ctera_filer.shares.delete.assert_not_called()
+        self.assertTrue(shares.ansible_return_value.param.skipped)
+        self.assertListEqual(shares.ansible_return_value.param.shares, [dict(name='demo', changed=False, msg='Share details did not change')])
+        self.assert_max_calls(shares._ctera_filer, writes=0)
+
+    def test_add_modify_delete(self):
+        desired_shares = [
+            dict(_share_dict('new'), state='present'),
+            dict(_share_dict('demo', export_to_nfs=True), state='present'),
+            dict(name='old', state='absent'),
+            dict(name='missing', state='absent')
+        ]
+        current_shares = [_share_dict('demo'), _share_dict('old'), _share_dict('unmanaged')]
+        shares = self._shares(desired_shares, current_shares)
+        shares._ctera_filer.shares.add.assert_called_once_with(**dict(_share_dict('new'), acl=[], trusted_nfs_clients=[]))
+        shares._ctera_filer.shares.modify.assert_called_once_with('demo', export_to_nfs=True)
+        shares._ctera_filer.shares.delete.assert_called_once_with('old')
+        self.assertTrue(shares.ansible_return_value.param.changed)
+        self.assertListEqual(
+            [(result['name'], result['changed']) for result in shares.ansible_return_value.param.shares],
+            [('new', True), ('demo', True), ('old', True), ('missing', False)]
+        )
+        self.assert_max_calls(shares._ctera_filer, writes=3)
+
+    def test_exclusive(self):
+        shares = self._shares([dict(_share_dict('demo'), state='present')], [_share_dict('demo'), _share_dict('unmanaged')], exclusive=True)
+        shares._ctera_filer.shares.delete.assert_called_once_with('unmanaged')
+        self.assertTrue(shares.ansible_return_value.param.changed)
+        self.assert_max_calls(shares._ctera_filer, writes=1)
+
+    def test_add_no_directory(self):
+        shares = self._shares([dict(_share_dict('new', directory=None), state='present')], [])
+        shares._ctera_filer.shares.add.assert_not_called()
+        self.assertTrue(shares.ansible_return_value.has_failed())
+        self.assertTrue(shares.ansible_return_value.param.shares[0]['failed'])
+        self.assert_max_calls(shares._ctera_filer, writes=0)
+
+    def test_partial_failure(self):
+        desired_shares = [dict(name='old', state='absent'), dict(name='other', state='absent')]
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(shares=desired_shares, exclusive=False)
+        shares._get_shares = mock.MagicMock(return_value=dict(old=_share_dict('old'), other=_share_dict('other')))
+        shares._ctera_filer.shares.delete = mock.MagicMock(side_effect=[CTERAException(), None])
+        shares._execute()
+        self.assertEqual(shares._ctera_filer.shares.delete.call_count, 2)
+        self.assertTrue(shares.ansible_return_value.has_failed())
+        self.assertTrue(shares.ansible_return_value.param.changed)
+        self.assertEqual(shares.ansible_return_value.param.msg, 'Failed to manage shares: old')
+
+    def test_duplicate_names(self):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(shares=[dict(name='demo'), dict(name='other'), dict(name='demo', state='absent')], exclusive=False)
+        shares._reject_duplicate_shares()
+        shares.ansible_module.fail_json.assert_called_once_with(msg='Shares are listed more than once: demo')
+
+    def test_unique_names(self):
+        shares = ctera_filer_shares.CteraFilerShares()
+        shares.parameters = dict(shares=[dict(name='demo'), dict(name='other')], exclusive=False)
+        shares._reject_duplicate_shares()
+        shares.ansible_module.fail_json.assert_not_called()
@@ -58,6 +58,7 @@ class TestCteraFilerSNMP(BaseTest):
         snmp._ctera_filer.snmp.enable.assert_called_once_with(port=self._port, community_str=self._community_str,
                                                               username=self._username, password=self._password)
         self.assertTrue(snmp.ansible_return_value.param.changed)
+        self.assert_max_calls(snmp._ctera_filer, reads=1, writes=1)
 
     def test_disable_snmp(self):
         for is_enabled in [True, False]:
@@ -74,9 +75,11 @@ class TestCteraFilerSNMP(BaseTest):
         snmp._ctera_filer.snmp.is_enabled.assert_called_once()
         if is_enabled:
             snmp._ctera_filer.snmp.disable.assert_called_once()
+            self.assert_max_calls(snmp._ctera_filer, reads=1, writes=1)
             self.assertTrue(snmp.ansible_return_value.param.changed)
         else:
             snmp._ctera_filer.snmp.disable.assert_not_called()
+            self.assert_max_calls(snmp._ctera_filer, reads=1, writes=0)
             self.assertTrue(snmp.ansible_return_value.param.skipped)
 
     def test_modify_snmp(self):
@@ -99,7 +102,9 @@ class TestCteraFilerSNMP(BaseTest):
         snmp._ctera_filer.snmp.is_enabled.assert_called_once()
         if changed:
             snmp._ctera_filer.snmp.modify.assert_called_once_with(port=self._port, community_str=self._community_str)
+            self.assert_max_calls(snmp._ctera_filer, reads=2, writes=1)
             self.assertTrue(snmp.ansible_return_value.param.changed)
         else:
             snmp._ctera_filer.snmp.modify.assert_not_called()
+            self.assert_max_calls(snmp._ctera_filer, reads=2, writes=0)
             self.assertTrue(snmp.ansible_return_value.param.skipped)
@@ -0,0 +1,182 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException, config
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_state as ctera_filer_state
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraFilerState(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_state.CteraFilerState)
+
+    @staticmethod
+    def _filer_state(**desired_state):
+        filer_state = ctera_filer_state.CteraFilerState()
+        filer_state.parameters = dict(desired_state=desired_state, workers=4, step_timeout=10)
+        return filer_state
+
+    def test_desired_state(self):
+        filer_state = self._filer_state(
+            hostname='branch',
+            timezone='UTC',
+            volumes=[dict(name='main', size=None, filesystem=None, device=None, passphrase=None, state='present')],
+            users=[dict(username='alice', password='password', full_name=None, email='alice@example.com', uid=None, state='present')],
+            shares=[dict(name='public', directory='/main/public', acl=[], comment=None, state='present')],
+            network=None
+        )
+        filer_state._ctera_filer.config.get_hostname.return_value = 'branch'
+        filer_state._ctera_filer.timezone.get_timezone.return_value = 'GMT'
+        filer_state._ctera_filer.volumes.get.return_value = []
+        filer_state._ctera_filer.users.get.return_value = [munch.Munch(username='alice', email='alice@ctera.com', fullName='Alice')]
+        filer_state._ctera_filer.shares.get.return_value = []
+        filer_state._ctera_filer.shares.add.side_effect = lambda **kwargs: self.assertTrue(filer_state._ctera_filer.volumes.add.called)
+        filer_state._execute()
+        filer_state._ctera_filer.config.set_hostname.assert_not_called()
+        filer_state._ctera_filer.timezone.set_timezone.assert_called_once_with('UTC')
+        filer_state._ctera_filer.volumes.add.assert_called_once_with(name='main')
+        filer_state._ctera_filer.users.modify.assert_called_once_with('alice', email='alice@example.com')
+        filer_state._ctera_filer.shares.add.assert_called_once_with(name='public', directory='/main/public', acl=[])
+        filer_state._ctera_filer.network.ifconfig.assert_not_called()
+        result = filer_state.ansible_return_value.param
+        self.assertTrue(result.changed)
+        self.assertEqual(result.msg, 'Changed: timezone, users, volumes, shares')
+        self.assertListEqual(list(result.steps.keys()), ['hostname', 'timezone', 'users', 'volumes', 'shares'])
+        self.assertDictEqual(
+            {step: (value['status'], value['changed']) for step, value in result.steps.items()},
+            dict(hostname=('done', False), timezone=('done', True), users=('done', True), volumes=('done', True), shares=('done', True))
+        )
+        self.assertEqual(result.steps['volumes']['msg'], 'main: Volume created')
+        self.assertEqual(result.steps['users']['msg'], 'alice: User modified')
+        self.assertTrue(all(step['elapsed'] is not None for step in result.steps.values()))
+        self.assert_max_calls(filer_state._ctera_filer, reads=5, writes=4)
+
+    def test_failed_dependency(self):
+        filer_state = self._filer_state(
+            hostname='branch',
+            cloud_services=dict(server='portal', user='admin', password='password', ctera_license='EV16', sso=False, trust_certificate=False),
+            license='EV32',
+            cloud_cache=dict(enabled=True, sync_enabled=True),
+            network=dict(mode='dynamic', primary_dns_server=None)
+        )
+        filer_state._ctera_filer.config.get_hostname.return_value = 'filer'
+        filer_state._ctera_filer.services.get_status.return_value = munch.Munch(connected=False)
+        filer_state._ctera_filer.services.connect.side_effect = CTERAException(message='Connection refused')
+        filer_state._execute()
+        filer_state._ctera_filer.config.set_hostname.assert_called_once_with('branch')
+        filer_state._ctera_filer.licenses.apply.assert_not_called()
+        filer_state._ctera_filer.cache.enable.assert_not_called()
+        filer_state._ctera_filer.network.enable_dhcp.assert_not_called()
+        result = filer_state.ansible_return_value.param
+        self.assertTrue(result.failed)
+        self.assertTrue(result.changed)
+        self.assertEqual(result.msg, 'Failed to apply: cloud_services, license, cloud_cache, network')
+        self.assertEqual(result.steps['cloud_services']['status'], 'error')
+        self.assertEqual(result.steps['license']['status'], 'skipped')
+        self.assertEqual(result.steps['network']['msg'], 'Skipped since cloud_services did not complete')
+
+    def test_cloud_services(self):
+        for server, force_reconnect, connect_error, status, msg in [
+            ('portal', True, None, 'done', 'Successfully reconnected the Filer to the Cloud Services'),
+            ('portal', False, None, 'done', 'The Filer is already connected to the Cloud Services, SSO already disabled'),
+            ('other', False, None, 'done', 'Successfully modified the Filer connection to the Cloud Services'),
+            ('other', False, CTERAException(message='Connection refused'), 'error', None)
+        ]:
+            filer_state = self._filer_state(cloud_services=dict(
+                server=server, user='admin', password='password', ctera_license='EV16', force_reconnect=force_reconnect, sso=False, trust_certificate=False
+            ))
+            filer_state._ctera_filer.services.get_status.return_value = munch.Munch(connected=True, server_address='portal')
+            filer_state._ctera_filer.services.sso_enabled.return_value = False
+            filer_state._ctera_filer.services.connect.side_effect = connect_error
+            filer_state._execute()
+            step = filer_state.ansible_return_value.param.steps['cloud_services']
+            self.assertEqual(step['status'], status)
+            if msg:
+                self.assertEqual(step['msg'], msg)
+            else:
+                self.assertIn('Failed to connect to new Cloud Services', step['msg'])
+                filer_state._ctera_filer.services.sso_enabled.assert_not_called()
+            self.assertEqual(filer_state._ctera_filer.services.reconnect.called, force_reconnect)
+
+    def test_no_change(self):
+        filer_state = self._filer_state(
+            ntp_servers=['0.pool.ntp.org'],
+            network=dict(mode='static', address='10.0.0.2', subnet='255.255.255.0', gateway='10.0.0.1',
+                         primary_dns_server='10.0.0.1', secondary_dns_server=None)
+        )
+        filer_state._ctera_filer.ntp.get_configuration.return_value = munch.Munch(NTPMode='enabled', NTPServer=['0.pool.ntp.org'])
+        filer_state._ctera_filer.network.ifconfig.return_value = munch.Munch(ip=munch.Munch(
+            DHCPMode='disabled', address='10.0.0.2', netmask='255.255.255.0', gateway='10.0.0.1', DNSServer1='10.0.0.1', DNSServer2=None
+        ))
+        filer_state._execute()
+        filer_state._ctera_filer.ntp.enable.assert_not_called()
+        filer_state._ctera_filer.network.set_static_ipaddr.assert_not_called()
+        self.assertTrue(filer_state.ansible_return_value.param.skipped)
+        self.assert_max_calls(filer_state._ctera_filer, reads=2, writes=0)
+
+    def test_absent_items(self):
+        filer_state = self._filer_state(
+            users=[dict(username='alice', state='absent'), dict(username='bob', state='absent')],
+            volumes=[dict(name='old', state='absent')],
+            shares=[dict(name='public', state='absent')]
+        )
+        filer_state._ctera_filer.users.get.return_value = [munch.Munch(username='alice', email=None, fullName=None)]
+        filer_state._ctera_filer.volumes.get.return_value = [munch.Munch(name='old', size=1024)]
+        filer_state._ctera_filer.shares.get.return_value = []
+        filer_state._execute()
+        filer_state._ctera_filer.users.delete.assert_called_once_with('alice')
+        filer_state._ctera_filer.volumes.delete.assert_called_once_with('old')
+        filer_state._ctera_filer.shares.delete.assert_not_called()
+        result = filer_state.ansible_return_value.param
+        self.assertEqual(result.steps['users']['msg'], 'alice: User deleted')
+        self.assertEqual(result.steps['volumes']['msg'], 'old: Volume deleted')
+        self.assertEqual(result.steps['shares']['msg'], 'Shares did not change')
+        self.assert_max_calls(filer_state._ctera_filer, reads=3, writes=2)
+
+    def test_duplicate_items(self):
+        filer_state = self._filer_state(users=[dict(username='alice'), dict(username='alice', state='absent')], volumes=[dict(name='main')])
+        filer_state._reject_duplicate_items()
+        filer_state.ansible_module.fail_json.assert_called_once_with(msg='Users are listed more than once: alice')
+
+    def test_trust_certificate_before_run(self):
+        filer_state = self._filer_state(
+            cloud_services=dict(server='portal', user='admin', password='password', ctera_license='EV16', sso=False, trust_certificate=True)
+        )
+        ssl = config.connect.get('ssl')
+        self.addCleanup(config.connect.__setitem__, 'ssl', ssl)
+        with mock.patch.object(ctera_filer_state.DependencyExecutor, 'run') as run:
+            run.side_effect = lambda tasks, dependencies: self.assertEqual(config.connect['ssl'], 'Trust') or {}
+            filer_state._execute()
+        run.assert_called_once()
@@ -76,8 +76,10 @@ class TestCteraFilerStorageCA(BaseTest):
         ssl._execute()
         if force_update or issuer not in self._issuer or subject not in self._subject:
             ssl._ctera_filer.ssl.import_storage_ca.assert_called_once_with(self._certificate)
+            self.assert_max_calls(ssl._ctera_filer, reads=1, writes=1)
         else:
             ssl._ctera_filer.ssl.import_storage_ca.assert_not_called()
+            self.assert_max_calls(ssl._ctera_filer, reads=1, writes=0)
 
     @staticmethod
     def _get_storage_ca_response(issuerName, subjectName):
@@ -63,8 +63,7 @@ class TestCteraFilerSyslog(BaseTest):
             for change_attributes in [True, False]:
                 self._test__ensure_enabled(current_is_enabled, change_attributes)
 
-    @staticmethod
-    def _test__ensure_enabled(current_is_enabled, change_attributes):
+    def _test__ensure_enabled(self, current_is_enabled, change_attributes):
         syslog = ctera_filer_syslog.CteraFilerSyslog()
         current_config = dict(
             mode='enabled' if current_is_enabled else 'disabled',
@@ -76,8 +75,11 @@ class TestCteraFilerSyslog(BaseTest):
         parameters_dict = copy.deepcopy(current_config)
         if change_attributes:
             parameters_dict['server'] = '192.168.1.2'
-        syslog.parameters = parameters_dict
-        syslog._ensure_enabled(current_config)
+        config_dict = copy.deepcopy(current_config)
+        config_dict['minSeverity'] = config_dict.pop('min_severity')
+        syslog.parameters = dict(enabled=True, **parameters_dict)
+        syslog._ctera_filer.syslog.get_configuration.return_value = munch.Munch(config_dict)
+        syslog._execute()
         if current_is_enabled:
             if change_attributes:
                 syslog._ctera_filer.syslog.modify.assert_called_once_with(server='192.168.1.2')
@@ -87,22 +89,25 @@ class TestCteraFilerSyslog(BaseTest):
             enable_params = copy.deepcopy(parameters_dict)
             enable_params.pop('mode')
             syslog._ctera_filer.syslog.enable.assert_called_once_with(**enable_params)
+        self.assert_max_calls(syslog._ctera_filer, reads=1, writes=0 if current_is_enabled and not change_attributes else 1)
 
     def test__ensure_disaled(self):
         for current_is_enabled in [True, False]:
             self._test__ensure_disabled(current_is_enabled)
 
-    @staticmethod
-    def _test__ensure_disabled(current_is_enabled):
+    def _test__ensure_disabled(self, current_is_enabled):
         syslog = ctera_filer_syslog.CteraFilerSyslog()
         current_config = dict(
             mode='enabled' if current_is_enabled else 'disabled'
         )
-        syslog._ensure_disabled(current_config)
+        syslog.parameters = dict(enabled=False)
+        syslog._ctera_filer.syslog.get_configuration.return_value = munch.Munch(current_config)
+        syslog._execute()
         if current_is_enabled:
             syslog._ctera_filer.syslog.disable.assert_called_once_with()
         else:
             syslog._ctera_filer.syslog.disable.assert_not_called()
+        self.assert_max_calls(syslog._ctera_filer, reads=1, writes=1 if current_is_enabled else 0)
 
     def test__get_current_config(self):
         expected_dict = dict(
@@ -117,3 +122,4 @@ class TestCteraFilerSyslog(BaseTest):
         syslog = ctera_filer_syslog.CteraFilerSyslog()
         syslog._ctera_filer.syslog.get_configuration.return_value = munch.Munch(config_dict)
         self.assertDictEqual(expected_dict, syslog._get_current_config())
+        self.assert_max_calls(syslog._ctera_filer, reads=1, writes=0)
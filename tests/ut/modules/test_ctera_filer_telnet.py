@@ -49,3 +49,4 @@ class TestCteraFilerTelnet(BaseTest):
             telnet._ctera_filer.telnet.disable.assert_called_once_with()
             telnet._ctera_filer.telnet.enable.assert_not_called()
         self.assertTrue(telnet.ansible_return_value.param.changed)
+        self.assert_max_calls(telnet._ctera_filer, reads=0, writes=1)
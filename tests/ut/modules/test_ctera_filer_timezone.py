@@ -23,6 +23,7 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_timezone_base as ctera_filer_timezone_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_timezone as ctera_filer_timezone
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -32,7 +33,7 @@ class TestCteraFilerTimezone(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_timezone.CteraFilerTimezone)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_timezone_base.CteraFilerTimezoneBase)
 
     def test_execute(self):
         for change_timezone in [True, False]:
@@ -47,12 +48,14 @@ class TestCteraFilerTimezone(BaseTest):
         timezone._execute()
         if change_timezone:
             timezone._ctera_filer.timezone.set_timezone.assert_called_once_with(new_timezone)
+            self.assert_max_calls(timezone._ctera_filer, reads=1, writes=1)
             self.assertTrue(timezone.ansible_return_value.param.changed)
             self.assertEqual(timezone.ansible_return_value.param.msg, 'Changed timezone')
             self.assertEqual(timezone.ansible_return_value.param.previous_timezone, current_timezone)
             self.assertEqual(timezone.ansible_return_value.param.current_timezone, new_timezone)
         else:
             timezone._ctera_filer.timezone.set_timezone.assert_not_called()
+            self.assert_max_calls(timezone._ctera_filer, reads=1, writes=0)
             self.assertFalse(hasattr(timezone.ansible_return_value.param, 'changed'))
             self.assertEqual(timezone.ansible_return_value.param.msg, 'No update required to the current timezone')
             self.assertEqual(timezone.ansible_return_value.param.current_timezone, current_timezone)
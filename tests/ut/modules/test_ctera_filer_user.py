@@ -32,6 +32,7 @@ try:
 except ImportError:  # pragma: no cover
     pass  # caught by ctera_common
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_user_base as ctera_filer_user_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_user as ctera_filer_user
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -41,7 +42,7 @@ class TestCteraFilerUser(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_user.CteraFilerUser)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_user_base.CteraFilerUserBase)
 
     def test__execute(self):
         for is_present in [True, False]:
@@ -94,8 +95,7 @@ class TestCteraFilerUser(BaseTest):
             for change_attributes in [True, False]:
                 self._test_ensure_present(is_present, change_attributes)
 
-    @staticmethod
-    def _test_ensure_present(is_present, change_attributes):
+    def _test_ensure_present(self, is_present, change_attributes):
         current_attributes = dict(
             username='admin',
             password='password',
@@ -106,16 +106,26 @@ class TestCteraFilerUser(BaseTest):
         desired_attributes = copy.deepcopy(current_attributes)
         if change_attributes:
             desired_attributes['full_name'] = 'Administrator'
+        user_object_dict = copy.deepcopy(current_attributes)
+        user_object_dict['fullName'] = user_object_dict.pop('full_name')
         user = ctera_filer_user.CteraFilerUser()
-        user.parameters = desired_attributes
-        user._ensure_present(current_attributes if is_present else None)
+        user.parameters = dict(state='present', **desired_attributes)
+        if is_present:
+            user._ctera_filer.users.get.return_value = munch.Munch(user_object_dict)
+        else:
+            user._ctera_filer.users.get.side_effect = CTERAException(response=munch.Munch(code=404))
+        user._execute()
+        user._ctera_filer.users.get.assert_called_once_with(name='admin')
         if is_present:
             if change_attributes:
                 user._ctera_filer.users.modify.assert_called_with(desired_attributes['username'], full_name=desired_attributes['full_name'])
+                self.assert_max_calls(user._ctera_filer, reads=1, writes=1)
             else:
                 user._ctera_filer.users.modify.assert_not_called()
+                self.assert_max_calls(user._ctera_filer, reads=1, writes=0)
         else:
             user._ctera_filer.users.add.assert_called_with(**desired_attributes)
+            self.assert_max_calls(user._ctera_filer, reads=1, writes=1)
 
     def test_create_no_password(self):
         user = ctera_filer_user.CteraFilerUser()
@@ -131,13 +141,14 @@ class TestCteraFilerUser(BaseTest):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         username = 'admin'
         user = ctera_filer_user.CteraFilerUser()
         user.parameters = dict(username=username)
         user._ensure_absent(user.parameters if is_present else None)
         if is_present:
             user._ctera_filer.users.delete.assert_called_once_with(username)
+            self.assert_max_calls(user._ctera_filer, reads=0, writes=1)
         else:
             user._ctera_filer.users.delete.assert_not_called()
+            self.assert_max_calls(user._ctera_filer, reads=0, writes=0)
@@ -0,0 +1,125 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_user_base as ctera_filer_user_base
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_users as ctera_filer_users
+import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
+from tests.ut.base import BaseTest
+
+
+def _user_dict(username, **kwargs):
+    user_dict = dict(username=username, full_name=username.capitalize(), email='%s@example.com' % username, uid='1000')
+    user_dict.update(kwargs)
+    return user_dict
+
+
+class TestCteraFilerUsers(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_user_base.CteraFilerUserBase)
+
+    def _users(self, desired_users, current_users, exclusive=False):
+        users = ctera_filer_users.CteraFilerUsers()
+        users.parameters = dict(users=desired_users, exclusive=exclusive)
+        users._get_users = mock.MagicMock(return_value={user['username']: user for user in current_users})
+        users._ctera_filer.session.return_value.user.name = 'admin'
+        users._execute()
+        return users
+
+    def test__get_users(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users._ctera_filer.users.get = mock.MagicMock(return_value=[
+            munch.Munch(username='alice', fullName='Alice', email='alice@example.com', _classname='user')
+        ])
+        self.assertDictEqual(users._get_users(), dict(alice=dict(username='alice', full_name='Alice', email='alice@example.com')))
+        users._ctera_filer.users.get.assert_called_once_with()
+        self.assert_max_calls(users._ctera_filer, reads=1, writes=0)
+
+    def test_no_change(self):
+        users = self._users([dict(_user_dict('alice'), state='present')], [_user_dict('alice')])
+        users._ctera_filer.users.add.assert_not_called()
+        users._ctera_filer.users.modify.assert_not_called()
+        users._ctera_filer.users.delete.assert_not_called()
+        self.assert_max_calls(users._ctera_filer, writes=0)
+        self.assertTrue(users.ansible_return_value.param.skipped)
+
+    def test_add_modify_delete(self):
+        desired_users = [
+            dict(_user_dict('carol'), password='password', state='present'),
+            dict(_user_dict('alice', email='alice@ctera.com'), state='present'),
+            dict(username='bob', state='absent'),
+            dict(username='dave', state='absent')
+        ]
+        users = self._users(desired_users, [_user_dict('alice'), _user_dict('bob')])
+        users._ctera_filer.users.add.assert_called_once_with(**dict(_user_dict('carol'), password='password'))
+        users._ctera_filer.users.modify.assert_called_once_with('alice', email='alice@ctera.com')
+        users._ctera_filer.users.delete.assert_called_once_with('bob')
+        self.assert_max_calls(users._ctera_filer, writes=3)
+        self.assertTrue(users.ansible_return_value.param.changed)
+        self.assertListEqual(
+            [(result['username'], result['changed']) for result in users.ansible_return_value.param.users],
+            [('carol', True), ('alice', True), ('bob', True), ('dave', False)]
+        )
+
+    def test_exclusive_keeps_session_user(self):
+        users = self._users([dict(_user_dict('alice'), state='present')], [_user_dict('alice'), _user_dict('admin'), _user_dict('bob')], exclusive=True)
+        users._ctera_filer.users.delete.assert_called_once_with('bob')
+        self.assert_max_calls(users._ctera_filer, writes=1)
+
+    def test_add_no_password(self):
+        users = self._users([dict(_user_dict('carol'), state='present')], [])
+        users._ctera_filer.users.add.assert_not_called()
+        self.assert_max_calls(users._ctera_filer, writes=0)
+        self.assertTrue(users.ansible_return_value.has_failed())
+
+    def test_partial_failure(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users.parameters = dict(users=[dict(username='bob', state='absent'), dict(username='carol', state='absent')], exclusive=False)
+        users._get_users = mock.MagicMock(return_value=dict(bob=_user_dict('bob'), carol=_user_dict('carol')))
+        users._ctera_filer.users.delete = mock.MagicMock(side_effect=[None, CTERAException()])
+        users._execute()
+        self.assertTrue(users.ansible_return_value.has_failed())
+        self.assertEqual(users.ansible_return_value.param.msg, 'Failed to manage users: carol')
+
+    def test_duplicate_names(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users.parameters = dict(users=[dict(username='alice'), dict(username='bob'), dict(username='alice', state='absent')], exclusive=False)
+        users._reject_duplicate_users()
+        users.ansible_module.fail_json.assert_called_once_with(msg='Users are listed more than once: alice')
+
+    def test_unique_names(self):
+        users = ctera_filer_users.CteraFilerUsers()
+        users.parameters = dict(users=[dict(username='alice'), dict(username='bob')], exclusive=False)
+        users._reject_duplicate_users()
+        users.ansible_module.fail_json.assert_not_called()
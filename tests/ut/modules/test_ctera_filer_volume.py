@@ -32,6 +32,7 @@ try:
 except ImportError:  # pragma: no cover
     pass  # caught by ctera_common
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_filer_volume_base as ctera_filer_volume_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_volume as ctera_filer_volume
 import tests.ut.mocks.ctera_filer_base_mock as ctera_filer_base_mock
 from tests.ut.base import BaseTest
@@ -41,7 +42,7 @@ class TestCteraFilerVolume(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_filer_base_mock.mock_bases(self, ctera_filer_volume.CteraFilerVolume)
+        ctera_filer_base_mock.mock_bases(self, ctera_filer_volume_base.CteraFilerVolumeBase)
 
     def test__execute(self):
         for is_present in [True, False]:
@@ -94,8 +95,7 @@ class TestCteraFilerVolume(BaseTest):
             for change_attributes in [True, False]:
                 self._test_ensure_present(is_present, change_attributes)
 
-    @staticmethod
-    def _test_ensure_present(is_present, change_attributes):
+    def _test_ensure_present(self, is_present, change_attributes):
         current_attributes = dict(
             name='volume_name',
             size=1024,
@@ -107,18 +107,25 @@ class TestCteraFilerVolume(BaseTest):
         if change_attributes:
             desired_attributes['size'] = 2048
         volume = ctera_filer_volume.CteraFilerVolume()
-        volume.parameters = desired_attributes
-        volume._ensure_present(current_attributes if is_present else None)
+        volume.parameters = dict(state='present', **desired_attributes)
+        if is_present:
+            volume._ctera_filer.volumes.get.return_value = munch.Munch(current_attributes)
+        else:
+            volume._ctera_filer.volumes.get.side_effect = CTERAException(response=munch.Munch(code=404))
+        volume._execute()
+        volume._ctera_filer.volumes.get.assert_called_once_with(name='volume_name')
         if is_present:
             if change_attributes:
                 volume._ctera_filer.volumes.modify.assert_called_with(desired_attributes['name'], size=desired_attributes['size'])
+                self.assert_max_calls(volume._ctera_filer, reads=1, writes=1)
             else:
                 volume._ctera_filer.volumes.modify.assert_not_called()
+                self.assert_max_calls(volume._ctera_filer, reads=1, writes=0)
         else:
             volume._ctera_filer.volumes.add.assert_called_with(**desired_attributes)
+            self.assert_max_calls(volume._ctera_filer, reads=1, writes=1)
 
-    @staticmethod
-    def test_modify_not_size():
+    def test_modify_not_size(self):
         current_attributes = dict(
             name='volume_name',
             size=1024,
@@ -132,18 +139,21 @@ class TestCteraFilerVolume(BaseTest):
         volume.parameters = desired_attributes
         volume._ensure_present(current_attributes)
         volume._ctera_filer.volumes.modify.assert_not_called()
+        self.assertTrue(volume.ansible_return_value.param.skipped)
+        self.assertEqual(volume.ansible_return_value.param.msg, 'Currently you can only modify the volume size')
 
     def test_ensure_absent(self):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         name = 'volume_name'
         volume = ctera_filer_volume.CteraFilerVolume()
         volume.parameters = dict(name=name)
         volume._ensure_absent(volume.parameters if is_present else None)
         if is_present:
             volume._ctera_filer.volumes.delete.assert_called_once_with(name)
+            self.assert_max_calls(volume._ctera_filer, reads=0, writes=1)
         else:
             volume._ctera_filer.volumes.delete.assert_not_called()
+            self.assert_max_calls(volume._ctera_filer, reads=0, writes=0)
@@ -48,6 +48,7 @@ class TestCteraFilerWizard(BaseTest):
             wizard._ctera_filer.config.enable_wizard.assert_not_called()
             wizard._ctera_filer.config.disable_wizard.assert_not_called()
             self.assertTrue(wizard.ansible_return_value.param.skipped)
+            self.assert_max_calls(wizard._ctera_filer, reads=1, writes=0)
         else:
             if desired_enabled:
                 wizard._ctera_filer.config.enable_wizard.assert_called_once_with()
@@ -56,3 +57,4 @@ class TestCteraFilerWizard(BaseTest):
                 wizard._ctera_filer.config.disable_wizard.assert_called_once_with()
                 wizard._ctera_filer.config.enable_wizard.assert_not_called()
             self.assertTrue(wizard.ansible_return_value.param.changed)
+            self.assert_max_calls(wizard._ctera_filer, reads=1, writes=1)
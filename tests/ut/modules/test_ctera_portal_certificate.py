@@ -74,5 +74,7 @@ class TestCteraPortalCertificate(BaseTest):
         ssl._execute()
         if force_update or sha1_fingerprint != self._thumbprint:
             ssl._ctera_portal.ssl.import_from_chain.assert_called_once_with(self._private_key, *[self._domain_cert, self._intermediate, self._root])
+            self.assert_max_calls(ssl._ctera_portal, writes=1)
         else:
             ssl._ctera_portal.ssl.import_from_chain.assert_not_called()
+            self.assert_max_calls(ssl._ctera_portal, writes=0)
@@ -79,6 +79,7 @@ class TestCteraPortalFolderGroup(BaseTest):
         cloud_folder.parameters = dict(name=expected_cf_dict['name'], owner=expected_cf_dict['owner'])
         cloud_folder._ctera_portal.cloudfs.find = mock.MagicMock(return_value=returned_object)
         self.assertDictEqual(expected_cf_dict, cloud_folder._get_cloud_folder())
+        self.assert_max_calls(cloud_folder._ctera_portal, reads=1, writes=0)
 
     def test__get_cloud_folder_doesnt_exist(self):
         cloud_folder = CteraPortalCloudFolder()
@@ -95,8 +96,7 @@ class TestCteraPortalFolderGroup(BaseTest):
             for change_attributes in [True, False]:
                 self._test_ensure_present(is_present, change_attributes)
 
-    @staticmethod
-    def _test_ensure_present(is_present, change_attributes):
+    def _test_ensure_present(self, is_present, change_attributes):
         current_attributes = dict(
             name='folder_name',
             owner=dict(name='admin'),
@@ -107,8 +107,17 @@ class TestCteraPortalFolderGroup(BaseTest):
         if change_attributes:
             desired_attributes['owner']['name'] = 'Tester'
         cloud_folder = CteraPortalCloudFolder()
-        cloud_folder.parameters = desired_attributes
-        cloud_folder._ensure_present(current_attributes if is_present else None)
+        cloud_folder.parameters = dict(state='present', **desired_attributes)
+        if is_present:
+            cloud_folder._ctera_portal.cloudfs.find.return_value = munch.Munch(
+                name=current_attributes['name'],
+                group='objs/13/portal/FoldersGroup/%s' % current_attributes['group'],
+                owner='objs/12/portal/PortalUser/%s' % current_attributes['owner']['name']
+            )
+        else:
+            cloud_folder._ctera_portal.cloudfs.find.side_effect = CTERAException(response=munch.Munch(code=404))
+        cloud_folder._execute()
+        cloud_folder._ctera_portal.cloudfs.find.assert_called_once()
         if is_present:
             cloud_folder._ctera_portal.cloudfs.mkdir.assert_not_called()
         else:
@@ -118,13 +127,13 @@ class TestCteraPortalFolderGroup(BaseTest):
                 portal_types.UserAccount(desired_attributes['owner']['name']),
                 winacls=True
             )
+        self.assert_max_calls(cloud_folder._ctera_portal, reads=1, writes=0 if is_present else 1)
 
     def test_ensure_absent(self):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         parameters = dict(
             name='folder_name',
             owner=dict(name='admin'),
@@ -141,3 +150,4 @@ class TestCteraPortalFolderGroup(BaseTest):
             )
         else:
             cloud_folder._ctera_portal.cloudfs.delete.assert_not_called()
+        self.assert_max_calls(cloud_folder._ctera_portal, reads=0, writes=1 if is_present else 0)
@@ -135,6 +135,7 @@ class TestCteraPortalDirectoryServices(BaseTest):
         if (not change_domain) and (not force_reconnect):
             directory_services._ctera_portal.directoryservice.disconnect.assert_not_called()
             directory_services._do_connect.assert_not_called()
+            self.assert_max_calls(directory_services._ctera_portal, reads=1, writes=0)
             self.assertEqual(directory_services.ansible_return_value.param.msg, 'The Portal is already connected to Active Directory')
         else:
             directory_services._ctera_portal.directoryservice.disconnect.assert_called_once_with()
@@ -150,8 +151,10 @@ class TestCteraPortalDirectoryServices(BaseTest):
         directory_services._ensure_disconnected(domain_dict)
         if is_connected:
             directory_services._ctera_portal.directoryservice.disconnect.assert_called_once_with()
+            self.assert_max_calls(directory_services._ctera_portal, reads=0, writes=1)
             self.assertEqual(directory_services.ansible_return_value.param.msg, 'Successfully disconnected the Portal from Active Directory')
             self.assertTrue(directory_services.ansible_return_value.param.changed)
         else:
             directory_services._ctera_portal.directoryservice.disconnect.assert_not_called()
+            self.assert_max_calls(directory_services._ctera_portal, reads=0, writes=0)
             self.assertEqual(directory_services.ansible_return_value.param.msg, 'The Portal is already not connected to Active Directory')
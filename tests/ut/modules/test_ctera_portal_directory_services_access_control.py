@@ -51,19 +51,25 @@ class TestCteraPortalDirectoryServicesAccessControl(BaseTest):
         ]
         ctera_portal_base_mock.mock_bases(self, ctera_portal_access_control.CteraPortalDirectoryServicesAccessControl)
 
-    def test_ensure_absent_changed(self):
+    def test_execute_absent_changed(self):
         access_control = ctera_portal_access_control.CteraPortalDirectoryServicesAccessControl()
-        access_control._ensure_absent(munch.Munch(dict(name='test')))
+        access_control._ctera_portal.directoryservice.get_access_control.return_value = self._current_acl
+        access_control.parameters = dict(state='absent', acl=[])
+        access_control._execute()
         access_control._ctera_portal.directoryservice.set_access_control.assert_called_once_with([])
         self.assertTrue(access_control.ansible_return_value.param.changed)
         self.assertEqual(access_control.ansible_return_value.param.msg, 'Removed access control entries')
+        self.assert_max_calls(access_control._ctera_portal, reads=1, writes=1)
 
-    def test_ensure_absent_skipped(self):
+    def test_execute_absent_skipped(self):
         access_control = ctera_portal_access_control.CteraPortalDirectoryServicesAccessControl()
-        access_control._ensure_absent(None)
+        access_control._ctera_portal.directoryservice.get_access_control.return_value = []
+        access_control.parameters = dict(state='absent', acl=[])
+        access_control._execute()
         access_control._ctera_portal.directoryservice.set_access_control.assert_not_called()
         self.assertTrue(access_control.ansible_return_value.param.skipped)
         self.assertEqual(access_control.ansible_return_value.param.msg, 'No access control rules exist')
+        self.assert_max_calls(access_control._ctera_portal, reads=1, writes=0)
 
     def test_execute_present_changed(self):
         access_control = ctera_portal_access_control.CteraPortalDirectoryServicesAccessControl()
@@ -86,6 +92,7 @@ class TestCteraPortalDirectoryServicesAccessControl(BaseTest):
                 self.assertEqual(ace.account, group.account)
         self.assertTrue(access_control.ansible_return_value.param.changed)
         self.assertEqual(access_control.ansible_return_value.param.msg, 'Configured access control rules')
+        self.assert_max_calls(access_control._ctera_portal, reads=1, writes=1)
 
     def test_execute_present_skipped(self):
         access_control = ctera_portal_access_control.CteraPortalDirectoryServicesAccessControl()
@@ -96,6 +103,7 @@ class TestCteraPortalDirectoryServicesAccessControl(BaseTest):
         access_control._execute()
         self.assertTrue(access_control.ansible_return_value.param.skipped)
         self.assertEqual(access_control.ansible_return_value.param.msg, 'Access control details did not change')
+        self.assert_max_calls(access_control._ctera_portal, reads=1, writes=0)
 
     def test_get_acl_not_found(self):
         access_control = ctera_portal_access_control.CteraPortalDirectoryServicesAccessControl()
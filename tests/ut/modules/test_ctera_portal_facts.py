@@ -0,0 +1,85 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.modules.ctera_portal_facts as ctera_portal_facts
+import tests.ut.mocks.ctera_portal_base_mock as ctera_portal_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraPortalFacts(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_portal_base_mock.mock_bases(self, ctera_portal_facts.CteraPortalFacts)
+
+    @staticmethod
+    def _facts(gather_subset, limit=1000, fields=None):
+        facts = ctera_portal_facts.CteraPortalFacts()
+        facts.parameters = dict(gather_subset=gather_subset, limit=limit)
+        if fields is not None:
+            facts.parameters['fields'] = fields
+        return facts
+
+    def test_default_fields(self):
+        facts = self._facts(['tenants', 'servers'])
+        facts._ctera_portal.portals.list_tenants.return_value = iter([munch.Munch(name='acme', companyName='Acme', _classname='Portal')])
+        facts._ctera_portal.servers.list_servers.return_value = iter([
+            munch.Munch(name='server1', replicationSettings=munch.Munch(replicationOf='server2', _classname='ReplicationSettings'))
+        ])
+        facts._execute()
+        facts._ctera_portal.portals.list_tenants.assert_called_once_with(include=ctera_portal_facts.CteraPortalFacts._default_fields['tenants'])
+        facts._ctera_portal.servers.list_servers.assert_called_once_with(include=ctera_portal_facts.CteraPortalFacts._default_fields['servers'])
+        facts._ctera_portal.users.list_local_users.assert_not_called()
+        self.assert_max_calls(facts._ctera_portal, reads=2, writes=0)
+        param = facts.ansible_return_value.param
+        self.assertDictEqual(param.ansible_facts, dict(ctera_portal=dict(
+            tenants=[dict(name='acme', companyName='Acme')],
+            servers=[dict(name='server1', replicationSettings=dict(replicationOf='server2'))]
+        )))
+        self.assertListEqual(param.truncated, [])
+
+    def test_fields_and_limit(self):
+        facts = self._facts(['users'], limit=2, fields=dict(users=['role']))
+        users = iter([munch.Munch(name='user%d' % i, role='EndUser') for i in range(5)])
+        facts._ctera_portal.users.list_local_users.return_value = users
+        facts._execute()
+        facts._ctera_portal.users.list_local_users.assert_called_once_with(include=['role'])
+        self.assert_max_calls(facts._ctera_portal, reads=1, writes=0)
+        param = facts.ansible_return_value.param
+        self.assertListEqual([user['name'] for user in param.ansible_facts['ctera_portal']['users']], ['user0', 'user1'])
+        self.assertListEqual(param.truncated, ['users'])
+        # stops reading the collection right after the limit
+        self.assertEqual(next(users).name, 'user3')
+
+    def test_unsupported_fields(self):
+        facts = self._facts(['users'], fields=dict(devices=['name']))
+        self.assertRaises(CTERAException, facts._execute)
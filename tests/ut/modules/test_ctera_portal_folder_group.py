@@ -77,6 +77,7 @@ class TestCteraPortalFolderGroup(BaseTest):
         folder_group.parameters = dict(name=expected_fg_dict['name'])
         folder_group._ctera_portal.cloudfs.get = mock.MagicMock(return_value=returned_object)
         self.assertDictEqual(expected_fg_dict, folder_group._get_folder_group())
+        self.assert_max_calls(folder_group._ctera_portal, reads=1, writes=0)
 
     def test__get_folder_group_doesnt_exist(self):
         folder_group = CteraPortalFolderGroup()
@@ -89,8 +90,7 @@ class TestCteraPortalFolderGroup(BaseTest):
             for change_attributes in [True, False]:
                 self._test_ensure_present(is_present, change_attributes)
 
-    @staticmethod
-    def _test_ensure_present(is_present, change_attributes):
+    def _test_ensure_present(self, is_present, change_attributes):
         current_attributes = dict(
             name='fg_name',
             owner=dict(name='admin')
@@ -99,8 +99,16 @@ class TestCteraPortalFolderGroup(BaseTest):
         if change_attributes:
             desired_attributes['owner']['name'] = 'Tester'
         folder_group = CteraPortalFolderGroup()
-        folder_group.parameters = desired_attributes
-        folder_group._ensure_present(current_attributes if is_present else None)
+        folder_group.parameters = dict(state='present', **desired_attributes)
+        if is_present:
+            folder_group._ctera_portal.cloudfs.get.return_value = munch.Munch(
+                name=current_attributes['name'],
+                owner='objs/12/portal/PortalUser/%s' % current_attributes['owner']['name']
+            )
+        else:
+            folder_group._ctera_portal.cloudfs.get.side_effect = CTERAException(response=munch.Munch(code=404))
+        folder_group._execute()
+        folder_group._ctera_portal.cloudfs.get.assert_called_once_with(desired_attributes['name'])
         if is_present:
             folder_group._ctera_portal.cloudfs.mkfg.assert_not_called()
         else:
@@ -108,13 +116,13 @@ class TestCteraPortalFolderGroup(BaseTest):
                 desired_attributes['name'],
                 user=portal_types.UserAccount(desired_attributes['owner']['name'])
             )
+        self.assert_max_calls(folder_group._ctera_portal, reads=1, writes=0 if is_present else 1)
 
     def test_ensure_absent(self):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         name = 'main'
         folder_group = CteraPortalFolderGroup()
         folder_group.parameters = dict(name=name)
@@ -123,3 +131,4 @@ class TestCteraPortalFolderGroup(BaseTest):
             folder_group._ctera_portal.cloudfs.rmfg.assert_called_once_with(name)
         else:
             folder_group._ctera_portal.cloudfs.rmfg.assert_not_called()
+        self.assert_max_calls(folder_group._ctera_portal, reads=0, writes=1 if is_present else 0)
@@ -67,10 +67,10 @@ class TestCteraPortalInitMaster(BaseTest):
         init_master._ctera_portal.setup.get_setup_status = mock.MagicMock(return_value=munch.Munch(dict(wizard=wizard_state)))
         is_configured = init_master._is_already_configured()
         init_master._ctera_portal.setup.get_setup_status.assert_called_once_with()
+        self.assert_max_calls(init_master._ctera_portal, reads=1, writes=0)
         self.assertEqual(is_configured, wizard_state == portal_enum.SetupWizardStage.Finish)
 
-    @staticmethod
-    def test__configure_master():
+    def test__configure_master(self):
         parameters = dict(
             ctera_host="192.168.1.1",
             ctera_user='admin',
@@ -89,3 +89,4 @@ class TestCteraPortalInitMaster(BaseTest):
         init_master._ctera_portal.setup.init_master = mock.MagicMock()
         init_master._configure_master()
         init_master._ctera_portal.setup.init_master.assert_called_once_with(**create_params)
+        self.assert_max_calls(init_master._ctera_portal, reads=0, writes=1)
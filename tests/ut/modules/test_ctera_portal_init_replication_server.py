@@ -68,10 +68,10 @@ class TestCteraPortalInitReplication(BaseTest):
         init_master._ctera_portal.setup.get_setup_status = mock.MagicMock(return_value=munch.Munch(dict(wizard=wizard_state)))
         is_configured = init_master._is_already_configured()
         init_master._ctera_portal.setup.get_setup_status.assert_called_once_with()
+        self.assert_max_calls(init_master._ctera_portal, reads=1, writes=0)
         self.assertEqual(is_configured, wizard_state == portal_enum.SetupWizardStage.Finish)
 
-    @staticmethod
-    def test__configure_replication_server():
+    def test__configure_replication_server(self):
         parameters = dict(
             ctera_host="192.168.1.2",
             ipaddr="192.168.1.1",
@@ -85,3 +85,4 @@ class TestCteraPortalInitReplication(BaseTest):
         init_master._ctera_portal.setup.init_replication_server = mock.MagicMock()
         init_master._configure_replication_server()
         init_master._ctera_portal.setup.init_replication_server.assert_called_once_with(**create_params)
+        self.assert_max_calls(init_master._ctera_portal, reads=0, writes=1)
@@ -33,6 +33,7 @@ try:
 except ImportError:  # pragma: no cover
     pass  # caught by ctera_common
 
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_local_user_base as ctera_portal_local_user_base
 import ansible_collections.ctera.ctera.plugins.modules.ctera_portal_local_user as ctera_portal_local_user
 import tests.ut.mocks.ctera_portal_base_mock as ctera_portal_base_mock
 from tests.ut.base import BaseTest
@@ -42,7 +43,7 @@ class TestCteraPortalLocalUser(BaseTest):
 
     def setUp(self):
         super().setUp()
-        ctera_portal_base_mock.mock_bases(self, ctera_portal_local_user.CteraPortalLocalUser)
+        ctera_portal_base_mock.mock_bases(self, ctera_portal_local_user_base.CteraPortalLocalUserBase)
 
     def test__execute(self):
         for is_present in [True, False]:
@@ -91,8 +92,7 @@ class TestCteraPortalLocalUser(BaseTest):
             for change_attributes in [True, False]:
                 self._test_ensure_present(is_present, change_attributes)
 
-    @staticmethod
-    def _test_ensure_present(is_present, change_attributes):
+    def _test_ensure_present(self, is_present, change_attributes):
         current_attributes = dict(
             name='admin',
             password='password',
@@ -109,15 +109,26 @@ class TestCteraPortalLocalUser(BaseTest):
         if change_attributes:
             desired_attributes['first_name'] = 'Administrator'
         user = ctera_portal_local_user.CteraPortalLocalUser()
-        user.parameters = desired_attributes
-        user._ensure_present(current_attributes if is_present else None)
+        user.parameters = dict(state='present', **desired_attributes)
+        if is_present:
+            user_object_dict = copy.deepcopy(current_attributes)
+            user_object_dict.pop('update_password')
+            user._ctera_portal.users.get.return_value = munch.Munch(user_object_dict)
+        else:
+            user._ctera_portal.users.get.side_effect = CTERAException(response=munch.Munch(code=404))
+        user._execute()
+        user._ctera_portal.users.get.assert_called_once()
         if is_present:
             if change_attributes:
                 user._ctera_portal.users.modify.assert_called_with(desired_attributes['name'], first_name=desired_attributes['first_name'])
+                self.assert_max_calls(user._ctera_portal, reads=1, writes=1)
             else:
                 user._ctera_portal.users.modify.assert_not_called()
+                self.assert_max_calls(user._ctera_portal, reads=1, writes=0)
         else:
+            desired_attributes.pop('update_password')
             user._ctera_portal.users.add.assert_called_with(**desired_attributes)
+            self.assert_max_calls(user._ctera_portal, reads=1, writes=1)
 
     def test_create_no_password(self):
         user = ctera_portal_local_user.CteraPortalLocalUser()
@@ -135,16 +146,17 @@ class TestCteraPortalLocalUser(BaseTest):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         name = 'admin'
         user = ctera_portal_local_user.CteraPortalLocalUser()
         user.parameters = dict(name=name)
         user._ensure_absent(user.parameters if is_present else None)
         if is_present:
             user._ctera_portal.users.delete.assert_called_once_with(portal_types.UserAccount(name))
+            self.assert_max_calls(user._ctera_portal, reads=0, writes=1)
         else:
             user._ctera_portal.users.delete.assert_not_called()
+            self.assert_max_calls(user._ctera_portal, reads=0, writes=0)
 
     def test__translate_password_change_same(self):
         for value in [True, False, 5]:
@@ -0,0 +1,212 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import datetime
+import os
+import tempfile
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_local_user_base as ctera_portal_local_user_base
+import ansible_collections.ctera.ctera.plugins.modules.ctera_portal_local_users as ctera_portal_local_users
+import tests.ut.mocks.ctera_portal_base_mock as ctera_portal_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraPortalLocalUsers(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_portal_base_mock.mock_bases(self, ctera_portal_local_user_base.CteraPortalLocalUserBase)
+
+    @staticmethod
+    def _users(users=None, src=None, src_format=None, update_password=False):
+        local_users = ctera_portal_local_users.CteraPortalLocalUsers()
+        local_users.parameters = dict(update_password=update_password)
+        if users is not None:
+            local_users.parameters['users'] = users
+        if src is not None:
+            local_users.parameters['src'] = src
+        if src_format is not None:
+            local_users.parameters['src_format'] = src_format
+        local_users._ctera_portal.users.list_local_users.return_value = iter([
+            munch.Munch(name='alice', email='alice@example.com', firstName='Alice', lastName='Wonderland', role='EndUser', company=None, comment=None),
+            munch.Munch(name='bob', email='bob@example.com', firstName='Bob', lastName='Builder', role='EndUser', company=None, comment=None)
+        ])
+        return local_users
+
+    def _write_src(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, 'w') as src_file:
+            src_file.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test__get_users(self):
+        local_users = self._users()
+        self.assertDictEqual(local_users._get_users(), dict(
+            alice=('alice@example.com', 'Alice', 'Wonderland', 'EndUser', None, None),
+            bob=('bob@example.com', 'Bob', 'Builder', 'EndUser', None, None)
+        ))
+        local_users._ctera_portal.users.list_local_users.assert_called_once_with(include=ctera_portal_local_users.CteraPortalLocalUsers._portal_fields)
+
+    def test_inline_no_change(self):
+        local_users = self._users(users=[dict(name='alice', email='alice@example.com', role='EndUser', state='present', password_change=False)])
+        local_users._execute()
+        local_users._ctera_portal.users.modify.assert_not_called()
+        local_users._ctera_portal.users.add.assert_not_called()
+        self.assert_max_calls(local_users._ctera_portal, reads=1, writes=0)
+        self.assertTrue(local_users.ansible_return_value.param.skipped)
+        self.assertEqual(local_users.ansible_return_value.param.unchanged, 1)
+
+    def test_inline_add_modify_delete(self):
+        local_users = self._users(users=[
+            dict(name='alice', email='alice@ctera.com', state='present', password_change=False),
+            dict(name='bob', state='absent', password_change=False),
+            dict(name='carol', email='carol@example.com', first_name='Carol', last_name='Singer', password='password', state='present', password_change=1)
+        ])
+        local_users._execute()
+        local_users._ctera_portal.users.modify.assert_called_once_with('alice', email='alice@ctera.com')
+        local_users._ctera_portal.users.delete.assert_called_once_with(mock.ANY)
+        self.assertEqual(local_users._ctera_portal.users.delete.call_args[0][0].name, 'bob')
+        local_users._ctera_portal.users.add.assert_called_once_with(
+            name='carol', email='carol@example.com', first_name='Carol', last_name='Singer', password='password', role='Disabled', password_change=1
+        )
+        self.assert_max_calls(local_users._ctera_portal, reads=1, writes=3)
+        param = local_users.ansible_return_value.param
+        self.assertTrue(param.changed)
+        self.assertEqual((param.created, param.modified, param.deleted, param.unchanged), (1, 1, 1, 0))
+
+    def test_update_password(self):
+        local_users = self._users(users=[dict(name='alice', password='password', state='present')], update_password=True)
+        local_users._execute()
+        local_users._ctera_portal.users.modify.assert_called_once_with('alice', password='password')
+
+    def test_csv_src(self):
+        path = self._write_src('.csv', 'name,email,password,role,password_change,state\n'
+                                       'alice,alice@example.com,,EndUser,,\n'
+                                       'dave,dave@example.com,password,ReadOnlyAdmin,2030-01-01,present\n'
+                                       'bob,,,,,absent\n')
+        local_users = self._users(src=path)
+        local_users._execute()
+        local_users._ctera_portal.users.add.assert_called_once_with(
+            name='dave', email='dave@example.com', password='password', role='ReadOnlyAdmin', password_change=datetime.date(2030, 1, 1)
+        )
+        local_users._ctera_portal.users.delete.assert_called_once_with(mock.ANY)
+        param = local_users.ansible_return_value.param
+        self.assertEqual((param.created, param.modified, param.deleted, param.unchanged), (1, 0, 1, 1))
+
+    def test_jsonl_src(self):
+        path = self._write_src('.json', '{"name": "alice", "comment": "on leave"}\n\n{"name": "erin", "password": "password", "password_change": "true"}\n')
+        local_users = self._users(src=path, src_format='jsonl')
+        local_users._execute()
+        local_users._ctera_portal.users.modify.assert_called_once_with('alice', comment='on leave')
+        local_users._ctera_portal.users.add.assert_called_once_with(name='erin', password='password', role='Disabled', password_change=True)
+
+    def test_jsonl_src_invalid_lines(self):
+        path = self._write_src('.jsonl', '{"name": "alice", "comment": "on leave"}\n{"name": \n["erin"]\n{"name": "bob", "state": "absent"}\n')
+        local_users = self._users(src=path)
+        local_users._execute()
+        local_users._ctera_portal.users.modify.assert_called_once_with('alice', comment='on leave')
+        local_users._ctera_portal.users.delete.assert_called_once_with(mock.ANY)
+        param = local_users.ansible_return_value.param
+        self.assertTrue(local_users.ansible_return_value.has_failed())
+        self.assertListEqual([(failure['name'], failure['line']) for failure in param.failures], [(None, 2), (None, 3)])
+        self.assertEqual((param.created, param.modified, param.deleted, param.unchanged), (0, 1, 1, 0))
+
+    def test_src_not_found(self):
+        local_users = self._users(users=[dict(name='alice', comment='on leave', state='present')], src='/nonexistent/users.csv')
+        local_users._execute()
+        local_users._ctera_portal.users.list_local_users.assert_not_called()
+        self.assert_max_calls(local_users._ctera_portal, reads=0, writes=0)
+        self.assertTrue(local_users.ansible_return_value.has_failed())
+        self.assertTrue(local_users.ansible_return_value.param.msg.startswith('Failed to read /nonexistent/users.csv.'))
+
+    def test_compare_ignores_case(self):
+        local_users = self._users(users=[dict(name='alice', email='Alice@Example.com', first_name='ALICE', state='present')])
+        local_users._execute()
+        local_users._ctera_portal.users.modify.assert_not_called()
+        self.assertEqual(local_users.ansible_return_value.param.unchanged, 1)
+
+    def test_failures(self):
+        local_users = self._users(users=[
+            dict(name='carol', state='present'),
+            dict(name='bob', state='present', role='Owner'),
+            dict(name='alice', state='absent')
+        ])
+        local_users._ctera_portal.users.delete.side_effect = CTERAException()
+        local_users._execute()
+        param = local_users.ansible_return_value.param
+        self.assertTrue(local_users.ansible_return_value.has_failed())
+        self.assertListEqual([failure['name'] for failure in param.failures], ['carol', 'bob', 'alice'])
+        self.assertEqual(param.failure_count, 3)
+        self.assertEqual(param.msg, 'Failed to manage 3 users. Created: 0, Modified: 0, Deleted: 0, Unchanged: 0')
+
+    def test_failures_are_limited(self):
+        local_users = self._users(users=[dict(name='user%d' % i, state='present') for i in range(5)])
+        with mock.patch.object(ctera_portal_local_users.CteraPortalLocalUsers, '_max_failures', 2):
+            local_users._execute()
+        param = local_users.ansible_return_value.param
+        self.assertListEqual([failure['name'] for failure in param.failures], ['user0', 'user1'])
+        self.assertEqual(param.failure_count, 5)
+        self.assertEqual(param.msg, 'Failed to manage 5 users. Created: 0, Modified: 0, Deleted: 0, Unchanged: 0')
+
+    def test_duplicate_users(self):
+        local_users = self._users(users=[
+            dict(name='carol', email='carol@example.com', password='password', state='present'),
+            dict(name='Carol', email='carol@example.com', password='password', state='present'),
+            dict(name='carol', email='carol@ctera.com', state='present'),
+            dict(name='bob', state='absent'),
+            dict(name='BOB', state='absent')
+        ])
+        local_users._execute()
+        local_users._ctera_portal.users.add.assert_called_once_with(
+            name='carol', email='carol@example.com', password='password', role='Disabled', password_change=mock.ANY
+        )
+        local_users._ctera_portal.users.modify.assert_called_once_with('carol', email='carol@ctera.com')
+        local_users._ctera_portal.users.delete.assert_called_once_with(mock.ANY)
+        self.assert_max_calls(local_users._ctera_portal, reads=1, writes=3)
+        param = local_users.ansible_return_value.param
+        self.assertEqual((param.created, param.modified, param.deleted, param.unchanged), (1, 1, 1, 2))
+
+    def test_names_ignore_case(self):
+        local_users = self._users(users=[dict(name='Alice', email='alice@ctera.com', state='present'), dict(name='BOB', state='absent')])
+        local_users._execute()
+        local_users._ctera_portal.users.add.assert_not_called()
+        local_users._ctera_portal.users.modify.assert_called_once_with('Alice', email='alice@ctera.com')
+        local_users._ctera_portal.users.delete.assert_called_once_with(mock.ANY)
+        self.assertEqual(local_users._ctera_portal.users.delete.call_args[0][0].name, 'BOB')
+
+    def test_throughput(self):
+        local_users = self._users(users=[dict(name='alice', state='present')])
+        with mock.patch.object(ctera_portal_local_users.time, 'monotonic', side_effect=[10.0, 10.5]):
+            local_users._execute()
+        self.assertEqual(local_users.ansible_return_value.param.elapsed, 0.5)
+        self.assertEqual(local_users.ansible_return_value.param.throughput, 2.0)
@@ -88,7 +88,14 @@ class TestCteraPortalPlan(BaseTest):
                 dict(item_name='Storage', amount=30)
             ]
         )
-        returned_dict = munch.Munch(dict(
+        plan = CteraPortalPlan()
+        plan.parameters = dict(name='admin')
+        plan._ctera_portal.plans.get.return_value = self._plan_object()
+        self.assertDictEqual(expected_user_dict, plan._get_plan())
+
+    @staticmethod
+    def _plan_object():
+        return munch.Munch(dict(
             name='main',
             retentionPolicy=munch.Munch(dict(
                 retainAll=11,
@@ -111,10 +118,6 @@ class TestCteraPortalPlan(BaseTest):
             cloudDrivesLite=munch.Munch(dict(amount=29)),
             storage=munch.Munch(dict(amount=30))
         ))
-        plan = CteraPortalPlan()
-        plan.parameters = dict(name='admin')
-        plan._ctera_portal.plans.get = mock.MagicMock(return_value=munch.Munch(returned_dict))
-        self.assertDictEqual(expected_user_dict, plan._get_plan())
 
     def test__get_user_doesnt_exist(self):
         plan = CteraPortalPlan()
@@ -127,8 +130,7 @@ class TestCteraPortalPlan(BaseTest):
             for change_attributes in [True, False]:
                 self._test_ensure_present(is_present, change_attributes)
 
-    @staticmethod
-    def _test_ensure_present(is_present, change_attributes):
+    def _test_ensure_present(self, is_present, change_attributes):
         current_attributes = dict(
             name='main',
             retention=[
@@ -167,27 +169,36 @@ class TestCteraPortalPlan(BaseTest):
                 quotas=None
             )
         plan = CteraPortalPlan()
-        plan.parameters = desired_attributes
-        plan._ensure_present(current_attributes if is_present else None)
+        plan.parameters = dict(state='present', **desired_attributes)
+        if is_present:
+            plan._ctera_portal.plans.get.return_value = self._plan_object()
+        else:
+            plan._ctera_portal.plans.get.side_effect = CTERAException(response=munch.Munch(code=404))
+        plan._execute()
+        plan._ctera_portal.plans.get.assert_called_once_with('main', include=mock.ANY)
         if is_present:
             if change_attributes:
                 plan._ctera_portal.plans.modify.assert_called_with(desired_attributes['name'], **expected_params)
+                self.assert_max_calls(plan._ctera_portal, reads=1, writes=1)
             else:
                 plan._ctera_portal.plans.modify.assert_not_called()
+                self.assert_max_calls(plan._ctera_portal, reads=1, writes=0)
         else:
             plan._ctera_portal.plans.add.assert_called_with(desired_attributes['name'], **expected_params)
+            self.assert_max_calls(plan._ctera_portal, reads=1, writes=1)
 
     def test_ensure_absent(self):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         name = 'main'
         plan = CteraPortalPlan()
         plan.parameters = dict(name=name)
         plan._ensure_absent(plan.parameters if is_present else None)
         if is_present:
             plan._ctera_portal.plans.delete.assert_called_once_with(name)
+            self.assert_max_calls(plan._ctera_portal, reads=0, writes=1)
         else:
             plan._ctera_portal.plans.delete.assert_not_called()
+            self.assert_max_calls(plan._ctera_portal, reads=0, writes=0)
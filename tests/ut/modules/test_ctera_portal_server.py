@@ -85,6 +85,7 @@ class TestCteraPortalServer(BaseTest):
             )
         )
         self.assertDictEqual(expected_server_dict, server._get_server())
+        self.assert_max_calls(server._ctera_portal, reads=1, writes=0)
 
     def test_execute_new_name(self):
         current_name = 'server'
@@ -94,6 +95,7 @@ class TestCteraPortalServer(BaseTest):
         server._get_server = mock.MagicMock(return_value=dict(server_name=current_name))
         server._execute()
         server._ctera_portal.servers.modify.assert_called_once_with(current_name, server_name=new_name)
+        self.assert_max_calls(server._ctera_portal, writes=1)
         self.assertTrue(server.ansible_return_value.param.changed)
 
     def test_execute_no_change(self):
@@ -103,4 +105,5 @@ class TestCteraPortalServer(BaseTest):
         server._get_server = mock.MagicMock(return_value=dict(server_name=current_name))
         server._execute()
         server._ctera_portal.servers.modify.assert_not_called()
+        self.assert_max_calls(server._ctera_portal, writes=0)
         self.assertTrue(server.ansible_return_value.param.skipped)
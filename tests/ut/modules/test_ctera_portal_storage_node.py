@@ -84,7 +84,14 @@ class TestCteraPortalStorageNode(BaseTest):
             read_only=True,
             dedicated_to='Main',
         )
-        storage_node_obj_dict = copy.deepcopy(expected_storage_node_dict)
+        storage_node = ctera_portal_storage_node.CteraPortalStorageNode()
+        storage_node.parameters = dict(name=expected_storage_node_dict['name'])
+        storage_node._ctera_portal.buckets.get.return_value = self._storage_node_object(expected_storage_node_dict)
+        self.assertDictEqual(expected_storage_node_dict, storage_node._get_storage_node())
+
+    @staticmethod
+    def _storage_node_object(storage_node_dict):
+        storage_node_obj_dict = copy.deepcopy(storage_node_dict)
         storage_node_obj_dict['readOnly'] = storage_node_obj_dict.pop('read_only')
         storage_node_obj_dict['dedicatedPortal'] = storage_node_obj_dict.pop('dedicated_to')
         storage_node_obj_dict['storage'] = storage_node_obj_dict['bucket_info']['bucket_type']
@@ -95,11 +102,7 @@ class TestCteraPortalStorageNode(BaseTest):
         storage_node_obj_dict['s3Endpoint'] = storage_node_obj_dict['bucket_info']['endpoint']
         storage_node_obj_dict['httpsOnly'] = storage_node_obj_dict['bucket_info']['https']
         storage_node_obj_dict.pop('bucket_info')
-
-        storage_node = ctera_portal_storage_node.CteraPortalStorageNode()
-        storage_node.parameters = dict(name=expected_storage_node_dict['name'])
-        storage_node._ctera_portal.buckets.get = mock.MagicMock(return_value=munch.Munch(storage_node_obj_dict))
-        self.assertDictEqual(expected_storage_node_dict, storage_node._get_storage_node())
+        return munch.Munch(storage_node_obj_dict)
 
     def test__get_storage_node_doesnt_exist(self):
         storage_node = ctera_portal_storage_node.CteraPortalStorageNode()
@@ -159,13 +162,12 @@ class TestCteraPortalStorageNode(BaseTest):
         self.assertEqual(actual_obj.https, expected_dict['https'] or True)
         self.assertEqual(actual_obj.direct, expected_dict['direct'])
 
-    def test__handle_modify(self):
-        self._test__handle_modify()
-        self._test__handle_modify(change_attributes=True)
-        self._test__handle_modify(change_attributes=True, change_bucket_info=True)
+    def test__execute_modify(self):
+        self._test__execute_modify()
+        self._test__execute_modify(change_attributes=True)
+        self._test__execute_modify(change_attributes=True, change_bucket_info=True)
 
-    @staticmethod
-    def _test__handle_modify(change_attributes=False, change_bucket_info=False):
+    def _test__execute_modify(self, change_attributes=False, change_bucket_info=False):
         current_attributes = dict(
             name='Example',
             bucket_info=dict(
@@ -186,32 +188,37 @@ class TestCteraPortalStorageNode(BaseTest):
                 desired_attributes['bucket_info']['https'] = False
             else:
                 desired_attributes['read_only'] = True
+        desired_attributes['bucket_info']['bucket_type'] = 'AWS'
         storage_node = ctera_portal_storage_node.CteraPortalStorageNode()
-        storage_node.parameters = desired_attributes
-        storage_node._handle_modify(current_attributes)
-        if change_attributes:
-            if change_bucket_info:
-                storage_node._ctera_portal.buckets.modify.assert_not_called()
-            else:
-                storage_node._ctera_portal.buckets.modify.assert_called_with(
-                    desired_attributes['name'],
-                    read_only=desired_attributes['read_only']
-                )
+        storage_node.parameters = dict(state='present', **desired_attributes)
+        storage_node._ctera_portal.buckets.get.return_value = self._storage_node_object(current_attributes)
+        storage_node._execute()
+        storage_node._ctera_portal.buckets.get.assert_called_once_with(desired_attributes['name'], include=mock.ANY)
+        if change_attributes and not change_bucket_info:
+            storage_node._ctera_portal.buckets.modify.assert_called_with(
+                desired_attributes['name'],
+                read_only=desired_attributes['read_only']
+            )
+            self.assert_max_calls(storage_node._ctera_portal, reads=1, writes=1)
+        else:
+            storage_node._ctera_portal.buckets.modify.assert_not_called()
+            self.assert_max_calls(storage_node._ctera_portal, reads=1, writes=0)
 
     def test_ensure_absent(self):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         name = 'example'
         storage_node = ctera_portal_storage_node.CteraPortalStorageNode()
         storage_node.parameters = dict(name=name)
         storage_node._ensure_absent(storage_node.parameters if is_present else None)
         if is_present:
             storage_node._ctera_portal.buckets.delete.assert_called_once_with(name)
+            self.assert_max_calls(storage_node._ctera_portal, reads=0, writes=1)
         else:
             storage_node._ctera_portal.buckets.delete.assert_not_called()
+            self.assert_max_calls(storage_node._ctera_portal, reads=0, writes=0)
 
     def test__get_bucket_object_type(self):
         cases = [
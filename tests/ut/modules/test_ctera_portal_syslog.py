@@ -59,6 +59,7 @@ class TestCteraPortalSyslog(BaseTest):
         )
         syslog._ctera_portal.syslog.get_configuration = mock.MagicMock(return_value=munch.Munch(server=server, port=port, minSeverity=min_severity))
         self.assertDictEqual(expected_server_dict, syslog._get_current_syslog_config())
+        self.assert_max_calls(syslog._ctera_portal, reads=1, writes=0)
 
     def test_execute(self):
         syslog = ctera_portal_syslog.CteraPortalSyslog()
@@ -80,6 +81,7 @@ class TestCteraPortalSyslog(BaseTest):
         syslog.parameters = dict(server=new_server)
         syslog._ensure_enabled()
         syslog._ctera_portal.syslog.modify.assert_called_once_with(server=new_server)
+        self.assert_max_calls(syslog._ctera_portal, reads=1, writes=1)
         self.assertTrue(syslog.ansible_return_value.param.changed)
         self.assertEqual(syslog.ansible_return_value.param.msg, 'Syslog server configuration was modified')
 
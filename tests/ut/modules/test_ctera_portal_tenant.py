@@ -124,13 +124,12 @@ class TestCteraPortalTenant(BaseTest):
         tenant._handle_create()
         tenant._ctera_portal.portals.add.assert_called_with(**parameters)
 
-    def test__handle_modify(self):
+    def test__execute_modify(self):
         for is_deleted in [True, False]:
             for change_attributes in [True, False]:
-                self._test__handle_modify(is_deleted=is_deleted, change_attributes=change_attributes)
+                self._test__execute_modify(is_deleted=is_deleted, change_attributes=change_attributes)
 
-    @staticmethod
-    def _test__handle_modify(is_deleted=False, change_attributes=False):
+    def _test__execute_modify(self, is_deleted=False, change_attributes=False):
         current_attributes = dict(
             name='Example',
             display_name='Tenant for the Example Company Ltd',
@@ -145,9 +144,19 @@ class TestCteraPortalTenant(BaseTest):
         if change_attributes:
             desired_attributes['billing_id'] = '456'
             desired_attributes['plan'] = 'Good'
+        tenant_obj_dict = copy.deepcopy(current_attributes)
+        tenant_obj_dict['displayName'] = tenant_obj_dict.pop('display_name')
+        tenant_obj_dict['externalPortalId'] = tenant_obj_dict.pop('billing_id')
+        tenant_obj_dict['companyName'] = tenant_obj_dict.pop('company')
+        tenant_obj_dict['activationStatus'] = tenant_obj_dict.pop('activation_status')
+        tenant_obj_dict['plan'] = '/objs/1234'
         tenant = ctera_portal_tenant.CteraPortalTenant()
-        tenant.parameters = desired_attributes
-        tenant._ensure_present(current_attributes)
+        tenant.parameters = dict(state='present', **desired_attributes)
+        tenant._ctera_portal.portals.get.return_value = munch.Munch(tenant_obj_dict)
+        tenant._ctera_portal.get.return_value = munch.Munch(dict(baseObjectRef='/objs/1234', name=current_attributes['plan']))
+        tenant._execute()
+        tenant._ctera_portal.portals.get.assert_called_once_with(desired_attributes['name'], include=mock.ANY)
+        tenant._ctera_portal.get.assert_called_once_with('/objs/1234')
         if is_deleted:
             tenant._ctera_portal.portals.undelete.assert_called_with(desired_attributes['name'])
         if change_attributes:
@@ -155,21 +164,23 @@ class TestCteraPortalTenant(BaseTest):
                 desired_attributes['name'],
                 desired_attributes['plan']
             )
+        self.assert_max_calls(tenant._ctera_portal, reads=2, writes=int(is_deleted) + int(change_attributes))
 
     def test_ensure_absent(self):
         for is_present in [True, False]:
             self._test_ensure_absent(is_present)
 
-    @staticmethod
-    def _test_ensure_absent(is_present):
+    def _test_ensure_absent(self, is_present):
         name = 'example'
         tenant = ctera_portal_tenant.CteraPortalTenant()
         tenant.parameters = dict(name=name)
         tenant._ensure_absent(tenant.parameters if is_present else None)
         if is_present:
             tenant._ctera_portal.portals.delete.assert_called_once_with(name)
+            self.assert_max_calls(tenant._ctera_portal, reads=0, writes=1)
         else:
             tenant._ctera_portal.portals.delete.assert_not_called()
+            self.assert_max_calls(tenant._ctera_portal, reads=0, writes=0)
 
     def test__get_plan_name(self):
         for exists in [True, False]:
@@ -0,0 +1,169 @@
+# pylint: disable=protected-access
+
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass  # caught by ctera_common
+
+import ansible_collections.ctera.ctera.plugins.module_utils.ctera_portal_local_user_base as ctera_portal_local_user_base
+import ansible_collections.ctera.ctera.plugins.modules.ctera_portal_tenant_state as ctera_portal_tenant_state
+import tests.ut.mocks.ctera_portal_base_mock as ctera_portal_base_mock
+from tests.ut.base import BaseTest
+
+
+class TestCteraPortalTenantState(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        ctera_portal_base_mock.mock_bases(self, ctera_portal_local_user_base.CteraPortalLocalUserBase)
+
+    @staticmethod
+    def _tenant_state(**desired_state):
+        tenant_state = ctera_portal_tenant_state.CteraPortalTenantState()
+        tenant_state.parameters = dict(name='acme', workers=4, step_timeout=60)
+        tenant_state.parameters.update(desired_state)
+        tenant_state._ctera_portal.portals.get.return_value = munch.Munch(name='acme', plan='objs/1/Good', activationStatus='Enabled')
+        tenant_state._ctera_portal.get.return_value = munch.Munch(name='Good')
+        return tenant_state
+
+    def test_in_desired_state(self):
+        tenant_state = self._tenant_state(
+            plan='Good',
+            users=[dict(name='alice', email='alice@acme.com', role='EndUser')],
+            folder_groups=[dict(name='acme', owner=None)],
+            cloud_folders=[dict(name='alice', group='acme', owner=dict(name='alice', directory=None), winacls=True)]
+        )
+        tenant_state._ctera_portal.users.list_local_users.return_value = [munch.Munch(name='alice', email='alice@acme.com', role='EndUser')]
+        tenant_state._ctera_portal.cloudfs.list_folder_groups.return_value = [munch.Munch(name='acme')]
+        tenant_state._ctera_portal.cloudfs.list_folders.return_value = [munch.Munch(name='alice', owner='objs/9/acme/PortalUser/alice')]
+        tenant_state._execute()
+        tenant_state._ctera_portal.portals.browse.assert_called_once_with('acme')
+        tenant_state._ctera_portal.portals.add.assert_not_called()
+        tenant_state._ctera_portal.portals.subscribe.assert_not_called()
+        tenant_state._ctera_portal.users.add.assert_not_called()
+        tenant_state._ctera_portal.cloudfs.mkfg.assert_not_called()
+        tenant_state._ctera_portal.cloudfs.mkdir.assert_not_called()
+        self.assertTrue(tenant_state.ansible_module.ctera_return_value().param.skipped)
+        self.assertEqual(tenant_state.ansible_module.ctera_return_value().param.msg, 'Tenant is in the desired state')
+        self.assertSetEqual(
+            set(tenant_state.ansible_module.ctera_return_value().param.steps),
+            {'tenant', 'users', 'folder_groups', 'cloud_folders'}
+        )
+        self.assert_max_calls(tenant_state._ctera_portal, reads=6, writes=0)
+
+    def test_onboard_new_tenant(self):
+        tenant_state = self._tenant_state(
+            display_name='ACME',
+            plan='Good',
+            users=[
+                dict(name='alice', email='alice@acme.com', password='password1!', password_change=False),
+                dict(name='bob', email='bob@acme.com', password='password2!', role='EndUser', password_change=False)
+            ],
+            folder_groups=[dict(name='acme', owner=None)],
+            cloud_folders=[
+                dict(name='alice', group='acme', owner=dict(name='alice', directory=None), winacls=True),
+                dict(name='bob', group='acme', owner=dict(name='bob', directory=None), winacls=True),
+                dict(name='shared', group='acme', owner=dict(name='bob', directory=None), winacls=False)
+            ]
+        )
+        tenant_state._ctera_portal.portals.get.side_effect = CTERAException()
+        tenant_state._ctera_portal.users.list_local_users.return_value = []
+        tenant_state._ctera_portal.cloudfs.list_folder_groups.return_value = []
+        tenant_state._ctera_portal.cloudfs.list_folders.return_value = []
+        tenant_state._execute()
+        tenant_state._ctera_portal.portals.add.assert_called_once_with(name='acme', display_name='ACME', plan='Good')
+        tenant_state._ctera_portal.portals.browse.assert_called_once_with('acme')
+        tenant_state._ctera_portal.users.add.assert_has_calls([
+            mock.call(name='alice', email='alice@acme.com', password='password1!', password_change=False, role='Disabled'),
+            mock.call(name='bob', email='bob@acme.com', password='password2!', role='EndUser', password_change=False)
+        ], any_order=True)
+        tenant_state._ctera_portal.cloudfs.mkfg.assert_called_once_with('acme', user=None)
+        self.assertEqual(tenant_state._ctera_portal.cloudfs.mkdir.call_count, 3)
+        bob_folders = [c.args[0] for c in tenant_state._ctera_portal.cloudfs.mkdir.call_args_list if c.args[0] != 'alice']
+        self.assertListEqual(bob_folders, ['bob', 'shared'])
+        self.assertTrue(tenant_state.ansible_module.ctera_return_value().param.changed)
+        steps = tenant_state.ansible_module.ctera_return_value().param.steps
+        self.assertEqual(steps['tenant']['msg'], 'Tenant was created')
+        self.assertEqual(steps['cloud_folders']['msg'], 'Applied: alice, bob, shared')
+        self.assert_max_calls(tenant_state._ctera_portal, reads=5, writes=7)
+
+    def test_failed_step_skips_dependents(self):
+        tenant_state = self._tenant_state(
+            users=[dict(name='carol', email='carol@acme.com', password_change=False)],
+            folder_groups=[dict(name='acme', owner=None)]
+        )
+        tenant_state._ctera_portal.users.list_local_users.return_value = []
+        tenant_state._ctera_portal.cloudfs.list_folder_groups.return_value = []
+        tenant_state._execute()
+        tenant_state._ctera_portal.users.add.assert_not_called()
+        tenant_state._ctera_portal.cloudfs.mkfg.assert_not_called()
+        self.assertTrue(tenant_state.ansible_module.ctera_return_value().param.failed)
+        self.assertEqual(tenant_state.ansible_module.ctera_return_value().param.msg, 'Failed to apply: users, folder_groups')
+        steps = tenant_state.ansible_module.ctera_return_value().param.steps
+        self.assertIn('Cannot create new user without a password', steps['users']['msg'])
+        self.assertEqual(steps['folder_groups']['msg'], 'Skipped since users did not complete')
+
+    def test_modify_user_case_insensitive(self):
+        tenant_state = self._tenant_state(users=[
+            dict(name='alice', email='Alice@ACME.com', role='EndUser'),
+            dict(name='bob', email='bob@acme.com', role='ReadWriteAdmin')
+        ])
+        tenant_state._ctera_portal.users.list_local_users.return_value = [
+            munch.Munch(name='alice', email='alice@acme.com', role='EndUser'),
+            munch.Munch(name='bob', email='bob@acme.com', role='EndUser')
+        ]
+        tenant_state._execute()
+        tenant_state._ctera_portal.users.modify.assert_called_once_with('bob', role='ReadWriteAdmin')
+
+    def test_duplicate_items(self):
+        tenant_state = self._tenant_state(
+            users=[dict(name='alice'), dict(name='alice', role='EndUser'), dict(name='bob')],
+            folder_groups=[dict(name='finance'), dict(name='legal')],
+            cloud_folders=[
+                dict(name='reports', group='finance', owner=dict(name='alice')),
+                dict(name='reports', group='finance', owner=dict(name='bob')),
+                dict(name='reports', group='legal', owner=dict(name='bob'))
+            ]
+        )
+        tenant_state._reject_duplicate_items()
+        self.assertEqual(tenant_state.ansible_module.fail_json.call_args_list, [
+            mock.call(msg='Users are listed more than once: alice'),
+            mock.call(msg='Cloud folders are listed more than once: bob/reports')
+        ])
+
+    def test_failed_tenant(self):
+        tenant_state = self._tenant_state(users=[dict(name='alice', email='alice@acme.com')])
+        tenant_state._ctera_portal.portals.get.side_effect = CTERAException()
+        tenant_state._ctera_portal.portals.add.side_effect = CTERAException(message='Testing Failure')
+        tenant_state._execute()
+        tenant_state._ctera_portal.portals.browse.assert_not_called()
+        self.assertTrue(tenant_state.ansible_module.ctera_return_value().param.failed)
+        self.assertEqual(tenant_state.ansible_module.ctera_return_value().param.msg, 'Failed to apply: tenant')
+        self.assertEqual(tenant_state.ansible_module.ctera_return_value().param.steps['tenant']['status'], 'error')
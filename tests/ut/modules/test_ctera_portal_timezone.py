@@ -47,12 +47,14 @@ class TestCteraFilerTimezone(BaseTest):
         timezone._execute()
         if change_timezone:
             timezone._ctera_portal.settings.global_settings.set_timezone.assert_called_once_with(new_timezone)
+            self.assert_max_calls(timezone._ctera_portal, reads=1, writes=1)
             self.assertTrue(timezone.ansible_return_value.param.changed)
             self.assertEqual(timezone.ansible_return_value.param.msg, 'Changed timezone')
             self.assertEqual(timezone.ansible_return_value.param.previous_timezone, current_timezone)
             self.assertEqual(timezone.ansible_return_value.param.current_timezone, new_timezone)
         else:
             timezone._ctera_portal.settings.global_settings.set_timezone.assert_not_called()
+            self.assert_max_calls(timezone._ctera_portal, reads=1, writes=0)
             self.assertFalse(hasattr(timezone.ansible_return_value.param, 'changed'))
             self.assertEqual(timezone.ansible_return_value.param.msg, 'No update required to the current timezone')
             self.assertEqual(timezone.ansible_return_value.param.current_timezone, current_timezone)
@@ -0,0 +1,90 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+
+try:
+    from cterasdk import CTERAException
+    from cterasdk import config as ctera_config
+except ImportError:  # pragma: no cover
+    pass
+
+from ansible.errors import AnsibleConnectionFailure
+
+import ansible_collections.ctera.ctera.plugins.httpapi.ctera_gateway as ctera_gateway
+import ansible_collections.ctera.ctera.plugins.httpapi.ctera_portal as ctera_portal
+from tests.ut.base import BaseTest
+
+
+class TestCteraHttpApi(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.connection = mock.MagicMock()
+        self.options = dict(host='192.168.1.1', port=None, use_ssl=True, validate_certs=False)
+        self.connection.get_option = mock.MagicMock(side_effect=lambda option: self.options[option])
+        self.gateway_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.httpapi.ctera_gateway.Gateway")
+        self.gateway_object_mock = self.gateway_class_mock.return_value
+
+    def test_login(self):
+        httpapi = ctera_gateway.HttpApi(self.connection)
+        httpapi.login('admin', 'password')
+        self.gateway_class_mock.assert_called_once_with('192.168.1.1', port=None, https=True)
+        self.gateway_object_mock.login.assert_called_once_with('admin', 'password')
+        self.assertEqual(ctera_config.http['ssl'], 'Trust')
+
+    def test_login_failed(self):
+        self.gateway_object_mock.login = mock.MagicMock(side_effect=CTERAException())
+        httpapi = ctera_gateway.HttpApi(self.connection)
+        self.assertRaises(AnsibleConnectionFailure, httpapi.login, 'admin', 'password')
+
+    def test_logout(self):
+        httpapi = ctera_gateway.HttpApi(self.connection)
+        httpapi.logout()
+        self.gateway_object_mock.logout.assert_not_called()
+        httpapi.login('admin', 'password')
+        httpapi.logout()
+        self.gateway_object_mock.logout.assert_called_once_with()
+
+    def test_get_session(self):
+        self.gateway_object_mock.host.return_value = '192.168.1.1'
+        self.gateway_object_mock.port.return_value = 443
+        self.gateway_object_mock.https.return_value = True
+        self.gateway_object_mock.get_session_id.return_value = 'abcd'
+        httpapi = ctera_gateway.HttpApi(self.connection)
+        self.connection._connect = mock.MagicMock(side_effect=lambda: httpapi.login('admin', 'password'))
+        self.assertDictEqual(
+            httpapi.get_session(),
+            dict(host='192.168.1.1', port=443, https=True, trust_certificate=True, session_id='abcd')
+        )
+        self.connection._connect.assert_called_once_with()
+        httpapi.get_session()
+        self.connection._connect.assert_called_once_with()
+        self.gateway_object_mock.login.assert_called_once_with('admin', 'password')
+
+    def test_portal(self):
+        portal_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.httpapi.ctera_portal.GlobalAdmin")
+        httpapi = ctera_portal.HttpApi(self.connection)
+        httpapi.login('admin', 'password')
+        portal_class_mock.assert_called_once_with('192.168.1.1', port=None, https=True)
+        portal_class_mock.return_value.login.assert_called_once_with('admin', 'password')
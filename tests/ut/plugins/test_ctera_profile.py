@@ -0,0 +1,97 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import json
+import os
+import tempfile
+import unittest.mock as mock
+
+import ansible_collections.ctera.ctera.plugins.callback.ctera_profile as ctera_profile
+from tests.ut.base import BaseTest
+
+
+def _result(host, task, result):
+    task_result = mock.MagicMock()
+    task_result._host.get_name.return_value = host  # pylint: disable=protected-access
+    task_result._task.get_name.return_value = task  # pylint: disable=protected-access
+    task_result._result = result  # pylint: disable=protected-access
+    return task_result
+
+
+def _timings(host, total, *calls):
+    return dict(
+        calls=[dict(host=host, method=method, path=path, status=200, bytes=0, elapsed=elapsed) for method, path, elapsed in calls],
+        requests=len(calls), login=0.5, logout=0.25, total=total
+    )
+
+
+class TestCteraProfileCallback(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.options = dict(output_file=None, slowest=2)
+        self.display = mock.MagicMock(verbosity=0)
+        self.callback = ctera_profile.CallbackModule(display=self.display)
+        self.callback.get_option = self.options.get
+        self.callback.v2_runner_on_ok(_result('filer1', 'shares', dict(ctera_timings=_timings(
+            'filer1.example.com', 3.0, ('GET', '/status', 0.1), ('GET', '/status', 0.2), ('PUT', '/config/shares', 1.0)
+        ))))
+        self.callback.v2_runner_on_failed(_result('filer2', 'shares', dict(ctera_timings=_timings(
+            'filer2.example.com', 1.0, ('GET', '/status', 0.4)
+        ))))
+        # delegated to localhost, and sent to both filers
+        self.callback.v2_runner_on_ok(_result('localhost', 'users', dict(results=[
+            dict(ctera_timings=_timings('filer1.example.com', 0.5, ('GET', '/status', 0.3))),
+            dict(ctera_timings=_timings('filer2.example.com', 0.5, ('GET', '/status', 0.3))),
+            dict(skipped=True)
+        ])))
+        self.callback.v2_runner_on_ok(_result('localhost', 'debug', dict(msg='not a CTERA task')))
+
+    def test_report(self):
+        report = self.callback.report()
+        self.assertDictEqual(report['endpoints']['GET /status'], dict(count=5, p50=0.3, p95=0.4, p99=0.4, max=0.4, total=1.3))
+        self.assertDictEqual(report['hosts']['filer1.example.com'], dict(count=4, p50=0.2, p95=1.0, p99=1.0, max=1.0, total=1.6))
+        self.assertEqual(report['hosts']['filer2.example.com']['count'], 2)
+        self.assertDictEqual({host: latency['count'] for host, latency in report['play_hosts'].items()}, dict(filer1=3, filer2=1, localhost=2))
+        self.assertEqual(report['login'], 2.0)
+        self.assertEqual(report['logout'], 1.0)
+        self.assertListEqual(report['slowest_tasks'], [
+            dict(host='filer1', task='shares', total=3.0, requests=3),
+            dict(host='filer2', task='shares', total=1.0, requests=1)
+        ])
+
+    def test_playbook_on_stats(self):
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        self.options['output_file'] = path
+        self.callback.v2_playbook_on_stats(mock.MagicMock())
+        self.display.banner.assert_called_once_with('CTERA API LATENCY')
+        with open(path) as report_file:
+            self.assertDictEqual(json.load(report_file), self.callback.report())
+
+    def test_playbook_on_stats_no_ctera_tasks(self):
+        callback = ctera_profile.CallbackModule(display=self.display)
+        callback.get_option = self.options.get
+        callback.v2_playbook_on_stats(mock.MagicMock())
+        self.display.banner.assert_not_called()
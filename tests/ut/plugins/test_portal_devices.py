@@ -0,0 +1,137 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import unittest.mock as mock
+import munch
+
+try:
+    from cterasdk import CTERAException
+except ImportError:  # pragma: no cover
+    pass
+
+from ansible.errors import AnsibleError
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+
+try:
+    from ansible.template import trust_as_template
+except ImportError:  # pragma: no cover
+    def trust_as_template(value):  # templates of ansible-core < 2.19 are trusted
+        return value
+
+import ansible_collections.ctera.ctera.plugins.inventory.portal_devices as portal_devices
+from tests.ut.base import BaseTest
+
+
+class TestPortalDevicesInventory(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        self.global_admin_class_mock = self.patch_call("ansible_collections.ctera.ctera.plugins.inventory.portal_devices.GlobalAdmin")
+        self.global_admin_object_mock = self.global_admin_class_mock.return_value
+        self.global_admin_object_mock.devices.filers.side_effect = lambda **kwargs: iter([
+            munch.Munch(name='filer1', portal='objs/11/acme/PortalTenant/acme', deviceType='vGateway', version='7.5.182.7',
+                        deviceConnectionStatus=munch.Munch(connected=True)),
+            munch.Munch(name='filer2', portal='objs/12/globex/PortalTenant/globex', deviceType='C200', version='7.6.1.0',
+                        deviceConnectionStatus=munch.Munch(connected=False))
+        ])
+        self.options = dict(
+            ctera_host='portal.ctera.com', ctera_port=None, ctera_https=True, ctera_user='admin', ctera_password='password',
+            ctera_trust_certificate=False, tenants=None, fields=[], hostname_template='{tenant}.{name}', cache=False, strict=False, compose={}, groups={},
+            keyed_groups=[dict(key=trust_as_template('ctera_device_type'), prefix='type')]  # as loaded from the source file
+        )
+
+    def _parse(self, cache=True, cached_devices=None):
+        plugin = portal_devices.InventoryModule()
+        plugin.get_option = self.options.get
+        plugin._read_config_data = mock.MagicMock()
+        plugin.get_cache_key = mock.MagicMock(return_value='portal_devices')
+        plugin._cache = dict(portal_devices=cached_devices) if cached_devices is not None else {}
+        inventory = InventoryData()
+        plugin.parse(inventory, DataLoader(), 'portal_devices.yml', cache=cache)
+        return plugin, inventory
+
+    def test_parse(self):
+        _plugin, inventory = self._parse()
+        self.global_admin_class_mock.assert_called_once_with('portal.ctera.com', port=None, https=True)
+        self.global_admin_object_mock.login.assert_called_once_with('admin', 'password')
+        self.global_admin_object_mock.devices.filers.assert_called_once_with(include=portal_devices.InventoryModule._device_fields, allPortals=True)
+        self.global_admin_object_mock.logout.assert_called_once_with()
+        self.assertListEqual(sorted(inventory.hosts.keys()), ['acme.filer1', 'globex.filer2'])
+        self.assertListEqual([host.name for host in inventory.groups['tenant_acme'].get_hosts()], ['acme.filer1'])
+        self.assertListEqual([host.name for host in inventory.groups['model_C200'].get_hosts()], ['globex.filer2'])
+        self.assertListEqual([host.name for host in inventory.groups['version_7_5_182_7'].get_hosts()], ['acme.filer1'])
+        self.assertListEqual([host.name for host in inventory.groups['connected'].get_hosts()], ['acme.filer1'])
+        self.assertListEqual([host.name for host in inventory.groups['disconnected'].get_hosts()], ['globex.filer2'])
+        self.assertListEqual([host.name for host in inventory.groups['type_vGateway'].get_hosts()], ['acme.filer1'])
+        hostvars = inventory.get_host('acme.filer1').vars
+        self.assertEqual(hostvars['ctera_tenant'], 'acme')
+        self.assertEqual(hostvars['ctera_device_name'], 'filer1')
+        self.assertDictEqual(hostvars['ctera_device']['deviceConnectionStatus'], dict(connected=True))
+
+    def test_parse_tenants(self):
+        self.options['tenants'] = ['globex']
+        _plugin, inventory = self._parse()
+        self.assertListEqual(list(inventory.hosts.keys()), ['globex.filer2'])
+
+    def test_parse_same_name_in_different_tenants(self):
+        self.options['cache'] = True
+        _plugin, inventory = self._parse(cached_devices=[
+            dict(name='filer1', portal='objs/11/acme/PortalTenant/acme'),
+            dict(name='filer1', portal='objs/12/globex/PortalTenant/globex')
+        ])
+        self.assertListEqual(sorted(inventory.hosts.keys()), ['acme.filer1', 'globex.filer1'])
+        self.assertEqual(inventory.get_host('globex.filer1').vars['ctera_tenant'], 'globex')
+
+    def test_parse_hostname_template(self):
+        self.options['hostname_template'] = '{name}'
+        _plugin, inventory = self._parse()
+        self.assertListEqual(sorted(inventory.hosts.keys()), ['filer1', 'filer2'])
+
+    def test_parse_invalid_hostname_template(self):
+        self.options['hostname_template'] = '{device}'
+        self.assertRaises(AnsibleError, self._parse)
+
+    def test_parse_cache_hit(self):
+        self.options['cache'] = True
+        _plugin, inventory = self._parse(cached_devices=[dict(name='filer3', portal='objs/13/acme/PortalTenant/acme', deviceType='vGateway')])
+        self.global_admin_class_mock.assert_not_called()
+        self.assertListEqual(list(inventory.hosts.keys()), ['acme.filer3'])
+
+    def test_parse_cache_miss(self):
+        self.options['cache'] = True
+        plugin, inventory = self._parse()
+        self.global_admin_object_mock.login.assert_called_once_with('admin', 'password')
+        self.assertListEqual([device['name'] for device in plugin._cache['portal_devices']], ['filer1', 'filer2'])
+        self.assertEqual(len(inventory.hosts), 2)
+
+    def test_parse_cache_refresh(self):
+        self.options['cache'] = True
+        plugin, _inventory = self._parse(cache=False, cached_devices=[dict(name='filer3')])
+        self.global_admin_object_mock.login.assert_called_once_with('admin', 'password')
+        self.assertListEqual([device['name'] for device in plugin._cache['portal_devices']], ['filer1', 'filer2'])
+
+    def test_login_failed(self):
+        self.global_admin_object_mock.login.side_effect = CTERAException()
+        self.assertRaises(AnsibleError, self._parse)
+        self.global_admin_object_mock.devices.filers.assert_not_called()
@@ -0,0 +1,217 @@
+# This code is part of Ansible, but is an independent component.
+# This particular file snippet, and this file snippet only, is licensed under the Apache License 2.0.
+# Modules you write using this snippet, which is embedded dynamically by Ansible
+# still belong to the author of the module, and may assign their own license
+# to the complete work.
+#
+# Copyright 2020, CTERA Networks
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import os
+import time
+import unittest
+import unittest.mock as mock
+
+from cterasdk import CTERAException, Gateway, GlobalAdmin, config
+from cterasdk.core.types import UserAccount
+
+from ansible_collections.ctera.ctera.plugins.module_utils import ctera_common
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_ftp as ctera_filer_ftp
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_nfs as ctera_filer_nfs
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_ntp as ctera_filer_ntp
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_rsync as ctera_filer_rsync
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_services as ctera_filer_services
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_share as ctera_filer_share
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_smb as ctera_filer_smb
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_snmp as ctera_filer_snmp
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_syslog as ctera_filer_syslog
+import ansible_collections.ctera.ctera.plugins.modules.ctera_filer_telnet as ctera_filer_telnet
+import ansible_collections.ctera.ctera.plugins.modules.ctera_portal_tenant as ctera_portal_tenant
+from tests.simulator.gateway import GatewaySimulator
+from tests.simulator.portal import PortalSimulator
+from tests.simulator.runner import run_module
+from tests.ut.base import BaseTest
+
+
+@unittest.skipUnless(ctera_common.is_supported_cterasdk(ctera_common.cterasdk_version()), 'requires cterasdk %s or later' % ctera_common.CTERASDK_MIN_VERSION)
+class SimulatorTest(BaseTest):
+
+    def setUp(self):
+        super().setUp()
+        # requests verifies the certificate against these bundles even when the session of the SDK trusts any certificate
+        environ = mock.patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        for variable in ['REQUESTS_CA_BUNDLE', 'CURL_CA_BUNDLE']:
+            os.environ.pop(variable, None)
+        ssl = mock.patch.dict(config.http, ssl='Trust')
+        ssl.start()
+        self.addCleanup(ssl.stop)
+
+    def start(self, simulator):
+        simulator.start()
+        self.addCleanup(simulator.stop)
+        return simulator
+
+
+class TestGatewaySimulator(SimulatorTest):
+
+    def setUp(self):
+        super().setUp()
+        self.simulator = self.start(GatewaySimulator())
+        self.gateway = Gateway(self.simulator.host, port=self.simulator.port, https=True)
+
+    def test_login_failure(self):
+        self.assertRaises(CTERAException, self.gateway.login, 'admin', 'wrong')
+
+    def test_shares(self):
+        self.gateway.login('admin', 'password')
+        self.gateway.shares.add('demo', 'main/demo')
+        self.gateway.shares.modify('demo', comment='comment')
+        share = self.gateway.shares.get('demo')
+        self.assertEqual(share.volume, 'main')
+        self.assertEqual(share.comment, 'comment')
+        self.gateway.shares.delete('demo')
+        self.assertListEqual(self.gateway.shares.get(), [])
+        self.gateway.logout()
+
+    def test_volumes(self):
+        self.gateway.login('admin', 'password')
+        self.gateway.volumes.add('data', size=512)
+        self.assertListEqual([volume.name for volume in self.gateway.volumes.get()], ['main', 'data'])
+        self.gateway.volumes.delete('main')
+        self.assertListEqual([volume.name for volume in self.gateway.volumes.get()], ['data'])
+        self.gateway.logout()
+
+    def test_session_required(self):
+        self.gateway.login('admin', 'password')
+        self.gateway.logout()
+        self.gateway.session().start_local_session = mock.MagicMock()
+        self.gateway.set_session_id('expired')
+        self.assertRaises(CTERAException, self.gateway.shares.get)
+
+    def test_run_module(self):
+        args = self.simulator.connection_args(name='demo', directory='main/demo')
+        self.assertEqual(run_module(ctera_filer_share, args)['msg'], 'Share created')
+        self.simulator.reset_requests()
+        self.assertEqual(run_module(ctera_filer_share, args)['msg'], 'Share details did not change')
+        self.assertListEqual(
+            [request.path for request in self.simulator.requests],
+            ['/admingui/api/login', '/admingui/api/currentuser', '/admingui/api/config/fileservices/share/demo', '/admingui/api/logout']
+        )
+
+    def test_latency(self):
+        self.simulator.latency = 0.05
+        start = time.monotonic()
+        self.gateway.login('admin', 'password')
+        self.assertGreaterEqual(time.monotonic() - start, 0.05 * self.simulator.round_trips())
+
+    def test_inject_fault(self):
+        self.gateway.login('admin', 'password')
+        self.simulator.inject_fault(status=500, method='GET', path='/share', count=1)
+        self.assertRaises(CTERAException, self.gateway.shares.get)
+        self.assertListEqual(self.gateway.shares.get(), [])
+        self.assertListEqual([request.status for request in self.simulator.requests[-2:]], [500, 200])
+
+
+class TestConfigServiceModules(SimulatorTest):
+    ''' Runs each of the modules of the configuration services against a fresh simulated Edge Filer, twice.
+        The first run applies the configuration and the second must find nothing to change,
+        except for Telnet, whose status the filer does not report, so enabling it always reports a change
+    '''
+
+    _modules = [
+        (ctera_filer_smb, dict(enabled=True, idle_disconnect_time=30)),
+        (ctera_filer_smb, dict(enabled=False)),
+        (ctera_filer_nfs, dict(enabled=True, async_write=False)),
+        (ctera_filer_ftp, dict(enabled=True, max_connections_per_ip=10)),
+        (ctera_filer_rsync, dict(enabled=True, max_connections=10)),
+        (ctera_filer_telnet, dict(enabled=False)),
+        (ctera_filer_snmp, dict(enabled=True, port=161, community_str='public')),
+        (ctera_filer_snmp, dict(enabled=False)),
+        (ctera_filer_syslog, dict(enabled=True, server='syslog.example.com')),
+        (ctera_filer_ntp, dict(state='enabled', servers=['0.pool.ntp.org', '1.pool.ntp.org'])),
+        (ctera_filer_services, dict(services=dict(
+            smb=dict(enabled=True, packet_signing='Required'),
+            nfs=dict(enabled=False),
+            rsync=dict(enabled=True, port=8730),
+            syslog=dict(enabled=True, server='syslog.example.com', port=1514)
+        )))
+    ]
+
+    def test_apply_and_no_change(self):
+        for module, args in TestConfigServiceModules._modules:
+            with self.subTest(module=module.__name__.split('.')[-1], args=args):
+                simulator = self.start(GatewaySimulator())
+                args = simulator.connection_args(**args)
+                result = run_module(module, args)
+                self.assertFalse(result.get('failed'), result.get('msg'))
+                result = run_module(module, args)
+                self.assertFalse(result.get('failed'), result.get('msg'))
+                if module is not ctera_filer_telnet:
+                    self.assertFalse(result.get('changed'), result.get('msg'))
+
+    def test_enable_telnet(self):
+        simulator = self.start(GatewaySimulator())
+        args = simulator.connection_args(enabled=True, code='a1b2c3')
+        self.assertEqual(run_module(ctera_filer_telnet, args)['msg'], 'Telnet daemon enabled')
+        self.assertEqual(simulator.store.get('config/device/telnet'), 'enabled')
+        self.assertFalse(run_module(ctera_filer_telnet, args).get('failed'))
+
+
+class TestPortalSimulator(SimulatorTest):
+
+    def setUp(self):
+        super().setUp()
+        self.simulator = self.start(PortalSimulator())
+        self.simulator.add_plan('default')
+        self.simulator.add_tenant('acme', plan='default')
+        self.portal = GlobalAdmin(self.simulator.host, port=self.simulator.port)
+
+    def test_tenant_users(self):
+        for i in range(120):
+            self.simulator.add_user('user%d' % i, 'password', tenant='acme')
+        self.portal.login('admin', 'password')
+        self.assertListEqual([user.name for user in self.portal.users.list_local_users()], ['admin'])
+        self.portal.portals.browse('acme')
+        self.assertEqual(len(list(self.portal.users.list_local_users())), 120)
+        self.portal.logout()
+
+    def test_cloudfs(self):
+        self.simulator.add_user('owner', 'password', tenant='acme')
+        owner = UserAccount('owner')
+        self.portal.login('admin', 'password')
+        self.portal.portals.browse('acme')
+        self.portal.cloudfs.mkfg('group', user=owner)
+        self.portal.cloudfs.mkdir('folder', 'group', owner)
+        self.assertEqual(self.portal.cloudfs.find('folder', owner).name, 'folder')
+        self.assertListEqual([folder_group.name for folder_group in self.portal.cloudfs.list_folder_groups()], ['group'])
+        self.portal.logout()
+
+    def test_run_module(self):
+        args = self.simulator.connection_args(name='other', plan='default')
+        self.assertEqual(run_module(ctera_portal_tenant, args)['msg'], 'Tenant was created')
+        self.assertTrue(self.simulator.store.exists('portals/other'))
+
+    def test_remote_device(self):
+        device = self.simulator.add_device('acme', 'edge')
+        args = self.simulator.connection_args(name='demo', directory='main/demo', ctera_host='edge')
+        args['ctera_portal'] = self.simulator.connection_args()
+        args['ctera_portal'].pop('ctera_trust_certificate')
+        args['ctera_portal']['tenant'] = 'acme'
+        self.assertEqual(run_module(ctera_filer_share, args)['msg'], 'Share created')
+        self.assertListEqual([share.name for share in device.store.get('config/fileservices/share')], ['demo'])